@@ -0,0 +1,101 @@
+"""Benchmark bulk row deletes and inserts.
+
+COM: deletes N scattered rows from a 5,000-row sheet in the in-process
+fake Excel from tests/fake_com.py, where every Insert/Delete call costs a
+recalculation (--recalc ms), once with one delete per position (bottom-up)
+and once with bulk_insert_delete.
+
+openpyxl: inserts one row at N positions in a sheet of --rows x 10 cells,
+once with ws.insert_rows per position (bottom-up) and once with
+FileEngine.bulk_insert_delete. The engine uses deferred durability and the
+workbook is loaded before timing, so both measure the in-memory edit only.
+
+Usage:
+    python benchmarks/bench_bulk_insert_delete.py [positions] [--recalc MS] [--rows N]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+import openpyxl  # noqa: E402
+
+from excellm.core import connection  # noqa: E402
+from excellm.core.file_engine import FileEngine  # noqa: E402
+from excellm.tools.sheet_mgmt import bulk_insert_delete_sync, delete_sync  # noqa: E402
+
+COLS = 10
+
+
+def make_app(recalc_s: float) -> fake_com.FakeExcelApp:
+    app = fake_com.FakeExcelApp(recalc_cost_s=recalc_s)
+    app.add_workbook("Book1.xlsx", {"Data": [[r] * COLS for r in range(1, 5001)]})
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return app
+
+
+def make_sheet(rows: int):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for r in range(1, rows + 1):
+        ws.append([r] * COLS)
+    return wb
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    opts = {"--recalc": 5.0, "--rows": 10000.0}
+    for flag in opts:
+        if flag in args:
+            i = args.index(flag)
+            opts[flag] = float(args[i + 1])
+            del args[i:i + 2]
+    count = int(args[0]) if args else 200
+    rows = int(opts["--rows"])
+
+    positions = [str(r) for r in range(2, 2 + 2 * count, 2)]
+    print(f"COM: delete {count} scattered rows, recalc {opts['--recalc']:g} ms")
+    print(f"  {'method':20s} {'time':>8s} {'calls':>6s} {'recalcs':>8s}")
+    app = make_app(opts["--recalc"] / 1000)
+    elapsed = timed(lambda: [delete_sync("Book1.xlsx", "Data", "row", p) for p in reversed(positions)])
+    print(f"  {'one per position':20s} {elapsed:7.2f}s {app.calls['Delete']:6d} {app.calls['Recalculate']:8d}")
+    app = make_app(opts["--recalc"] / 1000)
+    elapsed = timed(lambda: bulk_insert_delete_sync("Book1.xlsx", "Data", "delete", "row", positions))
+    print(f"  {'bulk_insert_delete':20s} {elapsed:7.2f}s {app.calls['Delete']:6d} {app.calls['Recalculate']:8d}")
+
+    print(f"openpyxl: insert 1 row at {count} positions, {rows} x {COLS} sheet")
+    ws = make_sheet(rows)["Data"]
+    elapsed = timed(lambda: [ws.insert_rows(int(p)) for p in reversed(positions)])
+    print(f"  {'insert_rows loop':20s} {elapsed:7.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lines.xlsx")
+        make_sheet(rows).save(path)
+        engine = FileEngine(durability="deferred", flush_interval_ms=0, flush_every=0)
+        engine.write_range(path, "Data", "A1", [[1]])  # Load for edit before timing
+        elapsed = timed(lambda: engine.bulk_insert_delete(path, "Data", "insert", "row", positions))
+        print(f"  {'bulk_insert_delete':20s} {elapsed:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark COM connection reuse: STA worker vs thread pools.
+
+Runs the same read tool calls against the in-process fake Excel from
+tests/fake_com.py (GetActiveObject sleeps for --latency ms, standing in
+for the Running Object Table lookup and proxy marshaling, and each
+workbook/worksheet lookup for --call-latency ms) with:
+
+- legacy:     asyncio.to_thread, CoInitialize + GetActiveObject in every
+              call (what ExcelSessionManager used to do)
+- to_thread:  asyncio.to_thread with get_excel_app's per-thread cache
+- pool:       AsyncExcelEngine with a 4-thread COM pool
+- worker:     AsyncExcelEngine with the shared STA ComWorker
+
+"Lookups" counts Workbooks(name), Worksheets(name) and Workbooks.Count
+calls that reached the fake Excel; the others were served from the proxy
+registry.
+
+Usage:
+    python benchmarks/bench_com_worker.py [calls] [--latency MS] [--call-latency MS]
+        [--concurrency N]
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection  # noqa: E402
+from excellm.core.async_engine import AsyncExcelEngine  # noqa: E402
+from excellm.core.com_worker import get_com_worker  # noqa: E402
+from excellm.tools.readers import read_range_sync  # noqa: E402
+
+ROWS = 200
+
+
+def make_runtime(latency_s: float, call_latency_s: float) -> fake_com.FakeComRuntime:
+    app = fake_com.FakeExcelApp(call_latency_s=call_latency_s)
+    app.add_workbook("Book1.xlsx", {"Data": [[f"r{r}", r, r * 1.5] for r in range(ROWS)]})
+    runtime = fake_com.FakeComRuntime(app, connect_latency_s=latency_s)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return runtime
+
+
+def legacy_read(runtime: fake_com.FakeComRuntime, i: int):
+    runtime.CoInitialize()
+    app = runtime.GetActiveObject("Excel.Application")
+    row = i % ROWS + 1
+    return app.Workbooks("Book1.xlsx").Worksheets("Data").Range(f"A{row}:C{row}").Value
+
+
+async def run_calls(mode: str, runtime: fake_com.FakeComRuntime, calls: int, concurrency: int):
+    engine = None
+    if mode in ("pool", "worker"):
+        engine = AsyncExcelEngine(
+            max_workers=4, max_queue_depth=0, com_worker=mode == "worker"
+        )
+
+    def call(i: int):
+        row = i % ROWS + 1
+        args = ("Book1.xlsx", "Data", f"A{row}:C{row}")
+        if mode == "legacy":
+            return asyncio.to_thread(legacy_read, runtime, i)
+        if mode == "to_thread":
+            return asyncio.to_thread(read_range_sync, *args)
+        return engine.run(read_range_sync, *args)
+
+    for start in range(0, calls, concurrency):
+        await asyncio.gather(*(call(i) for i in range(start, min(start + concurrency, calls))))
+    if engine is not None:
+        engine.shutdown()
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    latency_ms = 5.0
+    call_latency_ms = 0.5
+    concurrency = 8
+    if "--latency" in args:
+        i = args.index("--latency")
+        latency_ms = float(args[i + 1])
+        del args[i:i + 2]
+    if "--call-latency" in args:
+        i = args.index("--call-latency")
+        call_latency_ms = float(args[i + 1])
+        del args[i:i + 2]
+    if "--concurrency" in args:
+        i = args.index("--concurrency")
+        concurrency = int(args[i + 1])
+        del args[i:i + 2]
+    calls = int(args[0]) if args else 500
+
+    print(
+        f"{calls} read calls, {concurrency} in flight, GetActiveObject {latency_ms:g} ms, "
+        f"lookups {call_latency_ms:g} ms"
+    )
+    print(
+        f"  {'mode':10s} {'time':>8s} {'GetActiveObject':>16s} {'CoInitialize':>13s} "
+        f"{'threads':>8s} {'lookups':>8s}"
+    )
+    for mode in ("legacy", "to_thread", "pool", "worker"):
+        runtime = make_runtime(latency_ms / 1000, call_latency_ms / 1000)
+        start = time.perf_counter()
+        asyncio.run(run_calls(mode, runtime, calls, concurrency))
+        elapsed = time.perf_counter() - start
+        lookups = sum(runtime.app.calls[k] for k in ("Workbooks()", "Worksheets()", "Workbooks.Count"))
+        print(
+            f"  {mode:10s} {elapsed:7.2f}s {runtime.calls['GetActiveObject']:16d} "
+            f"{runtime.calls['CoInitialize']:13d} {len(runtime.threads):8d} {lookups:8d}"
+        )
+    get_com_worker().shutdown()
+
+
+if __name__ == "__main__":
+    main()
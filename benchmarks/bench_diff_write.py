@@ -0,0 +1,79 @@
+"""Benchmark diff writes on COM ranges.
+
+Re-writes an N-row x 10-column chunk into the in-process fake Excel from
+tests/fake_com.py, where every Range.Value write costs a recalculation
+(--recalc ms) and each marshaled cell costs --marshal us. The chunk is
+written unchanged and with a handful of edited rows, with diff off, diff
+on, and diff on with performance_mode (one recalculation for all blocks).
+
+Usage:
+    python benchmarks/bench_diff_write.py [rows] [--changed N] [--recalc MS] [--marshal US]
+"""
+
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection  # noqa: E402
+from excellm.tools.writers import write_range_sync  # noqa: E402
+
+COLS = 10
+
+
+def chunk(rows: int):
+    return [[float(r * COLS + c) if c else f"id{r}" for c in range(COLS)] for r in range(rows)]
+
+
+def make_app(rows: int, recalc_s: float, marshal_s: float) -> fake_com.FakeExcelApp:
+    app = fake_com.FakeExcelApp(recalc_cost_s=recalc_s, marshal_cost_s=marshal_s)
+    app.add_workbook("Book1.xlsx", {"Data": chunk(rows)})
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return app
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    opts = {"--changed": 5.0, "--recalc": 20.0, "--marshal": 0.5}
+    for flag in opts:
+        if flag in args:
+            i = args.index(flag)
+            opts[flag] = float(args[i + 1])
+            del args[i:i + 2]
+    rows = int(args[0]) if args else 10000
+    changed = int(opts["--changed"])
+
+    print(f"{rows} rows x {COLS} columns, recalc {opts['--recalc']:g} ms, marshal {opts['--marshal']:g} us")
+    print(f"  {'chunk':14s} {'mode':10s} {'time':>8s} {'writes':>7s} {'recalcs':>8s} {'cells':>10s}")
+    for label, edits in (("unchanged", 0), (f"{changed} rows edited", changed)):
+        data = chunk(rows)
+        for r in range(edits):
+            data[r * (rows // max(edits, 1))][3] = "edited"
+        for mode, diff, performance_mode in (("full", False, False), ("diff", True, False), ("diff+perf", True, True)):
+            app = make_app(rows, opts["--recalc"] / 1000, opts["--marshal"] / 1e6)
+            start = time.perf_counter()
+            write_range_sync(
+                "Book1.xlsx", "Data", f"A1:{chr(ord('A') + COLS - 1)}{rows}", data,
+                force_overwrite=True, activate=False, max_cells=rows * COLS, diff=diff,
+                performance_mode=performance_mode,
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {label:14s} {mode:10s} {elapsed:7.2f}s {app.calls['Range.Value=']:7d} "
+                f"{app.calls['Recalculate']:8d} {app.calls['cells_marshaled']:10d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
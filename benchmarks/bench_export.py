@@ -0,0 +1,108 @@
+"""Benchmark streaming sheet export against an edit-mode openpyxl write.
+
+Adds a generated sheet of rows x 20 columns (ints, floats, strings, dates)
+to a small existing workbook, either with FileEngine.export_rows or by
+loading the workbook in edit mode, writing each cell and saving (the path
+create_pivot_table_openpyxl used to take). Each case runs in a fresh
+process so its peak RSS can be reported.
+
+Usage:
+    python benchmarks/bench_export.py [rows[,rows...]] [--skip-edit-above N]
+"""
+
+import datetime
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource  # Unix only; peak RSS is reported as 0 elsewhere
+except ImportError:
+    resource = None
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from openpyxl import Workbook, load_workbook  # noqa: E402
+
+from excellm.core.file_engine import FileEngine  # noqa: E402
+
+COLUMNS = 20
+EPOCH = datetime.datetime(2024, 1, 1)
+
+
+def generate_rows(n_rows: int):
+    for r in range(n_rows):
+        row = []
+        for c in range(COLUMNS):
+            kind = c % 4
+            if kind == 0:
+                row.append(r * COLUMNS + c)
+            elif kind == 1:
+                row.append(r * 0.5 + c)
+            elif kind == 2:
+                row.append(f"item {r % 1000}-{c}")
+            else:
+                row.append(EPOCH + datetime.timedelta(minutes=r))
+        yield row
+
+
+def make_workbook(path: str) -> None:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for r in range(100):
+        ws.append([f"row {r}", r, r * 1.5])
+    wb.save(path)
+
+
+def run_case(mode: str, path: str, n_rows: int) -> None:
+    header = [f"col{c}" for c in range(COLUMNS)]
+    start = time.perf_counter()
+    if mode == "stream":
+        FileEngine(durability="immediate").export_rows(
+            path, "Export", generate_rows(n_rows), header=header
+        )
+    else:
+        wb = load_workbook(path)
+        ws = wb.create_sheet("Export")
+        for c, value in enumerate(header, start=1):
+            ws.cell(row=1, column=c, value=value)
+        for r, values in enumerate(generate_rows(n_rows), start=2):
+            for c, value in enumerate(values, start=1):
+                ws.cell(row=r, column=c, value=value)
+        wb.save(path)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource else 0
+    print(f"{elapsed:.2f} {peak_mb:.0f} {os.path.getsize(path) / 1e6:.1f}")
+
+
+def main() -> None:
+    if len(sys.argv) == 5 and sys.argv[1] == "--case":
+        run_case(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+
+    sizes = [int(n) for n in (sys.argv[1] if len(sys.argv) > 1 else "100000,1000000").split(",")]
+    skip_edit_above = 250_000
+    if "--skip-edit-above" in sys.argv:
+        skip_edit_above = int(sys.argv[sys.argv.index("--skip-edit-above") + 1])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in sizes:
+            print(f"{n_rows} rows x {COLUMNS} cols")
+            for mode in ("edit", "stream"):
+                if mode == "edit" and n_rows > skip_edit_above:
+                    print(f"  {mode:6s} skipped (needs ~{n_rows * COLUMNS * 400 / 1e9:.0f} GB)")
+                    continue
+                path = os.path.join(tmp, f"{mode}_{n_rows}.xlsx")
+                make_workbook(path)
+                out = subprocess.run(
+                    [sys.executable, __file__, "--case", mode, path, str(n_rows)],
+                    check=True, capture_output=True, text=True,
+                ).stdout.split()
+                print(f"  {mode:6s} {float(out[0]):8.2f}s  peak RSS {out[1]:>5s} MB  file {out[2]} MB")
+
+
+if __name__ == "__main__":
+    main()
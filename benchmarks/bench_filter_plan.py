@@ -0,0 +1,109 @@
+"""Benchmark FilterEngine: interpreted filter tree, compiled plan and numpy masks.
+
+Filters N rows x 5 columns (id, name, region, amount, status) in memory
+with a handful of typical search filters. "interpreted" walks the filter
+tree with FilterEngine._matches_filter for every row; "compiled" runs the
+FilterPlan that filter_data() builds once per call (backend="python"),
+with AND/OR conditions reordered by the planner from a row sample;
+"unplanned" is the same with the planner off (plan_rows=0), so conditions
+run in the order written; "numpy" evaluates column masks (backend="numpy",
+skipped when numpy is not installed). Every method must select the same rows.
+
+Usage:
+    python benchmarks/bench_filter_plan.py [rows]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from excellm.filters import FilterEngine  # noqa: E402
+from excellm.filters_vector import NUMPY_AVAILABLE  # noqa: E402
+
+HEADERS = ["Id", "Name", "Region", "Amount", "Status"]
+REGIONS = ("North", "South", "East", "West")
+STATUSES = ("open", "closed", "pending", "void")
+
+
+def column(name):
+    return {"type": "name", "value": name}
+
+
+FILTERS = [
+    ("amount > 500", {"column": column("Amount"), "operator": ">", "value": "500"}),
+    ("region = north", {"column": column("Region"), "operator": "=", "value": "north"}),
+    ("status in [2]", {"column": column("Status"), "operator": "in", "value": ["open", "pending"]}),
+    ("regex on name", {"column": column("Name"), "operator": "regex", "value": r"item \d*7$"}),
+    ("contains, all columns", "item 99"),
+    ("amount > 500 or id < 1000", {"operator": "or", "conditions": [
+        {"column": column("Amount"), "operator": ">", "value": 500},
+        {"column": column("Id"), "operator": "<", "value": 1000},
+    ]}),
+    ("and(amount, region, not)", {"operator": "and", "conditions": [
+        {"column": column("Amount"), "operator": "between", "value": 100, "value2": 900},
+        {"column": column("Region"), "operator": "starts_with", "value": "no"},
+        {"operator": "not", "conditions": [{"column": column("Status"), "operator": "=", "value": "void"}]},
+    ]}),
+    # Written in a costly order: the planner should move the cheap condition first
+    ("and(regex all, amount >)", {"operator": "and", "conditions": [
+        {"operator": "regex", "value": r"item \d+5$"},
+        {"column": column("Amount"), "operator": ">", "value": 990},
+    ]}),
+    ("or(contains all, status =)", {"operator": "or", "conditions": [
+        {"operator": "contains", "value": "zzz"},
+        {"column": column("Status"), "operator": "=", "value": "open"},
+    ]}),
+]
+
+
+def make_rows(rows):
+    return [
+        [r, f"item {r}", REGIONS[r % 4], round((r * 7919) % 1000 + 0.5, 2), STATUSES[r % 7 % 4]]
+        for r in range(rows)
+    ]
+
+
+def interpreted(engine, rows, filters):
+    if isinstance(filters, str):
+        filters = {"operator": "contains", "value": filters}
+    parsed = engine._parse_filter_dict(filters)
+    return [i for i, row in enumerate(rows) if engine._matches_filter(row, parsed, HEADERS)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    data = make_rows(rows)
+    engine = FilterEngine(backend="python")
+    unplanned = FilterEngine(backend="python", plan_rows=0)
+    vector = FilterEngine(backend="numpy")
+
+    print(f"{rows} rows x 5 columns" + ("" if NUMPY_AVAILABLE else " (numpy not installed)"))
+    print(
+        f"  {'filter':26s} {'matches':>9s} {'interpreted':>12s} {'unplanned':>10s} "
+        f"{'compiled':>9s} {'numpy':>7s}"
+    )
+    for label, filters in FILTERS:
+        expected, slow = timed(interpreted, engine, data, filters)
+        (_, indices), written = timed(unplanned.filter_data, data, filters, HEADERS)
+        assert indices == expected
+        (_, indices), fast = timed(engine.filter_data, data, filters, HEADERS)
+        assert indices == expected
+        line = f"  {label:26s} {len(indices):9d} {slow:11.2f}s {written:9.2f}s {fast:8.2f}s"
+        if NUMPY_AVAILABLE:
+            (_, indices), masked = timed(vector.filter_data, data, filters, HEADERS)
+            assert indices == expected
+            line += f" {masked:6.2f}s" if vector.last_backend == "numpy" else f" {'-':>7s}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark find_replace: Excel's Find/FindNext loop vs in-memory matching.
+
+Builds a sheet of N rows x 5 columns in the in-process fake Excel from
+tests/fake_com.py where one cell in every --every rows matches, and runs
+find_replace with method="com" and method="memory". Every Find/FindNext
+call costs --latency ms (a COM round-trip) and every marshaled cell
+--marshal us.
+
+Usage:
+    python benchmarks/bench_find_replace.py [rows] [--every N] [--latency MS] [--marshal US]
+"""
+
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection  # noqa: E402
+from excellm.tools.range_ops import find_replace_sync  # noqa: E402
+
+
+def make_app(rows: int, every: int, latency_s: float, marshal_s: float) -> fake_com.FakeExcelApp:
+    app = fake_com.FakeExcelApp(call_latency_s=latency_s, marshal_cost_s=marshal_s)
+    data = [
+        [r, f"item {r}", "pending" if r % every == 0 else "done", r * 1.5, f"note {r % 97}"]
+        for r in range(1, rows + 1)
+    ]
+    app.add_workbook("Book1.xlsx", {"Data": data})
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return app
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    opts = {"--every": 5.0, "--latency": 0.2, "--marshal": 0.5}
+    for flag in opts:
+        if flag in args:
+            i = args.index(flag)
+            opts[flag] = float(args[i + 1])
+            del args[i:i + 2]
+    rows = int(args[0]) if args else 50000
+    every = int(opts["--every"])
+
+    print(
+        f"{rows} rows x 5 columns, {rows // every} matches, "
+        f"{opts['--latency']:g} ms per Find call, {opts['--marshal']:g} us per cell"
+    )
+    print(f"  {'method':8s} {'preview':8s} {'time':>8s} {'round-trips':>12s} {'writes':>7s} {'areas':>6s}")
+    for method in ("com", "memory"):
+        for preview_only in (True, False):
+            app = make_app(rows, every, opts["--latency"] / 1000, opts["--marshal"] / 1e6)
+            start = time.perf_counter()
+            result = find_replace_sync(
+                "Book1.xlsx", "Data", "pending", "queued",
+                match_entire_cell=True, preview_only=preview_only, method=method,
+            )
+            elapsed = time.perf_counter() - start
+            trips = app.calls["Range.Find"] + app.calls["Range.FindNext"] + app.calls["Range.Replace"]
+            areas = result["results"][0].get("match_areas", len(result["results"][0].get("match_addresses", [])))
+            print(
+                f"  {method:8s} {str(preview_only):8s} {elapsed:7.2f}s {trips:12d} "
+                f"{app.calls['Range.Value=']:7d} {areas:6d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
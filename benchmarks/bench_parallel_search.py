@@ -0,0 +1,102 @@
+"""Benchmark all-sheets search: sheet by sheet vs parallel worker processes.
+
+Builds a workbook of S sheets x N rows x 5 columns in the in-process fake
+Excel from tests/fake_com.py and searches all sheets with a few filters,
+first sequentially (search_sync(all_sheets=True)) and then with
+parallel=True, which filters each sheet's values in a process pool while
+the next sheet is read. Both runs must return the same rows. A last run
+adds max_rows to show the search stopping once enough rows are found.
+
+Usage:
+    python benchmarks/bench_parallel_search.py [rows] [--sheets S] [--workers W]
+"""
+
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection, parallel_search  # noqa: E402
+from excellm.tools.search import search_sync  # noqa: E402
+
+CITIES = ("Cairo", "Giza", "Alexandria", "Luxor", "Aswan", "Mansoura", "Tanta")
+
+SEARCHES = [
+    ("contains 'item 4242'", "item 4242"),
+    ("regex on Name", {"column": {"type": "name", "value": "Name"}, "operator": "regex",
+                       "value": r"item \d*77$"}),
+    ("or(City =, Amount >)", {"operator": "or", "conditions": [
+        {"column": {"type": "name", "value": "City"}, "operator": "=", "value": "luxor"},
+        {"column": {"type": "name", "value": "Amount"}, "operator": ">", "value": 990},
+    ]}),
+]
+
+
+def make_app(rows: int, sheets: int) -> fake_com.FakeExcelApp:
+    app = fake_com.FakeExcelApp()
+    data = [["Id", "Name", "City", "Amount", "Note"]] + [
+        [r, f"item {r}", CITIES[r % 7], (r * 7919) % 1000, f"note {r % 97}"]
+        for r in range(1, rows + 1)
+    ]
+    app.add_workbook("Book1.xlsx", {f"Sheet{s + 1}": data for s in range(sheets)})
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return app
+
+
+def comparable(result):
+    return [(r["sheet"], r["cell_locations"]) for r in result["results"]]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    opts = {"--sheets": 8.0, "--workers": float(os.cpu_count() or 1)}
+    for flag in opts:
+        if flag in args:
+            i = args.index(flag)
+            opts[flag] = float(args[i + 1])
+            del args[i:i + 2]
+    rows = int(args[0]) if args else 100000
+    sheets, workers = int(opts["--sheets"]), int(opts["--workers"])
+    parallel_search.SEARCH_WORKERS = workers
+
+    make_app(rows, sheets)
+    # Start the pool outside the timings
+    search_sync("Book1.xlsx", "warm up", all_sheets=True, parallel=True)
+
+    print(f"{sheets} sheets x {rows} rows x 5 columns, {workers} workers")
+    print(f"  {'search':24s} {'matches':>8s} {'sequential':>11s} {'parallel':>9s}")
+    for label, filters in SEARCHES:
+        plain, slow = timed(search_sync, "Book1.xlsx", filters, all_sheets=True)
+        fast_result, fast = timed(search_sync, "Book1.xlsx", filters, all_sheets=True, parallel=True)
+        assert comparable(fast_result) == comparable(plain), label
+        print(f"  {label:24s} {plain['total_rows_filtered']:8d} {slow:10.2f}s {fast:8.2f}s")
+
+    label, filters = SEARCHES[2]
+    limited, elapsed = timed(
+        search_sync, "Book1.xlsx", filters, all_sheets=True, parallel=True, max_rows=100
+    )
+    print(
+        f"  {label + ', max_rows=100':24s} {limited['total_rows_filtered']:8d} {'':11s} "
+        f"{elapsed:8.2f}s  ({limited['sheets_searched']} sheet(s) searched)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark partial saves against full openpyxl saves.
+
+Writes 20 cells on one sheet of a multi-sheet workbook through FileEngine
+and times the save with partial saving on and off.
+
+Usage:
+    python benchmarks/bench_partial_save.py [sheets] [rows_per_sheet]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from openpyxl import Workbook  # noqa: E402
+
+from excellm.core.file_engine import FileEngine  # noqa: E402
+
+
+def make_workbook(path: str, sheets: int, rows: int) -> None:
+    wb = Workbook(write_only=True)
+    for s in range(sheets):
+        ws = wb.create_sheet(f"Report{s}")
+        for r in range(rows):
+            ws.append([f"item {r % 97}", r, r * 0.25, f"region {r % 5}", r * 3])
+    wb.save(path)
+
+
+def timed_save(path: str, partial: bool) -> float:
+    engine = FileEngine(durability="deferred", flush_interval_ms=0, flush_every=0,
+                        partial_save=partial)
+    engine.write_range(path, "Report7", "B2", [[i] for i in range(20)])
+    start = time.perf_counter()
+    engine.flush(path)
+    elapsed = time.perf_counter() - start
+    assert engine.list_workbooks()[0]["last_save"] == ("partial" if partial else "full")
+    return elapsed
+
+
+def main() -> None:
+    sheets = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        original = os.path.join(tmp, "original.xlsx")
+        make_workbook(original, sheets, rows)
+        print(f"{sheets} sheets x {rows} rows x 5 cols ({os.path.getsize(original) / 1e6:.1f} MB)")
+
+        for partial in (False, True):
+            path = os.path.join(tmp, f"copy_{partial}.xlsx")
+            shutil.copy(original, path)
+            label = "partial save" if partial else "full save"
+            print(f"  {label:12s} {timed_save(path, partial):7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark performance mode on bulk COM operations.
+
+Runs insert_sync (one Rows("2:N").Insert() call) and a batch of single-cell
+writes against the in-process fake Excel from tests/fake_com.py, where
+every mutation costs a recalculation (--recalc ms) in automatic
+calculation mode, a repaint (--repaint ms) while ScreenUpdating is on and
+a SheetChange event (--event ms) while EnableEvents is on, with
+performance_mode off and on.
+
+Usage:
+    python benchmarks/bench_performance_mode.py [count] [--recalc MS] [--repaint MS] [--event MS]
+"""
+
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection  # noqa: E402
+from excellm.tools.batch import execute_batch_sync  # noqa: E402
+from excellm.tools.sheet_mgmt import insert_sync  # noqa: E402
+
+
+def make_app(recalc_s: float, repaint_s: float, event_s: float) -> fake_com.FakeExcelApp:
+    app = fake_com.FakeExcelApp(recalc_cost_s=recalc_s, repaint_cost_s=repaint_s, event_cost_s=event_s)
+    app.add_workbook("Book1.xlsx", {"Data": [[f"r{r}", r] for r in range(1, 101)]})
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return app
+
+
+def run_insert(count: int, performance_mode: bool) -> None:
+    insert_sync("Book1.xlsx", "Data", "row", "2", count=count, performance_mode=performance_mode)
+
+
+def run_batch(count: int, performance_mode: bool) -> None:
+    operations = [
+        {"op": "write", "sheet": "Data", "range": f"C{row}", "data": [[row]]}
+        for row in range(1, count + 1)
+    ]
+    execute_batch_sync("Book1.xlsx", operations, performance_mode=performance_mode)
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    costs = {"--recalc": 2.0, "--repaint": 0.5, "--event": 0.2}
+    for flag in costs:
+        if flag in args:
+            i = args.index(flag)
+            costs[flag] = float(args[i + 1])
+            del args[i:i + 2]
+    count = int(args[0]) if args else 200
+
+    print(
+        f"{count} mutations, recalc {costs['--recalc']:g} ms, repaint {costs['--repaint']:g} ms, "
+        f"event {costs['--event']:g} ms"
+    )
+    print(f"  {'operation':10s} {'mode':5s} {'time':>8s} {'recalcs':>8s} {'repaints':>9s} {'events':>7s}")
+    for name, run in (("insert", run_insert), ("batch", run_batch)):
+        for performance_mode in (False, True):
+            app = make_app(*(ms / 1000 for ms in costs.values()))
+            start = time.perf_counter()
+            run(count, performance_mode)
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {name:10s} {'on' if performance_mode else 'off':5s} {elapsed:7.2f}s "
+                f"{app.calls['Recalculate']:8d} {app.calls['Repaint']:9d} {app.calls['SheetChange']:7d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark formula retrieval strategies of the read tool.
+
+Reads a 10-column sheet through read_range_sync against the in-process
+fake Excel from tests/fake_com.py, where every cell marshaled by a Value
+or Formula read costs --marshal microseconds, with include_formulas
+"always" (the previous behavior: Value plus the full Formula array),
+"auto" and "never". Sheets:
+
+- data:   plain values only
+- column: values plus one formula column (a single formula area)
+
+Usage:
+    python benchmarks/bench_read_formulas.py [rows] [--marshal US]
+"""
+
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection  # noqa: E402
+from excellm.tools.readers import read_range_sync  # noqa: E402
+
+COLS = 10
+
+
+def make_app(rows: int, formula_column: bool, marshal_s: float) -> fake_com.FakeExcelApp:
+    app = fake_com.FakeExcelApp(marshal_cost_s=marshal_s)
+    book = app.add_workbook("Book1.xlsx", {"Data": [[r * c for c in range(1, COLS + 1)] for r in range(1, rows + 1)]})
+    if formula_column:
+        sheet = book.Worksheets("Data")
+        for r in range(1, rows + 1):
+            sheet._store(r, COLS, f"=A{r}*{COLS}")
+            sheet.formula_results[(r, COLS)] = r * COLS
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return app
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    marshal_us = 2.0
+    if "--marshal" in args:
+        i = args.index("--marshal")
+        marshal_us = float(args[i + 1])
+        del args[i:i + 2]
+    rows = int(args[0]) if args else 50000
+
+    print(f"{rows} rows x {COLS} columns, {marshal_us:g} us per marshaled cell")
+    print(f"  {'sheet':7s} {'mode':7s} {'time':>8s} {'cells marshaled':>16s} {'formula read':>13s}")
+    last_col = fake_com._column_letters(COLS)
+    for sheet, formula_column in (("data", False), ("column", True)):
+        for mode in ("always", "auto", "never"):
+            app = make_app(rows, formula_column, marshal_us / 1e6)
+            start = time.perf_counter()
+            result = read_range_sync("Book1.xlsx", "Data", f"A1:{last_col}{rows}", include_formulas=mode)
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {sheet:7s} {mode:7s} {elapsed:7.2f}s {app.calls['cells_marshaled']:16d} "
+                f"{result['formula_read']:>13s}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark repeated searches of one sheet with and without use_index.
+
+Builds a sheet of N rows x 5 columns (id, name, city, amount, status) in the
+in-process fake Excel from tests/fake_com.py and runs the same sequence of
+different search terms against it, first as plain searches (read the range,
+test every row), then with use_index=True (the first search reads the range
+and builds the index; the rest reuse it and only test candidate rows).
+--marshal adds a simulated cost per cell read from Excel, in microseconds.
+Both runs must return the same matches.
+
+Usage:
+    python benchmarks/bench_search_index.py [rows] [--marshal US]
+"""
+
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection  # noqa: E402
+from excellm.core.search_index import clear_indexes  # noqa: E402
+from excellm.tools.search import search_sync  # noqa: E402
+
+CITIES = ("Cairo", "Giza", "Alexandria", "Luxor", "Aswan", "Mansoura", "Tanta")
+STATUSES = ("open", "closed", "pending")
+
+
+def column(name):
+    return {"type": "name", "value": name}
+
+
+SEARCHES = [
+    ("contains 'item 4242'", "item 4242"),
+    ("contains 'alexandria'", "alexandria"),
+    ("City = 'luxor'", {"column": column("City"), "operator": "=", "value": "luxor"}),
+    ("Name starts_with 'item 99'", {"column": column("Name"), "operator": "starts_with", "value": "item 99"}),
+    ("Status in [closed]", {"column": column("Status"), "operator": "in", "value": ["closed"]}),
+    ("and(City =, Amount >)", {"operator": "and", "conditions": [
+        {"column": column("City"), "operator": "=", "value": "aswan"},
+        {"column": column("Amount"), "operator": ">", "value": 900},
+    ]}),
+    ("contains 'no such value'", "no such value"),
+]
+
+
+def make_app(rows: int, marshal_us: float) -> fake_com.FakeExcelApp:
+    app = fake_com.FakeExcelApp()
+    app.marshal_cost_s = marshal_us / 1e6
+    data = [["Id", "Name", "City", "Amount", "Status"]] + [
+        [r, f"item {r}", CITIES[r % 7], (r * 7919) % 1000, STATUSES[r % 3]]
+        for r in range(1, rows + 1)
+    ]
+    app.add_workbook("Book1.xlsx", {"Data": data})
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return app
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    marshal_us = 0.0
+    if "--marshal" in args:
+        i = args.index("--marshal")
+        marshal_us = float(args[i + 1])
+        del args[i:i + 2]
+    rows = int(args[0]) if args else 200000
+
+    make_app(rows, marshal_us)
+    clear_indexes()
+    print(f"{rows} rows x 5 columns, {marshal_us:g} us marshal cost per cell")
+    print(f"  {'search':28s} {'matches':>8s} {'plain':>8s} {'indexed':>8s} {'candidates':>11s}")
+    totals = [0.0, 0.0]
+    for label, filters in SEARCHES:
+        start = time.perf_counter()
+        plain = search_sync("Book1.xlsx", filters, "Data")
+        plain_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = search_sync("Book1.xlsx", filters, "Data", use_index=True)
+        indexed_s = time.perf_counter() - start
+
+        info = indexed.pop("search_index")
+        assert indexed == plain, label
+        totals[0] += plain_s
+        totals[1] += indexed_s
+        print(
+            f"  {label:28s} {plain['rows_filtered']:8d} {plain_s:7.2f}s {indexed_s:7.2f}s "
+            f"{info['candidate_rows']:11d}{'  (built)' if info['status'] == 'built' else ''}"
+        )
+    print(f"  {'total':28s} {'':8s} {totals[0]:7.2f}s {totals[1]:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
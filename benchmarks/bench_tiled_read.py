@@ -0,0 +1,79 @@
+"""Benchmark tiled COM range reads.
+
+Builds a sheet of N rows x 30 numeric columns in the in-process fake Excel
+from tests/fake_com.py and scans it:
+
+- one-shot:  rng.Value for the whole range (what read_range_sync did)
+- tiled:     iter_range_tiles, rows consumed and dropped tile by tile
+- head:      the first 100 rows, one-shot then sliced vs max_rows=100
+
+Peak memory is measured with tracemalloc after the sheet is built, so it
+covers the marshaled values only.
+
+Usage:
+    python benchmarks/bench_tiled_read.py [rows] [--tile-cells N]
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection  # noqa: E402
+from excellm.core.connection import COM_READ_TILE_CELLS, iter_range_tiles  # noqa: E402
+
+COLS = 30
+
+
+def make_range(rows: int):
+    app = fake_com.FakeExcelApp()
+    book = app.add_workbook("Big.xlsx", {"Data": [[r * COLS + c for c in range(COLS)] for r in range(rows)]})
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return book.Worksheets("Data").UsedRange
+
+
+def measure(label: str, func) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:22s} {elapsed:7.2f}s {peak / 1e6:9.1f} MB {rows:9d}")
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    tile_cells = COM_READ_TILE_CELLS
+    if "--tile-cells" in args:
+        i = args.index("--tile-cells")
+        tile_cells = int(args[i + 1])
+        del args[i:i + 2]
+    rows = int(args[0]) if args else 200000
+
+    rng = make_range(rows)
+    print(f"{rows} rows x {COLS} columns, {tile_cells} cells per tile")
+    print(f"  {'read':22s} {'time':>8s} {'peak':>12s} {'rows':>9s}")
+    measure("full, one-shot", lambda: len(rng.Value))
+    measure("full, tiled", lambda: sum(len(tile) for tile in iter_range_tiles(rng, tile_cells=tile_cells)))
+    measure("100 rows, one-shot", lambda: len(rng.Value[:100]))
+    measure(
+        "100 rows, max_rows",
+        lambda: sum(len(tile) for tile in iter_range_tiles(rng, max_rows=100, tile_cells=tile_cells)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark get_unique_values on a high-cardinality column: exact vs sketches.
+
+Builds a sheet of N rows in the in-process fake Excel from tests/fake_com.py
+with an id column (every value distinct) and a status column (a few
+frequent values plus a long tail), then profiles both columns with
+by_column=True:
+
+- exact, all values: the whole distinct set is counted and returned
+- exact, top_k: counted exactly, only the top values returned
+- sketch, top_k: past --exact distinct values the profile switches to a
+  heavy-hitters table and a HyperLogLog estimate
+
+Peak memory is the tracemalloc peak of the call (the sheet itself is
+allocated before tracing starts); "response" is the JSON size of the result.
+
+Usage:
+    python benchmarks/bench_unique_values.py [rows] [--top-k K] [--exact N]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import fake_com  # noqa: E402
+
+fake_com.install()  # Always use the fake, even where pywin32 is installed
+
+from excellm.core import connection  # noqa: E402
+from excellm.tools import readers  # noqa: E402
+
+
+def make_app(rows: int) -> fake_com.FakeExcelApp:
+    app = fake_com.FakeExcelApp()
+    statuses = ("open", "closed", "pending")
+    data = [
+        [f"id-{r}", statuses[r % 3] if r % 10 else f"custom-{r % 5000}"]
+        for r in range(rows)
+    ]
+    app.add_workbook("Book1.xlsx", {"Data": data})
+    runtime = fake_com.FakeComRuntime(app)
+    connection.pythoncom = runtime.pythoncom
+    connection.win32 = runtime.client
+    connection._thread_local = threading.local()
+    return app
+
+
+def main() -> None:
+    args = list(sys.argv[1:])
+    opts = {"--top-k": 10.0, "--exact": 100000.0}
+    for flag in opts:
+        if flag in args:
+            i = args.index(flag)
+            opts[flag] = float(args[i + 1])
+            del args[i:i + 2]
+    rows = int(args[0]) if args else 1000000
+    top_k, exact = int(opts["--top-k"]), int(opts["--exact"])
+
+    make_app(rows)
+    print(f"{rows} rows x 2 columns (ids all distinct), top_k={top_k}, exact limit {exact}")
+    print(f"  {'mode':18s} {'time':>8s} {'peak MB':>8s} {'response':>10s} {'ids':>9s} {'approx':>7s}")
+    for label, limit, k in (
+        ("exact, all values", rows + 1, None),
+        ("exact, top_k", rows + 1, top_k),
+        ("sketch, top_k", exact, top_k),
+    ):
+        readers.UNIQUE_MAX_EXACT_VALUES = limit
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = readers.get_unique_values_sync("Book1.xlsx", "Data", by_column=True, top_k=k)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        size = len(json.dumps(result, default=str))
+        ids = result["columns"][0]
+        print(
+            f"  {label:18s} {elapsed:7.2f}s {peak / 1e6:8.1f} {size / 1e3:8.1f}kB "
+            f"{ids['unique_count']:9d} {str(ids['approximate']):>7s}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark the streaming XlsxReader against openpyxl read-only iter_rows.
+
+For each sheet size, times three reads:
+- a 100-row page at the top of the sheet
+- a 100-row page in the middle
+- the whole sheet
+
+Usage:
+    python benchmarks/bench_xlsx_reader.py [rows[,rows...]] [cols]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from openpyxl import Workbook, load_workbook  # noqa: E402
+
+from excellm.core.xlsx_reader import XlsxReader  # noqa: E402
+
+REGIONS = ["North", "South", "East", "West"]
+
+
+def make_workbook(path: str, rows: int, cols: int) -> None:
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Data")
+    for r in range(rows):
+        ws.append([
+            r * cols + c if c % 3 == 0 else (r + c) * 0.5 if c % 3 == 1 else REGIONS[(r + c) % 4]
+            for c in range(cols)
+        ])
+    wb.save(path)
+
+
+def time_openpyxl(path: str, bounds) -> float:
+    min_row, max_row, min_col, max_col = bounds
+    start = time.perf_counter()
+    wb = load_workbook(path, read_only=True)
+    for _ in wb["Data"].iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True
+    ):
+        pass
+    wb.close()
+    return time.perf_counter() - start
+
+
+def time_reader(path: str, bounds) -> float:
+    start = time.perf_counter()
+    reader = XlsxReader(path)
+    for _ in reader.iter_rows("Data", *bounds):
+        pass
+    reader.close()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    sizes = [int(n) for n in (sys.argv[1] if len(sys.argv) > 1 else "100000,1000000").split(",")]
+    cols = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = os.path.join(tmp, f"bench_{rows}.xlsx")
+            make_workbook(path, rows, cols)
+            print(f"{rows} rows x {cols} cols")
+
+            cases = {
+                "top page (100 rows)": (1, 100, 1, cols),
+                "middle page (100 rows)": (rows // 2, rows // 2 + 99, 1, cols),
+                "full sheet": (1, rows, 1, cols),
+            }
+            for label, bounds in cases.items():
+                baseline = time_openpyxl(path, bounds)
+                streamed = time_reader(path, bounds)
+                print(
+                    f"  {label:24s} iter_rows {baseline:8.3f}s  "
+                    f"XlsxReader {streamed:8.3f}s  ({baseline / streamed:5.1f}x)"
+                )
+
+
+if __name__ == "__main__":
+    main()
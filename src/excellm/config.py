@@ -28,3 +28,83 @@ MAX_CELLS_LIMIT = int(os.getenv("EXCELLM_MAX_CELLS", "250"))
 
 # Session expiry time in hours
 SESSION_EXPIRY_HOURS = int(os.getenv("EXCELLM_SESSION_EXPIRY_HOURS", "1"))
+
+
+# =============================================================================
+# FILE ENGINE SETTINGS
+# =============================================================================
+
+# Save durability for file-mode writes:
+#   "immediate" - save the workbook after every write (default)
+#   "deferred"  - mark the workbook dirty and save on the flush policy below
+FILE_DURABILITY = os.getenv("EXCELLM_FILE_DURABILITY", "immediate").lower()
+
+# Deferred mode: flush at most this many milliseconds after the first unsaved write
+# (0 disables the timer; workbooks are then flushed by write count, flush() or shutdown)
+FILE_FLUSH_INTERVAL_MS = int(os.getenv("EXCELLM_FILE_FLUSH_INTERVAL_MS", "2000"))
+
+# Deferred mode: flush once this many writes are pending (0 disables)
+FILE_FLUSH_EVERY_WRITES = int(os.getenv("EXCELLM_FILE_FLUSH_EVERY_WRITES", "50"))
+
+# Memory budget (MB) for workbooks cached by the file engine (0 = unbounded)
+FILE_CACHE_MAX_MB = int(os.getenv("EXCELLM_FILE_CACHE_MAX_MB", "1024"))
+
+# Serve file-mode reads from columnar sheet snapshots built once per workbook version
+FILE_SNAPSHOTS = os.getenv("EXCELLM_FILE_SNAPSHOTS", "").lower() in ("true", "1", "yes")
+
+# Save only the sheets that changed, copying the rest of the .xlsx package as-is
+FILE_PARTIAL_SAVE = os.getenv("EXCELLM_FILE_PARTIAL_SAVE", "").lower() in ("true", "1", "yes")
+
+
+# =============================================================================
+# TOOL DISPATCH SETTINGS
+# =============================================================================
+
+# Worker threads per engine executor (COM and file calls get separate pools)
+ASYNC_MAX_WORKERS = int(os.getenv("EXCELLM_ASYNC_MAX_WORKERS", "4"))
+
+# Calls allowed to be queued or running per engine before new ones are rejected
+ASYNC_MAX_QUEUE_DEPTH = int(os.getenv("EXCELLM_ASYNC_MAX_QUEUE_DEPTH", "64"))
+
+# Calls allowed to run at the same time against one workbook
+ASYNC_WORKBOOK_CONCURRENCY = int(os.getenv("EXCELLM_ASYNC_WORKBOOK_CONCURRENCY", "1"))
+
+# Seconds a tool call may spend queued plus running before it times out
+# (0 = no timeout); execute_vba uses its own timeout argument instead
+ASYNC_TIMEOUT_S = float(os.getenv("EXCELLM_ASYNC_TIMEOUT_S", "300"))
+
+# Run COM calls on one long-lived STA thread that owns the Excel connection
+# (false = a pool of ASYNC_MAX_WORKERS threads, each connecting on its own)
+COM_WORKER = os.getenv("EXCELLM_COM_WORKER", "true").lower() in ("true", "1", "yes")
+
+# Seconds a cached Excel connection, workbook or worksheet proxy is trusted
+# before it is looked up again (0 = until invalidated by an event or failure)
+COM_REGISTRY_TTL_S = float(os.getenv("EXCELLM_COM_REGISTRY_TTL_S", "10"))
+
+# Cells fetched per COM call when large ranges are read in row tiles
+# (tile height = this divided by the column count)
+COM_READ_TILE_CELLS = int(os.getenv("EXCELLM_COM_READ_TILE_CELLS", "65536"))
+
+# Largest range find_replace(method="auto") matches in memory; bigger ranges
+# use Excel's own Find/Replace
+FIND_REPLACE_MAX_CELLS = int(os.getenv("EXCELLM_FIND_REPLACE_MAX_CELLS", "5000000"))
+
+# Distinct values get_unique_values counts exactly per profile; past this it
+# keeps a heavy-hitters sketch and a HyperLogLog distinct estimate instead
+UNIQUE_MAX_EXACT_VALUES = int(os.getenv("EXCELLM_UNIQUE_MAX_EXACT_VALUES", "100000"))
+
+# Filter evaluation for search: "python" (compiled row matchers), "numpy"
+# (column masks, needs numpy) or "auto" (numpy when installed and the data
+# is large enough for it to pay off)
+FILTER_BACKEND = os.getenv("EXCELLM_FILTER_BACKEND", "auto").lower()
+
+# Rows sampled per search to order AND/OR conditions by cost and match rate
+# (0 = evaluate conditions in the order they were written)
+FILTER_PLAN_SAMPLE_ROWS = int(os.getenv("EXCELLM_FILTER_PLAN_SAMPLE_ROWS", "256"))
+
+# Total cells search indexes (search with use_index) may hold across sheets;
+# least recently used indexes are dropped past this, larger ranges are not indexed
+SEARCH_INDEX_MAX_CELLS = int(os.getenv("EXCELLM_SEARCH_INDEX_MAX_CELLS", "5000000"))
+
+# Worker processes for parallel all-sheets search (0 = one per CPU)
+SEARCH_WORKERS = int(os.getenv("EXCELLM_SEARCH_WORKERS", "0"))
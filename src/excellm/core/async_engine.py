@@ -0,0 +1,452 @@
+"""Async dispatch of blocking engine calls onto bounded executors.
+
+Every tool call used to go through asyncio.to_thread, so COM and openpyxl
+work shared Python's default executor with no limit per workbook.
+AsyncExcelEngine instead gives each engine ("COM", "File") its own
+thread pool and:
+
+- runs at most ``workbook_concurrency`` calls against one workbook at a
+  time (later calls wait their turn without holding a worker thread)
+- rejects new calls with ENGINE_BUSY once ``max_queue_depth`` calls are
+  waiting or running on an engine
+- fails calls with TIMEOUT after ``timeout_s`` seconds of waiting plus
+  running; a call that has not started yet is cancelled, one that is
+  running keeps its workbook slot until it returns
+- counts completed, failed, rejected and timed-out calls, queue wait and
+  run time, and pool saturation for metrics()
+- breaks latency down per tool function, including how many Excel
+  lookups of COM calls were served from the proxy registry
+
+With ``com_worker`` enabled (the default) the COM lane is the shared
+ComWorker thread that owns the Excel connection instead of a pool. Tool
+calls on a workbook file path run on the File lane (see workbook_lane), so
+file-mode work does not wait behind COM calls.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config import (
+    ASYNC_MAX_QUEUE_DEPTH,
+    ASYNC_MAX_WORKERS,
+    ASYNC_TIMEOUT_S,
+    ASYNC_WORKBOOK_CONCURRENCY,
+    COM_WORKER,
+)
+from .engine import ExcelEngine
+from .errors import ErrorCodes, ToolError
+from .utils import is_workbook_file
+
+# Executor lanes, named after ExcelEngine.engine_name
+COM_LANE = "COM"
+FILE_LANE = "File"
+
+
+class _Lane:
+    """Executor of one engine and its counters."""
+
+    def __init__(self, name: str, max_workers: int, executor: Optional[Executor] = None):
+        self.name = name
+        self.max_workers = max_workers
+        self.owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"excellm-{name.lower()}"
+        )
+        self.pending = 0  # Admitted and not finished: waiting, queued or running
+        self.running = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_s = 0.0
+        self.run_s = 0.0
+
+
+class _ToolStats:
+    """Latency breakdown of one tool function."""
+
+    def __init__(self, lane: str):
+        self.lane = lane
+        self.calls = 0
+        self.failed = 0
+        self.wait_s = 0.0
+        self.run_s = 0.0
+        self.served_from_registry = 0
+        self.com_lookups = 0
+
+
+class _WorkbookSlot:
+    """Concurrency limit for one workbook, dropped when no call uses it."""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.users = 0
+
+
+def workbook_key(workbook: str) -> str:
+    """Normalize a workbook name or path so both spellings share a slot."""
+    if "/" in workbook or "\\" in workbook:
+        return os.path.normcase(os.path.abspath(workbook))
+    return workbook.lower()
+
+
+def workbook_lane(workbook: Optional[str]) -> str:
+    """Lane for a call on workbook: File for a workbook file path, else COM.
+
+    Only for tools that fall back to the file engine when the workbook is
+    not open in Excel; their file-mode calls then never queue behind COM.
+    """
+    return FILE_LANE if workbook and is_workbook_file(workbook) else COM_LANE
+
+
+class AsyncExcelEngine:
+    """Async facade that runs blocking engine calls on bounded executors."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+        workbook_concurrency: Optional[int] = None,
+        timeout_s: Optional[float] = None,
+        com_worker: Optional[bool] = None,
+    ):
+        """
+        Args:
+            max_workers: Threads per engine executor.
+                Defaults to EXCELLM_ASYNC_MAX_WORKERS.
+            max_queue_depth: Waiting + running calls per engine before new
+                calls are rejected (0 = unlimited).
+                Defaults to EXCELLM_ASYNC_MAX_QUEUE_DEPTH.
+            workbook_concurrency: Calls that may run at once on one workbook.
+                Defaults to EXCELLM_ASYNC_WORKBOOK_CONCURRENCY.
+            timeout_s: Default per-call timeout in seconds (0 = none).
+                Defaults to EXCELLM_ASYNC_TIMEOUT_S.
+            com_worker: Run COM calls on one dedicated STA thread instead of
+                a pool. Defaults to EXCELLM_COM_WORKER.
+        """
+        self.max_workers = max(1, ASYNC_MAX_WORKERS if max_workers is None else max_workers)
+        self.max_queue_depth = (
+            ASYNC_MAX_QUEUE_DEPTH if max_queue_depth is None else max_queue_depth
+        )
+        self.workbook_concurrency = max(1, (
+            ASYNC_WORKBOOK_CONCURRENCY if workbook_concurrency is None else workbook_concurrency
+        ))
+        self.timeout_s = ASYNC_TIMEOUT_S if timeout_s is None else timeout_s
+        self.com_worker = COM_WORKER if com_worker is None else com_worker
+
+        self._lanes: Dict[str, _Lane] = {}
+        self._slots: Dict[tuple, _WorkbookSlot] = {}
+        self._tools: Dict[str, _ToolStats] = {}
+        self._lock = threading.Lock()
+
+    def _lane(self, name: str) -> _Lane:
+        with self._lock:
+            lane = self._lanes.get(name)
+            if lane is None:
+                if name == COM_LANE and self.com_worker:
+                    from .com_worker import get_com_worker
+                    lane = _Lane(name, 1, get_com_worker())
+                else:
+                    lane = _Lane(name, self.max_workers)
+                self._lanes[name] = lane
+            return lane
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        workbook: Optional[str] = None,
+        lane: str = COM_LANE,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run func(*args, **kwargs) on an engine's executor.
+
+        Args:
+            func: Blocking callable
+            workbook: Workbook the call touches (None = no per-workbook limit)
+            lane: Engine executor to use ("COM" or "File")
+            timeout: Seconds to wait for the result, including time queued
+                for the engine and the workbook (None = engine default,
+                0 = no timeout)
+
+        Raises:
+            ToolError: ENGINE_BUSY if the engine's queue is full, TIMEOUT if
+                the call did not finish in time, or whatever func raises
+        """
+        state = self._lane(lane)
+        with self._lock:
+            if self.max_queue_depth and state.pending >= self.max_queue_depth:
+                state.rejected += 1
+                raise ToolError(
+                    f"{lane} engine is busy ({state.pending} calls waiting or running). "
+                    "Retry shortly.",
+                    code=ErrorCodes.ENGINE_BUSY
+                )
+            state.pending += 1
+            state.peak_pending = max(state.peak_pending, state.pending)
+
+        timeout = self.timeout_s if timeout is None else timeout
+        call = self._dispatch(state, workbook, func, args, kwargs)
+        try:
+            return await asyncio.wait_for(call, timeout or None)
+        except asyncio.TimeoutError:
+            with self._lock:
+                state.timed_out += 1
+            raise ToolError(
+                f"{getattr(func, '__name__', 'Call')} timed out after {timeout:g}s",
+                code=ErrorCodes.TIMEOUT
+            )
+
+    async def _dispatch(
+        self,
+        state: _Lane,
+        workbook: Optional[str],
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Wait for the workbook slot, then run the call on the lane's pool."""
+        admitted = time.perf_counter()
+        key = (state.name, workbook_key(workbook)) if workbook else None
+        slot = None
+        acquired = submitted = False
+        try:
+            if key is not None:
+                with self._lock:
+                    slot = self._slots.get(key)
+                    if slot is None:
+                        slot = self._slots[key] = _WorkbookSlot(self.workbook_concurrency)
+                    slot.users += 1
+                await slot.semaphore.acquire()
+                acquired = True
+
+            future = state.executor.submit(
+                functools.partial(self._call, state, admitted, func, args, kwargs)
+            )
+            submitted = True
+            loop = asyncio.get_running_loop()
+            future.add_done_callback(
+                lambda _: self._finish_threadsafe(loop, state, key, slot, acquired)
+            )
+            return await asyncio.wrap_future(future)
+        finally:
+            if not submitted:
+                self._finish(state, key, slot, acquired)
+
+    def _call(
+        self,
+        state: _Lane,
+        admitted: float,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Worker-thread side of a call: run it and record timings."""
+        started = time.perf_counter()
+        with self._lock:
+            state.running += 1
+            state.wait_s += started - admitted
+        com = None
+        if state.name == COM_LANE:
+            from . import connection as com
+            counts_before = com.thread_connection_counts()
+        ok = False
+        try:
+            result = func(*args, **kwargs)
+            ok = True
+            return result
+        except BaseException as exc:
+            if com is not None and state.owns_executor:
+                com.invalidate_on_failure(exc)  # The COM worker does this itself
+            raise
+        finally:
+            run_s = time.perf_counter() - started
+            lookups = None
+            if com is not None:
+                lookups = com.registry_breakdown(counts_before, com.thread_connection_counts())
+            name = getattr(func, "__name__", "call")
+            with self._lock:
+                state.running -= 1
+                state.run_s += run_s
+                if ok:
+                    state.completed += 1
+                else:
+                    state.failed += 1
+                tool = self._tools.get(name)
+                if tool is None:
+                    tool = self._tools[name] = _ToolStats(state.name)
+                tool.calls += 1
+                tool.failed += not ok
+                tool.wait_s += started - admitted
+                tool.run_s += run_s
+                if lookups is not None:
+                    tool.served_from_registry += lookups["served_from_registry"]
+                    tool.com_lookups += lookups["com_lookups"]
+
+    def _finish_threadsafe(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        state: _Lane,
+        key: Optional[tuple],
+        slot: Optional[_WorkbookSlot],
+        acquired: bool,
+    ) -> None:
+        # Semaphores belong to the event loop; release them on its thread
+        try:
+            loop.call_soon_threadsafe(self._finish, state, key, slot, acquired)
+        except RuntimeError:
+            self._finish(state, key, slot, False)  # Loop already closed
+
+    def _finish(
+        self,
+        state: _Lane,
+        key: Optional[tuple],
+        slot: Optional[_WorkbookSlot],
+        acquired: bool,
+    ) -> None:
+        """Release the workbook slot and the queue position of a finished call."""
+        if acquired:
+            slot.semaphore.release()
+        with self._lock:
+            state.pending -= 1
+            if slot is not None:
+                slot.users -= 1
+                if slot.users == 0 and self._slots.get(key) is slot:
+                    del self._slots[key]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return per-engine executor saturation and call counters."""
+        with self._lock:
+            engines = {}
+            for name, state in self._lanes.items():
+                finished = state.completed + state.failed
+                engines[name] = {
+                    "max_workers": state.max_workers,
+                    "running": state.running,
+                    "queued": state.pending - state.running,
+                    "saturation": round(state.running / state.max_workers, 2),
+                    "peak_pending": state.peak_pending,
+                    "completed": state.completed,
+                    "failed": state.failed,
+                    "rejected": state.rejected,
+                    "timed_out": state.timed_out,
+                    "avg_wait_ms": round(state.wait_s / finished * 1000, 2) if finished else 0.0,
+                    "avg_run_ms": round(state.run_s / finished * 1000, 2) if finished else 0.0,
+                }
+                if hasattr(state.executor, "stats"):
+                    engines[name]["worker"] = state.executor.stats()
+
+            tools = {
+                name: {
+                    "engine": tool.lane,
+                    "calls": tool.calls,
+                    "failed": tool.failed,
+                    "avg_wait_ms": round(tool.wait_s / tool.calls * 1000, 2),
+                    "avg_run_ms": round(tool.run_s / tool.calls * 1000, 2),
+                    "served_from_registry": tool.served_from_registry,
+                    "com_lookups": tool.com_lookups,
+                }
+                for name, tool in self._tools.items()
+            }
+
+            metrics = {
+                "engines": engines,
+                "tools": tools,
+                "workbooks_in_use": {key[1]: slot.users for key, slot in self._slots.items()},
+                "max_queue_depth": self.max_queue_depth,
+                "workbook_concurrency": self.workbook_concurrency,
+                "timeout_s": self.timeout_s,
+                "com_worker": self.com_worker,
+            }
+        if COM_LANE in engines:
+            from .connection import connection_stats
+            metrics["com_connection"] = connection_stats()
+        return metrics
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all executors (queued calls that have not started are cancelled).
+
+        The shared COM worker outlives the engine and keeps running.
+        """
+        with self._lock:
+            lanes = list(self._lanes.values())
+            self._lanes.clear()
+        for state in lanes:
+            if state.owns_executor:
+                state.executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ExcelEngine facade: each call runs on the engine's own executor
+
+    async def read_range(
+        self, engine: ExcelEngine, workbook_path: str, sheet_name: str, range_ref: str,
+    ) -> List[List[Any]]:
+        return await self._engine_call(engine, "read_range", workbook_path, sheet_name, range_ref)
+
+    async def write_range(
+        self,
+        engine: ExcelEngine,
+        workbook_path: str,
+        sheet_name: str,
+        range_ref: str,
+        data: List[List[Any]],
+    ) -> Dict[str, Any]:
+        return await self._engine_call(
+            engine, "write_range", workbook_path, sheet_name, range_ref, data
+        )
+
+    async def get_sheet_names(self, engine: ExcelEngine, workbook_path: str) -> List[str]:
+        return await self._engine_call(engine, "get_sheet_names", workbook_path)
+
+    async def create_sheet(
+        self, engine: ExcelEngine, workbook_path: str, sheet_name: str,
+    ) -> Dict[str, Any]:
+        return await self._engine_call(engine, "create_sheet", workbook_path, sheet_name)
+
+    async def delete_sheet(
+        self, engine: ExcelEngine, workbook_path: str, sheet_name: str,
+    ) -> Dict[str, Any]:
+        return await self._engine_call(engine, "delete_sheet", workbook_path, sheet_name)
+
+    async def bulk_insert_delete(
+        self,
+        engine: ExcelEngine,
+        workbook_path: str,
+        sheet_name: str,
+        action: str,
+        line_type: str,
+        positions: List[Any],
+    ) -> Dict[str, Any]:
+        return await self._engine_call(
+            engine, "bulk_insert_delete", workbook_path, sheet_name, action, line_type, positions
+        )
+
+    async def execute_batch(
+        self,
+        engine: ExcelEngine,
+        workbook_path: str,
+        ops: List[Dict[str, Any]],
+        stop_on_error: bool = True,
+    ) -> Dict[str, Any]:
+        return await self._engine_call(
+            engine, "execute_batch", workbook_path, ops, stop_on_error
+        )
+
+    async def flush(self, engine: ExcelEngine, workbook_path: Optional[str] = None) -> Dict[str, Any]:
+        return await self.run(
+            engine.flush, workbook_path, workbook=workbook_path, lane=engine.engine_name
+        )
+
+    async def _engine_call(
+        self, engine: ExcelEngine, method: str, workbook_path: str, *args: Any
+    ) -> Any:
+        return await self.run(
+            getattr(engine, method), workbook_path, *args,
+            workbook=workbook_path, lane=engine.engine_name
+        )
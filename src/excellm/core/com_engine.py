@@ -6,9 +6,43 @@ Wraps existing ExceLLM COM functionality.
 
 from typing import Any, Dict, List
 
-from .connection import get_excel_app, get_workbook, get_worksheet
-from .engine import ExcelEngine
+from .connection import (
+    apply_line_blocks,
+    get_excel_app,
+    get_workbook,
+    get_worksheet,
+    invalidate_registry,
+    mark_sheet_changed,
+)
+from .engine import (
+    BATCH_WRITE_OPS,
+    ExcelEngine,
+    check_write_target,
+    plan_line_edit,
+    validate_batch_ops,
+)
 from .errors import ErrorCodes, ToolError
+from .utils import line_area_address
+
+
+def _values_to_rows(values: Any) -> List[List[Any]]:
+    """Convert a COM Value2 result to a 2D list."""
+    if values is None:
+        return [[]]
+
+    # Handle single cell
+    if not isinstance(values, tuple):
+        return [[values]]
+
+    # Handle multiple cells
+    result = []
+    for row in values:
+        if isinstance(row, tuple):
+            result.append(list(row))
+        else:
+            result.append([row])
+
+    return result
 
 
 class COMEngine(ExcelEngine):
@@ -73,24 +107,7 @@ class COMEngine(ExcelEngine):
             worksheet = get_worksheet(workbook, sheet_name)
 
             range_obj = worksheet.Range(range_ref)
-            values = range_obj.Value2
-
-            if values is None:
-                return [[]]
-
-            # Handle single cell
-            if not isinstance(values, tuple):
-                return [[values]]
-
-            # Handle multiple cells
-            result = []
-            for row in values:
-                if isinstance(row, tuple):
-                    result.append(list(row))
-                else:
-                    result.append([row])
-
-            return result
+            return _values_to_rows(range_obj.Value2)
 
         except Exception as e:
             raise ToolError(
@@ -120,6 +137,7 @@ class COMEngine(ExcelEngine):
                 # Multiple cells - convert to tuple of tuples
                 tuple_data = tuple(tuple(row) for row in data)
                 range_obj.Value = tuple_data
+            mark_sheet_changed(workbook_path, sheet_name)
 
             # Save workbook
             workbook.Save()
@@ -197,6 +215,8 @@ class COMEngine(ExcelEngine):
 
             try:
                 worksheet.Delete()
+                invalidate_registry(workbook_path, sheet_name)
+                mark_sheet_changed(workbook_path, sheet_name)
                 workbook.Save()
             finally:
                 self.app.DisplayAlerts = original_display_alerts
@@ -213,6 +233,123 @@ class COMEngine(ExcelEngine):
                 code=ErrorCodes.WRITE_FAILED
             )
 
+    def bulk_insert_delete(
+        self,
+        workbook_path: str,
+        sheet_name: str,
+        action: str,
+        line_type: str,
+        positions: List[Any],
+    ) -> Dict[str, Any]:
+        """Insert or delete rows/columns with multi-area Range calls."""
+        blocks = plan_line_edit(action, line_type, positions)
+        try:
+            workbook = get_workbook(self.app, workbook_path)
+            worksheet = get_worksheet(workbook, sheet_name)
+
+            calls = apply_line_blocks(worksheet, blocks, line_type, action)
+            mark_sheet_changed(workbook_path, sheet_name)
+            workbook.Save()
+
+            return {
+                "success": True,
+                "count": sum(last - first + 1 for first, last in blocks),
+                "blocks": [line_area_address(first, last, line_type) for first, last in blocks],
+                "calls": calls,
+            }
+
+        except ToolError:
+            raise
+        except Exception as e:
+            raise ToolError(
+                f"Failed to {action} {line_type}s: {str(e)}",
+                code=ErrorCodes.WRITE_FAILED
+            )
+
+    def execute_batch(
+        self,
+        workbook_path: str,
+        ops: List[Dict[str, Any]],
+        stop_on_error: bool = True,
+    ) -> Dict[str, Any]:
+        """Run several operations on one resolved workbook, saving once.
+
+        The workbook and each worksheet are looked up once; all ops run on
+        the calling thread's COM apartment. Writes are sized from the top-left
+        cell of "range" to the shape of "data" and, like the write tool, are
+        refused over non-empty cells unless the op sets force_overwrite.
+        """
+        validate_batch_ops(ops)
+        try:
+            workbook = get_workbook(self.app, workbook_path)
+        except ToolError:
+            raise
+        except Exception as e:
+            raise ToolError(
+                f"Failed to open workbook: {str(e)}",
+                code=ErrorCodes.WORKBOOK_NOT_FOUND
+            )
+
+        worksheets: Dict[str, Any] = {}
+
+        def worksheet(name: str) -> Any:
+            if name not in worksheets:
+                worksheets[name] = get_worksheet(workbook, name)
+            return worksheets[name]
+
+        def run_op(op: Dict[str, Any]) -> Dict[str, Any]:
+            name = op["op"]
+            if name == "read":
+                return {"data": _values_to_rows(worksheet(op["sheet"]).Range(op["range"]).Value2)}
+
+            if name == "write":
+                data = op["data"]
+                width = max(len(row) for row in data)
+                padded = tuple(tuple(row) + (None,) * (width - len(row)) for row in data)
+                target = worksheet(op["sheet"]).Range(op["range"]).Cells(1, 1).Resize(len(data), width)
+                if not op.get("force_overwrite"):
+                    check_write_target(op, target.Value)
+                target.Value = padded[0][0] if len(data) == 1 and width == 1 else padded
+                mark_sheet_changed(workbook_path, op["sheet"])
+                return {"cells_written": len(data) * width, "range": target.Address.replace("$", "")}
+
+            if name == "create_sheet":
+                new_sheet = workbook.Worksheets.Add()
+                new_sheet.Name = op["sheet"]
+                worksheets[op["sheet"]] = new_sheet
+                return {"sheet_name": op["sheet"], "message": f"Created sheet '{op['sheet']}'"}
+
+            if name == "delete_sheet":
+                sheet = worksheet(op["sheet"])
+                original_display_alerts = self.app.DisplayAlerts
+                self.app.DisplayAlerts = False
+                try:
+                    sheet.Delete()
+                finally:
+                    self.app.DisplayAlerts = original_display_alerts
+                invalidate_registry(workbook_path, op["sheet"])
+                mark_sheet_changed(workbook_path, op["sheet"])
+                worksheets.pop(op["sheet"], None)
+                return {"sheet_name": op["sheet"], "message": f"Deleted sheet '{op['sheet']}'"}
+
+            return {"sheets": [workbook.Worksheets(i).Name for i in range(1, workbook.Worksheets.Count + 1)]}
+
+        result = self._run_batch(workbook_path, ops, stop_on_error, run_op)
+
+        modified = any(
+            r["success"] and r["op"] in BATCH_WRITE_OPS for r in result["results"]
+        )
+        if modified:
+            try:
+                workbook.Save()
+            except Exception as e:
+                raise ToolError(
+                    f"Batch ran but the workbook could not be saved: {str(e)}",
+                    code=ErrorCodes.WRITE_FAILED
+                )
+        result["saved"] = modified
+        return result
+
     # Advanced features supported by COM
 
     def execute_vba(
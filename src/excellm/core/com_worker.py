@@ -0,0 +1,148 @@
+"""Single-threaded-apartment worker that owns the Excel COM connection.
+
+COM tool calls used to run on whichever pool thread picked them up, and
+every such thread initialized COM and looked Excel up with
+GetActiveObject on its own, so the Excel proxy was re-acquired and
+re-marshaled between apartments over and over. ComWorker runs all of them
+on one long-lived thread instead:
+
+- the thread calls CoInitialize once (single-threaded apartment) and keeps
+  the Excel.Application proxy from get_excel_app() for its whole lifetime
+- calls are submitted to a FIFO work queue and run one at a time
+- while the queue is idle the thread pumps window messages, as an STA
+  thread must; this also delivers the Excel application events that keep
+  the thread's proxy registry current
+- a failed call drops the thread's cached workbook/worksheet proxies
+
+ComWorker is a concurrent.futures.Executor. One process-wide instance,
+get_com_worker(), is the executor of AsyncExcelEngine's COM lane and runs
+ExcelSessionManager's calls through run_on_com_worker().
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Optional
+
+from .connection import (
+    _init_com,
+    _pump_com_messages,
+    _uninit_com,
+    enable_app_events,
+    invalidate_on_failure,
+)
+
+# Seconds the idle worker waits for work between message pumps
+IDLE_PUMP_INTERVAL_S = 0.1
+
+
+class ComWorker(Executor):
+    """Executor that runs every call on one long-lived COM (STA) thread."""
+
+    def __init__(self, name: str = "excellm-com-sta", idle_pump_s: float = IDLE_PUMP_INTERVAL_S):
+        """
+        Args:
+            name: Name of the worker thread.
+            idle_pump_s: Seconds to wait for work before pumping messages.
+        """
+        self.name = name
+        self.idle_pump_s = idle_pump_s
+        self._queue: "queue.SimpleQueue[Optional[tuple]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = False
+        self.tasks_run = 0
+
+    @property
+    def thread_id(self) -> Optional[int]:
+        """Ident of the worker thread (None until the first call)."""
+        return self._thread.ident if self._thread is not None else None
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Queue fn(*args, **kwargs) for the worker thread."""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future: Future = Future()
+            self._queue.put((future, fn, args, kwargs))
+            if self._thread is None:
+                # Started lazily so Excel need not be running at server start
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            return future
+
+    def _run(self) -> None:
+        _init_com()
+        enable_app_events()
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.idle_pump_s)
+                except queue.Empty:
+                    _pump_com_messages()
+                    continue
+                if item is None:
+                    break
+
+                future, fn, args, kwargs = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:
+                    invalidate_on_failure(exc)
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+                finally:
+                    self.tasks_run += 1
+                # Drop references so COM objects are released on this thread
+                del item, future, fn, args, kwargs
+        finally:
+            _uninit_com()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop the worker after the queued calls (or cancel them) and release COM."""
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            self._queue.put(None)
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return worker thread state and call counters."""
+        thread = self._thread
+        return {
+            "thread": self.name,
+            "alive": thread is not None and thread.is_alive(),
+            "tasks_run": self.tasks_run,
+            "queued": self._queue.qsize(),
+        }
+
+
+_shared_worker: Optional[ComWorker] = None
+_shared_lock = threading.Lock()
+
+
+def get_com_worker() -> ComWorker:
+    """Get the process-wide COM worker, creating it on first use."""
+    global _shared_worker
+    with _shared_lock:
+        if _shared_worker is None or _shared_worker._shutdown:
+            _shared_worker = ComWorker()
+        return _shared_worker
+
+
+async def run_on_com_worker(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking COM call on the shared worker and await its result."""
+    return await asyncio.wrap_future(get_com_worker().submit(func, *args, **kwargs))
@@ -2,21 +2,71 @@
 
 Provides thread-local connection pooling and batch read operations
 for improved performance with Excel COM automation.
+
+Workbook and worksheet dispatch objects are cached per thread in a
+ProxyRegistry, so repeated tool calls skip the Workbooks(name) and
+Worksheets(name) round-trips. Entries are dropped when:
+
+- a tool deletes, renames or moves a sheet (invalidate_registry)
+- Excel reports a workbook closing or a sheet being deleted (application
+  events, delivered on the COM worker thread while it pumps messages)
+- a COM call fails (invalidate_on_failure)
+- they are older than EXCELLM_COM_REGISTRY_TTL_S, which also bounds how
+  long a rename made in the Excel UI can go unnoticed
 """
 
 import functools
+import os
 import threading
-from typing import Any, Callable, Dict, List, Tuple, TypeVar
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 import pythoncom
 import win32com.client as win32
 
+from ..config import COM_READ_TILE_CELLS, COM_REGISTRY_TTL_S
 from .errors import ErrorCodes, ToolError
-from .utils import number_to_column
+from .utils import (
+    MAX_RANGE_ADDRESS_LEN,
+    build_range_address,
+    cell_blocks,
+    changed_blocks,
+    line_block_addresses,
+    number_to_column,
+)
 
 # Thread-local storage for COM connections
 _thread_local = threading.local()
 
+# Process-wide connection counters, reported by connection_stats()
+_stats_lock = threading.Lock()
+_stats = {
+    "co_initialize": 0,
+    "get_active_object": 0,
+    "app_probes": 0,
+    "reused": 0,
+    "workbook_hits": 0,
+    "workbook_misses": 0,
+    "sheet_hits": 0,
+    "sheet_misses": 0,
+    "invalidations": 0,
+}
+
+# Counters that mean a COM round-trip was saved / made by a lookup
+_REGISTRY_HITS = ("reused", "workbook_hits", "sheet_hits")
+_COM_LOOKUPS = ("get_active_object", "app_probes", "workbook_misses", "sheet_misses")
+
+# Failures caused by the caller's input, which say nothing about cached proxies
+_CALLER_ERROR_CODES = frozenset({
+    ErrorCodes.VALIDATION_ERROR,
+    ErrorCodes.INVALID_REFERENCE,
+    ErrorCodes.PROTECTED_SHEET,
+    ErrorCodes.READ_ONLY_WORKBOOK,
+    ErrorCodes.VBA_DISABLED,
+    ErrorCodes.INVALID_CURSOR,
+    ErrorCodes.STALE_CURSOR,
+})
+
 # Type variable for decorator
 F = TypeVar('F', bound=Callable[..., Any])
 
@@ -26,6 +76,240 @@ def _init_com() -> None:
     if not getattr(_thread_local, '_com_initialized', False):
         pythoncom.CoInitialize()
         _thread_local._com_initialized = True
+        _count("co_initialize")
+
+
+def _pump_com_messages() -> None:
+    """Dispatch pending window messages for the current STA thread."""
+    pump = getattr(pythoncom, "PumpWaitingMessages", None)
+    if pump is not None:
+        pump()
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        _stats[key] += 1
+    counts = getattr(_thread_local, "counts", None)
+    if counts is None:
+        counts = _thread_local.counts = dict.fromkeys(_stats, 0)
+    counts[key] += 1
+
+
+def connection_stats() -> Dict[str, int]:
+    """Return how often COM was initialized and Excel objects were looked up.
+
+    Returns:
+        Dictionary with co_initialize (threads that initialized COM),
+        get_active_object (GetActiveObject calls), app_probes (liveness
+        checks of a cached app), reused (app served from cache without a
+        probe), workbook/sheet hits and misses of the proxy registry and
+        invalidations
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def thread_connection_counts() -> Dict[str, int]:
+    """Return the connection counters of the current thread only."""
+    return dict(getattr(_thread_local, "counts", None) or dict.fromkeys(_stats, 0))
+
+
+def registry_breakdown(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    """Summarize counter deltas as lookups served from cache vs. made over COM."""
+    return {
+        "served_from_registry": sum(after[k] - before[k] for k in _REGISTRY_HITS),
+        "com_lookups": sum(after[k] - before[k] for k in _COM_LOOKUPS),
+    }
+
+
+class ProxyRegistry:
+    """Workbook and worksheet dispatch objects of one thread, by name.
+
+    Proxies belong to the apartment of the thread that looked them up, so
+    each thread keeps its own registry for its own Excel connection.
+    """
+
+    def __init__(self, app, ttl_s: float = COM_REGISTRY_TTL_S):
+        self.app = app
+        self.ttl_s = ttl_s
+        # name.lower() -> [workbook proxy, cached at, {sheet.lower(): (proxy, cached at)}]
+        self._workbooks: Dict[str, list] = {}
+        self._by_proxy: Dict[int, list] = {}
+
+    def _fresh(self, cached_at: float) -> bool:
+        return not self.ttl_s or time.monotonic() - cached_at < self.ttl_s
+
+    def workbook(self, name: str):
+        entry = self._workbooks.get(name.lower())
+        if entry is None:
+            return None
+        if not self._fresh(entry[1]):
+            self.invalidate(name)
+            return None
+        return entry[0]
+
+    def add_workbook(self, name: str, workbook) -> None:
+        self.invalidate(name)
+        entry = [workbook, time.monotonic(), {}]
+        self._workbooks[name.lower()] = entry
+        # The entry keeps the proxy alive, so its id() stays unique
+        self._by_proxy[id(workbook)] = entry
+
+    def worksheet(self, workbook, sheet_name: str):
+        entry = self._by_proxy.get(id(workbook))
+        cached = entry[2].get(sheet_name.lower()) if entry is not None else None
+        if cached is None:
+            return None
+        if not self._fresh(cached[1]):
+            del entry[2][sheet_name.lower()]
+            return None
+        return cached[0]
+
+    def add_worksheet(self, workbook, sheet_name: str, worksheet) -> bool:
+        """Cache a worksheet of a registered workbook (returns False otherwise)."""
+        entry = self._by_proxy.get(id(workbook))
+        if entry is None:
+            return False
+        entry[2][sheet_name.lower()] = (worksheet, time.monotonic())
+        return True
+
+    def invalidate(self, workbook_name: Optional[str] = None, sheet_name: Optional[str] = None) -> None:
+        """Drop one sheet, one workbook with its sheets, or everything."""
+        if workbook_name is None:
+            self._workbooks.clear()
+            self._by_proxy.clear()
+            return
+        entry = self._workbooks.get(workbook_name.lower())
+        if entry is None:
+            return
+        if sheet_name is not None:
+            entry[2].pop(sheet_name.lower(), None)
+            return
+        del self._workbooks[workbook_name.lower()]
+        self._by_proxy.pop(id(entry[0]), None)
+
+    def __len__(self) -> int:
+        return len(self._workbooks) + sum(len(e[2]) for e in self._workbooks.values())
+
+
+# Per-sheet change counters, process-wide. Tools bump them after writing;
+# Excel's SheetChange and SheetCalculate events bump them for edits made
+# elsewhere and for recalculated formulas, so a version stamp taken earlier
+# tells whether a sheet may have changed since.
+_versions_lock = threading.Lock()
+_versions_epoch = os.urandom(4).hex()  # Stamps from another server process never match
+_workbook_versions: Dict[str, int] = {}
+_sheet_versions: Dict[Tuple[str, str], int] = {}
+
+
+def _workbook_key(workbook_name: str) -> str:
+    return os.path.basename(workbook_name).lower()
+
+
+def mark_sheet_changed(workbook_name: str, sheet_name: Optional[str] = None) -> None:
+    """Record that a sheet (or, with sheet_name=None, any sheet of a workbook) changed."""
+    key = _workbook_key(workbook_name)
+    with _versions_lock:
+        if sheet_name is None:
+            _workbook_versions[key] = _workbook_versions.get(key, 0) + 1
+        else:
+            sheet_key = (key, sheet_name.lower())
+            _sheet_versions[sheet_key] = _sheet_versions.get(sheet_key, 0) + 1
+
+
+def sheet_version(workbook_name: str, sheet_name: str) -> str:
+    """Version stamp of a sheet; it differs after any recorded change."""
+    key = _workbook_key(workbook_name)
+    with _versions_lock:
+        return (
+            f"{_versions_epoch}.{_workbook_versions.get(key, 0)}"
+            f".{_sheet_versions.get((key, sheet_name.lower()), 0)}"
+        )
+
+
+class _AppEvents:
+    """Excel.Application event sink that keeps a ProxyRegistry and sheet versions current.
+
+    Attached with win32com.client.WithEvents, which does not pass
+    constructor arguments; _registry() sets ``registry`` afterwards.
+    """
+
+    registry: Optional[ProxyRegistry] = None
+
+    def OnWorkbookBeforeClose(self, wb, cancel):  # noqa: N802
+        if self.registry is not None:
+            self.registry.invalidate(wb.Name)
+            _count("invalidations")
+
+    def OnSheetBeforeDelete(self, sh):  # noqa: N802
+        if self.registry is not None:
+            self.registry.invalidate(sh.Parent.Name, sh.Name)
+            _count("invalidations")
+
+    def OnSheetChange(self, sh, target):  # noqa: N802
+        mark_sheet_changed(sh.Parent.Name, sh.Name)
+
+    def OnSheetCalculate(self, sh):  # noqa: N802
+        mark_sheet_changed(sh.Parent.Name, sh.Name)
+
+
+def enable_app_events() -> None:
+    """Subscribe to Excel application events on the current thread.
+
+    Only for threads that pump messages (the COM worker); events for other
+    threads would never be delivered.
+    """
+    _thread_local.app_events_enabled = True
+
+
+def app_events_active() -> bool:
+    """Whether an application event sink is attached on the current thread.
+
+    Without one, edits made in Excel and recalculations do not bump sheet
+    versions, so a version stamp cannot prove a sheet unchanged.
+    """
+    return getattr(_thread_local, "app_events", None) is not None
+
+
+def _registry(app) -> ProxyRegistry:
+    """Get the current thread's registry for app, starting a new one if app changed."""
+    registry = getattr(_thread_local, "registry", None)
+    if registry is None or registry.app is not app:
+        registry = _thread_local.registry = ProxyRegistry(app)
+        if getattr(_thread_local, "app_events_enabled", False):
+            try:
+                sink = win32.WithEvents(app, _AppEvents)
+                sink.registry = registry
+                _thread_local.app_events = sink
+            except Exception:
+                _thread_local.app_events = None  # TTL and failures still invalidate
+    return registry
+
+
+def invalidate_registry(workbook_name: Optional[str] = None, sheet_name: Optional[str] = None) -> None:
+    """Drop cached proxies of the current thread.
+
+    Args:
+        workbook_name: Workbook to drop (None = every workbook, and the
+            cached app is probed again on next use)
+        sheet_name: Drop only this sheet of workbook_name
+    """
+    registry = getattr(_thread_local, "registry", None)
+    if registry is not None:
+        registry.invalidate(workbook_name, sheet_name)
+    if workbook_name is None:
+        _thread_local.app_verified_at = None
+    _count("invalidations")
+
+
+def invalidate_on_failure(exc: BaseException) -> None:
+    """Drop the current thread's cached proxies after a failed COM call.
+
+    Errors caused by the caller's input (validation, protected sheet, ...)
+    keep the cache.
+    """
+    if getattr(exc, "code", None) not in _CALLER_ERROR_CODES:
+        invalidate_registry()
 
 
 def _uninit_com() -> None:
@@ -38,6 +322,8 @@ def _uninit_com() -> None:
         try:
             # Clear cached Excel app reference
             _thread_local.excel_app = None
+            _thread_local.registry = None
+            _thread_local.app_events = None
             pythoncom.CoUninitialize()
         except Exception:
             pass  # COM might already be uninitialized
@@ -87,7 +373,9 @@ def get_excel_app():
     """Get or create Excel Application COM object for current thread.
 
     Uses thread-local storage to cache the connection, avoiding
-    repeated COM initialization overhead.
+    repeated COM initialization overhead. A cached connection is probed
+    (Workbooks.Count) only once per EXCELLM_COM_REGISTRY_TTL_S or after
+    invalidate_registry(); in between it is trusted.
 
     Returns:
         Excel.Application COM object
@@ -101,9 +389,18 @@ def get_excel_app():
     app = getattr(_thread_local, 'excel_app', None)
 
     if app is not None:
+        verified_at = getattr(_thread_local, 'app_verified_at', None)
+        if verified_at is not None and (
+            not COM_REGISTRY_TTL_S or time.monotonic() - verified_at < COM_REGISTRY_TTL_S
+        ):
+            _count("reused")
+            return app
+
         # Verify connection is still valid
         try:
+            _count("app_probes")
             _ = app.Workbooks.Count
+            _thread_local.app_verified_at = time.monotonic()
             return app
         except Exception:
             # Connection is stale, need to reconnect
@@ -111,8 +408,11 @@ def get_excel_app():
 
     # Create new connection
     try:
+        _count("get_active_object")
         app = win32.GetActiveObject("Excel.Application")
         _thread_local.excel_app = app
+        _thread_local.app_verified_at = time.monotonic()
+        _registry(app)
         return app
     except Exception as e:
         raise ToolError(
@@ -129,18 +429,29 @@ def get_workbook(app, workbook_name: str):
         workbook_name: Name of the workbook
 
     Returns:
-        Workbook COM object
+        Workbook COM object (from the thread's registry when cached)
 
     Raises:
         ToolError: If workbook not found
     """
+    registry = _registry(app)
+    workbook = registry.workbook(workbook_name)
+    if workbook is not None:
+        _count("workbook_hits")
+        return workbook
+
+    _count("workbook_misses")
     try:
-        return app.Workbooks(workbook_name)
+        workbook = app.Workbooks(workbook_name)
     except Exception:
+        # The cached app may be the stale part; check it on next use
+        _thread_local.app_verified_at = None
         raise ToolError(
             f"Workbook '{workbook_name}' not found. Is it open in Excel?",
             code=ErrorCodes.WORKBOOK_NOT_FOUND
         )
+    registry.add_workbook(workbook_name, workbook)
+    return workbook
 
 
 def get_worksheet(workbook, sheet_name: str):
@@ -151,18 +462,28 @@ def get_worksheet(workbook, sheet_name: str):
         sheet_name: Name of the worksheet
 
     Returns:
-        Worksheet COM object
+        Worksheet COM object (from the thread's registry when cached)
 
     Raises:
         ToolError: If worksheet not found
     """
+    registry = getattr(_thread_local, "registry", None)
+    worksheet = registry.worksheet(workbook, sheet_name) if registry is not None else None
+    if worksheet is not None:
+        _count("sheet_hits")
+        return worksheet
+
+    _count("sheet_misses")
     try:
-        return workbook.Worksheets(sheet_name)
+        worksheet = workbook.Worksheets(sheet_name)
     except Exception:
         raise ToolError(
             f"Worksheet '{sheet_name}' not found in workbook.",
             code=ErrorCodes.SHEET_NOT_FOUND
         )
+    if registry is not None:
+        registry.add_worksheet(workbook, sheet_name, worksheet)
+    return worksheet
 
 
 def with_excel_context(func: F) -> F:
@@ -290,6 +611,266 @@ def batch_read_with_positions(
     return result
 
 
+def _value_rows(values: Any) -> List[Tuple[Any, ...]]:
+    """Normalize a Range.Value result (scalar, 1D or 2D) to a list of row tuples.
+
+    None (the value of an empty single cell) gives no rows.
+    """
+    if values is None:
+        return []
+    if not isinstance(values, (list, tuple)):
+        return [(values,)]
+    if values and isinstance(values[0], (list, tuple)):
+        return [tuple(row) for row in values]
+    return [tuple(values)]
+
+
+def tile_rows_for(cols: int, tile_cells: int = COM_READ_TILE_CELLS) -> int:
+    """Rows per tile so that one tile holds about tile_cells cells."""
+    return max(1, tile_cells // max(1, cols))
+
+
+def iter_range_tiles(
+    rng,
+    max_rows: Optional[int] = None,
+    tile_cells: int = COM_READ_TILE_CELLS,
+    attribute: str = "Value",
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """Read a range as blocks of whole rows, one COM call per block.
+
+    Reading a large range with one rng.Value call marshals a single
+    SAFEARRAY of the whole range and builds every row tuple at once. Tiles
+    keep each call (and, for consumers that don't keep the rows, peak
+    memory) bounded by tile_cells. Rows past max_rows are never fetched, and
+    a consumer that stops iterating stops the reads.
+
+    Args:
+        rng: Single-area Range COM object
+        max_rows: Stop after this many rows (None = whole range)
+        tile_cells: Cells per tile; the tile height adapts to the column count
+        attribute: Range property to read ("Value" or "Value2")
+
+    Yields:
+        Lists of row tuples, top to bottom
+    """
+    total, cols = rng.Rows.Count, rng.Columns.Count
+    rows = total if max_rows is None else min(total, max_rows)
+    tile_rows = tile_rows_for(cols, tile_cells)
+
+    if rows <= tile_rows:
+        if rows > 0:
+            yield _value_rows(getattr(rng if rows == total else rng.Resize(rows, cols), attribute))
+        return
+
+    for offset in range(0, rows, tile_rows):
+        height = min(tile_rows, rows - offset)
+        yield _value_rows(getattr(rng.Cells(offset + 1, 1).Resize(height, cols), attribute))
+
+
+# XlCellType
+XL_CELL_TYPE_FORMULAS = -4123
+
+# Formula-read strategies for read_formulas()
+FORMULA_MODES = ("auto", "always", "never")
+
+# With more formula areas than this, one full Formula read is cheaper
+MAX_FORMULA_AREAS = 64
+
+
+def _formula_or_none(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) and value.startswith("=") else None
+
+
+def _formula_rows(formulas: Any) -> List[List[Optional[str]]]:
+    """Normalize a Range.Formula result (scalar, 1D or 2D) to rows of formulas."""
+    if not isinstance(formulas, (list, tuple)):
+        return [[_formula_or_none(formulas)]]
+    if formulas and isinstance(formulas[0], (list, tuple)):
+        return [[_formula_or_none(f) for f in row] for row in formulas]
+    return [[_formula_or_none(f) for f in formulas]]
+
+
+def read_formulas(
+    rng,
+    rows: int,
+    cols: int,
+    include_formulas: str = "auto",
+) -> Tuple[Optional[List[List[Optional[str]]]], str]:
+    """Read the formulas of a range without marshaling it twice when avoidable.
+
+    "always" reads Range.Formula for the whole range. "auto" asks HasFormula
+    first (one property call): False means there is nothing to fetch and True
+    means every cell is a formula. For mixed ranges only the
+    SpecialCells(xlCellTypeFormulas) areas are read, unless there are more
+    than MAX_FORMULA_AREAS of them. "never" skips formulas.
+
+    Args:
+        rng: Range COM object whose values were already read
+        rows, cols: Shape of the values grid
+        include_formulas: "auto", "always" or "never"
+
+    Returns:
+        (grid, strategy): a rows x cols grid with None where a cell holds no
+        formula (None for "never"), and how it was read: "skipped", "none",
+        "full" or "areas"
+    """
+    if include_formulas not in FORMULA_MODES:
+        raise ToolError(
+            f"Invalid include_formulas: '{include_formulas}'. Use one of: {', '.join(FORMULA_MODES)}",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+    if include_formulas == "never":
+        return None, "skipped"
+
+    if include_formulas == "auto":
+        try:
+            has_formula = rng.HasFormula
+        except Exception:
+            has_formula = None
+        if has_formula is False:
+            return [[None] * cols for _ in range(rows)], "none"
+
+        # None: mixed (or unknown). Fetch just the formula areas
+        if has_formula is None and rows * cols > 1:
+            try:
+                areas = rng.SpecialCells(XL_CELL_TYPE_FORMULAS).Areas
+                if areas.Count <= MAX_FORMULA_AREAS:
+                    grid: List[List[Optional[str]]] = [[None] * cols for _ in range(rows)]
+                    top, left = rng.Row, rng.Column
+                    for i in range(1, areas.Count + 1):
+                        area = areas(i)
+                        r0, c0 = area.Row - top, area.Column - left
+                        for r, row in enumerate(_formula_rows(area.Formula)):
+                            for c, formula in enumerate(row):
+                                if 0 <= r0 + r < rows and 0 <= c0 + c < cols:
+                                    grid[r0 + r][c0 + c] = formula
+                    return grid, "areas"
+            except Exception:
+                # SpecialCells raises when nothing matches or the sheet is protected
+                pass
+
+    return _formula_rows(rng.Formula)[:rows], "full"
+
+
+# With more changed blocks than this, one full write is cheaper
+MAX_DIFF_BLOCKS = 64
+
+
+def write_changed_cells(rng, current: Any, data: List[List[Any]]) -> Dict[str, Any]:
+    """Write only the blocks of data that differ from the range's current values.
+
+    Every write makes Excel recalculate the dependents of the written cells,
+    so rewriting a large chunk that differs in a few cells is expensive.
+    This writes one rectangle per changed block (see changed_blocks), or
+    the whole range in one call when there are more than MAX_DIFF_BLOCKS.
+    Formula cells are looked up with read_formulas ("auto": one HasFormula
+    call when the range has none) and rewritten unless data holds the same
+    formula, so the cells end up as a plain write would leave them.
+
+    Args:
+        rng: Target Range, sized to data
+        current: rng.Value as already read by the caller
+        data: Rectangular rows to write
+
+    Returns:
+        Dictionary with cells_changed, cells_unchanged, blocks_written and
+        full_write (True when it fell back to writing the whole range)
+    """
+    total = len(data) * (len(data[0]) if data else 0)
+    formulas = None
+    if total:
+        formulas, _ = read_formulas(rng, len(data), len(data[0]), "auto")
+    blocks = changed_blocks(_value_rows(current), data, formulas)
+    cells_changed = sum((r1 - r0 + 1) * (c1 - c0 + 1) for r0, c0, r1, c1 in blocks)
+
+    full_write = len(blocks) > MAX_DIFF_BLOCKS
+    if full_write:
+        rng.Value = data
+    else:
+        top_left = rng.Cells(1, 1)
+        for r0, c0, r1, c1 in blocks:
+            block = top_left.Offset(r0, c0).Resize(r1 - r0 + 1, c1 - c0 + 1)
+            block.Value = [row[c0:c1 + 1] for row in data[r0:r1 + 1]]
+
+    return {
+        "cells_changed": cells_changed,
+        "cells_unchanged": total - cells_changed,
+        "blocks_written": 1 if full_write else len(blocks),
+        "full_write": full_write,
+    }
+
+
+def write_cell_updates(rng, updates: Dict[Tuple[int, int], Any]) -> int:
+    """Write scattered cells of a range without touching the cells between them.
+
+    The cells are grouped into rectangles (see cell_blocks). When every
+    cell gets the same value, the rectangles are joined into multi-area
+    addresses ("A2:A9,C4,F7:G7") of at most MAX_RANGE_ADDRESS_LEN
+    characters and each address is set in one call; otherwise each
+    rectangle is written with its own values.
+
+    Args:
+        rng: Range the offsets refer to
+        updates: {(row, col): value}, 0-based offsets from rng's top-left cell
+
+    Returns:
+        Number of COM writes made
+    """
+    if not updates:
+        return 0
+    blocks = cell_blocks(sorted(updates))
+    values = set(updates.values())
+
+    if len(values) == 1:
+        value = values.pop()
+        row0, col0 = rng.Row, rng.Column
+        worksheet = rng.Worksheet
+        calls = 0
+        areas: List[str] = []
+        length = -1
+        for r0, c0, r1, c1 in blocks:
+            area = build_range_address(row0 + r0, col0 + c0, row0 + r1, col0 + c1)
+            if areas and length + 1 + len(area) > MAX_RANGE_ADDRESS_LEN:
+                worksheet.Range(",".join(areas)).Value = value
+                calls += 1
+                areas, length = [], -1
+            areas.append(area)
+            length += 1 + len(area)
+        worksheet.Range(",".join(areas)).Value = value
+        return calls + 1
+
+    top_left = rng.Cells(1, 1)
+    for r0, c0, r1, c1 in blocks:
+        block = top_left.Offset(r0, c0).Resize(r1 - r0 + 1, c1 - c0 + 1)
+        block.Value = [[updates[(r, c)] for c in range(c0, c1 + 1)] for r in range(r0, r1 + 1)]
+    return len(blocks)
+
+
+def apply_line_blocks(worksheet, blocks: List[Tuple[int, int]], line_type: str, action: str) -> int:
+    """Insert or delete whole rows/columns with multi-area Range calls.
+
+    Args:
+        worksheet: Worksheet COM object
+        blocks: Sorted (first, last) blocks from group_line_blocks, in
+            positions of the sheet before the edit
+        line_type: "row" or "column"
+        action: "insert" or "delete"
+
+    Returns:
+        Number of Insert/Delete calls made (one unless the blocks do not
+        fit in one address, see line_block_addresses)
+    """
+    addresses = line_block_addresses(blocks, line_type, action)
+    for address in addresses:
+        rng = worksheet.Range(address)
+        lines = rng.EntireRow if line_type == "row" else rng.EntireColumn
+        if action == "insert":
+            lines.Insert()
+        else:
+            lines.Delete()
+    return len(addresses)
+
+
 def ensure_workbook_open() -> None:
     """Verify that at least one workbook is open in Excel.
 
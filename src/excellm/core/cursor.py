@@ -0,0 +1,55 @@
+"""Opaque continuation tokens for paged tool results.
+
+A tool that returns one page of a larger result hands back a cursor
+holding everything it needs to resume: which sheet, the bounds being
+paged, where the next page starts, the page size and a version stamp of
+the sheet. The next call decodes the cursor instead of locating the data
+again, and refuses it if the sheet changed in between.
+
+Tokens are URL-safe base64 of compact JSON. They only carry positions
+within data the caller can already read, so they are not signed; a
+tampered token fails to decode or reads a different range.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+from .errors import ErrorCodes, ToolError
+
+# Bumped when the layout of cursor state changes
+CURSOR_FORMAT = 1
+
+
+def encode_cursor(kind: str, state: Dict[str, Any]) -> str:
+    """Encode tool state as an opaque cursor.
+
+    Args:
+        kind: Tool the cursor belongs to (e.g. "read")
+        state: JSON-serializable resume state
+    """
+    payload = {"k": kind, "f": CURSOR_FORMAT, **state}
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, kind: str) -> Dict[str, Any]:
+    """Decode a cursor issued by encode_cursor for the same kind of tool.
+
+    Raises:
+        ToolError: INVALID_CURSOR if the token is malformed, from another
+            tool or from an incompatible version
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        payload = None
+    if not isinstance(payload, dict) or payload.get("k") != kind or payload.get("f") != CURSOR_FORMAT:
+        raise ToolError(
+            f"Invalid cursor for {kind}. Pass next_cursor exactly as returned, "
+            "or start again without a cursor.",
+            code=ErrorCodes.INVALID_CURSOR
+        )
+    return payload
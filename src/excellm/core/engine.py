@@ -8,7 +8,181 @@ implemented by different backends:
 
 import platform
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import MAX_CELLS_LIMIT
+from .errors import ErrorCodes, ToolError
+from .utils import (
+    build_range_address,
+    group_line_blocks,
+    is_cell_empty,
+    parse_line_span,
+    parse_range_bounds,
+)
+
+# Operations accepted by execute_batch() and the keys each one requires
+BATCH_OPS = {
+    "read": ("sheet", "range"),
+    "write": ("sheet", "range", "data"),
+    "create_sheet": ("sheet",),
+    "delete_sheet": ("sheet",),
+    "sheet_names": (),
+}
+
+# Operations that modify the workbook (and make the batch save it)
+BATCH_WRITE_OPS = frozenset({"write", "create_sheet", "delete_sheet"})
+
+
+def validate_batch_ops(ops: List[Dict[str, Any]]) -> None:
+    """Check a batch before running any of it.
+
+    Raises:
+        ToolError: VALIDATION_ERROR naming the first malformed operation
+    """
+    if not isinstance(ops, list) or not ops:
+        raise ToolError(
+            "Batch must be a non-empty list of operations.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+
+    for index, op in enumerate(ops):
+        name = op.get("op") if isinstance(op, dict) else None
+        if name not in BATCH_OPS:
+            raise ToolError(
+                f"Operation {index}: 'op' must be one of {', '.join(BATCH_OPS)}.",
+                code=ErrorCodes.VALIDATION_ERROR
+            )
+        missing = [key for key in BATCH_OPS[name] if op.get(key) is None]
+        if missing:
+            raise ToolError(
+                f"Operation {index} ({name}): missing {', '.join(missing)}.",
+                code=ErrorCodes.VALIDATION_ERROR
+            )
+        if name == "write" and not (
+            isinstance(op["data"], list) and op["data"]
+            and all(isinstance(row, list) for row in op["data"])
+        ):
+            raise ToolError(
+                f"Operation {index} (write): 'data' must be a non-empty 2D list.",
+                code=ErrorCodes.VALIDATION_ERROR
+            )
+        if name == "write":
+            _validate_batch_write(index, op)
+
+
+def _validate_batch_write(index: int, op: Dict[str, Any]) -> None:
+    """Apply the write tool's max_cells limit to one batch write."""
+    max_cells = op.get("max_cells")
+    if max_cells is not None and (
+        isinstance(max_cells, bool) or not isinstance(max_cells, int) or max_cells < 1
+    ):
+        raise ToolError(
+            f"Operation {index} (write): 'max_cells' must be a positive integer.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+    if not isinstance(op.get("force_overwrite", False), bool):
+        raise ToolError(
+            f"Operation {index} (write): 'force_overwrite' must be true or false.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+
+    rows = len(op["data"])
+    cols = max(len(row) for row in op["data"])
+    limit = max_cells if max_cells is not None else MAX_CELLS_LIMIT
+    if rows * cols > limit:
+        raise ToolError(
+            f"Operation {index} (write): data has {rows * cols} cells ({rows} rows × {cols} cols), "
+            f"but max_cells limit is {limit}. "
+            f"This limit exists to prevent LLM hallucination. "
+            f"Process data in smaller chunks or increase max_cells.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+
+
+def batch_write_address(op: Dict[str, Any]) -> str:
+    """Address a batch write covers: its data's shape from the top-left of "range"."""
+    start_row, start_col, _, _ = parse_range_bounds(op["range"])
+    width = max(len(row) for row in op["data"])
+    return build_range_address(start_row, start_col, start_row + len(op["data"]) - 1, start_col + width - 1)
+
+
+def check_write_target(op: Dict[str, Any], existing: Any) -> None:
+    """Refuse a batch write over cells holding data unless it sets force_overwrite.
+
+    Args:
+        op: Validated write op
+        existing: Current values of the target, a scalar or a 2D list/tuple
+
+    Raises:
+        ToolError: VALIDATION_ERROR if any target cell is non-empty
+    """
+    if op.get("force_overwrite"):
+        return
+    rows = existing if isinstance(existing, (list, tuple)) else [existing]
+    for row in rows:
+        cells = row if isinstance(row, (list, tuple)) else [row]
+        if any(not is_cell_empty(cell) for cell in cells):
+            raise ToolError(
+                f"Range '{batch_write_address(op)}' already contains data. "
+                "Clear range first or set force_overwrite on the operation.",
+                code=ErrorCodes.VALIDATION_ERROR
+            )
+
+
+def plan_line_edit(action: str, line_type: str, positions: List[Any]) -> List[Tuple[int, int]]:
+    """Validate a bulk row/column insert or delete and group it into blocks.
+
+    Args:
+        action: "insert" or "delete"
+        line_type: "row" or "column"
+        positions: Positions accepted by parse_line_span
+
+    Returns:
+        Sorted (first, last) blocks, see group_line_blocks
+
+    Raises:
+        ToolError: VALIDATION_ERROR for an unknown action or line type, an
+            empty position list or a position that cannot be parsed
+    """
+    if action not in ("insert", "delete"):
+        raise ToolError(
+            f"Invalid action '{action}'. Must be 'insert' or 'delete'.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+    if line_type not in ("row", "column"):
+        raise ToolError(
+            f"Invalid line_type '{line_type}'. Must be 'row' or 'column'.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+    if not isinstance(positions, list) or not positions:
+        raise ToolError(
+            "positions must be a non-empty list.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+    try:
+        spans = [parse_line_span(position, line_type) for position in positions]
+    except ValueError as e:
+        raise ToolError(str(e), code=ErrorCodes.VALIDATION_ERROR) from e
+    return group_line_blocks(spans, action)
+
+
+def validate_unique_options(top_k: Optional[int], min_count: int) -> None:
+    """Check the top_k/min_count options of a unique-values call.
+
+    Raises:
+        ToolError: VALIDATION_ERROR if top_k is not a positive integer (or
+            None) or min_count is below 1
+    """
+    if top_k is not None and (isinstance(top_k, bool) or not isinstance(top_k, int) or top_k < 1):
+        raise ToolError(
+            f"Invalid top_k {top_k!r}. Must be a positive integer.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+    if isinstance(min_count, bool) or not isinstance(min_count, int) or min_count < 1:
+        raise ToolError(
+            f"Invalid min_count {min_count!r}. Must be an integer of at least 1.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
 
 
 class ExcelEngine(ABC):
@@ -121,6 +295,127 @@ class ExcelEngine(ABC):
         """
         pass
 
+    @abstractmethod
+    def bulk_insert_delete(
+        self,
+        workbook_path: str,
+        sheet_name: str,
+        action: str,
+        line_type: str,
+        positions: List[Any],
+    ) -> Dict[str, Any]:
+        """Insert or delete rows or columns at many positions in one operation.
+
+        Positions refer to the sheet before the call; they are grouped into
+        blocks with plan_line_edit and applied at once.
+
+        Args:
+            workbook_path: Path or name of workbook
+            sheet_name: Name of worksheet
+            action: "insert" or "delete"
+            line_type: "row" or "column"
+            positions: Row numbers or column letters/numbers ("5", "5:10",
+                "C", "C:E"), or {"position": ..., "count": n}
+
+        Returns:
+            Dictionary with operation result
+        """
+        pass
+
+    def flush(self, workbook_path: str = None) -> Dict[str, Any]:
+        """Persist any deferred writes.
+
+        Engines that save on every write have nothing to flush.
+
+        Args:
+            workbook_path: Workbook to flush (None = all)
+
+        Returns:
+            Dictionary with the list of flushed workbooks
+        """
+        return {"success": True, "flushed": []}
+
+    def execute_batch(
+        self,
+        workbook_path: str,
+        ops: List[Dict[str, Any]],
+        stop_on_error: bool = True,
+    ) -> Dict[str, Any]:
+        """Run several operations against one workbook.
+
+        Each op is a dict with an "op" key ("read", "write", "create_sheet",
+        "delete_sheet" or "sheet_names") plus "sheet", "range" and "data" as
+        the op requires. This default runs every op through the single-shot
+        methods; engines override it to resolve the workbook once and save
+        once at the end.
+
+        Args:
+            workbook_path: Path or name of workbook
+            ops: Operations to run, in order
+            stop_on_error: If True, ops after the first failure are skipped
+
+        Returns:
+            Dictionary with one result per op (in order)
+        """
+        validate_batch_ops(ops)
+        return self._run_batch(
+            workbook_path, ops, stop_on_error,
+            lambda op: self._run_batch_op(workbook_path, op)
+        )
+
+    def _run_batch_op(self, workbook_path: str, op: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one batch op through the single-shot methods."""
+        name = op["op"]
+        if name == "read":
+            return {"data": self.read_range(workbook_path, op["sheet"], op["range"])}
+        if name == "write":
+            if not op.get("force_overwrite"):
+                check_write_target(op, self.read_range(workbook_path, op["sheet"], batch_write_address(op)))
+            return self.write_range(workbook_path, op["sheet"], op["range"], op["data"])
+        if name == "create_sheet":
+            return self.create_sheet(workbook_path, op["sheet"])
+        if name == "delete_sheet":
+            return self.delete_sheet(workbook_path, op["sheet"])
+        return {"sheets": self.get_sheet_names(workbook_path)}
+
+    def _run_batch(
+        self,
+        workbook_path: str,
+        ops: List[Dict[str, Any]],
+        stop_on_error: bool,
+        run_op: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Run ops with run_op and collect per-op results."""
+        results = []
+        failed = 0
+        for index, op in enumerate(ops):
+            entry = {"index": index, "op": op["op"]}
+            if failed and stop_on_error:
+                entry.update(success=False, skipped=True)
+                results.append(entry)
+                continue
+            try:
+                result = run_op(op)
+                result.pop("success", None)
+                entry["success"] = True
+                entry.update(result)
+            except ToolError as e:
+                failed += 1
+                entry.update(success=False, error=e.to_dict())
+            except Exception as e:
+                failed += 1
+                entry.update(success=False, error={"code": "UNEXPECTED_ERROR", "message": str(e)})
+            results.append(entry)
+
+        return {
+            "success": failed == 0,
+            "workbook": workbook_path,
+            "engine": self.engine_name,
+            "ops_run": sum(1 for r in results if not r.get("skipped")),
+            "ops_failed": failed,
+            "results": results,
+        }
+
     # Optional advanced features (may not be supported by all engines)
 
     def execute_vba(
@@ -82,3 +82,8 @@ class ErrorCodes:
     COM_ERROR = "COM_ERROR"
     VBA_DISABLED = "VBA_DISABLED"
     WRITE_FAILED = "WRITE_FAILED"
+    READ_FAILED = "READ_FAILED"
+    ENGINE_BUSY = "ENGINE_BUSY"
+    TIMEOUT = "TIMEOUT"
+    INVALID_CURSOR = "INVALID_CURSOR"
+    STALE_CURSOR = "STALE_CURSOR"
@@ -3,18 +3,98 @@
 Cross-platform engine for working with Excel files without Excel running.
 """
 
+import atexit
+import itertools
+import logging
 import os
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 try:
     import openpyxl
+    from openpyxl.styles import Font
     from openpyxl.utils import column_index_from_string
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
-from .engine import ExcelEngine
+from ..config import (
+    FILE_CACHE_MAX_MB,
+    FILE_DURABILITY,
+    FILE_FLUSH_EVERY_WRITES,
+    FILE_FLUSH_INTERVAL_MS,
+    FILE_PARTIAL_SAVE,
+    FILE_SNAPSHOTS,
+    UNIQUE_MAX_EXACT_VALUES,
+)
+from ..filters import FilterEngine
+from .engine import (
+    BATCH_WRITE_OPS,
+    ExcelEngine,
+    plan_line_edit,
+    validate_batch_ops,
+    validate_unique_options,
+)
 from .errors import ErrorCodes, ToolError
+from .parallel_search import SheetBlock, search_blocks
+from .partial_save import save_changed_parts, save_workbook_atomic, style_counts
+from .sketch import ValueProfile, profile_rows, profile_summary
+from .snapshot import SheetSnapshot, build_sheet_snapshot
+from .utils import build_range_address, is_cell_empty, line_area_address, line_shift
+from .workbook_cache import WorkbookCache, file_stamp
+from .xlsx_export import export_sheet, validate_sheet_name
+from .xlsx_reader import UnsupportedXlsxError, XlsxReader
+
+logger = logging.getLogger(__name__)
+
+# Workbook load modes reported by list_workbooks()
+READ_ONLY_MODE = "read_only"
+EDIT_MODE = "edit"
+
+# Save durability modes reported in write results
+DURABILITY_IMMEDIATE = "immediate"
+DURABILITY_DEFERRED = "deferred"
+
+# How the last save of a workbook was written
+SAVE_PARTIAL = "partial"
+SAVE_FULL = "full"
+
+# How export_rows() wrote its output
+EXPORT_STREAMING = "streaming"
+EXPORT_IN_MEMORY = "in_memory"
+
+
+class _WorkbookEntry:
+    """Cached workbook together with the mode it was loaded in."""
+
+    def __init__(
+        self,
+        workbook: Any,
+        mode: str,
+        load_time_ms: float,
+        stamp: Optional[Tuple[int, int]],
+    ):
+        self.workbook = workbook
+        self.mode = mode
+        self.load_time_ms = load_time_ms
+        # Cache bookkeeping (see WorkbookCache)
+        self.file_stamp = stamp
+        self.estimated_bytes = 0
+        # Bumped on every in-memory mutation; snapshots belong to one version
+        self.version = 0
+        self.snapshots: Dict[str, SheetSnapshot] = {}
+        # Streaming range reader, opened on first read of a read-only entry
+        self.reader: Optional[XlsxReader] = None
+        # Write-behind state (deferred durability only)
+        self.pending_writes = 0
+        self.flush_timer: Optional[threading.Timer] = None
+        # What changed since the last save, for partial saves
+        self.dirty_sheets: Set[str] = set()
+        self.structure_changed = False
+        self.saved_style_counts: Optional[Tuple[int, int]] = None
+        self.last_save: Optional[str] = None
 
 
 class FileEngine(ExcelEngine):
@@ -30,17 +110,84 @@ class FileEngine(ExcelEngine):
     - No screen capture
     - Limited formatting support
     - No live Excel integration
+
+    Workbooks are opened lazily in openpyxl's streaming read-only mode and
+    only promoted to a fully editable workbook on the first write,
+    create_sheet or delete_sheet for that path.
+
+    With "deferred" durability, writes only mark the workbook dirty; it is
+    saved once per flush (after flush_interval_ms, after flush_every writes,
+    on flush() or at interpreter shutdown) instead of after every call.
+
+    Loaded workbooks live in a byte-budgeted LRU cache that flushes dirty
+    entries before evicting them and reloads files changed on disk.
+
+    With snapshots enabled, the first read of a sheet builds a columnar
+    SheetSnapshot that later reads, searches and unique-value counts slice
+    until the next write to that sheet.
+
+    export_rows() writes large generated sheets by streaming rows into the
+    file, keeping memory flat regardless of the row count.
     """
 
-    def __init__(self):
-        """Initialize file engine."""
+    def __init__(
+        self,
+        durability: Optional[str] = None,
+        flush_interval_ms: Optional[int] = None,
+        flush_every: Optional[int] = None,
+        cache_max_mb: Optional[int] = None,
+        snapshots: Optional[bool] = None,
+        partial_save: Optional[bool] = None,
+    ):
+        """Initialize file engine.
+
+        Args:
+            durability: "immediate" (save on every write) or "deferred"
+                (write-behind). Defaults to EXCELLM_FILE_DURABILITY.
+            flush_interval_ms: Deferred mode timer; 0 disables it.
+                Defaults to EXCELLM_FILE_FLUSH_INTERVAL_MS.
+            flush_every: Deferred mode pending-write threshold; 0 disables it.
+                Defaults to EXCELLM_FILE_FLUSH_EVERY_WRITES.
+            cache_max_mb: Memory budget for cached workbooks; 0 = unbounded.
+                Defaults to EXCELLM_FILE_CACHE_MAX_MB.
+            snapshots: Serve reads from columnar sheet snapshots.
+                Defaults to EXCELLM_FILE_SNAPSHOTS.
+            partial_save: Rewrite only the changed sheets on save.
+                Defaults to EXCELLM_FILE_PARTIAL_SAVE.
+        """
         if not OPENPYXL_AVAILABLE:
             raise ToolError(
                 "openpyxl is not installed. Install it with: pip install openpyxl",
                 code=ErrorCodes.EXCEL_NOT_RUNNING
             )
 
-        self._workbook_cache: Dict[str, openpyxl.Workbook] = {}
+        durability = (durability or FILE_DURABILITY).lower()
+        if durability not in (DURABILITY_IMMEDIATE, DURABILITY_DEFERRED):
+            raise ToolError(
+                f"Invalid durability '{durability}'. Must be "
+                f"'{DURABILITY_IMMEDIATE}' or '{DURABILITY_DEFERRED}'.",
+                code=ErrorCodes.VALIDATION_ERROR
+            )
+
+        self._durability = durability
+        self._flush_interval_ms = (
+            FILE_FLUSH_INTERVAL_MS if flush_interval_ms is None else flush_interval_ms
+        )
+        self._flush_every = FILE_FLUSH_EVERY_WRITES if flush_every is None else flush_every
+        if cache_max_mb is None:
+            cache_max_mb = FILE_CACHE_MAX_MB
+        self._workbook_cache = WorkbookCache(
+            max_bytes=cache_max_mb * 1024 * 1024,
+            on_evict=self._evict_entry,
+        )
+        self._lock = threading.RLock()
+        self._use_snapshots = FILE_SNAPSHOTS if snapshots is None else snapshots
+        self._partial_save = FILE_PARTIAL_SAVE if partial_save is None else partial_save
+        # Workbooks inside execute_batch(), which saves them once at the end
+        self._batching: Set[str] = set()
+
+        if self._durability == DURABILITY_DEFERRED:
+            atexit.register(self._flush_on_exit)
 
     @property
     def engine_name(self) -> str:
@@ -50,41 +197,311 @@ class FileEngine(ExcelEngine):
     def supports_live_excel(self) -> bool:
         return False
 
-    def _load_workbook(self, workbook_path: str) -> openpyxl.Workbook:
-        """Load workbook from file, using cache if available."""
+    def _load_workbook(self, workbook_path: str, for_write: bool = False) -> openpyxl.Workbook:
+        """Load workbook from file, using cache if available.
+
+        Args:
+            workbook_path: Path to the workbook file
+            for_write: If True, make sure the cached workbook is editable,
+                upgrading a read-only entry by reloading it in full
+
+        Returns:
+            openpyxl Workbook (read-only unless for_write or already upgraded)
+        """
         abs_path = os.path.abspath(workbook_path)
 
-        if abs_path in self._workbook_cache:
-            return self._workbook_cache[abs_path]
+        with self._lock:
+            entry = self._workbook_cache.get(abs_path)
+            if entry is not None:
+                if not for_write or entry.mode == EDIT_MODE:
+                    return entry.workbook
+                # Release the read-only archive handles before reloading for edit
+                self._close_readers(entry)
+                self._workbook_cache.pop(abs_path)
+                carried_snapshots = entry.snapshots
+            else:
+                carried_snapshots = {}
 
-        if not os.path.exists(abs_path):
+            if not os.path.exists(abs_path):
+                raise ToolError(
+                    f"File not found: {abs_path}",
+                    code=ErrorCodes.WORKBOOK_NOT_FOUND
+                )
+
+            mode = EDIT_MODE if for_write else READ_ONLY_MODE
+            stamp = file_stamp(abs_path)
+            try:
+                start_time = time.perf_counter()
+                wb = openpyxl.load_workbook(abs_path, read_only=(mode == READ_ONLY_MODE))
+                load_time_ms = (time.perf_counter() - start_time) * 1000
+            except Exception as e:
+                raise ToolError(
+                    f"Failed to open workbook: {str(e)}",
+                    code=ErrorCodes.WORKBOOK_NOT_FOUND
+                )
+
+            entry = _WorkbookEntry(wb, mode, load_time_ms, stamp)
+            # Same file version, so snapshots taken in read-only mode stay valid
+            entry.snapshots = carried_snapshots
+            if mode == EDIT_MODE:
+                entry.saved_style_counts = style_counts(wb)
+            self._workbook_cache.put(abs_path, entry)
+            return wb
+
+    def _save_workbook(self, workbook_path: str):
+        """Save workbook to file."""
+        abs_path = os.path.abspath(workbook_path)
+
+        with self._lock:
+            entry = self._workbook_cache.peek(abs_path)
+            if entry is None or entry.mode != EDIT_MODE:
+                return
+
+            self._write_entry(abs_path, entry)
+            self._workbook_cache.refresh(abs_path, saved=True)
+
+    def _write_entry(self, abs_path: str, entry: _WorkbookEntry) -> None:
+        """Write a cached edit-mode workbook to disk and clear its pending writes."""
+        if entry.flush_timer is not None:
+            entry.flush_timer.cancel()
+            entry.flush_timer = None
+
+        # Only sheet values changed and the file is still the one we loaded:
+        # rewrite the changed sheets and copy every other part as-is
+        partial = (
+            self._partial_save
+            and entry.dirty_sheets
+            and not entry.structure_changed
+            and entry.file_stamp == file_stamp(abs_path)
+        )
+
+        try:
+            if partial and save_changed_parts(
+                entry.workbook, abs_path, entry.dirty_sheets, entry.saved_style_counts
+            ):
+                entry.last_save = SAVE_PARTIAL
+            else:
+                save_workbook_atomic(entry.workbook, abs_path)
+                entry.last_save = SAVE_FULL
+        except Exception as e:
             raise ToolError(
-                f"File not found: {abs_path}",
-                code=ErrorCodes.WORKBOOK_NOT_FOUND
+                f"Failed to save workbook: {str(e)}",
+                code=ErrorCodes.WRITE_FAILED
             )
+        entry.pending_writes = 0
+        entry.dirty_sheets.clear()
+        entry.structure_changed = False
+        entry.saved_style_counts = style_counts(entry.workbook)
+
+    def _evict_entry(self, abs_path: str, entry: _WorkbookEntry) -> None:
+        """Flush and release a workbook leaving the cache."""
+        if entry.pending_writes:
+            self._write_entry(abs_path, entry)
+        elif entry.flush_timer is not None:
+            entry.flush_timer.cancel()
+            entry.flush_timer = None
+        self._close_readers(entry)
+
+    def _close_readers(self, entry: _WorkbookEntry) -> None:
+        """Release the archive handles held by a cache entry."""
+        entry.workbook.close()
+        if entry.reader is not None:
+            entry.reader.close()
+            entry.reader = None
+
+    def _commit_change(
+        self, workbook_path: str, sheet_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Record a mutation and save it according to the durability policy.
+
+        Args:
+            workbook_path: Workbook that was modified
+            sheet_name: Sheet whose values changed (None = sheet structure
+                changed, which drops every snapshot)
 
+        Returns:
+            Durability report included in write results
+        """
+        abs_path = os.path.abspath(workbook_path)
+
+        with self._lock:
+            entry = self._workbook_cache.peek(abs_path)
+            entry.version += 1
+            if sheet_name is None:
+                entry.snapshots.clear()
+                entry.structure_changed = True
+            else:
+                entry.snapshots.pop(sheet_name, None)
+                entry.dirty_sheets.add(sheet_name)
+            entry.pending_writes += 1
+
+            if abs_path in self._batching:
+                # execute_batch() applies the durability policy once at the end
+                self._workbook_cache.refresh(abs_path)
+                return {
+                    "mode": self._durability,
+                    "saved": False,
+                    "pending_writes": entry.pending_writes,
+                }
+
+            return self._apply_durability(abs_path, entry)
+
+    def _apply_durability(self, abs_path: str, entry: _WorkbookEntry) -> Dict[str, Any]:
+        """Save now or schedule a deferred save for an entry with pending writes."""
+        with self._lock:
+            if self._durability == DURABILITY_IMMEDIATE or (
+                self._flush_every and entry.pending_writes >= self._flush_every
+            ):
+                self._save_workbook(abs_path)
+                return {"mode": self._durability, "saved": True, "pending_writes": 0}
+
+            self._workbook_cache.refresh(abs_path)
+
+            if self._flush_interval_ms and entry.flush_timer is None:
+                entry.flush_timer = threading.Timer(
+                    self._flush_interval_ms / 1000, self._timed_flush, args=(abs_path,)
+                )
+                entry.flush_timer.daemon = True
+                entry.flush_timer.start()
+
+            return {
+                "mode": self._durability,
+                "saved": False,
+                "pending_writes": entry.pending_writes,
+            }
+
+    def _timed_flush(self, abs_path: str) -> None:
+        """Flush a workbook whose write-behind timer expired."""
+        with self._lock:
+            entry = self._workbook_cache.peek(abs_path)
+            if entry is None:
+                return
+            entry.flush_timer = None
+            if entry.pending_writes:
+                try:
+                    self._save_workbook(abs_path)
+                except ToolError as e:
+                    logger.warning(f"Deferred save of {abs_path} failed: {e.message}")
+
+    def _flush_on_exit(self) -> None:
+        """Flush pending writes at interpreter shutdown."""
         try:
-            wb = openpyxl.load_workbook(abs_path)
-            self._workbook_cache[abs_path] = wb
-            return wb
-        except Exception as e:
+            self.flush()
+        except ToolError as e:
+            logger.warning(f"Deferred save at shutdown failed: {e.message}")
+
+    def flush(self, workbook_path: Optional[str] = None) -> Dict[str, Any]:
+        """Save workbooks that have pending deferred writes.
+
+        Args:
+            workbook_path: Workbook to flush (None = all cached workbooks)
+
+        Returns:
+            Dictionary with the list of flushed paths
+        """
+        with self._lock:
+            if workbook_path:
+                paths = [os.path.abspath(workbook_path)]
+            else:
+                paths = [path for path, _ in self._workbook_cache.items()]
+
+            flushed = []
+            for path in paths:
+                entry = self._workbook_cache.peek(path)
+                if entry is not None and entry.pending_writes:
+                    self._save_workbook(path)
+                    flushed.append(path)
+
+        return {"success": True, "flushed": flushed}
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return workbook cache hit/miss/eviction counters and memory usage."""
+        with self._lock:
+            return self._workbook_cache.stats()
+
+    def _get_worksheet(self, wb: Any, sheet_name: str) -> Any:
+        """Return a worksheet or raise SHEET_NOT_FOUND."""
+        if sheet_name not in wb.sheetnames:
             raise ToolError(
-                f"Failed to open workbook: {str(e)}",
-                code=ErrorCodes.WORKBOOK_NOT_FOUND
+                f"Sheet '{sheet_name}' not found in workbook.",
+                code=ErrorCodes.SHEET_NOT_FOUND
             )
+        return wb[sheet_name]
 
-    def _save_workbook(self, workbook_path: str):
-        """Save workbook to file."""
+    def _sheet_snapshot(self, workbook_path: str, sheet_name: str, ws: Any) -> SheetSnapshot:
+        """Return the sheet's snapshot for the current workbook version, building it once."""
         abs_path = os.path.abspath(workbook_path)
 
-        if abs_path in self._workbook_cache:
+        with self._lock:
+            entry = self._workbook_cache.peek(abs_path)
+            snapshot = entry.snapshots.get(sheet_name)
+            if snapshot is None:
+                reader = self._streaming_reader(abs_path, entry)
+                if reader is not None:
+                    try:
+                        snapshot = SheetSnapshot.build(reader.iter_rows(sheet_name))
+                    except (UnsupportedXlsxError, KeyError) as e:
+                        logger.debug(f"Streaming snapshot of '{sheet_name}' fell back to openpyxl: {e}")
+                if snapshot is None:
+                    snapshot = build_sheet_snapshot(ws)
+                entry.snapshots[sheet_name] = snapshot
+                self._workbook_cache.refresh(abs_path)
+            return snapshot
+
+    def _streaming_reader(self, abs_path: str, entry: _WorkbookEntry) -> Optional[XlsxReader]:
+        """Return the entry's XlsxReader, opening it on first use.
+
+        Only read-only entries are streamed: edit-mode workbooks may hold
+        changes that are not on disk yet.
+        """
+        if entry.mode != READ_ONLY_MODE:
+            return None
+        if entry.reader is None:
             try:
-                self._workbook_cache[abs_path].save(abs_path)
+                entry.reader = XlsxReader(abs_path)
             except Exception as e:
-                raise ToolError(
-                    f"Failed to save workbook: {str(e)}",
-                    code=ErrorCodes.WRITE_FAILED
-                )
+                logger.debug(f"Streaming reader unavailable for {abs_path}: {e}")
+                return None
+        return entry.reader
+
+    def _read_rows(
+        self,
+        workbook_path: str,
+        sheet_name: str,
+        ws: Any,
+        bounds: Tuple[int, int, int, int],
+    ) -> List[List[Any]]:
+        """Read the rows of a range, streaming the sheet XML when possible."""
+        start_row, start_col, end_row, end_col = bounds
+        abs_path = os.path.abspath(workbook_path)
+
+        with self._lock:
+            entry = self._workbook_cache.peek(abs_path)
+            reader = self._streaming_reader(abs_path, entry)
+
+        if reader is not None:
+            try:
+                return list(reader.iter_rows(sheet_name, start_row, end_row, start_col, end_col))
+            except (UnsupportedXlsxError, KeyError) as e:
+                logger.debug(f"Streaming read of '{sheet_name}' fell back to openpyxl: {e}")
+
+        return [
+            list(row)
+            for row in ws.iter_rows(
+                min_row=start_row,
+                max_row=end_row,
+                min_col=start_col,
+                max_col=end_col,
+                values_only=True
+            )
+        ]
+
+    def _used_range_ref(self, ws: Any) -> str:
+        """Range covering the sheet's stored data (A1 to max row/column)."""
+        if isinstance(ws, ReadOnlyWorksheet) and not (ws.max_row and ws.max_column):
+            # File has no dimension record; scan it once to size the sheet
+            ws.calculate_dimension(force=True)
+        return build_range_address(1, 1, ws.max_row or 1, ws.max_column or 1)
 
     def _parse_range(self, range_ref: str) -> Tuple[int, int, int, int]:
         """Parse Excel range reference to (start_row, start_col, end_row, end_col).
@@ -130,9 +547,9 @@ class FileEngine(ExcelEngine):
         """List cached workbooks (file mode has no 'open' concept)."""
         workbooks = []
 
-        for path, wb in self._workbook_cache.items():
+        for path, entry in self._workbook_cache.items():
             sheets = []
-            for sheet in wb.worksheets:
+            for sheet in entry.workbook.worksheets:
                 sheets.append({
                     "name": sheet.title,
                     "hidden": sheet.sheet_state != 'visible'
@@ -142,6 +559,10 @@ class FileEngine(ExcelEngine):
                 "name": os.path.basename(path),
                 "path": path,
                 "sheets": sheets,
+                "mode": entry.mode,
+                "load_time_ms": round(entry.load_time_ms, 1),
+                "estimated_bytes": entry.estimated_bytes,
+                "last_save": entry.last_save,
             })
 
         return workbooks
@@ -155,28 +576,26 @@ class FileEngine(ExcelEngine):
         """Read range from file."""
         try:
             wb = self._load_workbook(workbook_path)
-
-            if sheet_name not in wb.sheetnames:
-                raise ToolError(
-                    f"Sheet '{sheet_name}' not found in workbook.",
-                    code=ErrorCodes.SHEET_NOT_FOUND
-                )
-
-            ws = wb[sheet_name]
+            ws = self._get_worksheet(wb, sheet_name)
 
             # Parse range
             start_row, start_col, end_row, end_col = self._parse_range(range_ref)
 
+            if self._use_snapshots:
+                snapshot = self._sheet_snapshot(workbook_path, sheet_name, ws)
+                return snapshot.slice(start_row, start_col, end_row, end_col)
+
             # Read data
-            data = []
-            for row in ws.iter_rows(
-                min_row=start_row,
-                max_row=end_row,
-                min_col=start_col,
-                max_col=end_col,
-                values_only=True
-            ):
-                data.append(list(row))
+            data = self._read_rows(
+                workbook_path, sheet_name, ws, (start_row, start_col, end_row, end_col)
+            )
+
+            # Read-only sheets stop at their last stored row; pad to the
+            # requested height so both modes return the same shape.
+            if isinstance(ws, ReadOnlyWorksheet):
+                width = end_col - start_col + 1
+                while len(data) < end_row - start_row + 1:
+                    data.append([None] * width)
 
             return data if data else [[]]
 
@@ -188,48 +607,205 @@ class FileEngine(ExcelEngine):
                 code=ErrorCodes.READ_FAILED
             )
 
-    def write_range(
+    def get_unique_values(
         self,
         workbook_path: str,
         sheet_name: str,
-        range_ref: str,
-        data: List[List[Any]],
+        range_ref: Optional[str] = None,
+        by_column: bool = False,
+        top_k: Optional[int] = None,
+        min_count: int = 1,
     ) -> Dict[str, Any]:
-        """Write range to file."""
+        """Get unique values and their frequencies from a range.
+
+        Args:
+            workbook_path: Path to workbook
+            sheet_name: Name of worksheet
+            range_ref: Range reference (defaults to the sheet's data extent)
+            by_column: Profile each column separately
+            top_k: Return at most this many values per profile (None = all)
+            min_count: Leave out values seen fewer times than this
+
+        Returns:
+            Dictionary with unique values and counts (same shape as the COM tool)
+        """
+        validate_unique_options(top_k, min_count)
         try:
             wb = self._load_workbook(workbook_path)
+            ws = self._get_worksheet(wb, sheet_name)
+            range_ref = range_ref or self._used_range_ref(ws)
+            start_row, start_col, end_row, end_col = self._parse_range(range_ref)
 
-            if sheet_name not in wb.sheetnames:
-                raise ToolError(
-                    f"Sheet '{sheet_name}' not found in workbook.",
-                    code=ErrorCodes.SHEET_NOT_FOUND
-                )
+            width = end_col - start_col + 1
+            profiles = [
+                ValueProfile(UNIQUE_MAX_EXACT_VALUES, top_k)
+                for _ in range(width if by_column else 1)
+            ]
+            if self._use_snapshots:
+                # Count each snapshot column once, then fold the counts in
+                snapshot = self._sheet_snapshot(workbook_path, sheet_name, ws)
+                for col in range(start_col, min(end_col, snapshot.n_cols) + 1):
+                    profile = profiles[col - start_col if by_column else 0]
+                    counts = snapshot.columns[col - 1].value_counts(start_row - 1, end_row)
+                    for (_, value), count in counts.items():
+                        if not is_cell_empty(value):
+                            profile.add(value, count)
+            else:
+                profile_rows(profiles, self.read_range(workbook_path, sheet_name, range_ref), by_column)
 
-            ws = wb[sheet_name]
+            return {
+                "success": True,
+                "workbook": workbook_path,
+                "sheet": sheet_name,
+                "range": range_ref,
+                **profile_summary(profiles, by_column, start_col, top_k, min_count),
+            }
 
-            # Parse range
-            start_row, start_col, _, _ = self._parse_range(range_ref)
-
-            # Write data
-            cells_written = 0
-            for row_idx, row_data in enumerate(data):
-                for col_idx, value in enumerate(row_data):
-                    ws.cell(
-                        row=start_row + row_idx,
-                        column=start_col + col_idx,
-                        value=value
-                    )
-                    cells_written += 1
+        except ToolError:
+            raise
+        except Exception as e:
+            raise ToolError(
+                f"Failed to get unique values: {str(e)}",
+                code=ErrorCodes.READ_FAILED
+            )
 
-            # Save workbook
-            self._save_workbook(workbook_path)
+    def search(
+        self,
+        workbook_path: str,
+        sheet_name: str,
+        filters: Any,
+        range_ref: Optional[str] = None,
+        has_header: bool = True,
+    ) -> Dict[str, Any]:
+        """Filter the rows of a range with FilterEngine.
 
-            return {
+        Args:
+            workbook_path: Path to workbook
+            sheet_name: Name of worksheet
+            filters: Filter specification (string for contains search, dict for complex)
+            range_ref: Range reference (defaults to the sheet's data extent)
+            has_header: If True, first row contains headers
+
+        Returns:
+            Dictionary with filtered data and Excel row locations
+        """
+        try:
+            wb = self._load_workbook(workbook_path)
+            ws = self._get_worksheet(wb, sheet_name)
+            range_ref = range_ref or self._used_range_ref(ws)
+            start_row, _, _, _ = self._parse_range(range_ref)
+
+            data = self.read_range(workbook_path, sheet_name, range_ref)
+
+            headers = None
+            data_rows = data
+            if has_header and data:
+                headers = [str(h) if h else f"Column{i+1}" for i, h in enumerate(data[0])]
+                data_rows = data[1:]
+
+            engine = FilterEngine()
+            filtered_data, row_indices = engine.filter_data(data_rows, filters, headers)
+
+            first_data_row = start_row + (1 if has_header else 0)
+            result = {
                 "success": True,
-                "cells_written": cells_written,
+                "workbook": workbook_path,
+                "sheet": sheet_name,
                 "range": range_ref,
+                "data": ([headers] if headers else []) + filtered_data,
+                "rows_filtered": len(filtered_data),
+                "rows_removed": len(data_rows) - len(filtered_data),
+                "original_rows": len(data_rows),
+                "columns": headers,
+                "cell_locations": [f"A{first_data_row + idx}" for idx in row_indices],
             }
 
+            warnings = engine.get_warnings()
+            if warnings:
+                result["warnings"] = warnings
+
+            return result
+
+        except ToolError:
+            raise
+        except Exception as e:
+            raise ToolError(
+                f"Failed to search: {str(e)}",
+                code=ErrorCodes.READ_FAILED
+            )
+
+    def search_all_sheets(
+        self,
+        workbook_path: str,
+        filters: Any,
+        range_ref: Optional[str] = None,
+        has_header: bool = True,
+        max_rows: Optional[int] = None,
+        parallel: bool = False,
+        sheet_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Filter every visible sheet, optionally on the search process pool.
+
+        Args:
+            workbook_path: Path to workbook
+            filters: Filter specification (string for contains search, dict for complex)
+            range_ref: Range to search on each sheet (defaults to each sheet's data extent)
+            has_header: If True, first row of each range contains headers
+            max_rows: Maximum matching rows across all sheets
+            parallel: If True, filter sheets in worker processes
+            sheet_timeout: Seconds each sheet may be filtered for
+
+        Returns:
+            Dictionary in the shape of parallel_search.search_blocks()
+        """
+        wb = self._load_workbook(workbook_path)
+
+        def blocks() -> Iterator[SheetBlock]:
+            for ws in wb.worksheets:
+                if ws.sheet_state != "visible":
+                    continue
+                ref = range_ref or self._used_range_ref(ws)
+                data = self.read_range(workbook_path, ws.title, ref)
+                yield SheetBlock(ws.title, ref, self._parse_range(ref)[0], data)
+
+        return search_blocks(blocks(), filters, has_header, max_rows, sheet_timeout, parallel)
+
+    def write_range(
+        self,
+        workbook_path: str,
+        sheet_name: str,
+        range_ref: str,
+        data: List[List[Any]],
+    ) -> Dict[str, Any]:
+        """Write range to file."""
+        try:
+            with self._lock:
+                wb = self._load_workbook(workbook_path, for_write=True)
+                ws = self._get_worksheet(wb, sheet_name)
+
+                # Parse range
+                start_row, start_col, _, _ = self._parse_range(range_ref)
+
+                # Write data
+                cells_written = 0
+                for row_idx, row_data in enumerate(data):
+                    for col_idx, value in enumerate(row_data):
+                        ws.cell(
+                            row=start_row + row_idx,
+                            column=start_col + col_idx,
+                            value=value
+                        )
+                        cells_written += 1
+
+                durability = self._commit_change(workbook_path, sheet_name)
+
+                return {
+                    "success": True,
+                    "cells_written": cells_written,
+                    "range": range_ref,
+                    "durability": durability,
+                }
+
         except ToolError:
             raise
         except Exception as e:
@@ -238,6 +814,223 @@ class FileEngine(ExcelEngine):
                 code=ErrorCodes.WRITE_FAILED
             )
 
+    def iter_rows(
+        self,
+        workbook_path: str,
+        sheet_name: str,
+        range_ref: Optional[str] = None,
+    ) -> Iterator[List[Any]]:
+        """Yield the rows of a range one at a time without materializing them.
+
+        Streams the sheet XML when the cached workbook is read-only, and
+        falls back to openpyxl's row iterator otherwise. Rows are padded to
+        the requested range like read_range().
+
+        Args:
+            workbook_path: Path to workbook
+            sheet_name: Name of worksheet
+            range_ref: Range reference (defaults to the sheet's data extent)
+        """
+        wb = self._load_workbook(workbook_path)
+        ws = self._get_worksheet(wb, sheet_name)
+        start_row, start_col, end_row, end_col = self._parse_range(
+            range_ref or self._used_range_ref(ws)
+        )
+
+        with self._lock:
+            entry = self._workbook_cache.peek(os.path.abspath(workbook_path))
+            reader = self._streaming_reader(os.path.abspath(workbook_path), entry)
+
+        row_number = start_row
+        streamed = False
+        if reader is not None:
+            try:
+                for row in reader.iter_rows(sheet_name, start_row, end_row, start_col, end_col):
+                    yield row
+                    row_number += 1
+                streamed = True
+            except (UnsupportedXlsxError, KeyError) as e:
+                # Resume where the streaming reader stopped
+                logger.debug(f"Streaming read of '{sheet_name}' fell back to openpyxl: {e}")
+
+        if not streamed:
+            for row in ws.iter_rows(
+                min_row=row_number,
+                max_row=end_row,
+                min_col=start_col,
+                max_col=end_col,
+                values_only=True
+            ):
+                yield list(row)
+                row_number += 1
+
+        # Sheets stop at their last stored row; pad like read_range()
+        width = end_col - start_col + 1
+        for _ in range(row_number, end_row + 1):
+            yield [None] * width
+
+    def export_rows(
+        self,
+        workbook_path: str,
+        sheet_name: str,
+        rows: Iterable[Sequence[Any]],
+        header: Optional[Sequence[Any]] = None,
+        start_cell: str = "A1",
+        replace: bool = False,
+    ) -> Dict[str, Any]:
+        """Write rows into a new sheet with constant memory.
+
+        Rows are consumed once and streamed straight into the file, so no
+        cell objects are kept however many rows are written. The workbook
+        is created if it does not exist. Any cached copy is flushed first
+        and dropped, since the file changes underneath it.
+
+        Args:
+            workbook_path: Path to workbook
+            sheet_name: Sheet to create
+            rows: Iterable of row value sequences
+            header: Optional header row, written bold
+            start_cell: Top-left cell of the output
+            replace: Overwrite sheet_name if it already exists
+
+        Returns:
+            Dictionary with the written range and row/column counts
+        """
+        abs_path = os.path.abspath(workbook_path)
+        start_row, start_col, _, _ = self._parse_range(start_cell)
+
+        try:
+            with self._lock:
+                entry = self._workbook_cache.peek(abs_path)
+                if entry is not None:
+                    self._evict_entry(abs_path, entry)
+                    self._workbook_cache.pop(abs_path)
+
+                if not os.path.exists(abs_path):
+                    validate_sheet_name(sheet_name)
+                    wb = openpyxl.Workbook()
+                    wb.active.title = sheet_name
+                    save_workbook_atomic(wb, abs_path)
+                    replace = True
+
+                mode = EXPORT_STREAMING
+                try:
+                    rows_written, cols_written = export_sheet(
+                        abs_path, sheet_name, rows, header, start_row, start_col, replace
+                    )
+                except UnsupportedXlsxError as e:
+                    logger.debug(f"Streaming export to {abs_path} fell back to openpyxl: {e}")
+                    mode = EXPORT_IN_MEMORY
+                    rows_written, cols_written = self._export_in_memory(
+                        abs_path, sheet_name, rows, header, start_row, start_col, replace
+                    )
+
+        except ValueError as e:
+            raise ToolError(str(e), code=ErrorCodes.VALIDATION_ERROR)
+        except ToolError:
+            raise
+        except Exception as e:
+            raise ToolError(
+                f"Failed to export rows: {str(e)}",
+                code=ErrorCodes.WRITE_FAILED
+            )
+
+        end_row = start_row + max(rows_written, 1) - 1
+        end_col = start_col + max(cols_written, 1) - 1
+        return {
+            "success": True,
+            "workbook": workbook_path,
+            "sheet": sheet_name,
+            "range": build_range_address(start_row, start_col, end_row, end_col),
+            "rows_written": rows_written,
+            "cols_written": cols_written,
+            "mode": mode,
+        }
+
+    def _export_in_memory(
+        self,
+        abs_path: str,
+        sheet_name: str,
+        rows: Iterable[Sequence[Any]],
+        header: Optional[Sequence[Any]],
+        start_row: int,
+        start_col: int,
+        replace: bool,
+    ) -> Tuple[int, int]:
+        """Fallback for export_rows() on packages that cannot be streamed into."""
+        wb = self._load_workbook(abs_path, for_write=True)
+        if sheet_name in wb.sheetnames:
+            if not replace:
+                raise ValueError(f"Sheet '{sheet_name}' already exists")
+            index = wb.sheetnames.index(sheet_name)
+            wb.remove(wb[sheet_name])
+            ws = wb.create_sheet(title=sheet_name, index=index)
+        else:
+            ws = wb.create_sheet(title=sheet_name)
+
+        rows_written = cols_written = 0
+        bold = Font(bold=True)
+        for row_idx, values in enumerate(
+            itertools.chain([header] if header is not None else [], rows)
+        ):
+            for col_idx, value in enumerate(values):
+                cell = ws.cell(row=start_row + row_idx, column=start_col + col_idx, value=value)
+                if header is not None and row_idx == 0:
+                    cell.font = bold
+            rows_written += 1
+            cols_written = max(cols_written, len(values))
+
+        self._commit_change(abs_path)
+        self.flush(abs_path)
+        return rows_written, cols_written
+
+    def execute_batch(
+        self,
+        workbook_path: str,
+        ops: List[Dict[str, Any]],
+        stop_on_error: bool = True,
+    ) -> Dict[str, Any]:
+        """Run several operations against one workbook with a single save.
+
+        The workbook is loaded once (editable if any op modifies it) and
+        the batch holds the engine lock throughout. Writes and sheet
+        operations only mark the workbook dirty; the durability policy is
+        applied once after the last op, so an "immediate" batch saves once.
+
+        Args:
+            workbook_path: Path to workbook
+            ops: Operations to run, in order (see ExcelEngine.execute_batch)
+            stop_on_error: If True, ops after the first failure are skipped
+
+        Returns:
+            Dictionary with one result per op and the batch's durability report
+        """
+        validate_batch_ops(ops)
+        abs_path = os.path.abspath(workbook_path)
+        modifies = any(op["op"] in BATCH_WRITE_OPS for op in ops)
+
+        with self._lock:
+            self._load_workbook(workbook_path, for_write=modifies)
+            pending_before = self._workbook_cache.peek(abs_path).pending_writes
+
+            def run_op(op: Dict[str, Any]) -> Dict[str, Any]:
+                result = self._run_batch_op(workbook_path, op)
+                result.pop("durability", None)  # Reported once for the batch
+                return result
+
+            self._batching.add(abs_path)
+            try:
+                result = self._run_batch(workbook_path, ops, stop_on_error, run_op)
+            finally:
+                self._batching.discard(abs_path)
+
+            entry = self._workbook_cache.peek(abs_path)
+            result["saved"] = False
+            if entry is not None and entry.pending_writes > pending_before:
+                result["durability"] = self._apply_durability(abs_path, entry)
+                result["saved"] = result["durability"]["saved"]
+            return result
+
     def get_sheet_names(self, workbook_path: str) -> List[str]:
         """Get sheet names from file."""
         try:
@@ -259,22 +1052,24 @@ class FileEngine(ExcelEngine):
     ) -> Dict[str, Any]:
         """Create new sheet in file."""
         try:
-            wb = self._load_workbook(workbook_path)
+            with self._lock:
+                wb = self._load_workbook(workbook_path, for_write=True)
 
-            if sheet_name in wb.sheetnames:
-                raise ToolError(
-                    f"Sheet '{sheet_name}' already exists.",
-                    code=ErrorCodes.WRITE_FAILED
-                )
+                if sheet_name in wb.sheetnames:
+                    raise ToolError(
+                        f"Sheet '{sheet_name}' already exists.",
+                        code=ErrorCodes.WRITE_FAILED
+                    )
 
-            wb.create_sheet(title=sheet_name)
-            self._save_workbook(workbook_path)
+                wb.create_sheet(title=sheet_name)
+                durability = self._commit_change(workbook_path)
 
-            return {
-                "success": True,
-                "sheet_name": sheet_name,
-                "message": f"Created sheet '{sheet_name}'",
-            }
+                return {
+                    "success": True,
+                    "sheet_name": sheet_name,
+                    "message": f"Created sheet '{sheet_name}'",
+                    "durability": durability,
+                }
 
         except ToolError:
             raise
@@ -291,28 +1086,30 @@ class FileEngine(ExcelEngine):
     ) -> Dict[str, Any]:
         """Delete sheet from file."""
         try:
-            wb = self._load_workbook(workbook_path)
+            with self._lock:
+                wb = self._load_workbook(workbook_path, for_write=True)
 
-            if sheet_name not in wb.sheetnames:
-                raise ToolError(
-                    f"Sheet '{sheet_name}' not found in workbook.",
-                    code=ErrorCodes.SHEET_NOT_FOUND
-                )
+                if sheet_name not in wb.sheetnames:
+                    raise ToolError(
+                        f"Sheet '{sheet_name}' not found in workbook.",
+                        code=ErrorCodes.SHEET_NOT_FOUND
+                    )
 
-            if len(wb.sheetnames) == 1:
-                raise ToolError(
-                    "Cannot delete the only sheet in workbook.",
-                    code=ErrorCodes.WRITE_FAILED
-                )
+                if len(wb.sheetnames) == 1:
+                    raise ToolError(
+                        "Cannot delete the only sheet in workbook.",
+                        code=ErrorCodes.WRITE_FAILED
+                    )
 
-            wb.remove(wb[sheet_name])
-            self._save_workbook(workbook_path)
+                wb.remove(wb[sheet_name])
+                durability = self._commit_change(workbook_path)
 
-            return {
-                "success": True,
-                "sheet_name": sheet_name,
-                "message": f"Deleted sheet '{sheet_name}'",
-            }
+                return {
+                    "success": True,
+                    "sheet_name": sheet_name,
+                    "message": f"Deleted sheet '{sheet_name}'",
+                    "durability": durability,
+                }
 
         except ToolError:
             raise
@@ -321,3 +1118,55 @@ class FileEngine(ExcelEngine):
                 f"Failed to delete sheet: {str(e)}",
                 code=ErrorCodes.WRITE_FAILED
             )
+
+    def bulk_insert_delete(
+        self,
+        workbook_path: str,
+        sheet_name: str,
+        action: str,
+        line_type: str,
+        positions: List[Any],
+    ) -> Dict[str, Any]:
+        """Insert or delete rows or columns, moving every cell once.
+
+        openpyxl's insert_rows/delete_rows move all cells past the edit on
+        each call, so k positions cost k passes over the sheet. This maps
+        every cell to its final position in a single pass. As with
+        openpyxl, formulas, merged ranges and row/column dimensions are not
+        adjusted.
+        """
+        blocks = plan_line_edit(action, line_type, positions)
+        try:
+            with self._lock:
+                wb = self._load_workbook(workbook_path, for_write=True)
+                ws = self._get_worksheet(wb, sheet_name)
+
+                shift = line_shift(blocks, action)
+                moved = {}
+                for (row, col), cell in ws._cells.items():
+                    if line_type == "row":
+                        row = shift(row)
+                    else:
+                        col = shift(col)
+                    if row is None or col is None:
+                        continue  # Deleted
+                    cell.row, cell.column = row, col
+                    moved[(row, col)] = cell
+                ws._cells = moved
+
+                durability = self._commit_change(workbook_path, sheet_name)
+
+                return {
+                    "success": True,
+                    "count": sum(last - first + 1 for first, last in blocks),
+                    "blocks": [line_area_address(first, last, line_type) for first, last in blocks],
+                    "durability": durability,
+                }
+
+        except ToolError:
+            raise
+        except Exception as e:
+            raise ToolError(
+                f"Failed to {action} {line_type}s: {str(e)}",
+                code=ErrorCodes.WRITE_FAILED
+            )
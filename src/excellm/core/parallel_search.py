@@ -0,0 +1,266 @@
+"""Search of many sheets at once on a process pool.
+
+Once a sheet's values are in memory (a COM Range.Value read or a file-mode
+snapshot slice) filtering them is pure Python CPU work, so an all-sheets
+search can filter several sheets at the same time in worker processes:
+
+- the caller yields one SheetBlock per sheet; each block is sent to a
+  worker as soon as it is read, so reading the next sheet overlaps with
+  filtering the previous ones
+- workers run FilterEngine over the block in chunks and return only the
+  matching row indices; the caller still holds the rows
+- results are merged in sheet order
+
+Work stops early in two ways. A worker stops a sheet once its time budget
+(sheet_timeout, counted from when the worker starts it) runs out and
+reports the rows it got through. Once the merged matches reach max_rows,
+sheets not yet started are cancelled and no further sheets are read.
+
+Sheets under MIN_PARALLEL_CELLS cells, and every sheet when parallel is
+off, are filtered in this process with the same code. If the pool cannot
+be started or a worker dies, the affected sheets are filtered here too.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ..config import FILTER_PLAN_SAMPLE_ROWS, SEARCH_WORKERS
+from ..filters import FilterEngine, plan_filter, to_filter_tree
+
+logger = logging.getLogger(__name__)
+
+# Rows filtered between checks of the time budget and the row limit
+CHUNK_ROWS = 10000
+
+# Smaller sheets are filtered in this process (shipping them costs more)
+MIN_PARALLEL_CELLS = 20000
+
+
+class SheetBlock(NamedTuple):
+    """Values of one sheet's search range."""
+
+    sheet: str
+    range: str
+    start_row: int  # Excel row of data[0]
+    data: List[List[Any]]
+
+
+def split_header(
+    data: List[List[Any]], has_header: bool
+) -> Tuple[Optional[List[str]], List[List[Any]]]:
+    """Split a block into (headers, data rows), naming blank headers ColumnN."""
+    if has_header and data:
+        headers = [str(h) if h else f"Column{i+1}" for i, h in enumerate(data[0])]
+        return headers, data[1:]
+    return None, data
+
+
+def filter_block(
+    data: List[List[Any]],
+    filters: Any,
+    has_header: bool,
+    limit: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Filter one block; runs in a worker process or inline.
+
+    Args:
+        data: Block values, header row first when has_header
+        filters: Filter specification accepted by FilterEngine.filter_data
+        has_header: If True, the first row holds headers
+        limit: Stop once this many matches are found
+        time_budget: Stop after this many seconds
+
+    Returns:
+        Dictionary with row_indices (into the data rows), rows_scanned,
+        timed_out, limited and warnings
+    """
+    deadline = time.monotonic() + time_budget if time_budget else None
+    headers, data_rows = split_header(data, has_header)
+    # Order the conditions once, on the first chunk's rows, for every chunk
+    engine = FilterEngine(plan_rows=0)
+    tree = to_filter_tree(filters)
+    if FILTER_PLAN_SAMPLE_ROWS > 0:
+        tree, _ = plan_filter(tree, headers, data_rows[:min(FILTER_PLAN_SAMPLE_ROWS, CHUNK_ROWS)])
+
+    indices: List[int] = []
+    scanned = 0
+    timed_out = limited = False
+    for start in range(0, len(data_rows), CHUNK_ROWS):
+        _, found = engine.filter_data(data_rows[start:start + CHUNK_ROWS], tree, headers)
+        indices.extend(start + i for i in found)
+        scanned = min(start + CHUNK_ROWS, len(data_rows))
+        if limit is not None and len(indices) >= limit:
+            limited = len(indices) > limit or scanned < len(data_rows)
+            del indices[limit:]
+            break
+        if deadline is not None and scanned < len(data_rows) and time.monotonic() > deadline:
+            timed_out = True
+            break
+
+    return {
+        "row_indices": indices,
+        "rows_scanned": scanned,
+        "timed_out": timed_out,
+        "limited": limited,
+        "warnings": engine.get_warnings(),
+    }
+
+
+_pool_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """The shared worker pool, started on first use (None if it cannot start)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = ProcessPoolExecutor(max_workers=SEARCH_WORKERS or os.cpu_count() or 1)
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Search worker pool unavailable, filtering in process: {e}")
+                return None
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def search_blocks(
+    blocks: Iterable[SheetBlock],
+    filters: Any,
+    has_header: bool = True,
+    max_rows: Optional[int] = None,
+    sheet_timeout: Optional[float] = None,
+    parallel: bool = True,
+) -> Dict[str, Any]:
+    """Filter every block and merge the results in block order.
+
+    Args:
+        blocks: Sheets to search, read lazily in order
+        filters: Filter specification accepted by FilterEngine.filter_data
+        has_header: If True, each block's first row holds headers
+        max_rows: Maximum matching rows across all sheets
+        sheet_timeout: Seconds each sheet may be filtered for
+        parallel: If True, filter blocks on the process pool
+
+    Returns:
+        Dictionary with sheets_searched, total_rows_filtered, results (one
+        entry per sheet with matches, in order: sheet, range, rows_filtered,
+        data, cell_locations) and parallel (whether the pool was used); plus
+        truncated/hint when max_rows stopped the search and timed_out_sheets
+        (sheet, rows_scanned) for sheets cut short by sheet_timeout
+    """
+    pool = _get_pool() if parallel else None
+    pending: List[Tuple[SheetBlock, Any]] = []  # (block, Future or inline result)
+    results: List[Dict[str, Any]] = []
+    sheets_searched: List[str] = []
+    timed_out: List[Dict[str, Any]] = []
+    warnings: List[str] = []
+    total = 0
+    truncated = False
+
+    def merge(block: SheetBlock, outcome: Any) -> None:
+        nonlocal total, truncated
+        if isinstance(outcome, Future):
+            try:
+                outcome = outcome.result()
+            except Exception as e:  # Worker died or the pool broke
+                logger.warning(f"Search worker failed on sheet {block.sheet}, filtering in process: {e}")
+                _reset_pool()
+                outcome = filter_block(block.data, filters, has_header, max_rows, sheet_timeout)
+
+        indices = outcome["row_indices"]
+        if max_rows is not None and total + len(indices) >= max_rows:
+            truncated = truncated or outcome["limited"] or total + len(indices) > max_rows
+            indices = indices[:max_rows - total]
+        total += len(indices)
+
+        sheets_searched.append(block.sheet)
+        if outcome["timed_out"]:
+            timed_out.append({"sheet": block.sheet, "rows_scanned": outcome["rows_scanned"]})
+        warnings.extend(outcome["warnings"])
+        if not indices:
+            return
+
+        headers, data_rows = split_header(block.data, has_header)
+        first_row = block.start_row + (1 if headers is not None else 0)
+        results.append({
+            "sheet": block.sheet,
+            "range": block.range,
+            "rows_filtered": len(indices),
+            "data": ([headers] if headers else []) + [data_rows[i] for i in indices],
+            "cell_locations": [f"A{first_row + i}" for i in indices],
+        })
+
+    def drain(wait: bool) -> bool:
+        """Merge finished sheets in order; True once max_rows is reached."""
+        while pending and (wait or not isinstance(pending[0][1], Future) or pending[0][1].done()):
+            merge(*pending.pop(0))
+            if max_rows is not None and total >= max_rows:
+                return True
+        return False
+
+    stopped = False
+    blocks = iter(blocks)
+    while True:
+        # Check before reading the next sheet, which may be costly
+        if drain(wait=False):
+            stopped = True
+            break
+        block = next(blocks, None)
+        if block is None:
+            break
+        # Earlier unmerged sheets may still match, so this is only an upper bound
+        limit = None if max_rows is None else max_rows - total
+        cells = len(block.data) * max((len(row) for row in block.data), default=0)
+        outcome = None
+        if pool is not None and cells >= MIN_PARALLEL_CELLS:
+            try:
+                outcome = pool.submit(filter_block, block.data, filters, has_header, limit, sheet_timeout)
+            except Exception as e:  # Pool already broken
+                logger.warning(f"Search worker pool failed, filtering in process: {e}")
+                _reset_pool()
+                pool = None
+        if outcome is None:
+            outcome = filter_block(block.data, filters, has_header, limit, sheet_timeout)
+        pending.append((block, outcome))
+
+    if stopped or drain(wait=True):
+        # max_rows reached: drop the sheets still queued
+        for _, outcome in pending:
+            if isinstance(outcome, Future):
+                outcome.cancel()
+        if pending:
+            truncated = True
+        elif not truncated and next(blocks, None) is not None:
+            # Exactly max_rows matched: only a sheet left unsearched may hold more
+            truncated = True
+
+    result = {
+        "sheets_searched": len(sheets_searched),
+        "total_rows_filtered": total,
+        "results": results,
+        "parallel": pool is not None,
+    }
+    if truncated:
+        result["truncated"] = True
+        result["hint"] = (
+            f"Stopped at max_rows={max_rows} after {len(sheets_searched)} sheet(s); "
+            "more matching rows may exist."
+        )
+    if timed_out:
+        result["timed_out_sheets"] = timed_out
+    if warnings:
+        result["warnings"] = warnings
+    return result
@@ -0,0 +1,201 @@
+"""Atomic and partial saves for openpyxl workbooks.
+
+A full openpyxl save regenerates every part of the package, so changing a
+few cells on one sheet of a 30-sheet workbook re-serializes and re-deflates
+all 30 sheets. save_changed_parts() instead rebuilds the archive from the
+file on disk:
+
+- only the worksheets that were written to are re-serialized with
+  openpyxl's worksheet writer (strings are written inline, so the shared
+  string table of the untouched sheets stays valid)
+- styles.xml is rewritten only if the writes added cell or differential
+  styles; openpyxl keeps existing style indices, so untouched sheets
+  still point at the right formats
+- every other zip member is copied as its raw compressed bytes
+
+Both save paths write to a temporary file next to the target and rename it
+into place, so a crash never leaves a half-written workbook behind.
+"""
+
+import os
+import posixpath
+import re
+import shutil
+import struct
+import tempfile
+import zipfile
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from openpyxl.styles.stylesheet import write_stylesheet
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.xml.functions import tostring
+
+from .xlsx_reader import XlsxReader
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+
+def style_counts(workbook: Any) -> Tuple[int, int]:
+    """Number of cell styles and differential styles a workbook holds."""
+    return len(workbook._cell_styles), len(workbook._differential_styles.styles)
+
+
+def write_atomic(path: str, write: Callable[[str], None]) -> None:
+    """Call write(temp_path) and rename the result over path."""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", prefix=".excellm-", dir=folder)
+    os.close(fd)
+    try:
+        write(temp_path)
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def save_workbook_atomic(workbook: Any, path: str) -> None:
+    """Full openpyxl save through a temporary file and rename."""
+    write_atomic(path, workbook.save)
+
+
+def _render_worksheet(ws: Any) -> Optional[bytes]:
+    """Serialize one worksheet, or None if it needs parts of its own.
+
+    Hyperlinks, comments, tables, pivots, images and charts are written as
+    separate parts with fresh relationship ids, which only a full save can
+    wire up.
+    """
+    if ws._images or ws._charts or ws._tables or ws._pivots or ws.legacy_drawing:
+        return None
+
+    writer = WorksheetWriter(ws)
+    try:
+        writer.write()
+        if len(writer._rels) or ws._comments:
+            return None
+        return writer.read()
+    finally:
+        writer.cleanup()
+
+
+def copy_member_raw(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """Copy a member's compressed bytes without inflating and re-deflating them."""
+    source.fp.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, source.fp.read(zipfile.sizeFileHeader))
+    name_length = header[zipfile._FH_FILENAME_LENGTH]
+    extra_length = header[zipfile._FH_EXTRA_FIELD_LENGTH]
+    source.fp.seek(name_length + extra_length, os.SEEK_CUR)
+    data = source.fp.read(info.compress_size)
+
+    copied = zipfile.ZipInfo(info.filename, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.external_attr = info.external_attr
+    copied.create_system = info.create_system
+    copied.CRC = info.CRC
+    copied.compress_size = info.compress_size
+    copied.file_size = info.file_size
+    # Sizes are known, so the local header carries them (no data descriptor)
+    copied.flag_bits = info.flag_bits & ~0x08
+
+    target.fp.seek(target.start_dir)
+    copied.header_offset = target.fp.tell()
+    zip64 = max(copied.file_size, copied.compress_size) > zipfile.ZIP64_LIMIT
+    target.fp.write(copied.FileHeader(zip64=zip64))
+    target.fp.write(data)
+    target.start_dir = target.fp.tell()
+    target.filelist.append(copied)
+    target.NameToInfo[copied.filename] = copied
+    target._didModify = True
+
+
+def without_calc_chain(reader: XlsxReader, replacements: Dict[str, bytes]) -> Optional[str]:
+    """Unregister calcChain.xml, which may list cells that lost their formulas.
+
+    Excel rebuilds the chain on load (openpyxl full saves drop it too).
+    Edits parts already in replacements. Returns the dropped part name, if any.
+    """
+    part = reader.related_part("calcChain")
+    if part is None:
+        return None
+
+    archive = reader.archive
+    folder, name = posixpath.split(reader.workbook_part)
+    workbook_rels = posixpath.join(folder, "_rels", name + ".rels")
+    rels = replacements.get(workbook_rels) or archive.read(workbook_rels)
+    replacements[workbook_rels] = re.sub(
+        r"<Relationship\b[^>]*?Type=\"[^\"]*/calcChain\"[^>]*/>", "", rels.decode("utf-8")
+    ).encode("utf-8")
+
+    content_types = (
+        replacements.get(CONTENT_TYPES_PART) or archive.read(CONTENT_TYPES_PART)
+    ).decode("utf-8")
+    replacements[CONTENT_TYPES_PART] = re.sub(
+        r"<Override\b[^>]*?PartName=\"/" + re.escape(part) + r"\"[^>]*/>", "", content_types
+    ).encode("utf-8")
+    return part
+
+
+def save_changed_parts(
+    workbook: Any,
+    path: str,
+    dirty_sheets: Iterable[str],
+    loaded_style_counts: Tuple[int, int],
+) -> bool:
+    """Rewrite only the changed parts of the .xlsx file at path.
+
+    Args:
+        workbook: Editable openpyxl workbook loaded from path
+        path: File the workbook was loaded from (and is saved to)
+        dirty_sheets: Names of the worksheets whose cells were written
+        loaded_style_counts: style_counts() of the workbook as last saved
+
+    Returns:
+        True if the file was saved, False if the changes need a full save
+    """
+    try:
+        reader = XlsxReader(path)
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+    try:
+        replacements: Dict[str, bytes] = {}
+        for sheet_name in dirty_sheets:
+            try:
+                part = reader.sheet_part(sheet_name)
+            except KeyError:
+                return False
+            if sheet_name not in workbook.sheetnames:
+                return False
+            rendered = _render_worksheet(workbook[sheet_name])
+            if rendered is None:
+                return False
+            replacements[part] = rendered
+
+        if style_counts(workbook) != tuple(loaded_style_counts):
+            styles_part = reader.related_part("styles")
+            if styles_part is None:
+                return False
+            replacements[styles_part] = tostring(write_stylesheet(workbook))
+
+        dropped = without_calc_chain(reader, replacements)
+
+        def write(temp_path: str) -> None:
+            source = reader.archive
+            with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as target:
+                for info in source.infolist():
+                    if info.filename == dropped:
+                        continue
+                    if info.filename in replacements:
+                        target.writestr(info.filename, replacements[info.filename])
+                    else:
+                        copy_member_raw(source, target, info)
+            # Release the original before it is replaced (required on Windows)
+            reader.close()
+
+        write_atomic(path, write)
+        return True
+    finally:
+        reader.close()
@@ -0,0 +1,144 @@
+"""Performance mode for bulk COM operations.
+
+Excel repaints, raises Change events and (in automatic calculation mode)
+recalculates after every mutation, so a tool that inserts 50 rows one at
+a time pays for 50 recalculations. PerformanceMode turns ScreenUpdating,
+EnableEvents and automatic Calculation off for a block of COM calls and
+restores the values it changed afterwards, also when the block raises.
+
+Calculation is restored first: switching back to automatic makes Excel
+recalculate the cells dirtied inside the block once, instead of once per
+mutation. If calculation was already manual nothing is recalculated.
+
+Nested blocks on the same app (a performance-mode tool call inside a
+performance-mode batch) are no-ops; the outermost block restores.
+"""
+
+import functools
+import logging
+import threading
+from typing import Any, Callable, Dict, TypeVar
+
+from .connection import get_excel_app
+
+logger = logging.getLogger(__name__)
+
+# XlCalculation
+XL_CALCULATION_AUTOMATIC = -4105
+XL_CALCULATION_MANUAL = -4135
+XL_CALCULATION_SEMIAUTOMATIC = 2
+
+# Application settings switched off, in the order they are applied
+_SETTINGS = (
+    ("ScreenUpdating", False),
+    ("EnableEvents", False),
+    ("Calculation", XL_CALCULATION_MANUAL),
+)
+
+# Apps with an active performance mode on this thread: id(app) -> depth
+_active = threading.local()
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class PerformanceMode:
+    """Context manager that suspends repainting, events and recalculation.
+
+    Usage:
+        with PerformanceMode(app) as mode:
+            for row in rows:
+                worksheet.Rows(row).Insert()
+        mode.report()  # {"suspended": [...], "recalculated": True, ...}
+    """
+
+    def __init__(self, app, enabled: bool = True):
+        """
+        Args:
+            app: Excel Application COM object
+            enabled: If False the context does nothing
+        """
+        self.app = app
+        self.enabled = enabled
+        self.saved: Dict[str, Any] = {}
+        self.nested = False
+        self.recalculated = False
+
+    def __enter__(self) -> "PerformanceMode":
+        if not self.enabled:
+            return self
+
+        depths = getattr(_active, "depths", None)
+        if depths is None:
+            depths = _active.depths = {}
+        key = id(self.app)
+        depths[key] = depths.get(key, 0) + 1
+        if depths[key] > 1:
+            self.nested = True
+            return self
+
+        for name, value in _SETTINGS:
+            try:
+                current = getattr(self.app, name)
+                if current != value:
+                    setattr(self.app, name, value)
+                    self.saved[name] = current
+            except Exception as e:
+                # Calculation cannot be read or set while no workbook is open
+                logger.debug(f"Performance mode could not switch {name}: {e}")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self.enabled:
+            return False
+
+        depths = _active.depths
+        key = id(self.app)
+        depths[key] -= 1
+        if depths[key] == 0:
+            del depths[key]
+        if self.nested:
+            return False
+
+        # Reverse order: Calculation first, so its one recalculation runs
+        # with repainting and events still off
+        for name, _ in reversed(_SETTINGS):
+            if name not in self.saved:
+                continue
+            try:
+                setattr(self.app, name, self.saved[name])
+            except Exception as e:
+                logger.warning(f"Performance mode could not restore {name}: {e}")
+            else:
+                if name == "Calculation":
+                    self.recalculated = self.saved[name] != XL_CALCULATION_MANUAL
+
+        return False  # Don't suppress exceptions
+
+    def report(self) -> Dict[str, Any]:
+        """Describe what the block suspended and whether it recalculated."""
+        return {
+            "enabled": self.enabled,
+            "nested": self.nested,
+            "suspended": [name for name, _ in _SETTINGS if name in self.saved],
+            "recalculated": self.recalculated,
+        }
+
+
+def with_performance_mode(func: F) -> F:
+    """Decorator that adds a ``performance_mode=False`` keyword to a COM tool.
+
+    With performance_mode=True the call runs inside PerformanceMode on the
+    thread's Excel app, and a dict result gets a "performance_mode" report.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, performance_mode: bool = False, **kwargs):
+        if not performance_mode:
+            return func(*args, **kwargs)
+
+        with PerformanceMode(get_excel_app()) as mode:
+            result = func(*args, **kwargs)
+        if isinstance(result, dict):
+            result["performance_mode"] = mode.report()
+        return result
+
+    return wrapper  # type: ignore
@@ -0,0 +1,226 @@
+"""Inverted index over the cell text of a sheet, for repeated searches.
+
+An agent often searches the same sheet many times in a row with different
+terms. With use_index, the first search reads the range once and builds a
+SearchIndex of it; later searches of the same range reuse the values and
+only evaluate the filter on the rows the index says can match.
+
+The index holds, for the trimmed, lowercased text of every non-empty cell
+(the text the string filters compare):
+
+- values: cell text -> posting list of cells with exactly that text
+- grams:  trigram -> cells whose text, framed by start/end markers,
+  contains it
+
+Postings are cell ids (row * width + col) in compact int arrays. A lookup
+only narrows the rows: candidates are a superset of the matches and the
+search still runs the filter on each of them, so results are the same as a
+full scan. Conditions the index cannot narrow (numbers, regex, short
+needles, numeric-looking equality values) leave the scan to the filter.
+
+Indexes are kept per (workbook, sheet, range) with a stamp of the sheet
+version; any tool write (mark_sheet_changed) or Excel-reported edit changes
+the version and the next search rebuilds. The cache is an LRU bounded by
+SEARCH_INDEX_MAX_CELLS indexed cells.
+"""
+
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set, Union
+
+from ..config import SEARCH_INDEX_MAX_CELLS
+from ..filters import (
+    FilterGroup,
+    FilterOperator,
+    LogicalOperator,
+    SingleFilter,
+    _to_number,
+)
+
+GRAM = 3
+_START = "\x02"
+_END = "\x03"
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class SearchIndex:
+    """Cell-text postings of a block of value rows (header row included)."""
+
+    def __init__(self, rows: List[List[Any]]):
+        self.rows = rows
+        self.width = max((len(row) for row in rows), default=0)
+        self.values: Dict[str, array] = {}
+        self.grams: Dict[str, array] = {}
+
+        width = self.width
+        values = self.values
+        for r, row in enumerate(rows):
+            base = r * width
+            for c, cell in enumerate(row):
+                if cell is None:
+                    continue
+                text = str(cell).strip().lower()
+                postings = values.get(text)
+                if postings is None:
+                    postings = values[text] = array("l")
+                postings.append(base + c)
+
+        # Each distinct text is split once; its postings go to every gram
+        grams = self.grams
+        for text, postings in values.items():
+            for gram in _grams(_START + text + _END):
+                if gram in grams:
+                    grams[gram].extend(postings)
+                else:
+                    grams[gram] = array("l", postings)
+
+    @property
+    def cell_count(self) -> int:
+        return len(self.rows) * self.width
+
+    def _gram_cells(self, text: str) -> Optional[Set[int]]:
+        """Cells whose framed text contains every gram of text (None = text too short)."""
+        grams = sorted(_grams(text), key=lambda g: len(self.grams.get(g, ())))
+        if not grams:
+            return None
+        cells = set(self.grams.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not cells:
+                break
+            cells.intersection_update(self.grams.get(gram, ()))
+        return cells
+
+    def _value_cells(self, value: Any) -> Optional[Set[int]]:
+        """Cells that can equal value under the = operator (None = can't tell)."""
+        if not isinstance(value, str):
+            return None
+        value = value.strip()
+        # Numeric text also equals numbers; "None" equals empty cells
+        if _to_number(value) is not None or value == "None":
+            return None
+        return set(self.values.get(value.lower(), ()))
+
+    def _condition_cells(self, filter_obj: SingleFilter) -> Optional[Set[int]]:
+        operator = filter_obj.operator
+        value = filter_obj.value
+        if operator == FilterOperator.EQ:
+            return self._value_cells(value)
+        if operator == FilterOperator.IN and isinstance(value, (list, tuple)):
+            cells: Set[int] = set()
+            for item in value:
+                item_cells = self._value_cells(item)
+                if item_cells is None:
+                    return None
+                cells |= item_cells
+            return cells
+        if value is None:
+            return None
+        text = str(value).strip().lower()
+        if operator == FilterOperator.CONTAINS:
+            return self._gram_cells(text)
+        if operator == FilterOperator.STARTS_WITH:
+            return self._gram_cells(_START + text)
+        if operator == FilterOperator.ENDS_WITH:
+            return self._gram_cells(text + _END)
+        return None
+
+    def _rows_for(
+        self, node: Union[FilterGroup, SingleFilter], headers: Optional[List[str]]
+    ) -> Optional[Set[int]]:
+        """Rows (of self.rows) that can match node, or None for any row."""
+        if isinstance(node, SingleFilter):
+            cells = self._condition_cells(node)
+            if cells is None:
+                return None
+            width = self.width
+            if node.column is None:
+                return {cell // width for cell in cells}
+            try:
+                col = node.column.resolve(headers)
+            except (ValueError, IndexError):
+                return None
+            if not 0 <= col < width:
+                return None
+            return {cell // width for cell in cells if cell % width == col}
+
+        if not isinstance(node, FilterGroup) or not node.conditions:
+            return None
+        if node.operator == LogicalOperator.AND:
+            rows = None
+            for cond in node.conditions:
+                cond_rows = self._rows_for(cond, headers)
+                if cond_rows is not None:
+                    rows = cond_rows if rows is None else rows & cond_rows
+            return rows
+        if node.operator == LogicalOperator.OR:
+            rows = set()
+            for cond in node.conditions:
+                cond_rows = self._rows_for(cond, headers)
+                if cond_rows is None:
+                    return None
+                rows |= cond_rows
+            return rows
+        return None  # NOT: the complement is not narrower
+
+    def candidate_rows(
+        self,
+        filters: Union[FilterGroup, SingleFilter],
+        headers: Optional[List[str]] = None,
+        first_row: int = 0,
+    ) -> Optional[List[int]]:
+        """Ascending data-row indices that can match, or None to scan every row.
+
+        Args:
+            filters: Parsed filter tree
+            headers: Headers for name-based column references
+            first_row: Index of the first data row in self.rows (1 with a header)
+        """
+        rows = self._rows_for(filters, headers)
+        if rows is None:
+            return None
+        return [r - first_row for r in sorted(rows) if r >= first_row]
+
+
+_lock = threading.Lock()
+_indexes: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+
+def get_index(key: Hashable, stamp: Hashable) -> Optional[SearchIndex]:
+    """Cached index for key if it was built at the same stamp."""
+    with _lock:
+        entry = _indexes.get(key)
+        if entry is None:
+            return None
+        if entry[0] != stamp:
+            del _indexes[key]
+            return None
+        _indexes.move_to_end(key)
+        return entry[1]
+
+
+def put_index(key: Hashable, stamp: Hashable, index: SearchIndex) -> bool:
+    """Cache an index, evicting least recently used ones to stay in budget.
+
+    Returns:
+        False if the index alone is larger than the budget (not cached)
+    """
+    if index.cell_count > SEARCH_INDEX_MAX_CELLS:
+        return False
+    with _lock:
+        _indexes[key] = (stamp, index)
+        _indexes.move_to_end(key)
+        total = sum(entry[1].cell_count for entry in _indexes.values())
+        while total > SEARCH_INDEX_MAX_CELLS:
+            _, (_, evicted) = _indexes.popitem(last=False)
+            total -= evicted.cell_count
+    return True
+
+
+def clear_indexes() -> None:
+    """Drop every cached index."""
+    with _lock:
+        _indexes.clear()
@@ -0,0 +1,221 @@
+"""Bounded-memory value profiling for unique-value counts.
+
+ValueProfile counts values exactly until it has seen more distinct values
+than its cardinality limit, then folds those counts into two sketches and
+keeps streaming in fixed memory:
+
+- HeavyHitters (Misra-Gries) keeps the most frequent values with counts
+  that are low by at most a known error bound.
+- HyperLogLog estimates the number of distinct values (about 0.8%
+  standard error with the default 2**14 one-byte registers).
+
+Keys are typed: 100, "100" and TRUE stay distinct, while the 100.0 Excel
+returns for a whole number counts together with an int 100.
+"""
+
+import hashlib
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .utils import is_cell_empty, number_to_column
+
+# Tags that keep values of different types apart in counts
+TAG_NUMBER = "n"
+TAG_TEXT = "s"
+TAG_BOOL = "b"
+TAG_DATE = "d"
+TAG_OTHER = "o"
+
+# Smallest heavy-hitter table used once counting switches to sketches
+MIN_SKETCH_COUNTERS = 1024
+
+
+def value_key(value: Any) -> Tuple[str, Any]:
+    """Typed, hashable key for a non-empty cell value."""
+    if isinstance(value, bool):
+        return (TAG_BOOL, value)
+    if isinstance(value, (int, float)):
+        if isinstance(value, float) and value.is_integer():
+            return (TAG_NUMBER, int(value))
+        return (TAG_NUMBER, value)
+    if isinstance(value, str):
+        return (TAG_TEXT, value)
+    if hasattr(value, "isoformat"):
+        return (TAG_DATE, value.isoformat())
+    return (TAG_OTHER, str(value))
+
+
+def _key_bytes(key: Tuple[str, Any]) -> bytes:
+    return f"{key[0]}:{key[1]!r}".encode("utf-8", "surrogatepass")
+
+
+class HyperLogLog:
+    """Distinct-count estimator with 2**precision one-byte registers."""
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+        self._rest_bits = 64 - precision
+        self._rest_mask = (1 << self._rest_bits) - 1
+
+    def add(self, key: Tuple[str, Any]) -> None:
+        h = int.from_bytes(hashlib.blake2b(_key_bytes(key), digest_size=8).digest(), "big")
+        index = h >> self._rest_bits
+        rank = self._rest_bits - (h & self._rest_mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self) -> int:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m) if m >= 128 else {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction: linear counting
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+
+class HeavyHitters:
+    """Misra-Gries frequent-items summary with at most `capacity` counters.
+
+    Each reported count is at most `error` below the true count, and every
+    value occurring more than `error` times is kept.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counters: Dict[Tuple[str, Any], int] = {}
+        self.error = 0
+
+    def add(self, key: Tuple[str, Any], count: int = 1) -> None:
+        counters = self.counters
+        if key in counters:
+            counters[key] += count
+            return
+        if len(counters) < self.capacity:
+            counters[key] = count
+            return
+        # Table full: take the smallest counter off everything, the new
+        # value included. Each pass removes at least one counter, and
+        # the mass it removes bounds the total work by the stream length.
+        cut = min(count, min(counters.values()))
+        self.error += cut
+        for k in [k for k, c in counters.items() if c <= cut]:
+            del counters[k]
+        for k in counters:
+            counters[k] -= cut
+        if count > cut:
+            counters[key] = count - cut
+
+    def items(self) -> List[Tuple[Tuple[str, Any], int]]:
+        return sorted(self.counters.items(), key=lambda item: item[1], reverse=True)
+
+
+class ValueProfile:
+    """Frequency counts of one stream of cell values, exact while they fit.
+
+    Args:
+        max_cardinality: Distinct values counted exactly before switching
+            to sketches
+        top_k: Values the caller will ask for (sizes the heavy-hitter table)
+    """
+
+    def __init__(self, max_cardinality: int, top_k: Optional[int] = None):
+        self.max_cardinality = max_cardinality
+        self.capacity = max(MIN_SKETCH_COUNTERS, 8 * (top_k or 0))
+        self.counts: Optional[Dict[Tuple[str, Any], int]] = {}
+        self.heavy: Optional[HeavyHitters] = None
+        self.hll: Optional[HyperLogLog] = None
+        self.total = 0
+
+    @property
+    def approximate(self) -> bool:
+        return self.counts is None
+
+    def add(self, value: Any, count: int = 1) -> None:
+        """Count a non-empty value `count` times."""
+        key = value_key(value)
+        self.total += count
+        counts = self.counts
+        if counts is not None:
+            if key in counts:
+                counts[key] += count
+                return
+            counts[key] = count
+            if len(counts) > self.max_cardinality:
+                self._switch_to_sketches()
+            return
+        self.heavy.add(key, count)
+        self.hll.add(key)
+
+    def _switch_to_sketches(self) -> None:
+        self.heavy = HeavyHitters(self.capacity)
+        self.hll = HyperLogLog()
+        for key, count in self.counts.items():
+            self.heavy.add(key, count)
+            self.hll.add(key)
+        self.counts = None
+
+    def result(self, top_k: Optional[int] = None, min_count: int = 1) -> Dict[str, Any]:
+        """Summarize as {unique_count, values, ...} in descending count order."""
+        if self.counts is not None:
+            items = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+            unique_count = len(self.counts)
+        else:
+            items = self.heavy.items()
+            unique_count = self.hll.estimate()
+
+        values = [{"value": key[1], "count": count} for key, count in items if count >= min_count]
+        result: Dict[str, Any] = {
+            "unique_count": unique_count,
+            "total_count": self.total,
+            "approximate": self.approximate,
+        }
+        if top_k is not None and len(values) > top_k:
+            del values[top_k:]
+            result["truncated"] = True
+        if self.approximate:
+            # Counts are low by at most this much; only values seen more
+            # often than this are guaranteed to be listed
+            result["count_error_bound"] = self.heavy.error
+        result["values"] = values
+        return result
+
+
+def profile_rows(
+    profiles: List[ValueProfile], rows: Iterable[Sequence[Any]], by_column: bool
+) -> None:
+    """Add the non-empty cells of value rows to one profile per column, or to profiles[0]."""
+    if not by_column:
+        add = profiles[0].add
+        for row in rows:
+            for value in row:
+                if not is_cell_empty(value):
+                    add(value)
+        return
+    for row in rows:
+        for profile, value in zip(profiles, row):
+            if not is_cell_empty(value):
+                profile.add(value)
+
+
+def profile_summary(
+    profiles: List[ValueProfile],
+    by_column: bool,
+    start_col: int,
+    top_k: Optional[int] = None,
+    min_count: int = 1,
+) -> Dict[str, Any]:
+    """Result fields for a unique-values call: flat counts, or one entry per column."""
+    if not by_column:
+        return profiles[0].result(top_k, min_count)
+    return {
+        "columns": [
+            {"column": number_to_column(start_col + i), **profile.result(top_k, min_count)}
+            for i, profile in enumerate(profiles)
+        ]
+    }
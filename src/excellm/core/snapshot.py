@@ -0,0 +1,266 @@
+"""Columnar, array-backed snapshots of worksheet values.
+
+A snapshot is built once per workbook version by streaming a sheet's rows
+and stores each column as a compact typed array:
+
+- ints -> array('q'), floats -> array('d'), bools -> array('b')
+- strings -> array('l') of codes into a snapshot-wide interned string pool
+- anything else (dates, mixed types) -> plain list
+
+Empty cells are recorded in a per-column null bitmap. Range reads and value
+counts slice the arrays instead of touching openpyxl cell objects.
+"""
+
+import sys
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+# Column kinds
+KIND_NULL = "null"
+KIND_INT = "int"
+KIND_FLOAT = "float"
+KIND_BOOL = "bool"
+KIND_STR = "str"
+KIND_OBJECT = "object"
+
+_TYPECODES = {KIND_INT: "q", KIND_FLOAT: "d", KIND_BOOL: "b", KIND_STR: "l"}
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _kind_of(value: Any) -> str:
+    """Classify a non-null value into a column kind."""
+    if isinstance(value, bool):
+        return KIND_BOOL
+    if isinstance(value, int):
+        return KIND_INT if _INT64_MIN <= value <= _INT64_MAX else KIND_OBJECT
+    if isinstance(value, float):
+        return KIND_FLOAT
+    if isinstance(value, str):
+        return KIND_STR
+    return KIND_OBJECT
+
+
+class StringPool:
+    """Interned strings shared by all string columns of a snapshot."""
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def intern(self, text: str) -> int:
+        code = self._codes.get(text)
+        if code is None:
+            code = len(self.strings)
+            self._codes[text] = code
+            self.strings.append(text)
+        return code
+
+    def memory_bytes(self) -> int:
+        return (
+            sys.getsizeof(self._codes)
+            + sys.getsizeof(self.strings)
+            + sum(sys.getsizeof(s) for s in self.strings)
+        )
+
+
+class ColumnData:
+    """One column of a snapshot: typed values plus a null bitmap."""
+
+    def __init__(self, pool: StringPool):
+        self.kind = KIND_NULL
+        self.values: Any = None
+        self.nulls = bytearray()
+        self.null_count = 0
+        self.length = 0
+        self._pool = pool
+
+    def append(self, value: Any) -> None:
+        """Append a cell value, promoting the column to object if types mix."""
+        index = self.length
+        self.length += 1
+        if index % 8 == 0:
+            self.nulls.append(0)
+
+        if value is None:
+            self.nulls[index >> 3] |= 1 << (index & 7)
+            self.null_count += 1
+            if self.values is not None:
+                self.values.append(None if self.kind == KIND_OBJECT else 0)
+            return
+
+        kind = _kind_of(value)
+        if self.kind == KIND_NULL:
+            self._start(kind, index)
+        elif kind != self.kind and self.kind != KIND_OBJECT:
+            self._promote_to_object()
+
+        if self.kind == KIND_STR:
+            self.values.append(self._pool.intern(value))
+        else:
+            self.values.append(value)
+
+    def _start(self, kind: str, leading_nulls: int) -> None:
+        self.kind = kind
+        if kind == KIND_OBJECT:
+            self.values = [None] * leading_nulls
+        else:
+            self.values = array(_TYPECODES[kind], bytes(leading_nulls * array(_TYPECODES[kind]).itemsize))
+
+    def _promote_to_object(self) -> None:
+        self.values = self.slice(0, self.length - 1)
+        self.kind = KIND_OBJECT
+
+    def is_null(self, index: int) -> bool:
+        return bool(self.nulls[index >> 3] & (1 << (index & 7)))
+
+    def slice(self, start: int, stop: int) -> List[Any]:
+        """Return decoded values for rows [start, stop) (0-based), None for nulls."""
+        stop = min(stop, self.length)
+        if start >= stop:
+            return []
+        if self.kind == KIND_NULL:
+            return [None] * (stop - start)
+
+        if self.kind == KIND_STR:
+            strings = self._pool.strings
+            out = [strings[code] for code in self.values[start:stop]]
+        elif self.kind == KIND_BOOL:
+            out = [bool(v) for v in self.values[start:stop]]
+        elif self.kind == KIND_OBJECT:
+            return list(self.values[start:stop])
+        else:
+            out = self.values[start:stop].tolist()
+
+        if self.null_count:
+            for i in range(start, stop):
+                if self.is_null(i):
+                    out[i - start] = None
+        return out
+
+    def value_counts(self, start: int, stop: int) -> Counter:
+        """Count non-null values in rows [start, stop) (0-based).
+
+        Keys are (type, value) pairs, so True, 1 and 1.0 are counted apart.
+        """
+        stop = min(stop, self.length)
+        if start >= stop or self.kind == KIND_NULL:
+            return Counter()
+
+        if self.kind == KIND_STR and not self.null_count:
+            # Count codes, decode each distinct string once
+            strings = self._pool.strings
+            return Counter({
+                (str, strings[code]): n
+                for code, n in Counter(self.values[start:stop]).items()
+            })
+
+        values = self.slice(start, stop)
+        counts = Counter(zip(map(type, values), values))
+        counts.pop((type(None), None), None)
+        return counts
+
+    def memory_bytes(self) -> int:
+        size = sys.getsizeof(self.nulls)
+        if isinstance(self.values, array):
+            size += self.values.buffer_info()[1] * self.values.itemsize
+        elif self.values is not None:
+            size += sys.getsizeof(self.values)
+        return size
+
+
+class SheetSnapshot:
+    """Columnar copy of a worksheet's values, addressed with 1-based rows/cols."""
+
+    def __init__(self, columns: List[ColumnData], n_rows: int, pool: StringPool):
+        self.columns = columns
+        self.n_rows = n_rows
+        self.n_cols = len(columns)
+        self.pool = pool
+
+    @classmethod
+    def build(
+        cls, rows: Iterable[Iterable[Any]], n_cols: Optional[int] = None
+    ) -> "SheetSnapshot":
+        """Build a snapshot by streaming value rows (e.g. iter_rows(values_only=True)).
+
+        Args:
+            rows: Row value iterables starting at row 1, column 1
+            n_cols: Number of columns to keep (None = as wide as the widest row)
+        """
+        pool = StringPool()
+        columns = [ColumnData(pool) for _ in range(n_cols or 0)]
+        n_rows = 0
+
+        for row in rows:
+            values = list(row)
+            if n_cols is None:
+                # Unsized sheets: add columns as wider rows appear
+                while len(columns) < len(values):
+                    column = ColumnData(pool)
+                    for _ in range(n_rows):
+                        column.append(None)
+                    columns.append(column)
+            else:
+                del values[n_cols:]
+            if len(values) < len(columns):
+                values.extend([None] * (len(columns) - len(values)))
+            for column, value in zip(columns, values):
+                column.append(value)
+            n_rows += 1
+
+        return cls(columns, n_rows, pool)
+
+    def slice(
+        self, start_row: int, start_col: int, end_row: int, end_col: int
+    ) -> List[List[Any]]:
+        """Return the 2D values of a range, padding cells outside the snapshot with None."""
+        height = end_row - start_row + 1
+        col_values = []
+        for col in range(start_col, end_col + 1):
+            if col > self.n_cols:
+                col_values.append([None] * height)
+                continue
+            values = self.columns[col - 1].slice(start_row - 1, end_row)
+            if len(values) < height:
+                values.extend([None] * (height - len(values)))
+            col_values.append(values)
+        return [list(row) for row in zip(*col_values)]
+
+    def value_counts(
+        self, start_row: int, start_col: int, end_row: int, end_col: int
+    ) -> Counter:
+        """Count non-null values across a range, keyed by (type, value)."""
+        counts: Counter = Counter()
+        for col in range(start_col, min(end_col, self.n_cols) + 1):
+            counts.update(self.columns[col - 1].value_counts(start_row - 1, end_row))
+        return counts
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the snapshot (arrays, bitmaps, string pool)."""
+        return sum(c.memory_bytes() for c in self.columns) + self.pool.memory_bytes()
+
+    def stats(self) -> Dict[str, Any]:
+        """Describe the snapshot's shape and column kinds."""
+        return {
+            "rows": self.n_rows,
+            "cols": self.n_cols,
+            "column_kinds": [c.kind for c in self.columns],
+            "distinct_strings": len(self.pool.strings),
+            "memory_bytes": self.memory_bytes(),
+        }
+
+
+def build_sheet_snapshot(worksheet: Any, max_col: Optional[int] = None) -> SheetSnapshot:
+    """Build a snapshot from an openpyxl worksheet (read-only or editable).
+
+    Read-only sheets saved without a dimension record report no max_column;
+    their width is then taken from the rows themselves.
+    """
+    n_cols = max_col or worksheet.max_column
+    return SheetSnapshot.build(
+        worksheet.iter_rows(min_row=1, min_col=1, max_col=n_cols, values_only=True),
+        n_cols,
+    )
@@ -4,8 +4,13 @@ This module provides all shared utility functions for Excel operations,
 consolidating previously duplicated functions from multiple modules.
 """
 
+import bisect
+import os
 import re
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Longest address string Excel accepts in Range()
+MAX_RANGE_ADDRESS_LEN = 255
 
 
 def normalize_address(addr: str) -> str:
@@ -121,6 +126,15 @@ def build_range_address(
     return f"{start}:{end}"
 
 
+def is_workbook_file(workbook_name: str) -> bool:
+    """Check whether a workbook argument is the path of a file on disk.
+
+    Excel workbook names cannot contain path separators, so such a path is
+    never an open workbook and can go straight to the file engine.
+    """
+    return ("/" in workbook_name or "\\" in workbook_name) and os.path.isfile(workbook_name)
+
+
 def is_cell_empty(value: Any) -> bool:
     """Check if a cell value is empty.
 
@@ -137,6 +151,298 @@ def is_cell_empty(value: Any) -> bool:
     return False
 
 
+def same_cell_value(old: Any, new: Any) -> bool:
+    """Check whether writing new over a cell holding old would leave it unchanged.
+
+    Empty values (None, "") match each other and numbers match across int and
+    float, since Excel returns every number as float. Anything else must
+    match in type and value. A formula never matches the value it computed,
+    so formulas are always treated as changed.
+    """
+    if is_cell_empty(old) and is_cell_empty(new):
+        return True
+    if isinstance(old, bool) or isinstance(new, bool):
+        return isinstance(old, bool) and isinstance(new, bool) and old == new
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+        return old == new
+    return type(old) is type(new) and old == new
+
+
+def cell_blocks(cells: Iterable[Tuple[int, int]]) -> List[Tuple[int, int, int, int]]:
+    """Cover a set of cells with rectangles.
+
+    Each row's cells are split into runs of adjacent columns; a run is
+    merged into the block above it when that block spans the same columns
+    and ends on the previous row.
+
+    Args:
+        cells: (row, col) pairs in row-major order
+
+    Returns:
+        List of (first_row, first_col, last_row, last_col), inclusive, in
+        row order
+    """
+    blocks: List[List[int]] = []
+    open_blocks: Dict[Tuple[int, int], List[int]] = {}
+
+    def add_run(r: int, first: int, last: int) -> None:
+        block = open_blocks.get((first, last))
+        if block is not None and block[2] == r - 1:
+            block[2] = r
+        else:
+            block = [r, first, r, last]
+            blocks.append(block)
+            open_blocks[(first, last)] = block
+
+    run = None  # [row, first_col, last_col]
+    for r, c in cells:
+        if run is not None and run[0] == r and run[2] == c - 1:
+            run[2] = c
+            continue
+        if run is not None:
+            add_run(*run)
+        run = [r, c, c]
+    if run is not None:
+        add_run(*run)
+    return [tuple(block) for block in blocks]
+
+
+def changed_blocks(
+    current: List[List[Any]],
+    new: List[List[Any]],
+    formulas: Optional[List[List[Optional[str]]]] = None,
+) -> List[Tuple[int, int, int, int]]:
+    """Cover the cells where new differs from current with rectangles.
+
+    Cells missing from current count as empty. A cell holding a formula
+    counts as changed unless new is that same formula, even when its result
+    equals the new value: writing a constant replaces the formula. See
+    cell_blocks for how cells are grouped.
+
+    Args:
+        current: Current values, row by row
+        new: Values to write, same origin as current
+        formulas: Formulas of the current cells, None where a cell holds a
+            constant (see read_formulas)
+
+    Returns:
+        List of (first_row, first_col, last_row, last_col), 0-based and
+        inclusive, in row order
+    """
+    def changed() -> Iterator[Tuple[int, int]]:
+        for r, new_row in enumerate(new):
+            old_row = current[r] if r < len(current) else ()
+            formula_row = formulas[r] if formulas is not None and r < len(formulas) else ()
+            for c, value in enumerate(new_row):
+                formula = formula_row[c] if c < len(formula_row) else None
+                if formula is not None:
+                    if value != formula:
+                        yield r, c
+                    continue
+                old = old_row[c] if c < len(old_row) else None
+                if not same_cell_value(old, value):
+                    yield r, c
+
+    return cell_blocks(changed())
+
+
+def cell_text(value: Any) -> str:
+    """Text of a Value2 cell value as Find/Replace compares it.
+
+    Whole numbers lose their ".0" and booleans read TRUE/FALSE. This is the
+    displayed text only for numbers in the General format; dates come back
+    from Value2 as serial numbers, so callers match formatted numbers on
+    Range.Text instead.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def compile_find_pattern(find_value: str, use_regex: bool = False, match_case: bool = False) -> "re.Pattern":
+    """Compile a find_value as Excel's Find would interpret it.
+
+    Without use_regex, "*" and "?" are Excel wildcards and "~" escapes
+    them ("~*" is a literal asterisk).
+
+    Raises:
+        re.error: If use_regex is set and find_value is not a valid regex
+    """
+    flags = re.DOTALL if match_case else re.DOTALL | re.IGNORECASE
+    if use_regex:
+        return re.compile(find_value, flags)
+
+    parts = []
+    i = 0
+    while i < len(find_value):
+        ch = find_value[i]
+        if ch == "~" and i + 1 < len(find_value) and find_value[i + 1] in "*?~":
+            parts.append(re.escape(find_value[i + 1]))
+            i += 2
+            continue
+        parts.append(".*" if ch == "*" else "." if ch == "?" else re.escape(ch))
+        i += 1
+    return re.compile("".join(parts), flags)
+
+
+def parse_line_span(
+    position: Union[int, str, Dict[str, Any]], line_type: str
+) -> Tuple[int, int]:
+    """Parse one row/column position into a (first, last) span, 1-based.
+
+    Args:
+        position: Row number or column letter/number ("5", "5:10", "C",
+            "C:E", 3), or {"position": ..., "count": n} for n lines
+            starting at position
+        line_type: "row" or "column"
+
+    Returns:
+        Tuple of (first, last), inclusive
+
+    Raises:
+        ValueError: If the position cannot be parsed
+    """
+    count = 1
+    if isinstance(position, dict):
+        count = position.get("count", 1)
+        position = position.get("position")
+        if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+            raise ValueError(f"count must be a positive integer, got {count!r}")
+
+    def number(part: str) -> int:
+        part = part.strip().upper()
+        if part.isdigit():
+            return int(part)
+        if line_type == "column" and part.isalpha():
+            return column_to_number(part)
+        raise ValueError(f"Invalid {line_type} position '{position}'")
+
+    if isinstance(position, int) and not isinstance(position, bool):
+        first = last = position
+    elif isinstance(position, str) and position.strip():
+        start, _, end = position.partition(":")
+        first, last = number(start), number(end or start)
+        if end and count != 1:
+            raise ValueError(f"Give either a span or a count for '{position}', not both")
+    else:
+        raise ValueError(f"Invalid {line_type} position {position!r}")
+
+    if first < 1 or last < first:
+        raise ValueError(f"Invalid {line_type} position '{position}'")
+    return first, max(last, first + count - 1)
+
+
+def group_line_blocks(spans: List[Tuple[int, int]], action: str) -> List[Tuple[int, int]]:
+    """Group row/column spans into the blocks of one bulk insert or delete.
+
+    Spans refer to the sheet before the edit. Deleted spans that overlap or
+    touch are merged. Inserts at the same line add up (each span inserts
+    its length before its first line); inserts at different lines stay
+    separate, since merging them would move the later ones.
+
+    Args:
+        spans: (first, last) spans, 1-based and inclusive, in any order
+        action: "insert" or "delete"
+
+    Returns:
+        Sorted list of (first, last) blocks
+    """
+    if action == "insert":
+        counts: Dict[int, int] = {}
+        for first, last in spans:
+            counts[first] = counts.get(first, 0) + last - first + 1
+        return [(first, first + count - 1) for first, count in sorted(counts.items())]
+
+    blocks: List[List[int]] = []
+    for first, last in sorted(spans):
+        if blocks and first <= blocks[-1][1] + 1:
+            blocks[-1][1] = max(blocks[-1][1], last)
+        else:
+            blocks.append([first, last])
+    return [tuple(block) for block in blocks]
+
+
+def line_area_address(first: int, last: int, line_type: str) -> str:
+    """Address of whole rows ("5:10") or columns ("C:E")."""
+    if line_type == "column":
+        return f"{number_to_column(first)}:{number_to_column(last)}"
+    return f"{first}:{last}"
+
+
+def line_block_addresses(
+    blocks: List[Tuple[int, int]],
+    line_type: str,
+    action: str,
+    max_length: int = MAX_RANGE_ADDRESS_LEN,
+) -> List[str]:
+    """Pack line blocks into multi-area addresses, one per Insert/Delete call.
+
+    Excel applies one multi-area call ("5:10,20:25") relative to the sheet
+    before the call, but an address is limited to max_length characters,
+    and inserted areas that touch would be taken as one area. Blocks are
+    therefore packed from the bottom up and a new address is started when
+    one is full or an insert would touch the area below it. Applying the
+    addresses in the returned order keeps the later ones valid, because
+    each call only moves lines below the blocks still to come.
+
+    Args:
+        blocks: Sorted (first, last) blocks from group_line_blocks
+        line_type: "row" or "column"
+        action: "insert" or "delete"
+        max_length: Longest address per call
+
+    Returns:
+        Addresses like "5:10,20:25" or "C:E,H:H", bottom-most first
+    """
+    calls: List[List[str]] = []
+    length = 0
+    lowest = None  # First line of the topmost area in the current call
+    for first, last in reversed(blocks):
+        text = line_area_address(first, last, line_type)
+        touches = action == "insert" and lowest is not None and last + 1 >= lowest
+        if not calls or touches or length + 1 + len(text) > max_length:
+            calls.append([])
+            length = -1
+        calls[-1].append(text)
+        length += 1 + len(text)
+        lowest = first
+    return [",".join(reversed(areas)) for areas in calls]
+
+
+def line_shift(blocks: List[Tuple[int, int]], action: str) -> Callable[[int], Optional[int]]:
+    """Map line numbers from before to after a bulk insert or delete.
+
+    Args:
+        blocks: Sorted (first, last) blocks from group_line_blocks
+        action: "insert" or "delete"
+
+    Returns:
+        Function taking a row/column number and returning where it ends up,
+        or None if it was deleted
+    """
+    firsts = [first for first, _ in blocks]
+    lasts = [last for _, last in blocks]
+    # moved[i]: lines inserted or deleted by the first i blocks
+    moved = [0]
+    for first, last in blocks:
+        moved.append(moved[-1] + last - first + 1)
+
+    if action == "insert":
+        def shift(line: int) -> Optional[int]:
+            return line + moved[bisect.bisect_right(firsts, line)]
+    else:
+        def shift(line: int) -> Optional[int]:
+            i = bisect.bisect_left(lasts, line)
+            if i < len(blocks) and firsts[i] <= line:
+                return None
+            return line - moved[i]
+    return shift
+
+
 def safe_int(value: Any, default: int = 0) -> int:
     """Safely convert to int with default.
 
@@ -0,0 +1,192 @@
+"""Byte-budgeted LRU cache for file-mode workbooks.
+
+Keeps loaded openpyxl workbooks keyed by absolute path, evicting the least
+recently used entries once their estimated memory footprint exceeds the
+budget, and dropping entries whose file changed on disk since it was loaded.
+"""
+
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Measured with tracemalloc on openpyxl 3.1: a loaded cell (Cell object,
+# coordinate key and value) costs roughly 390 bytes in edit mode.
+BYTES_PER_CELL = 400
+
+# Per-string overhead for shared strings held by read-only workbooks
+BYTES_PER_SHARED_STRING = 60
+
+# Fixed cost of a workbook (styles, archive handle, sheet objects)
+WORKBOOK_BASE_BYTES = 64 * 1024
+
+
+def file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def estimate_workbook_bytes(workbook: Any) -> int:
+    """Estimate the in-memory footprint of an openpyxl workbook.
+
+    Edit-mode workbooks are dominated by per-cell objects; read-only
+    workbooks only hold shared strings and sheet metadata.
+    """
+    total = WORKBOOK_BASE_BYTES
+
+    if getattr(workbook, "read_only", False):
+        for text in getattr(workbook, "shared_strings", None) or []:
+            total += BYTES_PER_SHARED_STRING + len(str(text))
+        return total
+
+    for ws in workbook.worksheets:
+        total += len(getattr(ws, "_cells", ())) * BYTES_PER_CELL
+    return total
+
+
+def estimate_entry_bytes(entry: Any) -> int:
+    """Estimate a cache entry's footprint: the workbook plus any sheet snapshots."""
+    total = estimate_workbook_bytes(entry.workbook)
+    for snapshot in (getattr(entry, "snapshots", None) or {}).values():
+        total += snapshot.memory_bytes()
+    return total
+
+
+class WorkbookCache:
+    """LRU mapping of absolute path -> workbook entry with a byte budget.
+
+    Entries are any object with ``workbook``, ``estimated_bytes``,
+    ``file_stamp`` and ``pending_writes`` attributes. The eviction callback
+    is responsible for flushing dirty entries and releasing resources.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        on_evict: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """
+        Args:
+            max_bytes: Memory budget for all cached workbooks (0 = unbounded)
+            on_evict: Called with (path, entry) before an entry is evicted
+        """
+        self.max_bytes = max_bytes
+        self._on_evict = on_evict
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over (path, entry) pairs without touching LRU order."""
+        return iter(list(self._entries.items()))
+
+    def peek(self, path: str) -> Optional[Any]:
+        """Return an entry without validation, stats or LRU update."""
+        return self._entries.get(path)
+
+    def get(self, path: str) -> Optional[Any]:
+        """Return a valid cached entry, or None on miss.
+
+        Entries whose file changed on disk (mtime or size) are dropped
+        unless they hold unsaved writes, which would otherwise be lost.
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.file_stamp != file_stamp(path):
+            if entry.pending_writes:
+                logger.warning(
+                    f"{path} changed on disk but has {entry.pending_writes} unsaved "
+                    "write(s); keeping the cached copy."
+                )
+            else:
+                self.invalidations += 1
+                if self._on_evict is not None:
+                    self._on_evict(path, entry)
+                self._drop(path)
+                self.misses += 1
+                return None
+
+        self.hits += 1
+        self._entries.move_to_end(path)
+        return entry
+
+    def put(self, path: str, entry: Any) -> None:
+        """Insert or replace an entry, then evict down to the budget."""
+        if path in self._entries:
+            self._drop(path)
+        entry.estimated_bytes = estimate_entry_bytes(entry)
+        self._entries[path] = entry
+        self._total_bytes += entry.estimated_bytes
+        self._evict_to_budget(keep=path)
+
+    def pop(self, path: str) -> Optional[Any]:
+        """Remove an entry without calling the eviction callback."""
+        if path not in self._entries:
+            return None
+        return self._drop(path)
+
+    def refresh(self, path: str, saved: bool = False) -> None:
+        """Re-estimate an entry's size after it was modified.
+
+        Args:
+            path: Absolute workbook path
+            saved: If True, the entry was just written to disk; re-stamp it
+                so the new mtime/size is not mistaken for an external change
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return
+        if saved:
+            entry.file_stamp = file_stamp(path)
+        self._total_bytes -= entry.estimated_bytes
+        entry.estimated_bytes = estimate_entry_bytes(entry)
+        self._total_bytes += entry.estimated_bytes
+        self._evict_to_budget(keep=path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and memory usage."""
+        return {
+            "entries": len(self._entries),
+            "estimated_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _drop(self, path: str) -> Any:
+        entry = self._entries.pop(path)
+        self._total_bytes -= entry.estimated_bytes
+        return entry
+
+    def _evict_to_budget(self, keep: str) -> None:
+        if not self.max_bytes:
+            return
+        while self._total_bytes > self.max_bytes:
+            victim = next((p for p in self._entries if p != keep), None)
+            if victim is None:
+                return  # A single oversized workbook stays cached
+            if self._on_evict is not None:
+                self._on_evict(victim, self._entries[victim])
+            self._drop(victim)
+            self.evictions += 1
@@ -0,0 +1,306 @@
+"""Constant-memory export of rows into a worksheet of an .xlsx file.
+
+export_sheet() streams rows straight into a new zip member (deflated as it
+is written) instead of building openpyxl cells, so memory stays flat no
+matter how many rows are exported. The rest of the package is carried
+over untouched:
+
+- every existing member is copied as raw compressed bytes
+- workbook.xml, its relationships and [Content_Types].xml gain one entry
+  for the new sheet; when an existing sheet is replaced in place, the
+  calculation chain is unregistered instead (Excel rebuilds it on load)
+- styles.xml gains a bold font and a handful of cell formats (bold
+  header, datetime, date, time, duration) appended after the existing
+  ones, so no existing style index moves; an earlier export's entries are
+  reused, so repeated exports do not grow the stylesheet
+
+Packages this module cannot edit safely raise UnsupportedXlsxError so the
+caller can fall back to a regular openpyxl save.
+"""
+
+import datetime
+import math
+import posixpath
+import re
+import zipfile
+from decimal import Decimal
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import to_excel
+
+from .partial_save import CONTENT_TYPES_PART, copy_member_raw, without_calc_chain, write_atomic
+from .xlsx_reader import UnsupportedXlsxError, XlsxReader
+
+WORKSHEET_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
+WORKSHEET_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+_SHEET_HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    b'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    b"<sheetData>"
+)
+_SHEET_FOOTER = b"</sheetData></worksheet>"
+
+# Cell formats appended to cellXfs, as offsets from the first new index
+_BOLD, _DATETIME, _DATE, _TIME, _DURATION = range(5)
+# Built-in number formats: m/d/yy h:mm, mm-dd-yy, h:mm:ss, [h]:mm:ss
+_EXPORT_XFS = (
+    '<xf numFmtId="0" fontId="{font}" fillId="0" borderId="0" xfId="0" applyFont="1"/>',
+    '<xf numFmtId="22" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>',
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>',
+    '<xf numFmtId="21" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>',
+    '<xf numFmtId="46" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>',
+)
+
+# Excel's sheet name rules
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+MAX_SHEET_NAME_LENGTH = 31
+
+
+def validate_sheet_name(name: str) -> None:
+    """Raise ValueError if Excel would reject a sheet name."""
+    if not name or len(name) > MAX_SHEET_NAME_LENGTH:
+        raise ValueError(f"Sheet name must be 1-{MAX_SHEET_NAME_LENGTH} characters: '{name}'")
+    if _INVALID_SHEET_CHARS.search(name) or name.startswith("'") or name.endswith("'"):
+        raise ValueError(f"Sheet name contains characters Excel does not allow: '{name}'")
+
+
+def _add_to_list(xml: str, tag: str, child: str, items: List[str]) -> Tuple[str, int]:
+    """Add <child> elements to <tag>...</tag>, fixing its count attribute.
+
+    When the list already holds items as a consecutive run (written by an
+    earlier export) it is left as it is and that run is reused.
+
+    Returns the new XML and the index of the first of the items.
+    """
+    match = re.search(rf"<{tag}\b([^>]*)>(.*?)</{tag}>", xml, re.DOTALL)
+    if match is None:
+        raise UnsupportedXlsxError(f"styles.xml has no <{tag}> list")
+    children = re.findall(rf"<{child}\b[^>]*?/>|<{child}\b[^>]*>.*?</{child}>", match.group(2), re.DOTALL)
+    first_new = len(re.findall(rf"<{child}\b", match.group(2)))
+    if len(children) == first_new:  # Every child parsed, so positions are indices
+        for index in range(len(children) - len(items) + 1):
+            if children[index:index + len(items)] == items:
+                return xml, index
+
+    attrs = re.sub(r'\scount="\d+"', "", match.group(1))
+    start_tag = f'<{tag}{attrs} count="{first_new + len(items)}">'
+    patched = start_tag + match.group(2) + "".join(items) + f"</{tag}>"
+    return xml[:match.start()] + patched + xml[match.end():], first_new
+
+
+def _patch_styles(styles: bytes) -> Tuple[bytes, int]:
+    """Add the export cell formats; returns new styles.xml and their first index."""
+    xml = styles.decode("utf-8")
+    xml, bold_font = _add_to_list(xml, "fonts", "font", ["<font><b/></font>"])
+    xfs = [xf.format(font=bold_font) for xf in _EXPORT_XFS]
+    xml, first_xf = _add_to_list(xml, "cellXfs", "xf", xfs)
+    return xml.encode("utf-8"), first_xf
+
+
+def _insert_before(xml: bytes, closing_tag: bytes, fragment: str) -> bytes:
+    index = xml.rfind(closing_tag)
+    if index < 0:
+        raise UnsupportedXlsxError(f"{closing_tag.decode()} not found")
+    return xml[:index] + fragment.encode("utf-8") + xml[index:]
+
+
+class _RowWriter:
+    """Serializes row values to <row> XML with inline strings."""
+
+    def __init__(self, style_base: int, epoch: datetime.datetime, start_col: int):
+        self.style_base = style_base
+        self.epoch = epoch
+        self.start_col = start_col
+        self._letters: List[str] = []
+        self.rows_written = 0
+        self.max_width = 0
+
+    def _letter(self, offset: int) -> str:
+        while len(self._letters) <= offset:
+            self._letters.append(get_column_letter(self.start_col + len(self._letters)))
+        return self._letters[offset]
+
+    def _cell(self, ref: str, value: Any, bold: bool) -> Optional[str]:
+        if value is None:
+            return None
+        style = f' s="{self.style_base + _BOLD}"' if bold else ""
+
+        if isinstance(value, bool):
+            return f'<c r="{ref}" t="b"{style}><v>{int(value)}</v></c>'
+        if isinstance(value, Decimal):
+            value = float(value)
+        if isinstance(value, (int, float)):
+            if isinstance(value, float) and not math.isfinite(value):
+                return None
+            return f'<c r="{ref}"{style}><v>{value!r}</v></c>'
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)):
+            if isinstance(value, datetime.datetime):
+                offset = _DATETIME
+            elif isinstance(value, datetime.date):
+                offset = _DATE
+            elif isinstance(value, datetime.time):
+                offset = _TIME
+            else:
+                offset = _DURATION
+            serial = to_excel(value, self.epoch)
+            return f'<c r="{ref}" s="{self.style_base + offset}"><v>{serial!r}</v></c>'
+
+        text = ILLEGAL_CHARACTERS_RE.sub("", str(value))
+        if text.startswith("=") and len(text) > 1:
+            return f'<c r="{ref}"{style}><f>{escape(text[1:])}</f></c>'
+        space = ' xml:space="preserve"' if text != text.strip() else ""
+        return f'<c r="{ref}" t="inlineStr"{style}><is><t{space}>{escape(text)}</t></is></c>'
+
+    def row(self, row_number: int, values: Sequence[Any], bold: bool = False) -> bytes:
+        cells = []
+        for offset, value in enumerate(values):
+            cell = self._cell(f"{self._letter(offset)}{row_number}", value, bold)
+            if cell is not None:
+                cells.append(cell)
+        self.rows_written += 1
+        self.max_width = max(self.max_width, len(values))
+        if not cells:
+            return b""
+        return f'<row r="{row_number}">{"".join(cells)}</row>'.encode("utf-8")
+
+
+def export_sheet(
+    path: str,
+    sheet_name: str,
+    rows: Iterable[Sequence[Any]],
+    header: Optional[Sequence[Any]] = None,
+    start_row: int = 1,
+    start_col: int = 1,
+    replace: bool = False,
+) -> Tuple[int, int]:
+    """Stream rows into a worksheet of the .xlsx file at path.
+
+    Args:
+        path: Existing .xlsx/.xlsm file
+        sheet_name: Sheet to create (or to overwrite if replace is True)
+        rows: Row value sequences, consumed once
+        header: Optional first row, written bold
+        start_row: Row number of the first written row
+        start_col: Column number of the first written column
+        replace: Overwrite sheet_name if it already exists
+
+    Returns:
+        (rows_written, max_columns_written), header included
+
+    Raises:
+        ValueError: If the sheet name is invalid, or exists and replace is False
+        UnsupportedXlsxError: If the package cannot be edited in place
+    """
+    validate_sheet_name(sheet_name)
+    reader = XlsxReader(path)
+
+    try:
+        archive = reader.archive
+        existing = {name.lower(): name for name in reader.sheet_names}
+        replaced_part = None
+        if sheet_name.lower() in existing:
+            if not replace:
+                raise ValueError(f"Sheet '{existing[sheet_name.lower()]}' already exists")
+            if existing[sheet_name.lower()] != sheet_name:
+                raise UnsupportedXlsxError("replacing a sheet under a different case")
+            replaced_part = reader.sheet_part(sheet_name)
+            folder, name = posixpath.split(replaced_part)
+            if posixpath.join(folder, "_rels", name + ".rels") in archive.namelist():
+                # Drawings, tables or comments would be left dangling
+                raise UnsupportedXlsxError(f"sheet '{sheet_name}' has related parts")
+
+        styles_part = reader.related_part("styles")
+        if styles_part is None:
+            raise UnsupportedXlsxError("package has no styles part")
+        styles, style_base = _patch_styles(archive.read(styles_part))
+        replacements = {styles_part: styles}
+
+        dropped = None
+        if replaced_part is not None:
+            part = replaced_part
+            # Its chain may list formula cells of the replaced sheet
+            dropped = without_calc_chain(reader, replacements)
+        else:
+            part = _register_sheet(reader, sheet_name, replacements)
+
+        writer = _RowWriter(style_base, reader.epoch, start_col)
+
+        def write(temp_path: str) -> None:
+            with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as target:
+                for info in archive.infolist():
+                    if info.filename not in (part, dropped) and info.filename not in replacements:
+                        copy_member_raw(archive, target, info)
+                for name, data in replacements.items():
+                    target.writestr(name, data)
+
+                with target.open(part, "w", force_zip64=True) as stream:
+                    stream.write(_SHEET_HEADER)
+                    row_number = start_row
+                    if header is not None:
+                        stream.write(writer.row(row_number, header, bold=True))
+                        row_number += 1
+                    for values in rows:
+                        stream.write(writer.row(row_number, values))
+                        row_number += 1
+                    stream.write(_SHEET_FOOTER)
+            # Release the original before it is replaced (required on Windows)
+            reader.close()
+
+        write_atomic(path, write)
+        return writer.rows_written, writer.max_width
+    finally:
+        reader.close()
+
+
+def _register_sheet(reader: XlsxReader, sheet_name: str, replacements: dict) -> str:
+    """Add a new sheet to workbook.xml, its rels and content types.
+
+    Returns the zip member name for the new sheet's XML.
+    """
+    archive = reader.archive
+    names = set(archive.namelist())
+    workbook_part = reader.workbook_part
+    folder, name = posixpath.split(workbook_part)
+    rels_part = posixpath.join(folder, "_rels", name + ".rels")
+
+    number = 1
+    while posixpath.join(folder, "worksheets", f"sheet{number}.xml") in names:
+        number += 1
+    part = posixpath.join(folder, "worksheets", f"sheet{number}.xml")
+
+    rels = archive.read(rels_part)
+    rel_ids = {int(n) for n in re.findall(rb'Id="rId(\d+)"', rels)}
+    rel_id = f"rId{max(rel_ids, default=0) + 1}"
+    replacements[rels_part] = _insert_before(
+        rels,
+        b"</Relationships>",
+        f'<Relationship Id="{rel_id}" Type="{WORKSHEET_REL}" '
+        f'Target="{posixpath.relpath(part, folder)}"/>',
+    )
+
+    workbook = archive.read(workbook_part)
+    prefix = re.search(
+        rb'xmlns:(\w+)="http://schemas.openxmlformats.org/officeDocument/2006/relationships"',
+        workbook,
+    )
+    if prefix is None:
+        raise UnsupportedXlsxError("workbook.xml does not declare the relationships namespace")
+    sheet_ids = [int(n) for n in re.findall(rb'sheetId="(\d+)"', workbook)]
+    replacements[workbook_part] = _insert_before(
+        workbook,
+        b"</sheets>",
+        f"<sheet name={quoteattr(sheet_name)} sheetId=\"{max(sheet_ids, default=0) + 1}\" "
+        f'{prefix.group(1).decode()}:id="{rel_id}"/>',
+    )
+
+    replacements[CONTENT_TYPES_PART] = _insert_before(
+        archive.read(CONTENT_TYPES_PART),
+        b"</Types>",
+        f'<Override PartName="/{part}" ContentType="{WORKSHEET_CONTENT_TYPE}"/>',
+    )
+    return part
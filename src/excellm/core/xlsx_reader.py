@@ -0,0 +1,490 @@
+"""Streaming XLSX sheet reader that bypasses openpyxl cell objects.
+
+openpyxl's read-only mode still builds a cell object (or tuple) for every
+cell of every row it walks past. For range reads on large sheets this reader
+goes straight to the package parts instead:
+
+- ``sharedStrings.xml`` and the cell-style number formats are parsed once
+  per reader and reused for every read
+- ``xl/worksheets/sheetN.xml`` is streamed with an incremental parser;
+  rows above the requested range are cut out of the byte stream before
+  parsing, and parsing stops at the first row below it
+
+Values are decoded the way openpyxl's read-only worksheets decode them
+(``load_workbook(read_only=True)``, formulas as "=..." strings, date
+formats as datetimes), so callers can switch between the two freely.
+Anything the reader does not reproduce exactly raises
+UnsupportedXlsxError and callers fall back to openpyxl.
+"""
+
+import datetime
+import posixpath
+import re
+import zipfile
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from xml.etree.ElementTree import XMLPullParser, fromstring
+
+from openpyxl.formula.translate import Translator
+from openpyxl.styles.numbers import builtin_format_code, is_date_format, is_timedelta_format
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    CALENDAR_WINDOWS_1900,
+    from_excel,
+    from_ISO8601,
+)
+
+SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+
+_ROW = SHEET_NS + "row"
+_CELL = SHEET_NS + "c"
+_VALUE = SHEET_NS + "v"
+_FORMULA = SHEET_NS + "f"
+_INLINE = SHEET_NS + "is"
+_TEXT = SHEET_NS + "t"
+_RUN = SHEET_NS + "r"
+_SHEET_DATA = SHEET_NS + "sheetData"
+
+# Parser feed size; large enough that per-chunk overhead is negligible
+CHUNK_SIZE = 64 * 1024
+
+
+class UnsupportedXlsxError(Exception):
+    """Raised when a part cannot be decoded identically to openpyxl."""
+
+
+class _SkipUnsafeError(Exception):
+    """Rows above the range cannot be skipped as raw bytes."""
+
+
+# Row start tags, with and without their row number
+_ROW_TAG = re.compile(rb"<(?:\w+:)?row\b")
+_NUMBERED_ROW_TAG = re.compile(rb"<(?:\w+:)?row\b[^>]*?\sr=\"(\d+)\"")
+_SHARED_FORMULA = b't="shared"'
+
+
+def _skip_rows_above(source: Any, min_row: int) -> Iterator[bytes]:
+    """Yield sheet XML chunks with the rows above min_row cut out unparsed.
+
+    Everything before the first <row> (the worksheet and sheetData start
+    tags) is passed through; whole rows are then dropped at the byte level
+    until the first row numbered min_row or later. Raises _SkipUnsafeError
+    when a dropped region holds rows without an r attribute or shared
+    formulas, which only a full parse can account for.
+    """
+    pending = b""
+    in_rows = False
+
+    def check(skipped: bytes) -> None:
+        if _SHARED_FORMULA in skipped or (
+            len(_ROW_TAG.findall(skipped)) != len(_NUMBERED_ROW_TAG.findall(skipped))
+        ):
+            raise _SkipUnsafeError()
+
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            return  # No row at or below min_row
+        pending += chunk
+
+        if not in_rows:
+            match = _ROW_TAG.search(pending)
+            if match is None:
+                # Keep a possibly incomplete tag for the next chunk
+                cut = max(pending.rfind(b"<"), 0)
+                yield pending[:cut]
+                pending = pending[cut:]
+                continue
+            yield pending[:match.start()]
+            pending = pending[match.start():]
+            in_rows = True
+
+        for match in _NUMBERED_ROW_TAG.finditer(pending):
+            if int(match.group(1)) >= min_row:
+                check(pending[:match.start()])
+                yield pending[match.start():]
+                yield from iter(lambda: source.read(CHUNK_SIZE), b"")
+                return
+
+        cut = max(pending.rfind(b"<"), 0)
+        check(pending[:cut])
+        pending = pending[cut:]
+
+
+_DIGITS = "0123456789"
+_column_numbers: Dict[str, int] = {}
+
+
+def _column_number(coordinate: str) -> int:
+    """Column number of an A1 cell reference ("C12" -> 3)."""
+    letters = coordinate.rstrip(_DIGITS)
+    col = _column_numbers.get(letters)
+    if col is None:
+        col = 0
+        for ch in letters.upper():
+            col = col * 26 + (ord(ch) - 64)
+        _column_numbers[letters] = col
+    return col
+
+
+def _cast_number(text: str) -> Any:
+    """Convert a numeric cell value the way openpyxl does."""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _string_item_text(node: Any) -> str:
+    """Plain text of a shared/inline string item (<t> or rich-text runs)."""
+    # Plain text followed by rich-text runs; phonetic (rPh) runs are ignored
+    snippets = [node.findtext(_TEXT, "")]
+    snippets.extend(run.findtext(_TEXT, "") for run in node.findall(_RUN))
+    return "".join(snippets)
+
+
+class XlsxReader:
+    """Range reader over one .xlsx file.
+
+    The package index, shared strings and styles are loaded lazily and kept
+    for the lifetime of the reader; call close() to release the zip handle.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._archive = zipfile.ZipFile(path)
+        self._workbook_part = "xl/workbook.xml"
+        self._sheet_parts: Optional[Dict[str, str]] = None
+        self._workbook_rels: Dict[str, Tuple[str, str]] = {}
+        self._shared_strings: Optional[List[str]] = None
+        self._date_styles: Set[int] = set()
+        self._timedelta_styles: Set[int] = set()
+        self._epoch = CALENDAR_WINDOWS_1900
+
+    def close(self) -> None:
+        self._archive.close()
+
+    @property
+    def archive(self) -> zipfile.ZipFile:
+        """The open package, for callers that work with raw parts."""
+        return self._archive
+
+    # ------------------------------------------------------------------
+    # Package parts
+    # ------------------------------------------------------------------
+
+    def _read_rels(self, part: str) -> Dict[str, Tuple[str, str]]:
+        """Map relationship Id -> (type, absolute target) for a part."""
+        folder, name = posixpath.split(part)
+        rels_part = posixpath.join(folder, "_rels", name + ".rels")
+        try:
+            root = fromstring(self._archive.read(rels_part))
+        except KeyError:
+            return {}
+
+        rels = {}
+        for rel in root.iter(PKG_REL_NS + "Relationship"):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            rels[rel.get("Id")] = (rel.get("Type"), target)
+        return rels
+
+    def _load_index(self) -> None:
+        """Locate the workbook part and the parts it relates to."""
+        for rel_type, target in self._read_rels("").values():
+            if rel_type == OFFICE_DOCUMENT_REL:
+                self._workbook_part = target
+                break
+
+        rels = self._workbook_rels = self._read_rels(self._workbook_part)
+        root = fromstring(self._archive.read(self._workbook_part))
+
+        pr = root.find(SHEET_NS + "workbookPr")
+        if pr is not None and pr.get("date1904") in ("1", "true"):
+            self._epoch = CALENDAR_MAC_1904
+
+        self._sheet_parts = {}
+        for sheet in root.iter(SHEET_NS + "sheet"):
+            rel = rels.get(sheet.get(REL_NS + "id"))
+            if rel is not None:
+                self._sheet_parts[sheet.get("name")] = rel[1]
+
+    @property
+    def epoch(self) -> datetime.datetime:
+        """Date system of the workbook (1900 or 1904)."""
+        if self._sheet_parts is None:
+            self._load_index()
+        return self._epoch
+
+    @property
+    def workbook_part(self) -> str:
+        if self._sheet_parts is None:
+            self._load_index()
+        return self._workbook_part
+
+    def sheet_part(self, sheet_name: str) -> str:
+        """Zip member holding a worksheet (KeyError if there is none)."""
+        if self._sheet_parts is None:
+            self._load_index()
+        return self._sheet_parts[sheet_name]
+
+    def related_part(self, kind: str) -> Optional[str]:
+        """Workbook-level part of a relationship kind ("styles", "calcChain", ...)."""
+        if self._sheet_parts is None:
+            self._load_index()
+        for rel_type, target in self._workbook_rels.values():
+            if rel_type.endswith("/" + kind):
+                return target
+        return None
+
+    def _load_cell_formats(self) -> None:
+        """Parse shared strings and date styles, once per reader."""
+        self._load_shared_strings(self.related_part("sharedStrings"))
+        self._load_styles(self.related_part("styles"))
+
+    def _load_shared_strings(self, part: Optional[str]) -> None:
+        self._shared_strings = []
+        if part is None or part not in self._archive.namelist():
+            return
+        root = fromstring(self._archive.read(part))
+        self._shared_strings = [
+            _string_item_text(si).replace("x005F_", "") for si in root.iter(SHEET_NS + "si")
+        ]
+
+    def _load_styles(self, part: Optional[str]) -> None:
+        """Index which cell styles display numbers as dates or durations."""
+        if part is None or part not in self._archive.namelist():
+            return
+        root = fromstring(self._archive.read(part))
+
+        custom = {
+            int(fmt.get("numFmtId")): fmt.get("formatCode")
+            for fmt in root.iter(SHEET_NS + "numFmt")
+        }
+        cell_xfs = root.find(SHEET_NS + "cellXfs")
+        if cell_xfs is None:
+            return
+
+        for idx, xf in enumerate(cell_xfs.iter(SHEET_NS + "xf")):
+            fmt_id = int(xf.get("numFmtId", 0))
+            code = custom.get(fmt_id) or builtin_format_code(fmt_id)
+            if code and is_date_format(code):
+                self._date_styles.add(idx)
+                if is_timedelta_format(code):
+                    self._timedelta_styles.add(idx)
+
+    @property
+    def sheet_names(self) -> List[str]:
+        if self._sheet_parts is None:
+            self._load_index()
+        return list(self._sheet_parts)
+
+    @property
+    def shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            self._load_cell_formats()
+        return self._shared_strings
+
+    # ------------------------------------------------------------------
+    # Cell decoding
+    # ------------------------------------------------------------------
+
+    def _decode(self, cell: Any, shared_formulae: Dict[str, Translator]) -> Any:
+        """Decode one <c> element to the value openpyxl would return."""
+        data_type = cell.get("t", "n")
+
+        formula = cell.find(_FORMULA)
+        if formula is not None:
+            return self._decode_formula(formula, cell.get("r"), shared_formulae)
+
+        if data_type == "inlineStr":
+            inline = cell.find(_INLINE)
+            return _string_item_text(inline) if inline is not None else None
+
+        value = cell.findtext(_VALUE) or None
+        if value is None:
+            return None
+
+        if data_type == "n":
+            number = _cast_number(value)
+            style = cell.get("s")
+            if style and int(style) in self._date_styles:
+                style_id = int(style)
+                try:
+                    return from_excel(
+                        number, self._epoch, timedelta=style_id in self._timedelta_styles
+                    )
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return number
+        if data_type == "s":
+            return self._shared_strings[int(value)]
+        if data_type == "b":
+            return bool(int(value))
+        if data_type == "d":
+            return from_ISO8601(value)
+        # "str" (cached formula string) and "e" (error) keep their text
+        return value
+
+    def _decode_formula(
+        self, formula: Any, coordinate: Optional[str], shared_formulae: Dict[str, Translator]
+    ) -> str:
+        formula_type = formula.get("t")
+        if formula_type in ("array", "dataTable"):
+            # openpyxl returns ArrayFormula/DataTableFormula objects here
+            raise UnsupportedXlsxError(f"{formula_type} formula at {coordinate}")
+
+        value = "=" + (formula.text or "")
+        if formula_type == "shared":
+            idx = formula.get("si")
+            if idx in shared_formulae:
+                return shared_formulae[idx].translate_formula(coordinate)
+            if value != "=":
+                shared_formulae[idx] = Translator(value, coordinate)
+        return value
+
+    def _remember_shared_formula(
+        self, cell: Any, shared_formulae: Dict[str, Translator]
+    ) -> None:
+        """Record a shared-formula master from a cell outside the requested range.
+
+        Cells inside the range may be translated from a master that precedes it.
+        """
+        formula = cell.find(_FORMULA)
+        if (
+            formula is not None
+            and formula.get("t") == "shared"
+            and formula.text
+            and formula.get("si") not in shared_formulae
+        ):
+            shared_formulae[formula.get("si")] = Translator("=" + formula.text, cell.get("r"))
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def iter_rows(
+        self,
+        sheet_name: str,
+        min_row: int = 1,
+        max_row: Optional[int] = None,
+        min_col: int = 1,
+        max_col: Optional[int] = None,
+    ) -> Iterator[List[Any]]:
+        """Yield value lists for rows min_row..max_row of a sheet.
+
+        Missing rows inside the range are yielded as lists of None. Iteration
+        ends at max_row or at the sheet's last stored row, whichever is first.
+        Without max_col, each row is as wide as its last stored cell.
+
+        Raises:
+            KeyError: If the sheet does not exist
+            UnsupportedXlsxError: If a cell in range cannot be decoded
+                like openpyxl would
+        """
+        part = self.sheet_part(sheet_name)
+        if self._shared_strings is None:
+            self._load_cell_formats()
+
+        if min_row > 1:
+            with self._archive.open(part) as source:
+                try:
+                    yield from self._parse_rows(
+                        _skip_rows_above(source, min_row), min_row, max_row, min_col, max_col
+                    )
+                    return
+                except _SkipUnsafeError:
+                    pass  # Nothing was yielded yet; parse the whole part instead
+
+        with self._archive.open(part) as source:
+            yield from self._parse_rows(
+                iter(lambda: source.read(CHUNK_SIZE), b""), min_row, max_row, min_col, max_col
+            )
+
+    def _parse_rows(
+        self,
+        chunks: Iterator[bytes],
+        min_row: int,
+        max_row: Optional[int],
+        min_col: int,
+        max_col: Optional[int],
+    ) -> Iterator[List[Any]]:
+        """Incrementally parse sheet XML chunks and yield decoded rows in range."""
+        width = None if max_col is None else max_col - min_col + 1
+        shared_formulae: Dict[str, Translator] = {}
+        parser = XMLPullParser(events=("start", "end"))
+        sheet_data = None
+        next_row = min_row
+        row_counter = 0
+
+        for chunk in chunks:
+            parser.feed(chunk)
+
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if elem.tag == _SHEET_DATA:
+                        sheet_data = elem
+                    continue
+                if elem.tag != _ROW:
+                    continue
+
+                r = elem.get("r")
+                row_counter = int(float(r)) if r else row_counter + 1
+
+                if row_counter < min_row:
+                    for cell in elem.iter(_CELL):
+                        self._remember_shared_formula(cell, shared_formulae)
+                elif max_row is not None and row_counter > max_row:
+                    return
+                elif row_counter < next_row:
+                    raise UnsupportedXlsxError(f"row {row_counter} is out of order")
+                else:
+                    # Rows absent from the file are empty
+                    while next_row < row_counter:
+                        yield [None] * (width or 0)
+                        next_row += 1
+                    yield self._decode_row(elem, min_col, max_col, width, shared_formulae)
+                    next_row = row_counter + 1
+
+                # Drop the parsed row so memory stays flat
+                if sheet_data is not None:
+                    sheet_data.clear()
+                else:
+                    elem.clear()
+
+    def _decode_row(
+        self,
+        row: Any,
+        min_col: int,
+        max_col: Optional[int],
+        width: Optional[int],
+        shared_formulae: Dict[str, Translator],
+    ) -> List[Any]:
+        values: List[Any] = [None] * width if width is not None else []
+        col_counter = 0
+
+        for cell in row.iter(_CELL):
+            coordinate = cell.get("r")
+            if coordinate:
+                col_counter = _column_number(coordinate)
+            else:
+                col_counter += 1
+
+            if col_counter < min_col or (max_col is not None and col_counter > max_col):
+                self._remember_shared_formula(cell, shared_formulae)
+                continue
+
+            value = self._decode(cell, shared_formulae)
+            offset = col_counter - min_col
+            if width is None and offset >= len(values):
+                values.extend([None] * (offset + 1 - len(values)))
+            values[offset] = value
+
+        return values
@@ -4,17 +4,29 @@ This module handles the connection to running Excel instances and provides
 methods for reading, writing, and managing Excel data via COM automation.
 """
 
-import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
 import pythoncom
-import win32com.client as win32
 
 
 class ToolError(Exception):
     """Exception raised for tool-related errors."""
 
+from .config import UNIQUE_MAX_EXACT_VALUES
+from .core.com_worker import run_on_com_worker
+from .core.connection import (
+    FORMULA_MODES,
+    _init_com,
+    get_excel_app,
+    invalidate_registry,
+    iter_range_tiles,
+    mark_sheet_changed,
+    read_formulas,
+    write_changed_cells,
+)
+from .core.engine import validate_unique_options
+from .core.sketch import ValueProfile, profile_rows, profile_summary
 from .filters import FilterEngine
 from .validators import (
     get_cell_type,
@@ -54,7 +66,7 @@ class ExcelSessionManager:
 
         try:
             # Execute COM operation in thread to avoid blocking event loop
-            self.excel_app = await asyncio.to_thread(self._connect_sync)
+            self.excel_app = await run_on_com_worker(self._connect_sync)
             self._connected = True
             logger.info("Connected to Excel application")
         except Exception as e:
@@ -66,9 +78,8 @@ class ExcelSessionManager:
     def _connect_sync(self) -> Any:
         """Synchronous COM connection (runs in thread)."""
         try:
-            # Initialize COM in this thread
-            pythoncom.CoInitialize()
-            return win32.GetActiveObject("Excel.Application")
+            # Initializes COM once per thread and reuses its cached Excel app
+            return get_excel_app()
         except Exception as e:
             raise Exception(f"Failed to connect to Excel: {str(e)}")
 
@@ -163,12 +174,11 @@ class ExcelSessionManager:
         This moves the focus in the Excel UI to the specified location.
         """
         await self._connect()
-        return await asyncio.to_thread(self._select_range_sync, workbook_name, sheet_name, reference)
+        return await run_on_com_worker(self._select_range_sync, workbook_name, sheet_name, reference)
 
     def _select_range_sync(self, workbook_name: str, sheet_name: str, reference: str) -> Dict[str, Any]:
         """Synchronous range selection."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
 
@@ -203,7 +213,7 @@ class ExcelSessionManager:
         await self._connect()
 
         try:
-            workbooks = await asyncio.to_thread(self._list_workbooks_sync)
+            workbooks = await run_on_com_worker(self._list_workbooks_sync)
             return workbooks
         except Exception as e:
             error_msg = str(e)[:200] if str(e) else "Unknown Excel error"
@@ -211,8 +221,7 @@ class ExcelSessionManager:
 
     def _list_workbooks_sync(self) -> List[Dict[str, any]]:
         """Synchronous workbook listing."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbooks = []
 
         try:
@@ -263,15 +272,14 @@ class ExcelSessionManager:
             raise ToolError(f"Invalid workbook name: '{workbook_name}'")
 
         try:
-            sheets = await asyncio.to_thread(self._get_sheet_names_sync, workbook_name)
+            sheets = await run_on_com_worker(self._get_sheet_names_sync, workbook_name)
             return sheets
         except Exception as e:
             raise ToolError(f"Failed to get sheet names: {str(e)}") from e
 
     def _get_sheet_names_sync(self, workbook_name: str) -> List[str]:
         """Synchronous sheet name retrieval."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         sheets = []
 
@@ -307,7 +315,7 @@ class ExcelSessionManager:
             raise ToolError(f"Invalid cell reference: '{cell}'. Expected format: A1, B5, Z100")
 
         try:
-            result = await asyncio.to_thread(self._read_cell_sync, workbook_name, sheet_name, cell)
+            result = await run_on_com_worker(self._read_cell_sync, workbook_name, sheet_name, cell)
             return result
         except Exception as e:
             error_msg = str(e).lower()
@@ -320,8 +328,7 @@ class ExcelSessionManager:
 
     def _read_cell_sync(self, workbook_name: str, sheet_name: str, cell: str) -> Dict[str, Any]:
         """Synchronous cell read."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
 
@@ -360,7 +367,11 @@ class ExcelSessionManager:
         return result
 
     async def read_range(
-        self, workbook_name: str, sheet_name: str, range_str: Optional[str] = None
+        self,
+        workbook_name: str,
+        sheet_name: str,
+        range_str: Optional[str] = None,
+        include_formulas: str = "auto",
     ) -> Dict[str, Any]:
         """Read a range of cells.
 
@@ -368,6 +379,8 @@ class ExcelSessionManager:
             workbook_name: Name of open workbook
             sheet_name: Name of worksheet
             range_str: Range reference (e.g., "A1:C5", "B2:D10")
+            include_formulas: "auto" (fetch formulas only where the range has
+                any), "always" or "never"
 
         Returns:
             Dictionary with range data and metadata
@@ -387,20 +400,24 @@ class ExcelSessionManager:
         if range_str and not validate_range_format(range_str):
             raise ToolError(f"Invalid range format: '{range_str}'. Expected format: A1:C5, B2:D10")
 
+        if include_formulas not in FORMULA_MODES:
+            raise ToolError(
+                f"Invalid include_formulas: '{include_formulas}'. Use one of: {', '.join(FORMULA_MODES)}"
+            )
+
         try:
-            result = await asyncio.to_thread(
-                self._read_range_sync, workbook_name, sheet_name, range_str
+            result = await run_on_com_worker(
+                self._read_range_sync, workbook_name, sheet_name, range_str, include_formulas
             )
             return result
         except Exception as e:
             raise ToolError(f"Failed to read range: {str(e)}") from e
 
     def _read_range_sync(
-        self, workbook_name: str, sheet_name: str, range_str: str
+        self, workbook_name: str, sheet_name: str, range_str: str, include_formulas: str = "auto"
     ) -> Dict[str, Any]:
         """Synchronous range read."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
 
@@ -562,39 +579,9 @@ class ExcelSessionManager:
             "end_col": rng.Column + cols - 1,
         }
 
-        # Always add formulas field
+        # Formulas: in "auto" mode only the areas that contain any are fetched
         try:
-            formulas = rng.Formula
-            formula_data = []
-            if formulas:
-                if isinstance(formulas, (list, tuple)):
-                    if len(formulas) > 0 and isinstance(formulas[0], (list, tuple)):
-                        # 2D array
-                        for row in formulas:
-                            row_formulas = []
-                            for f in row:
-                                if isinstance(f, str) and f.startswith("="):
-                                    row_formulas.append(f)
-                                else:
-                                    row_formulas.append(None)
-                            formula_data.append(row_formulas)
-                    else:
-                        # 1D array
-                        row_formulas = []
-                        for f in formulas:
-                            if isinstance(f, str) and f.startswith("="):
-                                row_formulas.append(f)
-                            else:
-                                row_formulas.append(None)
-                        formula_data.append(row_formulas)
-                else:
-                    # Single value
-                    if isinstance(formulas, str) and formulas.startswith("="):
-                        formula_data.append([formulas])
-                    else:
-                        formula_data.append([None])
-
-            result["formulas"] = formula_data if formula_data else None
+            result["formulas"], result["formula_read"] = read_formulas(rng, rows, cols, include_formulas)
         except Exception:
             result["formulas"] = None
 
@@ -625,11 +612,11 @@ class ExcelSessionManager:
         if dry_run:
             # For dry run, we still need to validate existence and overwrite constraints
             # but we use a sync wrapper that doesn't actually write
-            return await asyncio.to_thread(
+            return await run_on_com_worker(
                 self._write_cell_sync, workbook_name, sheet_name, cell, sanitized_value, force_overwrite, activate, dry_run=True
             )
 
-        return await asyncio.to_thread(
+        return await run_on_com_worker(
             self._write_cell_sync, workbook_name, sheet_name, cell, sanitized_value, force_overwrite, activate
         )
 
@@ -644,8 +631,7 @@ class ExcelSessionManager:
         dry_run: bool = False,
     ) -> Dict[str, Any]:
         """Synchronous cell write."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
         rng = worksheet.Range(cell)
@@ -661,6 +647,7 @@ class ExcelSessionManager:
 
         if not dry_run:
             worksheet.Range(cell).Value = value
+            mark_sheet_changed(workbook_name, sheet_name)
 
             if activate:
                 try:
@@ -695,6 +682,7 @@ class ExcelSessionManager:
         activate: bool = True,
         dry_run: bool = False,
         strict_alignment: bool = False,
+        diff: bool = False,
     ) -> Dict[str, Any]:
         """Write a 2D array of values to a range.
 
@@ -709,6 +697,8 @@ class ExcelSessionManager:
             force_overwrite: If True, bypass caution mode and overwrite existing data
             activate: If True, activate the workbook, sheet, and select the range after writing.
             dry_run: If True, validate without writing.
+            diff: If True, write only the blocks that differ from the current
+                values and report cells_changed / cells_unchanged.
 
         Returns:
             Dictionary with operation result
@@ -799,7 +789,7 @@ class ExcelSessionManager:
 
 
         try:
-            result = await asyncio.to_thread(
+            result = await run_on_com_worker(
                 self._write_range_sync,
                 workbook_name,
                 sheet_name,
@@ -809,6 +799,7 @@ class ExcelSessionManager:
                 activate,
                 dry_run,
                 strict_alignment,
+                diff,
             )
 
             # Add warning if data was trimmed or range was adjusted
@@ -880,10 +871,10 @@ class ExcelSessionManager:
         activate: bool = True,
         dry_run: bool = False,
         strict_alignment: bool = False,
+        diff: bool = False,
     ) -> Dict[str, Any]:
         """Synchronous range write."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
         target_rng = worksheet.Range(range_str)
@@ -910,6 +901,7 @@ class ExcelSessionManager:
                 )
 
         # Check if any cells already have data (caution mode - skip if force_overwrite)
+        current_values = None  # (values,) once caution mode has read the cells under data
         if not force_overwrite:
             cells_with_data = []  # Track which cells have data
             try:
@@ -932,6 +924,7 @@ class ExcelSessionManager:
                 check_range_str = f"{self._number_to_column(s_col_num)}{s_row}:{e_col_letter}{e_row}"
 
                 range_values = worksheet.Range(check_range_str).Value
+                current_values = (range_values,)
                 if range_values is not None:
 
                     # Check if range_values is a 2D structure (multiple rows)
@@ -973,9 +966,16 @@ class ExcelSessionManager:
                 # Continue write if we can't read (might be empty range)
                 pass
 
+        diff_stats = None
         if not dry_run:
             # Perform write
-            worksheet.Range(range_str).Value = data
+            if diff and data and data[0]:
+                data_rng = target_rng.Cells(1, 1).Resize(len(data), len(data[0]))
+                current = current_values[0] if current_values else data_rng.Value
+                diff_stats = write_changed_cells(data_rng, current, data)
+            else:
+                worksheet.Range(range_str).Value = data
+            mark_sheet_changed(workbook_name, sheet_name)
 
             if activate:
                 try:
@@ -1013,6 +1013,8 @@ class ExcelSessionManager:
             "cells_written": rows_written * cols_written if not dry_run else 0,
             "dry_run": dry_run,
         }
+        if diff_stats is not None:
+            result.update(diff_stats)
 
         if rows_written > 0:
             result["data_preview"] = {
@@ -1041,15 +1043,14 @@ class ExcelSessionManager:
             raise ToolError(f"Invalid workbook name: '{workbook_name}'")
 
         try:
-            info = await asyncio.to_thread(self._get_workbook_info_sync, workbook_name)
+            info = await run_on_com_worker(self._get_workbook_info_sync, workbook_name)
             return info
         except Exception as e:
             raise ToolError(f"Failed to get workbook info: {str(e)}") from e
 
     def _get_workbook_info_sync(self, workbook_name: str) -> Dict[str, Any]:
         """Synchronous workbook info retrieval."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
 
         # Get workbook properties
@@ -1508,13 +1509,13 @@ class ExcelSessionManager:
 
         try:
             if action == "add":
-                result = await asyncio.to_thread(self._add_sheet_sync, workbook_name, sheet_name)
+                result = await run_on_com_worker(self._add_sheet_sync, workbook_name, sheet_name)
             elif action == "remove":
-                result = await asyncio.to_thread(
+                result = await run_on_com_worker(
                     self._remove_sheet_sync, workbook_name, sheet_name, force_delete
                 )
             elif action == "copy":
-                result = await asyncio.to_thread(
+                result = await run_on_com_worker(
                     self._copy_sheet_sync,
                     workbook_name,
                     sheet_name,
@@ -1524,7 +1525,7 @@ class ExcelSessionManager:
                     reference_sheet,
                 )
             elif action == "move":
-                result = await asyncio.to_thread(
+                result = await run_on_com_worker(
                     self._move_sheet_sync,
                     workbook_name,
                     sheet_name,
@@ -1534,17 +1535,17 @@ class ExcelSessionManager:
                     reference_sheet,
                 )
             elif action == "rename":
-                result = await asyncio.to_thread(
+                result = await run_on_com_worker(
                     self._rename_sheet_sync, workbook_name, sheet_name, target_name
                 )
             elif action == "hide":
                 sheets = [sheet_name] if sheet_name else sheet_names
-                result = await asyncio.to_thread(
+                result = await run_on_com_worker(
                     self._hide_sheets_sync, workbook_name, sheets
                 )
             else:  # unhide
                 sheets = [sheet_name] if sheet_name else sheet_names
-                result = await asyncio.to_thread(
+                result = await run_on_com_worker(
                     self._unhide_sheets_sync, workbook_name, sheets
                 )
             return result
@@ -1558,8 +1559,7 @@ class ExcelSessionManager:
 
     def _add_sheet_sync(self, workbook_name: str, sheet_name: str) -> Dict[str, Any]:
         """Synchronous add sheet."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         new_sheet = workbook.Worksheets.Add()
         new_sheet.Name = sheet_name
@@ -1582,8 +1582,7 @@ class ExcelSessionManager:
         Returns:
             True if sheet is completely empty, False otherwise
         """
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
 
@@ -1624,8 +1623,7 @@ class ExcelSessionManager:
         force_delete: bool = False,
     ) -> Dict[str, Any]:
         """Synchronous sheet removal."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
 
         # Check if sheet exists
@@ -1651,6 +1649,8 @@ class ExcelSessionManager:
 
         # Delete the sheet
         worksheet.Delete()
+        invalidate_registry(workbook_name, sheet_name)
+        mark_sheet_changed(workbook_name, sheet_name)
 
         return {
             "success": True,
@@ -1682,7 +1682,7 @@ class ExcelSessionManager:
         Returns:
             Dictionary with operation result
         """
-        pythoncom.CoInitialize()
+        _init_com()
         source_workbook = self.excel_app.Workbooks(workbook_name)
         source_sheet = source_workbook.Worksheets(sheet_name)
 
@@ -1789,7 +1789,7 @@ class ExcelSessionManager:
         Returns:
             Dictionary with operation result
         """
-        pythoncom.CoInitialize()
+        _init_com()
         source_workbook = self.excel_app.Workbooks(workbook_name)
 
         # Check if source sheet exists
@@ -1842,6 +1842,7 @@ class ExcelSessionManager:
             # Move to end of same workbook
             last_sheet = source_workbook.Sheets(source_workbook.Sheets.Count)
             source_sheet.Move(None, last_sheet)
+        invalidate_registry(workbook_name, sheet_name)
 
         # Rename if requested (only after move completes)
         final_name = original_name
@@ -1882,12 +1883,12 @@ class ExcelSessionManager:
         target_name: str,
     ) -> Dict[str, Any]:
         """Synchronous sheet rename."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         sheet = workbook.Worksheets(sheet_name)
 
         sheet.Name = target_name
+        invalidate_registry(workbook_name, sheet_name)
 
         return {
             "success": True,
@@ -1904,8 +1905,7 @@ class ExcelSessionManager:
         sheet_names: list,
     ) -> Dict[str, Any]:
         """Synchronous sheet hiding (supports bulk)."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
 
         results = []
@@ -1954,8 +1954,7 @@ class ExcelSessionManager:
         sheet_names: list,
     ) -> Dict[str, Any]:
         """Synchronous sheet unhiding (supports bulk)."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
 
         results = []
@@ -2008,7 +2007,7 @@ class ExcelSessionManager:
         await self._connect()
 
         try:
-            result = await asyncio.to_thread(self._get_selection_info_sync)
+            result = await run_on_com_worker(self._get_selection_info_sync)
             return result
         except Exception as e:
             error_msg = str(e)[:200] if str(e) else "Unknown Excel error"
@@ -2016,8 +2015,7 @@ class ExcelSessionManager:
 
     def _get_selection_info_sync(self) -> Dict[str, Any]:
         """Synchronous selection info retrieval."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         # Get active window
         try:
             active_window = app.ActiveWindow
@@ -2149,7 +2147,7 @@ class ExcelSessionManager:
             raise ToolError("Count must be 1 or greater")
 
         try:
-            result = await asyncio.to_thread(
+            result = await run_on_com_worker(
                 self._insert_sync, workbook_name, sheet_name, insert_type, position, count
             )
             return result
@@ -2171,8 +2169,7 @@ class ExcelSessionManager:
         count: int,
     ) -> Dict[str, Any]:
         """Synchronous insert operation."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
 
@@ -2196,6 +2193,7 @@ class ExcelSessionManager:
 
             # Insert rows
             worksheet.Rows(range_to_insert).Insert()
+            mark_sheet_changed(workbook_name, sheet_name)
 
             return {
                 "success": True,
@@ -2231,6 +2229,7 @@ class ExcelSessionManager:
             # Insert columns
             range_to_insert = f"{col_letter}:{end_col_letter}"
             worksheet.Columns(range_to_insert).Insert()
+            mark_sheet_changed(workbook_name, sheet_name)
 
             return {
                 "success": True,
@@ -2327,7 +2326,7 @@ class ExcelSessionManager:
             combined_format.update(format)
 
         try:
-            result = await asyncio.to_thread(
+            result = await run_on_com_worker(
                 self._format_sync, workbook_name, sheet_name, reference, combined_format, activate
             )
             return result
@@ -2416,8 +2415,7 @@ class ExcelSessionManager:
         activate: bool = True,
     ) -> Dict[str, Any]:
         """Apply format to a single cell or range."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
         rng = worksheet.Range(reference)
@@ -2552,7 +2550,7 @@ class ExcelSessionManager:
             raise ToolError(f"Invalid sheet name: '{sheet_name}'")
 
         try:
-            result = await asyncio.to_thread(
+            result = await run_on_com_worker(
                 self._get_format_sync, workbook_name, sheet_name, reference
             )
             return result
@@ -2572,8 +2570,7 @@ class ExcelSessionManager:
         reference: str,
     ) -> Dict[str, Any]:
         """Synchronous format retrieval."""
-        pythoncom.CoInitialize()
-        win32.GetActiveObject("Excel.Application")
+        get_excel_app()
         # Check if reference contains commas (multiple references)
         if "," in reference:
             refs = parse_reference_string(reference)
@@ -2615,8 +2612,7 @@ class ExcelSessionManager:
         reference: str,
     ) -> Dict[str, Any]:
         """Get format from a single cell or range."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
         rng = worksheet.Range(reference)
@@ -2739,7 +2735,13 @@ class ExcelSessionManager:
         return result
 
     async def get_unique_values(
-        self, workbook_name: str, sheet_name: str, range_str: Optional[str] = None
+        self,
+        workbook_name: str,
+        sheet_name: str,
+        range_str: Optional[str] = None,
+        by_column: bool = False,
+        top_k: Optional[int] = None,
+        min_count: int = 1,
     ) -> Dict[str, Any]:
         """Get unique values from a range.
 
@@ -2747,6 +2749,9 @@ class ExcelSessionManager:
             workbook_name: Name of open workbook
             sheet_name: Name of worksheet
             range_str: Range reference (e.g., "A1:A100"). Defaults to UsedRange.
+            by_column: Profile each column separately
+            top_k: Return at most this many values per profile (None = all)
+            min_count: Leave out values seen fewer times than this
 
         Returns:
             Dictionary with unique values and counts
@@ -2762,20 +2767,28 @@ class ExcelSessionManager:
         if range_str and not validate_range_format(range_str) and not validate_cell_format(range_str):
              raise ToolError(f"Invalid reference format: '{range_str}'")
 
+        validate_unique_options(top_k, min_count)
+
         try:
-            result = await asyncio.to_thread(
-                self._get_unique_values_sync, workbook_name, sheet_name, range_str
+            result = await run_on_com_worker(
+                self._get_unique_values_sync, workbook_name, sheet_name, range_str,
+                by_column, top_k, min_count,
             )
             return result
         except Exception as e:
             raise ToolError(f"Failed to get unique values: {str(e)}") from e
 
     def _get_unique_values_sync(
-        self, workbook_name: str, sheet_name: str, range_str: Optional[str] = None
+        self,
+        workbook_name: str,
+        sheet_name: str,
+        range_str: Optional[str] = None,
+        by_column: bool = False,
+        top_k: Optional[int] = None,
+        min_count: int = 1,
     ) -> Dict[str, Any]:
         """Synchronous unique values retrieval."""
-        pythoncom.CoInitialize()
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
         workbook = app.Workbooks(workbook_name)
         worksheet = workbook.Worksheets(sheet_name)
 
@@ -2784,35 +2797,17 @@ class ExcelSessionManager:
         else:
             rng = worksheet.UsedRange
 
-        values = rng.Value
-        from collections import Counter
-
-        counts = Counter()
-        if values is not None:
-            # Flatten values
-            if isinstance(values, (list, tuple)):
-                for item in values:
-                    if isinstance(item, (list, tuple)):
-                        for subitem in item:
-                            if subitem is not None and str(subitem).strip() != "":
-                                counts[subitem] += 1
-                    else:
-                        if item is not None and str(item).strip() != "":
-                            counts[item] += 1
-            else:
-                if values is not None and str(values).strip() != "":
-                    counts[values] += 1
-
-        # Sort by frequency (descending) then by value
-        unique_results = []
-        for val, count in counts.most_common():
-            unique_results.append({"value": val, "count": count})
+        profiles = [
+            ValueProfile(UNIQUE_MAX_EXACT_VALUES, top_k)
+            for _ in range(rng.Columns.Count if by_column else 1)
+        ]
+        for tile in iter_range_tiles(rng):
+            profile_rows(profiles, tile, by_column)
 
         return {
             "success": True,
             "workbook": workbook_name,
             "sheet": sheet_name,
             "range": rng.Address,
-            "unique_count": len(counts),
-            "values": unique_results,
+            **profile_summary(profiles, by_column, rng.Column, top_k, min_count),
         }
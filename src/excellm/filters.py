@@ -5,9 +5,12 @@ Supports nested boolean logic (AND/OR/NOT), equations, and advanced operators.
 """
 
 import logging
+import operator as _op
 import re
 from enum import Enum
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .config import FILTER_BACKEND, FILTER_PLAN_SAMPLE_ROWS
 
 logger = logging.getLogger(__name__)
 
@@ -217,14 +220,515 @@ class FilterGroup:
         return f"FilterGroup({self.operator.value}, {len(self.conditions)} conditions)"
 
 
+def _to_number(value: Any) -> Optional[float]:
+    """Convert value to number if possible."""
+    if value is None:
+        return None
+    try:
+        # Handle common numeric formats
+        if isinstance(value, (int, float)):
+            return float(value)
+        # Remove common currency/thousand separators
+        if isinstance(value, str):
+            value = value.strip().replace(",", "").replace("$", "")
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# =============================================================================
+# Compiled filter plans
+# =============================================================================
+#
+# compile_filter() turns a FilterGroup/SingleFilter tree into nested closures
+# once per search: operators are dispatched, column references resolved,
+# filter values stripped/lowered/converted to numbers and regexes compiled
+# up front, so evaluating a row only does the per-cell work. The plan must
+# agree row for row with FilterEngine._matches_filter, which stays the
+# reference interpretation of the filter semantics.
+
+# Row matcher: returns the indices of the matching columns ([] = no match,
+# [None] = matched without a specific column)
+RowMatcher = Callable[[List[Any]], List[Optional[int]]]
+
+_EMPTY_VALUES = (None, "", " ", [])
+
+_NUMERIC_OPS = {
+    FilterOperator.GT: _op.gt,
+    FilterOperator.GTE: _op.ge,
+    FilterOperator.LT: _op.lt,
+    FilterOperator.LTE: _op.le,
+}
+
+
+class FilterPlan:
+    """A filter tree compiled to a row matcher.
+
+    Attributes:
+        filters: The FilterGroup or SingleFilter the plan was compiled from
+        matches: Callable taking a row and returning the matching column
+            indices, exactly as FilterEngine._matches_filter does
+        test: Callable taking a row and returning bool(matches(row)),
+            without collecting columns (so OR groups stop at the first
+            matching condition too); compiled on first use
+    """
+
+    def __init__(
+        self,
+        filters: Union[FilterGroup, SingleFilter],
+        matches: RowMatcher,
+        headers: Optional[List[str]] = None,
+    ):
+        self.filters = filters
+        self.matches = matches
+        self._headers = headers
+        self._test: Optional[Callable[[List[Any]], bool]] = None
+
+    @property
+    def test(self) -> Callable[[List[Any]], bool]:
+        if self._test is None:
+            self._test = _compile_test(self.filters, self._headers)
+        return self._test
+
+    def __repr__(self) -> str:
+        return f"FilterPlan({self.filters!r})"
+
+
+def compile_filter(
+    filters: Union[FilterGroup, SingleFilter],
+    headers: Optional[List[str]] = None,
+) -> FilterPlan:
+    """Compile a parsed filter tree against the headers of the data it will run on.
+
+    Args:
+        filters: FilterGroup or SingleFilter
+        headers: Column headers used to resolve name-based column references
+
+    Returns:
+        FilterPlan whose matches(row) gives the same result as
+        FilterEngine._matches_filter(row, filters, headers)
+    """
+    return FilterPlan(filters, _compile_node(filters, headers), headers)
+
+
+def _no_match(row: List[Any]) -> List[Optional[int]]:
+    return []
+
+
+def _compile_node(
+    node: Union[FilterGroup, SingleFilter], headers: Optional[List[str]]
+) -> RowMatcher:
+    if isinstance(node, SingleFilter):
+        return _compile_single(node, headers)
+    if isinstance(node, FilterGroup):
+        return _compile_group(node, headers)
+    return _no_match
+
+
+def _compile_group(group: FilterGroup, headers: Optional[List[str]]) -> RowMatcher:
+    if not group.conditions:
+        return lambda row: [None]  # Empty group matches everything
+
+    children = [_compile_node(cond, headers) for cond in group.conditions]
+
+    if group.operator == LogicalOperator.AND:
+        def match_all(row):
+            all_indices = []
+            for child in children:
+                indices = child(row)
+                if not indices:
+                    return []
+                all_indices.extend(indices)
+            return list(dict.fromkeys(all_indices))
+        return match_all
+
+    if group.operator == LogicalOperator.OR:
+        def match_any(row):
+            any_indices = []
+            matched = False
+            for child in children:
+                indices = child(row)
+                if indices:
+                    matched = True
+                    any_indices.extend(indices)
+            if matched:
+                return list(dict.fromkeys(any_indices)) or [None]
+            return []
+        return match_any
+
+    if group.operator == LogicalOperator.NOT:
+        first = children[0]
+        return lambda row: [] if first(row) else [None]
+
+    return _no_match
+
+
+def _compile_single(filter_obj: SingleFilter, headers: Optional[List[str]]) -> RowMatcher:
+    pred = _cell_predicate(filter_obj)
+
+    if filter_obj.column is None:
+        # Search across all columns
+        return lambda row: [i for i, value in enumerate(row) if pred(value)]
+
+    try:
+        col = filter_obj.column.resolve(headers)
+    except (ValueError, IndexError):
+        return _no_match  # Column not found
+
+    def match_column(row):
+        if col >= len(row):
+            return []  # Column doesn't exist in this row
+        return [col] if pred(row[col]) else []
+    return match_column
+
+
+def _cell_predicate(filter_obj: SingleFilter) -> Callable[[Any], bool]:
+    """Specialize one condition into a test of a single cell value."""
+    operator = filter_obj.operator
+    value = filter_obj.value
+
+    if operator == FilterOperator.IS_EMPTY:
+        return lambda cell: cell in _EMPTY_VALUES
+    if operator == FilterOperator.NOT_EMPTY:
+        return lambda cell: cell not in _EMPTY_VALUES
+
+    if operator in _NUMERIC_OPS:
+        compare = _NUMERIC_OPS[operator]
+        target = _to_number(value)
+        if target is None:
+            return lambda cell: False
+
+        def numeric(cell):
+            if isinstance(cell, (int, float)):
+                return compare(float(cell), target)
+            number = _to_number(cell)
+            return number is not None and compare(number, target)
+        return numeric
+
+    if operator == FilterOperator.BETWEEN:
+        low, high = _to_number(value), _to_number(filter_obj.value2)
+        if low is None or high is None:
+            return lambda cell: False
+
+        def between(cell):
+            number = float(cell) if isinstance(cell, (int, float)) else _to_number(cell)
+            return number is not None and low <= number <= high
+        return between
+
+    if operator in (FilterOperator.EQ, FilterOperator.NE):
+        equal = _equality_predicate(value, filter_obj.strict_type)
+        if operator == FilterOperator.EQ:
+            return equal
+        return lambda cell: not equal(cell)
+
+    if operator in (FilterOperator.IN, FilterOperator.NOT_IN):
+        if not isinstance(value, (list, tuple)):
+            return (lambda cell: False) if operator == FilterOperator.IN else (lambda cell: True)
+        member = _membership_predicate(value, filter_obj.strict_type)
+        if operator == FilterOperator.IN:
+            return member
+        return lambda cell: not member(cell)
+
+    if operator in (
+        FilterOperator.CONTAINS, FilterOperator.STARTS_WITH,
+        FilterOperator.ENDS_WITH, FilterOperator.REGEX,
+    ):
+        return _text_predicate(operator, value)
+
+    return lambda cell: False
+
+
+def _text_predicate(operator: FilterOperator, value: Any) -> Callable[[Any], bool]:
+    """String search operators: case-insensitive on the trimmed cell text."""
+    if value is None:
+        return lambda cell: False
+
+    if operator == FilterOperator.REGEX:
+        try:
+            search = re.compile(str(value), re.IGNORECASE).search
+        except re.error:
+            return lambda cell: False
+        return lambda cell: search(("" if cell is None else str(cell)).strip()) is not None
+
+    needle = str(value).strip().lower()
+    if operator == FilterOperator.CONTAINS:
+        return lambda cell: needle in ("" if cell is None else str(cell)).strip().lower()
+    if operator == FilterOperator.STARTS_WITH:
+        return lambda cell: ("" if cell is None else str(cell)).strip().lower().startswith(needle)
+    return lambda cell: ("" if cell is None else str(cell)).strip().lower().endswith(needle)
+
+
+def _equality_predicate(value: Any, strict_type: bool) -> Callable[[Any], bool]:
+    """Compile FilterEngine._values_equal(cell, value, strict_type) for a fixed value."""
+    if isinstance(value, str):
+        value = value.strip()
+        lowered = value.lower()
+        # Numeric reading of the filter value, for coercion against numbers
+        number = None if strict_type else _to_number(value)
+
+        def equal_text(cell):
+            if isinstance(cell, str):
+                cell = cell.strip()
+                if number is not None:
+                    cell_number = _to_number(cell)
+                    if cell_number is not None:
+                        return cell_number == number
+                return cell.lower() == lowered
+            if number is not None and isinstance(cell, (int, float)):
+                return float(cell) == number
+            return str(cell) == value
+        return equal_text
+
+    text = str(value)
+    if isinstance(value, (int, float)) and not strict_type:
+        number = float(value)
+
+        def equal_number(cell):
+            if isinstance(cell, str):
+                cell = cell.strip()
+                cell_number = _to_number(cell)
+                if cell_number is not None:
+                    return cell_number == number
+                return cell == text
+            # Number against number compares as text (5 != 5.0), as _values_equal does
+            return str(cell) == text
+        return equal_number
+
+    def equal_other(cell):
+        if isinstance(cell, str):
+            cell = cell.strip()
+        return str(cell) == text
+    return equal_other
+
+
+def _membership_predicate(values: Union[list, tuple], strict_type: bool) -> Callable[[Any], bool]:
+    """Compile the IN test: equal to any of the values."""
+    items = [item.strip() if isinstance(item, str) else item for item in values]
+    if all(isinstance(item, str) for item in items) and (
+        strict_type or all(_to_number(item) is None for item in items)
+    ):
+        # Plain text values: text cells match case-insensitively, anything
+        # else by its str(); both are set lookups
+        lowered = {item.lower() for item in items}
+        texts = set(items)
+        return lambda cell: (
+            cell.strip().lower() in lowered if isinstance(cell, str) else str(cell) in texts
+        )
+
+    tests = [_equality_predicate(item, strict_type) for item in items]
+    return lambda cell: any(test(cell) for test in tests)
+
+
+def _compile_test(
+    node: Union[FilterGroup, SingleFilter], headers: Optional[List[str]]
+) -> Callable[[List[Any]], bool]:
+    """Compile a tree to a row test agreeing with bool(_compile_node(node)(row))."""
+    if isinstance(node, SingleFilter):
+        pred = _cell_predicate(node)
+        if node.column is None:
+            return lambda row: any(map(pred, row))
+        try:
+            col = node.column.resolve(headers)
+        except (ValueError, IndexError):
+            return lambda row: False
+        return lambda row: col < len(row) and bool(pred(row[col]))
+
+    if not isinstance(node, FilterGroup):
+        return lambda row: False
+    if not node.conditions:
+        return lambda row: True
+
+    children = [_compile_test(cond, headers) for cond in node.conditions]
+    if node.operator == LogicalOperator.AND:
+        return lambda row: all(child(row) for child in children)
+    if node.operator == LogicalOperator.OR:
+        return lambda row: any(child(row) for child in children)
+    if node.operator == LogicalOperator.NOT:
+        first = children[0]
+        return lambda row: not first(row)
+    return lambda row: False
+
+
+# =============================================================================
+# Condition ordering
+# =============================================================================
+#
+# AND/OR groups stop at the first condition that decides them, so the order
+# of their conditions decides what a row costs. plan_filter() estimates for
+# each condition a cost per row (by operator, times the row width for
+# searches across all columns) and a match rate measured on a sample of the
+# rows, then orders every group so that cheap conditions likely to decide
+# it run first: by cost / (1 - match rate) for AND, cost / match rate for
+# OR. Only the evaluation order changes, never the rows selected.
+
+# Relative cost of testing one cell, by operator
+_OPERATOR_COSTS = {
+    FilterOperator.IS_EMPTY: 0.5,
+    FilterOperator.NOT_EMPTY: 0.5,
+    FilterOperator.GT: 1.0,
+    FilterOperator.GTE: 1.0,
+    FilterOperator.LT: 1.0,
+    FilterOperator.LTE: 1.0,
+    FilterOperator.BETWEEN: 1.2,
+    FilterOperator.EQ: 1.5,
+    FilterOperator.NE: 1.5,
+    FilterOperator.IN: 1.5,
+    FilterOperator.NOT_IN: 1.5,
+    FilterOperator.CONTAINS: 2.0,
+    FilterOperator.STARTS_WITH: 2.0,
+    FilterOperator.ENDS_WITH: 2.0,
+    FilterOperator.REGEX: 4.0,
+}
+
+
+def _describe_condition(filter_obj: SingleFilter) -> str:
+    column = "any column" if filter_obj.column is None else str(filter_obj.column.value)
+    text = f"{column} {filter_obj.operator.value}"
+    if filter_obj.operator not in (FilterOperator.IS_EMPTY, FilterOperator.NOT_EMPTY):
+        text += f" {filter_obj.value!r}"
+    if filter_obj.operator == FilterOperator.BETWEEN:
+        text += f" and {filter_obj.value2!r}"
+    return text
+
+
+def _plan_node(
+    node: Union[FilterGroup, SingleFilter],
+    headers: Optional[List[str]],
+    sample: List[List[Any]],
+    width: float,
+) -> Tuple[Union[FilterGroup, SingleFilter], float, float, Dict[str, Any]]:
+    """Plan one node: (reordered node, cost per row, match rate, report)."""
+    test = _compile_test(node, headers)
+    hits = sum(1 for row in sample if test(row))
+    # Smoothed, so no condition is treated as certain to match or fail
+    rate = (hits + 1) / (len(sample) + 2)
+
+    if isinstance(node, SingleFilter):
+        cost = _OPERATOR_COSTS.get(node.operator, 1.0) * (width if node.column is None else 1)
+        report = {"condition": _describe_condition(node)}
+    elif not isinstance(node, FilterGroup) or not node.conditions:
+        cost = 0.0
+        report = {"operator": getattr(node.operator, "value", None), "conditions": []}
+    else:
+        planned = [_plan_node(cond, headers, sample, width) for cond in node.conditions]
+        positions = list(range(len(planned)))
+        if node.operator == LogicalOperator.AND:
+            # Expected cost of a child per row it rejects
+            positions.sort(key=lambda i: planned[i][1] / (1 - planned[i][2]))
+        elif node.operator == LogicalOperator.OR:
+            # Expected cost of a child per row it accepts
+            positions.sort(key=lambda i: planned[i][1] / planned[i][2])
+
+        # Cost of a row: each child runs if the ones before it did not decide the group
+        cost = 0.0
+        reach = 1.0
+        for i in positions:
+            _, child_cost, child_rate, _ = planned[i]
+            cost += reach * child_cost
+            if node.operator == LogicalOperator.AND:
+                reach *= child_rate
+            elif node.operator == LogicalOperator.OR:
+                reach *= 1 - child_rate
+
+        if positions != sorted(positions):
+            node = FilterGroup(node.operator, [planned[i][0] for i in positions])
+        elif any(child is not cond for (child, _, _, _), cond in zip(planned, node.conditions)):
+            node = FilterGroup(node.operator, [child for child, _, _, _ in planned])
+        report = {
+            "operator": node.operator.value,
+            "conditions": [dict(planned[i][3], position=i) for i in positions],
+        }
+
+    report.update(cost=round(cost, 2), match_rate=round(rate, 3))
+    return node, cost, rate, report
+
+
+def plan_filter(
+    filters: Union[FilterGroup, SingleFilter],
+    headers: Optional[List[str]] = None,
+    sample: Optional[List[List[Any]]] = None,
+) -> Tuple[Union[FilterGroup, SingleFilter], Optional[Dict[str, Any]]]:
+    """Order the conditions of each AND/OR group by estimated cost and match rate.
+
+    Args:
+        filters: Parsed filter tree (not modified)
+        headers: Headers for name-based column references
+        sample: Rows to measure match rates on (e.g. the first rows of the data)
+
+    Returns:
+        Tuple of (tree, report): the tree with each group's conditions in
+        evaluation order, and a report of the chosen order (each group lists
+        its conditions with their original position, estimated cost per row
+        and sampled match rate). Trees without a group of two or more
+        conditions, or without a sample, are returned as is with no report.
+    """
+    if not sample or not _has_choice(filters):
+        return filters, None
+    width = max(len(headers or ()), sum(len(row) for row in sample) / len(sample), 1)
+    tree, _, _, report = _plan_node(filters, headers, sample, width)
+    report["sample_rows"] = len(sample)
+    return tree, report
+
+
+def _has_choice(node: Union[FilterGroup, SingleFilter]) -> bool:
+    if not isinstance(node, FilterGroup):
+        return False
+    if len(node.conditions) > 1 and node.operator != LogicalOperator.NOT:
+        return True
+    return any(_has_choice(cond) for cond in node.conditions)
+
+
+# Row evaluation strategies, see FilterEngine
+FILTER_BACKENDS = ("auto", "python", "numpy")
+
+
 class FilterEngine:
     """Engine for applying filters to 2D Excel data arrays."""
 
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None, plan_rows: Optional[int] = None):
+        """
+        Args:
+            backend: "python" (compiled row matchers), "numpy" (column masks,
+                see filters_vector) or "auto" (numpy when installed and the
+                data is large enough). Defaults to EXCELLM_FILTER_BACKEND.
+            plan_rows: Rows filter_data samples to order AND/OR conditions
+                (see plan_filter); 0 keeps the written order. Defaults to
+                EXCELLM_FILTER_PLAN_SAMPLE_ROWS.
+        """
+        backend = backend or FILTER_BACKEND
+        if backend not in FILTER_BACKENDS:
+            raise ValueError(
+                f"Invalid filter backend: {backend}. Must be one of {', '.join(FILTER_BACKENDS)}"
+            )
+        self.backend = backend
+        self.plan_rows = FILTER_PLAN_SAMPLE_ROWS if plan_rows is None else plan_rows
+        # Backend the last apply_filter/filter_data call actually used
+        self.last_backend: Optional[str] = None
+        # Condition order the last filter_data call chose (plan_filter report)
+        self.last_plan: Optional[Dict[str, Any]] = None
         self._cache_column_types = {}
         self._warnings: List[str] = []
         self._trim = True
 
+    def _use_vector_backend(
+        self,
+        data_rows: List[List[Any]],
+        filters: Union[FilterGroup, SingleFilter],
+        headers: Optional[List[str]],
+    ) -> bool:
+        """Decide whether to evaluate this call with the numpy backend."""
+        use = False
+        if self.backend != "python":
+            from . import filters_vector
+
+            if not filters_vector.NUMPY_AVAILABLE:
+                if self.backend == "numpy":
+                    logger.debug("numpy is not installed; filtering row by row")
+            elif self.backend == "numpy" or len(data_rows) >= filters_vector.MIN_VECTOR_ROWS:
+                use = filters_vector.is_vectorizable(filters, headers)
+        self.last_backend = "numpy" if use else "python"
+        return use
+
     def apply_filter(
         self,
         data: List[List[Any]],
@@ -299,9 +803,18 @@ class FilterEngine:
         filtered_rows = []
         matched_indices = []
         data_start_index = 1 if has_header else 0
+        matches = compile_filter(filters, headers).matches
+
+        candidates = range(len(data_rows))
+        if self._use_vector_backend(data_rows, filters, headers):
+            from .filters_vector import matching_rows
+
+            # Masks pick the rows; the plan then reports their matching columns
+            candidates = matching_rows(data_rows, filters, headers)
 
-        for i, row in enumerate(data_rows):
-            col_indices = self._matches_filter(row, filters, headers)
+        for i in candidates:
+            row = data_rows[i]
+            col_indices = matches(row)
             if col_indices:
                 filtered_rows.append(row)
                 # Track all matching cells in this row
@@ -696,24 +1209,14 @@ class FilterEngine:
 
     def _to_number(self, value: Any) -> Optional[float]:
         """Convert value to number if possible."""
-        if value is None:
-            return None
-        try:
-            # Handle common numeric formats
-            if isinstance(value, (int, float)):
-                return float(value)
-            # Remove common currency/thousand separators
-            if isinstance(value, str):
-                value = value.strip().replace(",", "").replace("$", "")
-            return float(value)
-        except (ValueError, TypeError):
-            return None
+        return _to_number(value)
 
     def filter_data(
         self,
         data_rows: List[List[Any]],
         filters: Union[str, dict, FilterGroup, SingleFilter],
         headers: Optional[List[str]] = None,
+        candidates: Optional[List[int]] = None,
     ) -> Tuple[List[List[Any]], List[int]]:
         """
         Filter data rows and return filtered data with row indices.
@@ -725,29 +1228,40 @@ class FilterEngine:
             data_rows: 2D array of data values (without header row)
             filters: Filter specification (string for simple contains search, dict for complex)
             headers: Optional list of column headers for name-based column references
+            candidates: Ascending indices of the only rows that can match (e.g.
+                from a search index); other rows are not evaluated
 
         Returns:
             Tuple of (filtered_data, row_indices) where:
             - filtered_data: List of rows that matched the filter
             - row_indices: Original indices of matched rows in data_rows
         """
-        # Handle simple string filter (contains search across all columns)
-        if isinstance(filters, str):
-            filters = SingleFilter(
-                column=None,  # Search all columns
-                operator=FilterOperator.CONTAINS,
-                value=filters
-            )
-        elif isinstance(filters, dict):
-            filters = self._parse_filter_dict(filters)
+        filters = to_filter_tree(filters)
+
+        # Order AND/OR conditions by cost and by match rate on the first rows
+        self.last_plan = None
+        if self.plan_rows > 0:
+            if candidates is None:
+                sample = data_rows[:self.plan_rows]
+            else:
+                sample = [data_rows[i] for i in candidates[:self.plan_rows]]
+            filters, self.last_plan = plan_filter(filters, headers, sample)
+
+        if candidates is None and self._use_vector_backend(data_rows, filters, headers):
+            from .filters_vector import matching_rows
+
+            matched_indices = matching_rows(data_rows, filters, headers)
+            return ([data_rows[i] for i in matched_indices], matched_indices)
 
         # Apply filter to each row, tracking indices
         filtered_rows = []
         matched_indices = []
+        test = compile_filter(filters, headers).test
+        self.last_backend = "python"
 
-        for i, row in enumerate(data_rows):
-            col_indices = self._matches_filter(row, filters, headers)
-            if col_indices:
+        for i in range(len(data_rows)) if candidates is None else candidates:
+            row = data_rows[i]
+            if test(row):
                 filtered_rows.append(row)
                 matched_indices.append(i)
 
@@ -758,6 +1272,25 @@ class FilterEngine:
         return self._warnings
 
 
+def to_filter_tree(
+    filters: Union[str, dict, FilterGroup, SingleFilter],
+) -> Union[FilterGroup, SingleFilter]:
+    """Parse any accepted filter specification into a filter tree.
+
+    A string is a contains search across all columns; a dict is parsed with
+    parse_filters; filter objects are returned unchanged.
+    """
+    if isinstance(filters, str):
+        return SingleFilter(
+            column=None,  # Search all columns
+            operator=FilterOperator.CONTAINS,
+            value=filters
+        )
+    if isinstance(filters, dict):
+        return parse_filters(filters)
+    return filters
+
+
 def parse_filters(filter_dict: dict) -> Union[FilterGroup, SingleFilter]:
     """
     Parse filter dictionary into FilterGroup or SingleFilter object.
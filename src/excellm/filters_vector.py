@@ -0,0 +1,327 @@
+"""NumPy backend for FilterEngine.
+
+Evaluates a filter tree as boolean row masks instead of row by row. Each
+column a condition references is converted once per call into the arrays
+the comparison needs (numbers with the same currency/thousands coercion as
+FilterEngine._to_number, dictionary codes of the trimmed and lowercased
+text, empty flags); comparisons become array operations and groups combine
+their children's masks with &, | and ~.
+
+Conditions without an array form (string search, regex, any-column
+searches, negative column indices) fall back to the compiled Python matcher
+for that node only, run on just the rows still undecided by the rest of the
+group. The rows selected are exactly those the Python plan selects.
+
+NumPy is optional; NUMPY_AVAILABLE is False when it is not installed.
+"""
+
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .filters import (
+    _EMPTY_VALUES,
+    FilterGroup,
+    FilterOperator,
+    LogicalOperator,
+    SingleFilter,
+    _to_number,
+    compile_filter,
+)
+
+# Fewer data rows than this are filtered row by row (array setup costs more)
+MIN_VECTOR_ROWS = 2000
+
+# Cell kinds in ColumnArrays.kinds()
+_KIND_NUMBER = 1
+_KIND_TEXT = 2
+_KIND_OTHER = 3
+
+_VECTOR_OPERATORS = frozenset({
+    FilterOperator.GT, FilterOperator.GTE, FilterOperator.LT, FilterOperator.LTE,
+    FilterOperator.BETWEEN, FilterOperator.EQ, FilterOperator.NE,
+    FilterOperator.IN, FilterOperator.NOT_IN,
+    FilterOperator.IS_EMPTY, FilterOperator.NOT_EMPTY,
+})
+
+# idx (row numbers still to decide) -> bool mask aligned with idx
+MaskFn = Callable[["np.ndarray"], "np.ndarray"]
+
+
+class ColumnArrays:
+    """Typed arrays of the columns of a row list, converted on first use."""
+
+    def __init__(self, rows: List[List[Any]]):
+        self.rows = rows
+        self.n = len(rows)
+        self._cache: Dict[Any, Any] = {}
+
+    def _cached(self, name: str, col: int, build: Callable[[], Any]) -> Any:
+        key = (name, col)
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def _full_width(self, col: int) -> bool:
+        if "min_width" not in self._cache:
+            self._cache["min_width"] = min(map(len, self.rows), default=0)
+        return col < self._cache["min_width"]
+
+    def cells(self, col: int) -> List[Any]:
+        def build():
+            if self._full_width(col):
+                return list(map(itemgetter(col), self.rows))
+            return [row[col] if col < len(row) else None for row in self.rows]
+        return self._cached("cells", col, build)
+
+    def present(self, col: int) -> "np.ndarray":
+        """Rows long enough to have the column."""
+        def build():
+            if self._full_width(col):
+                return np.ones(self.n, bool)
+            return np.fromiter((col < len(row) for row in self.rows), bool, self.n)
+        return self._cached("present", col, build)
+
+    def numbers(self, col: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        """(has_number, value) with NaN where a cell is not numeric."""
+        def build():
+            cells = self.cells(col)
+            try:
+                # Wherever float() accepts every cell it agrees with _to_number
+                return np.ones(self.n, bool), np.fromiter(cells, float, self.n)
+            except (TypeError, ValueError, OverflowError):
+                pass
+            values = [_to_number(cell) for cell in cells]
+            has = np.fromiter((v is not None for v in values), bool, self.n)
+            nums = np.fromiter((np.nan if v is None else v for v in values), float, self.n)
+            return has, nums
+        return self._cached("numbers", col, build)
+
+    def kinds(self, col: int) -> "np.ndarray":
+        def build():
+            return np.fromiter(
+                (
+                    _KIND_TEXT if isinstance(cell, str)
+                    else _KIND_NUMBER if isinstance(cell, (int, float))
+                    else _KIND_OTHER
+                    for cell in self.cells(col)
+                ),
+                np.int8, self.n,
+            )
+        return self._cached("kinds", col, build)
+
+    def _text_factors(self, col: int) -> Tuple["np.ndarray", List[str]]:
+        """Codes of distinct text cells (-1 for other cells) and the distinct texts."""
+        def build():
+            factors: Dict[str, int] = {}
+            array = np.fromiter(
+                (
+                    factors.setdefault(cell, len(factors)) if isinstance(cell, str) else -1
+                    for cell in self.cells(col)
+                ),
+                np.int64, self.n,
+            )
+            return array, list(factors)
+        return self._cached("factors", col, build)
+
+    def _recode(self, col: int, key: Callable[[str], str]) -> Tuple["np.ndarray", Dict[str, int]]:
+        """Map text cells to codes of key(text), computing key once per distinct text."""
+        factors, texts = self._text_factors(col)
+        codes: Dict[str, int] = {}
+        lookup = np.fromiter((codes.setdefault(key(t), len(codes)) for t in texts), np.int64, len(texts))
+        array = np.full(self.n, -1, np.int64)
+        is_text = factors >= 0
+        array[is_text] = lookup[factors[is_text]]
+        return array, codes
+
+    def lower_codes(self, col: int) -> Tuple["np.ndarray", Dict[str, int]]:
+        """Codes of trimmed, lowercased text cells (-1 for other cells)."""
+        return self._cached("lower", col, lambda: self._recode(col, lambda t: t.strip().lower()))
+
+    def text_codes(self, col: int) -> Tuple["np.ndarray", Dict[str, int]]:
+        """Codes of the trimmed text of text cells and str() of other cells."""
+        def build():
+            array, codes = self._recode(col, str.strip)
+            other = np.flatnonzero(array < 0)
+            if len(other):
+                cells = self.cells(col)
+                array[other] = np.fromiter(
+                    (codes.setdefault(str(cells[i]), len(codes)) for i in other.tolist()),
+                    np.int64, len(other),
+                )
+            return array, codes
+        return self._cached("text", col, build)
+
+    def empty(self, col: int) -> "np.ndarray":
+        return self._cached(
+            "empty", col,
+            lambda: np.fromiter((cell in _EMPTY_VALUES for cell in self.cells(col)), bool, self.n)
+        )
+
+
+def _code_match(codes: Tuple["np.ndarray", Dict[str, int]], key: str) -> "np.ndarray":
+    array, lookup = codes
+    code = lookup.get(key)
+    if code is None:
+        return np.zeros(len(array), bool)
+    return array == code
+
+
+def _equal_mask(columns: ColumnArrays, col: int, value: Any, strict_type: bool) -> "np.ndarray":
+    """Mask of cells equal to value, as filters._equality_predicate decides it."""
+    if isinstance(value, str):
+        value = value.strip()
+        number = None if strict_type else _to_number(value)
+        is_text = columns.kinds(col) == _KIND_TEXT
+        text_part = _code_match(columns.lower_codes(col), value.lower())
+        other_part = _code_match(columns.text_codes(col), value)
+        if number is not None:
+            has, nums = columns.numbers(col)
+            text_part = np.where(has, nums == number, text_part)
+            other_part = np.where(columns.kinds(col) == _KIND_NUMBER, nums == number, other_part)
+        return np.where(is_text, text_part, other_part)
+
+    text_equal = _code_match(columns.text_codes(col), str(value))
+    if isinstance(value, (int, float)) and not strict_type:
+        has, nums = columns.numbers(col)
+        text_part = np.where(has, nums == float(value), text_equal)
+        return np.where(columns.kinds(col) == _KIND_TEXT, text_part, text_equal)
+    return text_equal
+
+
+def _single_mask(columns: ColumnArrays, col: int, filter_obj: SingleFilter) -> "np.ndarray":
+    """Full-length mask of one vectorizable condition on column col."""
+    operator = filter_obj.operator
+    value = filter_obj.value
+    present = columns.present(col)
+
+    if operator == FilterOperator.IS_EMPTY:
+        return present & columns.empty(col)
+    if operator == FilterOperator.NOT_EMPTY:
+        return present & ~columns.empty(col)
+
+    if operator in (FilterOperator.GT, FilterOperator.GTE, FilterOperator.LT, FilterOperator.LTE):
+        target = _to_number(value)
+        if target is None:
+            return np.zeros(columns.n, bool)
+        has, nums = columns.numbers(col)
+        compare = {
+            FilterOperator.GT: np.greater, FilterOperator.GTE: np.greater_equal,
+            FilterOperator.LT: np.less, FilterOperator.LTE: np.less_equal,
+        }[operator]
+        return present & has & compare(nums, target)
+
+    if operator == FilterOperator.BETWEEN:
+        low, high = _to_number(value), _to_number(filter_obj.value2)
+        if low is None or high is None:
+            return np.zeros(columns.n, bool)
+        has, nums = columns.numbers(col)
+        return present & has & (low <= nums) & (nums <= high)
+
+    if operator in (FilterOperator.EQ, FilterOperator.NE):
+        equal = _equal_mask(columns, col, value, filter_obj.strict_type)
+        return present & (equal if operator == FilterOperator.EQ else ~equal)
+
+    # IN / NOT_IN
+    if not isinstance(value, (list, tuple)):
+        return present if operator == FilterOperator.NOT_IN else np.zeros(columns.n, bool)
+    member = np.zeros(columns.n, bool)
+    for item in value:
+        member |= _equal_mask(columns, col, item, filter_obj.strict_type)
+    return present & (member if operator == FilterOperator.IN else ~member)
+
+
+def _vector_column(filter_obj: SingleFilter, headers: Optional[List[str]]) -> Optional[int]:
+    """Column index of a condition with an array form, else None."""
+    if filter_obj.column is None or filter_obj.operator not in _VECTOR_OPERATORS:
+        return None
+    try:
+        col = filter_obj.column.resolve(headers)
+    except (ValueError, IndexError):
+        return None
+    return col if col >= 0 else None
+
+
+def is_vectorizable(
+    filters: Union[FilterGroup, SingleFilter], headers: Optional[List[str]] = None
+) -> bool:
+    """Whether any condition in the tree has an array form."""
+    if isinstance(filters, SingleFilter):
+        return _vector_column(filters, headers) is not None
+    if isinstance(filters, FilterGroup):
+        return any(is_vectorizable(cond, headers) for cond in filters.conditions)
+    return False
+
+
+def _python_mask(rows: List[List[Any]], node: Union[FilterGroup, SingleFilter], headers) -> MaskFn:
+    test = compile_filter(node, headers).test
+
+    def evaluate(idx):
+        return np.fromiter((test(rows[i]) for i in idx.tolist()), bool, len(idx))
+    return evaluate
+
+
+def _compile_mask(
+    node: Union[FilterGroup, SingleFilter],
+    headers: Optional[List[str]],
+    columns: ColumnArrays,
+) -> MaskFn:
+    if not is_vectorizable(node, headers):
+        return _python_mask(columns.rows, node, headers)
+
+    if isinstance(node, SingleFilter):
+        col = _vector_column(node, headers)
+        full: List["np.ndarray"] = []
+
+        def single(idx):
+            if not full:
+                full.append(_single_mask(columns, col, node))
+            return full[0][idx]
+        return single
+
+    if not node.conditions:
+        return lambda idx: np.ones(len(idx), bool)
+    children = [_compile_mask(cond, headers, columns) for cond in node.conditions]
+
+    if node.operator == LogicalOperator.AND:
+        def match_all(idx):
+            mask = np.ones(len(idx), bool)
+            for child in children:
+                pos = np.flatnonzero(mask)
+                if not len(pos):
+                    break
+                mask[pos] = child(idx[pos])
+            return mask
+        return match_all
+
+    if node.operator == LogicalOperator.OR:
+        def match_any(idx):
+            mask = np.zeros(len(idx), bool)
+            for child in children:
+                pos = np.flatnonzero(~mask)
+                if not len(pos):
+                    break
+                mask[pos] = child(idx[pos])
+            return mask
+        return match_any
+
+    first = children[0]  # NOT
+    return lambda idx: ~first(idx)
+
+
+def matching_rows(
+    rows: List[List[Any]],
+    filters: Union[FilterGroup, SingleFilter],
+    headers: Optional[List[str]] = None,
+) -> List[int]:
+    """Indices of the rows the filter selects (same rows as the Python plan)."""
+    if not rows:
+        return []
+    columns = ColumnArrays(rows)
+    mask = _compile_mask(filters, headers, columns)(np.arange(len(rows)))
+    return np.flatnonzero(mask).tolist()
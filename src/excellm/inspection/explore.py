@@ -7,9 +7,7 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Tuple
 
-import pythoncom
-import win32com.client as win32
-
+from ..core.connection import get_excel_app
 from .types import (
     TOOL_VERSION,
     CommentsNotes,
@@ -55,10 +53,8 @@ def explore_sync(sheet: str, mode: str = "quick") -> Dict[str, Any]:
     """
     start_time = time.perf_counter()
 
-    pythoncom.CoInitialize()
-
     try:
-        app = win32.GetActiveObject("Excel.Application")
+        app = get_excel_app()
     except Exception as e:
         raise RuntimeError(f"Excel not running or not accessible: {e}")
 
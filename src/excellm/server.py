@@ -6,13 +6,13 @@ automation tools to LLM clients (Claude, ChatGPT, Cursor, etc.).
 Refactored version with modular tool organization.
 """
 
-import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
 # Import from refactored modules
+from .core.async_engine import COM_LANE, AsyncExcelEngine, workbook_lane
 from .core.errors import ErrorCodes, ToolError
 
 # For backward compatibility - keep ExcelSessionManager for tools that still need it
@@ -20,6 +20,7 @@ from .excel_session import ExcelSessionManager
 from .inspection import explore_sync, inspect_workbook_sync
 from .tools import (
     batch_read_sync,
+    bulk_insert_delete_sync,
     # Screen Capture (NEW)
     capture_sheet_sync,
     # Range Operations (NEW)
@@ -35,6 +36,8 @@ from .tools import (
     create_transform_session_sync,
     delete_sync,
     delete_table_sync,
+    # Batch Operations
+    execute_batch_sync,
     # VBA Execution (NEW)
     execute_vba_sync,
     find_replace_sync,
@@ -105,6 +108,7 @@ mcp = FastMCP(
     - list_open_workbooks(): List all open workbooks
     - read(): Read cells/ranges (supports batch=[...] for multi-read)
     - write(): Write to cells/ranges
+    - batch(): Run several reads/writes/sheet ops with a single save
     - search(): Filter data by conditions
     - format(): Apply formatting
     - insert(): Insert rows/columns
@@ -129,6 +133,31 @@ def get_session_manager() -> ExcelSessionManager:
     return _session_manager
 
 
+# Tool calls run on per-engine executors with per-workbook limits
+_async_engine: Optional[AsyncExcelEngine] = None
+
+
+def get_async_engine() -> AsyncExcelEngine:
+    """Get or create the async engine that runs blocking tool calls."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = AsyncExcelEngine()
+    return _async_engine
+
+
+async def _dispatch(func, *args, workbook: Optional[str] = None, lane: str = COM_LANE, **kwargs):
+    """Run a blocking tool function on an engine executor (COM unless lane says otherwise).
+
+    Tools that also work on workbook files pass lane=workbook_lane(...), so
+    calls on a file path run on the File executor instead of queueing
+    behind COM calls. Calls naming a workbook are limited per workbook; the
+    engine rejects calls with ENGINE_BUSY when its queue is full and
+    TIMEOUT when a call takes too long, time spent queued included
+    (timeout=... overrides EXCELLM_ASYNC_TIMEOUT_S for one call).
+    """
+    return await get_async_engine().run(func, *args, workbook=workbook, lane=lane, **kwargs)
+
+
 # ============================================================================
 # MCP Tool Implementations - Using Refactored Modules
 # ============================================================================
@@ -160,7 +189,7 @@ async def list_open_workbooks() -> dict:
         }
     """
     try:
-        workbooks = await asyncio.to_thread(list_workbooks_sync)
+        workbooks = await _dispatch(list_workbooks_sync)
         return {
             "success": True,
             "workbooks": workbooks,
@@ -189,8 +218,9 @@ async def select_range(
         Dictionary with success status and message
     """
     try:
-        result = await asyncio.to_thread(
-            select_range_sync, workbook_name, sheet_name, reference
+        result = await _dispatch(
+            select_range_sync, workbook_name, sheet_name, reference,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -206,6 +236,8 @@ async def read(
     reference: str = None,
     batch: List[dict] = None,
     max_rows: int = None,
+    include_formulas: str = "auto",
+    cursor: str = None,
 ) -> dict:
     """Read from a cell, range, or multiple ranges in Excel.
 
@@ -215,21 +247,30 @@ async def read(
         reference: Cell (A1), range (A1:C5). Defaults to UsedRange.
         batch: Optional list of read requests: [{"sheet": "S1", "range": "A1"}, ...]
                If provided, sheet_name and reference are ignored.
-        max_rows: Maximum rows to return (prevents token explosion). None = unlimited.
+        max_rows: Maximum rows to return (prevents token explosion); also the page
+            size of cursor paging. None = unlimited.
+        include_formulas: "auto" (default) fetches formulas only for the parts of
+            the range that contain any, "always" fetches the full formula grid,
+            "never" skips formulas
+        cursor: next_cursor from a previous page. Continues that read exactly
+            where it stopped (same sheet, range, page size and formula mode).
+            Rejected with STALE_CURSOR if the sheet changed in between.
 
     Returns:
         Dictionary with cell/range data and metadata
     """
     try:
         if batch:
-            return await asyncio.to_thread(batch_read_sync, workbook_name, batch)
+            return await _dispatch(batch_read_sync, workbook_name, batch, workbook=workbook_name)
 
-        if not sheet_name:
+        if not sheet_name and not cursor:
             raise ToolError("sheet_name is required when batch is not used")
 
-        # Use read_range_sync with max_rows support
-        result = await asyncio.to_thread(
-            read_range_sync, workbook_name, sheet_name, reference, max_rows
+        # Use read_range_sync with max_rows and cursor paging support
+        result = await _dispatch(
+            read_range_sync, workbook_name, sheet_name, reference, max_rows, include_formulas,
+            cursor=cursor,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -253,6 +294,8 @@ async def write(
     max_cells: int = None,
     verify_source: dict = None,
     abort_threshold: float = 0.0,
+    performance_mode: bool = False,
+    diff: bool = False,
 ) -> dict:
     """Write to a cell or range in Excel.
 
@@ -275,6 +318,11 @@ async def write(
             {"column": "A", "key_index": 0, "match_mode": "contains"}
         abort_threshold: Max allowed mismatch rate (default: 0.0 = 0%)
             If verification fails above this rate, write is aborted.
+        performance_mode: If True (range writes), suspend screen updating,
+            events and automatic calculation and recalculate once at the end
+        diff: If True (range writes), write only the blocks whose values differ
+            from what is in the sheet; the result reports cells_changed and
+            cells_unchanged. Use when re-writing a chunk with few edits.
 
     Returns:
         Dictionary with operation result
@@ -283,7 +331,7 @@ async def write(
         # Check if single cell or range
         if isinstance(data, list) and isinstance(data[0], list):
             # Range write - use write_range_sync directly with new safety features
-            result = await asyncio.to_thread(
+            result = await _dispatch(
                 write_range_sync,
                 workbook_name, sheet_name, reference, data,
                 force_overwrite=force_overwrite,
@@ -293,6 +341,9 @@ async def write(
                 max_cells=max_cells,
                 verify_source=verify_source,
                 abort_threshold=abort_threshold,
+                performance_mode=performance_mode,
+                diff=diff,
+                workbook=workbook_name,
             )
 
         else:
@@ -321,24 +372,48 @@ async def search(
     has_header: bool = True,
     all_sheets: bool = False,
     max_rows: int = None,
+    export_path: str = None,
+    export_sheet: str = "Search_Results",
+    use_index: bool = False,
+    parallel: bool = False,
+    sheet_timeout: float = None,
+    cursor: str = None,
 ) -> dict:
     """Search and filter Excel data before returning to LLM.
 
     Args:
-        workbook_name: Name of open workbook
+        workbook_name: Name of open workbook (with all_sheets, also a workbook file path)
         filters: Filter dict or simple search string
         sheet_name: Name of worksheet (required if all_sheets is False)
         range: Excel range (defaults to UsedRange)
         has_header: Whether first row contains headers
         all_sheets: If True, search all sheets
         max_rows: Maximum rows to return (prevents token explosion). None = unlimited.
+            A single-sheet search stops scanning once this many rows match and
+            returns next_cursor plus the total (or estimated_total) matches.
+        export_path: Optional .xlsx file to write all matching rows to (created
+            if missing). Not limited by max_rows; single-sheet searches only.
+        export_sheet: New sheet to hold the exported rows
+        use_index: If True, index the searched range on first use so later
+            searches of the unchanged sheet skip the read and only check rows
+            whose text can match (contains, starts_with, ends_with, =, in).
+            Edits and recalculations in Excel rebuild the index
+        parallel: If True with all_sheets, filter sheets in worker processes;
+            max_rows then caps the matching rows across all sheets
+        sheet_timeout: Seconds each sheet may be filtered for in a parallel or
+            file all-sheets search; sheets cut short are listed in timed_out_sheets
+        cursor: next_cursor of a previous page; continues that search with its
+            sheet, range, filters and page size (other arguments are ignored)
 
     Returns:
         Dictionary with filtered data and metadata
     """
     try:
-        result = await asyncio.to_thread(
-            search_sync, workbook_name, filters, sheet_name, range, has_header, all_sheets, max_rows
+        result = await _dispatch(
+            search_sync, workbook_name, filters, sheet_name, range, has_header, all_sheets, max_rows,
+            export_path, export_sheet, use_index, parallel, sheet_timeout, cursor,
+            workbook=workbook_name,
+            lane=workbook_lane(workbook_name),
         )
         return result
     except Exception as e:
@@ -347,6 +422,58 @@ async def search(
         raise ToolError(f"Failed to search: {str(e)}") from e
 
 
+@mcp.tool()
+async def batch(
+    workbook_name: str,
+    operations: List[Dict[str, Any]],
+    stop_on_error: bool = True,
+    performance_mode: bool = False,
+) -> dict:
+    """Run several reads, writes and sheet operations in one call.
+
+    The workbook is resolved once and saved once at the end, so a
+    multi-step edit costs a single round-trip.
+
+    Args:
+        workbook_name: Name of open workbook (or path to a workbook file)
+        operations: Ordered list of operations:
+            - {"op": "read", "sheet": "Sheet1", "range": "A1:C5"}
+            - {"op": "write", "sheet": "Sheet1", "range": "A1", "data": [[1, 2], [3, 4]]}
+              (optional "max_cells", default 250, and "force_overwrite" as in write;
+              without force_overwrite a write over existing data fails)
+            - {"op": "create_sheet", "sheet": "Summary"}
+            - {"op": "delete_sheet", "sheet": "Old"}
+            - {"op": "sheet_names"}
+        stop_on_error: If True, operations after the first failure are skipped
+        performance_mode: If True (open workbooks), suspend screen updating,
+            events and automatic calculation for the whole batch and
+            recalculate once at the end
+
+    Returns:
+        Dictionary with one result per operation (index, op, success, and
+        data/error), plus ops_run, ops_failed and whether the workbook was saved
+
+    Example:
+        >>> batch("data.xlsx", [
+        ...     {"op": "create_sheet", "sheet": "Summary"},
+        ...     {"op": "write", "sheet": "Summary", "range": "A1", "data": [["Total", 42]]},
+        ...     {"op": "read", "sheet": "Summary", "range": "A1:B1"},
+        ... ])
+        {"success": True, "ops_run": 3, "ops_failed": 0, "saved": True, "results": [...]}
+    """
+    try:
+        result = await _dispatch(
+            execute_batch_sync, workbook_name, operations, stop_on_error, performance_mode,
+            workbook=workbook_name,
+            lane=workbook_lane(workbook_name),
+        )
+        return result
+    except Exception as e:
+        if isinstance(e, ToolError):
+            raise
+        raise ToolError(f"Failed to run batch: {str(e)}") from e
+
+
 @mcp.tool()
 async def manage_sheet(
     workbook_name: str,
@@ -376,10 +503,11 @@ async def manage_sheet(
         Dictionary with operation result
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             manage_sheet_sync,
             workbook_name, sheet_name, sheet_names, action,
-            force_delete, target_workbook, target_name, position, reference_sheet
+            force_delete, target_workbook, target_name, position, reference_sheet,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -388,6 +516,21 @@ async def manage_sheet(
         raise ToolError(f"Failed to manage sheet: {str(e)}") from e
 
 
+@mcp.tool()
+async def engine_metrics() -> dict:
+    """Report tool executor load: saturation, queue depth and call counters.
+
+    Returns:
+        Dictionary with per-engine running/queued calls, saturation
+        (running / max_workers), completed/failed/rejected/timed-out counts,
+        average queue wait and run time, workbooks with calls in flight,
+        the COM worker thread state and how often Excel was connected to.
+        "tools" breaks latency down per tool function, with how many Excel
+        lookups were served from the COM proxy registry vs. made over COM
+    """
+    return {"success": True, **get_async_engine().metrics()}
+
+
 @mcp.tool()
 async def validate_cell_reference(cell: str) -> dict:
     """Validate Excel cell reference format.
@@ -409,7 +552,7 @@ async def get_current_selection() -> dict:
         Dictionary with selection details (address, type, workbook, sheet, etc.)
     """
     try:
-        result = await asyncio.to_thread(get_current_selection_sync)
+        result = await _dispatch(get_current_selection_sync)
         return result
     except Exception as e:
         if isinstance(e, ToolError):
@@ -424,6 +567,7 @@ async def insert(
     insert_type: str,
     position: str,
     count: int = 1,
+    performance_mode: bool = False,
 ) -> dict:
     """Insert rows or columns at a specific position.
 
@@ -433,13 +577,17 @@ async def insert(
         insert_type: "row" or "column"
         position: Row number or column letter
         count: Number to insert (default: 1)
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
 
     Returns:
         Dictionary with operation result
     """
     try:
-        result = await asyncio.to_thread(
-            insert_sync, workbook_name, sheet_name, insert_type, position, count
+        result = await _dispatch(
+            insert_sync, workbook_name, sheet_name, insert_type, position, count,
+            performance_mode=performance_mode,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -473,8 +621,9 @@ async def delete(
         {"success": True, "action": "rows_deleted", "count": 3, "at": "5"}
     """
     try:
-        result = await asyncio.to_thread(
-            delete_sync, workbook_name, sheet_name, delete_type, position, count
+        result = await _dispatch(
+            delete_sync, workbook_name, sheet_name, delete_type, position, count,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -483,6 +632,52 @@ async def delete(
         raise ToolError(f"Failed to delete: {str(e)}") from e
 
 
+@mcp.tool()
+async def bulk_insert_delete(
+    workbook_name: str,
+    sheet_name: str,
+    action: str,
+    line_type: str,
+    positions: list,
+    performance_mode: bool = False,
+) -> dict:
+    """Insert or delete rows or columns at many positions in one operation.
+
+    All positions refer to the sheet before the call. Overlapping and
+    adjacent deletions are merged; the blocks are applied together with
+    multi-area Insert/Delete calls instead of one call per row.
+
+    Args:
+        workbook_name: Name of open workbook
+        sheet_name: Name of worksheet
+        action: "insert" or "delete"
+        line_type: "row" or "column"
+        positions: Rows or columns, e.g. ["5:10", "20", {"position": "30", "count": 3}]
+            or ["C", "F:H"]. An insert at "5:10" adds 6 lines before line 5
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
+
+    Returns:
+        Dictionary with operation result, including the merged blocks and
+        the number of Insert/Delete calls
+
+    Example:
+        >>> bulk_insert_delete("data.xlsx", "Sheet1", "delete", "row", ["5:10", "11", "20:25"])
+        {"success": True, "action": "rows_deleted", "count": 13, "blocks": ["5:11", "20:25"], "calls": 1}
+    """
+    try:
+        result = await _dispatch(
+            bulk_insert_delete_sync, workbook_name, sheet_name, action, line_type, positions,
+            performance_mode=performance_mode,
+            workbook=workbook_name,
+        )
+        return result
+    except Exception as e:
+        if isinstance(e, ToolError):
+            raise
+        raise ToolError(f"Failed to {action} {line_type}s: {str(e)}") from e
+
+
 @mcp.tool()
 async def format(
     workbook_name: str,
@@ -492,6 +687,7 @@ async def format(
     format: dict = None,
     conditional_format: dict = None,
     activate: bool = True,
+    performance_mode: bool = False,
 ) -> dict:
     """Apply formatting to cells/ranges in Excel.
 
@@ -507,13 +703,17 @@ async def format(
             - iconSet: {type: "iconSet", icon_style: "3trafficlights"}
             - cellIs: {type: "cellIs", operator: "greaterThan", value: 100, fill_color: "FFEB9C"}
         activate: If True, activate after formatting
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
 
     Returns:
         Dictionary with operation result
     """
     try:
-        result = await asyncio.to_thread(
-            format_range_sync, workbook_name, sheet_name, reference, style, format, conditional_format, activate
+        result = await _dispatch(
+            format_range_sync, workbook_name, sheet_name, reference, style, format, conditional_format, activate,
+            performance_mode=performance_mode,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -539,8 +739,9 @@ async def get_format(
         Dictionary with formatting properties
     """
     try:
-        result = await asyncio.to_thread(
-            get_format_sync, workbook_name, sheet_name, reference
+        result = await _dispatch(
+            get_format_sync, workbook_name, sheet_name, reference,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -554,20 +755,32 @@ async def get_unique_values(
     workbook_name: str,
     sheet_name: str,
     range: str = None,
+    by_column: bool = False,
+    top_k: int = None,
+    min_count: int = 1,
 ) -> dict:
     """Get unique values and their frequencies from an Excel range.
 
+    Values keep their type (100, "100" and TRUE are counted apart). Very
+    high-cardinality ranges switch to approximate counts ("approximate":
+    true) with a distinct-count estimate, so use top_k to keep the answer small.
+
     Args:
         workbook_name: Name of open workbook
         sheet_name: Name of worksheet
         range: Excel range (defaults to UsedRange)
+        by_column: Profile each column separately (result has "columns")
+        top_k: Return at most this many of the most frequent values per profile
+        min_count: Leave out values seen fewer times than this
 
     Returns:
         Dictionary with unique values and counts
     """
     try:
-        result = await asyncio.to_thread(
-            get_unique_values_sync, workbook_name, sheet_name, range
+        result = await _dispatch(
+            get_unique_values_sync, workbook_name, sheet_name, range,
+            by_column, top_k, min_count,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -594,7 +807,8 @@ async def copy_range(
     """Copy range to another location with optional formatting.
 
     Args:
-        source_workbook: Name of source workbook
+        source_workbook: Name of source workbook, or a file path (copied without
+            Excel, as values and formulas, when it is not open)
         source_sheet: Name of source worksheet
         source_range: Range to copy (e.g., "A1:D10")
         target_workbook: Target workbook (defaults to source)
@@ -610,9 +824,11 @@ async def copy_range(
         {"success": True, "cells_copied": 40, ...}
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             copy_range_sync, source_workbook, source_sheet, source_range,
-            target_workbook, target_sheet, target_cell, include_formatting
+            target_workbook, target_sheet, target_cell, include_formatting,
+            workbook=source_workbook,
+            lane=workbook_lane(source_workbook),
         )
         return result
     except Exception as e:
@@ -628,6 +844,7 @@ async def sort_range(
     range: str,
     sort_by: list,
     has_header: bool = True,
+    performance_mode: bool = False,
 ) -> dict:
     """Sort data in a range by one or more columns.
 
@@ -637,6 +854,8 @@ async def sort_range(
         range: Range to sort (e.g., "A1:D100")
         sort_by: List of sort specs: [{"column": "B", "order": "asc"}, ...]
         has_header: If True, first row is header
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
 
     Returns:
         Dictionary with operation result
@@ -647,8 +866,10 @@ async def sort_range(
         {"success": True, "rows_sorted": 99, ...}
     """
     try:
-        result = await asyncio.to_thread(
-            sort_range_sync, workbook_name, sheet_name, range, sort_by, has_header
+        result = await _dispatch(
+            sort_range_sync, workbook_name, sheet_name, range, sort_by, has_header,
+            performance_mode=performance_mode,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -667,30 +888,42 @@ async def find_replace(
     match_entire_cell: bool = False,
     range: str = None,
     preview_only: bool = False,
+    use_regex: bool = False,
+    method: str = "auto",
 ) -> dict:
     """Find and replace values in a sheet or workbook.
 
     Args:
         workbook_name: Name of open workbook
-        find_value: Value to find
+        find_value: Value to find ("*" and "?" are wildcards, "~" escapes them)
         replace_value: Value to replace with
         sheet_name: Worksheet (None = all sheets)
         match_case: If True, match case exactly
         match_entire_cell: If True, match entire cell
         range: Specific range (defaults to UsedRange)
         preview_only: If True, count matches without replacing
+        use_regex: If True, find_value is a regular expression and
+            replace_value may refer to its groups (\\1)
+        method: "memory" matches a Value2 read of the range in Python, lists
+            the matched cells as compressed addresses and writes back only
+            the replaced cells (formula cells are left alone); "com" uses
+            Excel's Find/Replace, which also edits formula text; "auto"
+            (default) uses memory unless the range is very large
 
     Returns:
-        Dictionary with operation result
+        Dictionary with operation result, per sheet: matches_found,
+        replacements_made and (memory) match_addresses
 
     Example:
         >>> find_replace("data.xlsx", "old", "new", sheet_name="Sheet1")
-        {"success": True, "total_matches": 15, "total_replacements": 15, ...}
+        {"success": True, "total_matches": 15, "total_replacements": 15,
+         "results": [{"sheet": "Sheet1", "match_addresses": ["B2:B16"], ...}], ...}
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             find_replace_sync, workbook_name, sheet_name, find_value, replace_value,
-            match_case, match_entire_cell, range, preview_only
+            match_case, match_entire_cell, range, preview_only, use_regex, method,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -720,7 +953,7 @@ async def get_recent_changes(limit: int = 10) -> Dict[str, Any]:
     """
     try:
         # Run syncing logic in thread pool to avoid blocking async loop
-        result = await asyncio.to_thread(get_recent_changes_sync, limit)
+        result = await _dispatch(get_recent_changes_sync, limit)
 
         return {
             "success": True,
@@ -755,7 +988,7 @@ async def inspect_workbook() -> dict:
         "Sheet1"
     """
     try:
-        result = await asyncio.to_thread(inspect_workbook_sync)
+        result = await _dispatch(inspect_workbook_sync)
         return result
     except Exception as e:
         if isinstance(e, ToolError):
@@ -793,7 +1026,7 @@ async def explore(
         raise ToolError(f"Invalid mode '{mode}'. Must be 'quick' or 'deep'")
 
     try:
-        result = await asyncio.to_thread(explore_sync, sheet_name, mode)
+        result = await _dispatch(explore_sync, sheet_name, mode)
         return result
     except Exception as e:
         if isinstance(e, ToolError):
@@ -837,10 +1070,11 @@ async def create_transform_session(
         session_id, total_rows, first_chunk source data, processing instructions
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             create_transform_session_sync,
             workbook_name, sheet_name, source_column, output_columns,
-            start_row, end_row, chunk_size, verify_key_index
+            start_row, end_row, chunk_size, verify_key_index,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -883,10 +1117,11 @@ async def create_parallel_sessions(
         List of sessions with session_id, row range, and first_chunk data
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             create_parallel_sessions_sync,
             workbook_name, sheet_name, source_column, output_columns,
-            start_row, end_row, num_sessions, chunk_size, verify_key_index
+            start_row, end_row, num_sessions, chunk_size, verify_key_index,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -914,7 +1149,7 @@ async def process_chunk(
         rows_written, verification results, remaining rows, next_chunk source data
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             process_chunk_sync, session_id, data
         )
         return result
@@ -937,7 +1172,7 @@ async def get_session_status(session_id: str) -> dict:
         processed_rows, remaining_rows, errors, next_chunk source data if active
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             get_session_status_sync, session_id
         )
         return result
@@ -982,7 +1217,9 @@ async def execute_vba(
         module_name: Optional custom module name (auto-generated if None)
         procedure_name: Name for the procedure (default: "Main")
         sheet_name: Optional sheet to activate before execution
-        timeout: Execution timeout in seconds (default: 30)
+        timeout: Seconds to wait for the result, time queued behind other
+            Excel calls included (default: 30; 0 = no limit). Replaces
+            EXCELLM_ASYNC_TIMEOUT_S for this call
 
     Returns:
         Dictionary with execution result:
@@ -1012,7 +1249,7 @@ async def execute_vba(
         )
 
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             execute_vba_sync,
             workbook_name,
             vba_code,
@@ -1020,6 +1257,8 @@ async def execute_vba(
             procedure_name,
             sheet_name,
             timeout,
+            workbook=workbook_name,
+            timeout=timeout,
         )
         return result
     except Exception as e:
@@ -1071,13 +1310,14 @@ async def capture_sheet(
         ...               output_path="C:/temp/screenshot.png")
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             capture_sheet_sync,
             workbook_name,
             sheet_name,
             range_ref,
             output_format,
             output_path,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -1130,7 +1370,7 @@ async def create_table(
         ...              "SalesData", table_style="medium9")
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             create_table_sync,
             workbook_name,
             sheet_name,
@@ -1138,6 +1378,7 @@ async def create_table(
             table_name,
             has_headers,
             table_style,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -1161,10 +1402,11 @@ async def list_tables(
         Dictionary with list of tables and their properties
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             list_tables_sync,
             workbook_name,
             sheet_name,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -1192,12 +1434,13 @@ async def delete_table(
         Dictionary with operation result
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             delete_table_sync,
             workbook_name,
             sheet_name,
             table_name,
             keep_data,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -1244,10 +1487,12 @@ async def create_chart(
         Dictionary with chart details
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             create_chart_sync,
             workbook_name, sheet_name, data_range, chart_type,
-            target_cell, title, x_axis_title, y_axis_title, width, height, style
+            target_cell, title, x_axis_title, y_axis_title, width, height, style,
+            workbook=workbook_name,
+            lane=workbook_lane(workbook_name),
         )
         return result
     except Exception as e:
@@ -1287,10 +1532,12 @@ async def create_pivot_table(
         Dictionary with pivot table details
     """
     try:
-        result = await asyncio.to_thread(
+        result = await _dispatch(
             create_pivot_table_sync,
             workbook_name, sheet_name, data_range, rows, values,
-            columns, agg_func, target_sheet, target_cell, table_name
+            columns, agg_func, target_sheet, target_cell, table_name,
+            workbook=workbook_name,
+            lane=workbook_lane(workbook_name),
         )
         return result
     except Exception as e:
@@ -1318,8 +1565,9 @@ async def merge_cells(
         Dictionary with operation result
     """
     try:
-        result = await asyncio.to_thread(
-            merge_cells_sync, workbook_name, sheet_name, start_cell, end_cell
+        result = await _dispatch(
+            merge_cells_sync, workbook_name, sheet_name, start_cell, end_cell,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -1347,8 +1595,9 @@ async def unmerge_cells(
         Dictionary with operation result
     """
     try:
-        result = await asyncio.to_thread(
-            unmerge_cells_sync, workbook_name, sheet_name, start_cell, end_cell
+        result = await _dispatch(
+            unmerge_cells_sync, workbook_name, sheet_name, start_cell, end_cell,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -1372,8 +1621,9 @@ async def get_merged_cells(
         Dictionary with list of merged ranges
     """
     try:
-        result = await asyncio.to_thread(
-            get_merged_cells_sync, workbook_name, sheet_name
+        result = await _dispatch(
+            get_merged_cells_sync, workbook_name, sheet_name,
+            workbook=workbook_name,
         )
         return result
     except Exception as e:
@@ -3,6 +3,9 @@
 Contains all tool implementations organized by functionality.
 """
 
+from .batch import (
+    execute_batch_sync,
+)
 from .chart import (
     create_chart_sync,
     delete_chart_sync,
@@ -46,6 +49,7 @@ from .session import (
     process_chunk_sync,
 )
 from .sheet_mgmt import (
+    bulk_insert_delete_sync,
     delete_sync,
     insert_sync,
     manage_sheet_sync,
@@ -89,6 +93,9 @@ __all__ = [
     "manage_sheet_sync",
     "insert_sync",
     "delete_sync",
+    "bulk_insert_delete_sync",
+    # Batch
+    "execute_batch_sync",
     # Range Operations
     "copy_range_sync",
     "sort_range_sync",
@@ -0,0 +1,78 @@
+"""Batch operations for ExceLLM MCP server.
+
+Runs a list of reads, writes and sheet operations against one workbook in
+a single call, through the COM engine for open workbooks or the file
+engine for workbook paths.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List
+
+from ..core.connection import _init_com, get_excel_app, get_workbook, mark_sheet_changed
+from ..core.engine import validate_batch_ops
+from ..core.errors import ErrorCodes, ToolError
+from ..core.performance import PerformanceMode
+from ..core.utils import is_workbook_file
+
+logger = logging.getLogger(__name__)
+
+
+def execute_batch_sync(
+    workbook_name: str,
+    operations: List[Dict[str, Any]],
+    stop_on_error: bool = True,
+    performance_mode: bool = False,
+) -> Dict[str, Any]:
+    """Run several operations against one workbook.
+
+    Args:
+        workbook_name: Name of open workbook, or path to a workbook file
+        operations: List of ops, each {"op": "read"|"write"|"create_sheet"|
+            "delete_sheet"|"sheet_names", "sheet": ..., "range": ..., "data": ...}.
+            Writes take the write tool's max_cells and force_overwrite
+            fields: a batch with an oversized write is rejected before
+            running, and a write over non-empty cells fails unless
+            force_overwrite is set
+        stop_on_error: If True, ops after the first failure are skipped
+        performance_mode: If True (open workbooks only), suspend screen
+            updating, events and automatic calculation for the whole batch
+            and recalculate once at the end
+
+    Returns:
+        Dictionary with one result per op, in order
+    """
+    validate_batch_ops(operations)
+    _init_com()
+
+    # Engine Selection Logic: open workbooks go through COM
+    use_com = False
+    if not is_workbook_file(workbook_name):
+        try:
+            get_workbook(get_excel_app(), workbook_name)
+            use_com = True
+        except Exception:
+            pass
+
+    if use_com:
+        from ..core.com_engine import COMEngine
+        engine = COMEngine()
+    elif os.path.exists(workbook_name):
+        from ..core.file_engine import FileEngine
+        engine = FileEngine(durability="immediate")
+    else:
+        raise ToolError(
+            f"Workbook not found (checked open workbooks and file path): {workbook_name}",
+            code=ErrorCodes.WORKBOOK_NOT_FOUND
+        )
+
+    if not use_com:
+        return engine.execute_batch(workbook_name, operations, stop_on_error)
+
+    with PerformanceMode(engine.app, enabled=performance_mode) as mode:
+        result = engine.execute_batch(workbook_name, operations, stop_on_error)
+    if result["saved"]:
+        mark_sheet_changed(workbook_name)
+    if performance_mode:
+        result["performance_mode"] = mode.report()
+    return result
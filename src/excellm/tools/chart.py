@@ -68,6 +68,7 @@ def create_chart_sync(
         Dictionary with operation result
     """
     from ..core.connection import get_excel_app, get_workbook, get_worksheet
+    from ..core.utils import is_workbook_file
     from ..validators import validate_cell_reference
 
     # Validate chart type
@@ -87,14 +88,15 @@ def create_chart_sync(
         }
 
     # Engine Selection Logic
-    use_com = True
-    try:
-        # Try to get COM app and check if workbook is open
-        excel = get_excel_app()
-        workbook = get_workbook(excel, workbook_name)
-    except Exception:
-        # COM failed or workbook not open
-        use_com = False
+    use_com = not is_workbook_file(workbook_name)
+    if use_com:
+        try:
+            # Try to get COM app and check if workbook is open
+            excel = get_excel_app()
+            workbook = get_workbook(excel, workbook_name)
+        except Exception:
+            # COM failed or workbook not open
+            use_com = False
 
     if not use_com:
         # Fallback to openpyxl if it's a file
@@ -12,6 +12,7 @@ from ..core.connection import (
     get_workbook,
     get_worksheet,
 )
+from ..core.performance import with_performance_mode
 
 logger = logging.getLogger(__name__)
 
@@ -280,6 +281,7 @@ def _apply_conditional_format(rng, cond_format: Dict[str, Any]) -> None:
             cf.Font.Color = r + (g * 256) + (b * 65536)
 
 
+@with_performance_mode
 def format_range_sync(
     workbook_name: str,
     sheet_name: str,
@@ -304,6 +306,8 @@ def format_range_sync(
             - For iconSet: icon_style ('3arrows', '3trafficlights', etc.), reverse
             - For cellIs: operator, value, fill_color, font_color
         activate: If True, activate the range after formatting
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
 
     Returns:
         Dictionary with operation result
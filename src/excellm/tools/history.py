@@ -2,9 +2,7 @@
 import re
 from typing import Any, Dict, List
 
-import pythoncom
-import win32com.client as win32
-
+from ..core.connection import get_excel_app
 from ..core.errors import ToolError
 
 # Command Bar Control IDs
@@ -20,10 +18,9 @@ def get_recent_changes_sync(limit: int = 10) -> Dict[str, List[Dict[str, Any]]]:
     Returns:
         Dict with keys 'undo' and 'redo', each containing list of history items
     """
-    pythoncom.CoInitialize()
     try:
         try:
-            excel = win32.GetActiveObject("Excel.Application")
+            excel = get_excel_app()
         except Exception as e:
             raise ToolError("Could not connect to Excel. Is it running?") from e
 
@@ -56,7 +56,8 @@ def create_pivot_table_sync(
     Returns:
         Dictionary with operation result
     """
-    from ..core.connection import get_excel_app, get_workbook, get_worksheet
+    from ..core.connection import get_excel_app, get_workbook, get_worksheet, mark_sheet_changed
+    from ..core.utils import is_workbook_file
 
     # Validate aggregation function
     agg_func_lower = agg_func.lower()
@@ -81,12 +82,13 @@ def create_pivot_table_sync(
 
     try:
         # Engine Selection Logic
-        use_com = True
-        try:
-            excel = get_excel_app()
-            workbook = get_workbook(excel, workbook_name)
-        except Exception:
-            use_com = False
+        use_com = not is_workbook_file(workbook_name)
+        if use_com:
+            try:
+                excel = get_excel_app()
+                workbook = get_workbook(excel, workbook_name)
+            except Exception:
+                use_com = False
 
         if not use_com:
             # Fallback to openpyxl if it's a file
@@ -150,6 +152,7 @@ def create_pivot_table_sync(
             TableDestination=target_range,
             TableName=table_name,
         )
+        mark_sheet_changed(workbook_name, target_sheet)
 
         # Add row fields
         for i, field_name in enumerate(rows):
@@ -222,7 +225,7 @@ def refresh_pivot_table_sync(
     Returns:
         Dictionary with operation result
     """
-    from ..core.connection import get_excel_app, get_workbook, get_worksheet
+    from ..core.connection import get_excel_app, get_workbook, get_worksheet, mark_sheet_changed
 
     try:
         excel = get_excel_app()
@@ -251,6 +254,7 @@ def refresh_pivot_table_sync(
                 except Exception as e:
                     logger.warning(f"Could not refresh pivot table: {e}")
 
+        mark_sheet_changed(workbook_name, sheet_name)
         return {
             "success": True,
             "message": f"Refreshed {len(refreshed)} pivot table(s)",
@@ -335,7 +339,7 @@ def delete_pivot_table_sync(
     Returns:
         Dictionary with operation result
     """
-    from ..core.connection import get_excel_app, get_workbook, get_worksheet
+    from ..core.connection import get_excel_app, get_workbook, get_worksheet, mark_sheet_changed
 
     try:
         excel = get_excel_app()
@@ -361,6 +365,7 @@ def delete_pivot_table_sync(
 
         # Delete the pivot table
         pivot_table.TableRange2.Clear()
+        mark_sheet_changed(workbook_name, sheet_name)
 
         logger.info(f"Deleted pivot table '{table_name}' from {sheet_name}")
 
@@ -418,8 +423,7 @@ def create_pivot_table_openpyxl(
         Dictionary with operation result
     """
     try:
-        from openpyxl import load_workbook
-        from openpyxl.utils import range_boundaries
+        from ..core.file_engine import FileEngine
     except ImportError:
         return {
             "success": False,
@@ -429,65 +433,50 @@ def create_pivot_table_openpyxl(
     # Since openpyxl pivot tables are complex and often require Excel to calc,
     # we'll implement a "Static Summary Table" which is more robust for LLMs to read back immediately.
     # This manually aggregates the data using Python.
+    # Source rows are streamed and the summary is written with the file
+    # engine's constant-memory export, so no cell objects are built.
 
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
+        engine = FileEngine(durability="immediate")
+        if sheet_name not in engine.get_sheet_names(filepath):
             return {"success": False, "error": f"Sheet '{sheet_name}' not found"}
 
-        ws = wb[sheet_name]
-
         # Parse range (remove sheet name if present)
         if "!" in data_range:
             data_range = data_range.split("!")[-1]
 
-        min_col, min_row, max_col, max_row = range_boundaries(data_range)
+        source_rows = engine.iter_rows(filepath, sheet_name, data_range)
 
-        # Read header row to map column names to indices
+        # Read header row to map column names to offsets within the range
         headers = {}
-        for col_idx in range(min_col, max_col + 1):
-            cell_val = ws.cell(row=min_row, column=col_idx).value
+        for offset, cell_val in enumerate(next(source_rows, [])):
             if cell_val:
-                headers[str(cell_val)] = col_idx
+                headers[str(cell_val)] = offset
 
         # Validate fields
         for f in rows + values + (columns or []):
             if f not in headers:
                 return {"success": False, "error": f"Field '{f}' not found in headers"}
 
-        # Create/Get target sheet
-        if target_sheet:
-            if target_sheet in wb.sheetnames:
-                target_ws = wb[target_sheet]
-                # Clear target area (simple clear)
-                target_ws.delete_rows(1, target_ws.max_row + 1)
-            else:
-                target_ws = wb.create_sheet(target_sheet)
-        else:
-            target_sheet_name = f"{sheet_name}_Summary"
-            if target_sheet_name in wb.sheetnames:
-                target_ws = wb[target_sheet_name]
-                target_ws.delete_rows(1, target_ws.max_row + 1)
-            else:
-                target_ws = wb.create_sheet(target_sheet_name)
-            target_sheet = target_sheet_name
+        if not target_sheet:
+            target_sheet = f"{sheet_name}_Summary"
 
         # ---------------------------------------------------------
         # Perform Aggregation (Python-side Pivot)
         # ---------------------------------------------------------
 
-        # Data structure: { (row_key_tuple, col_key_tuple): {val_field: [values]} }
+        # Running aggregates: { (row_key_tuple, col_key_tuple): {val_field: [sum, count, min, max]} }
         data_map = {}
         row_keys_set = set()
         col_keys_set = set()
 
-        for r in range(min_row + 1, max_row + 1):
+        for row in source_rows:
             # Build row key
-            r_key = tuple(ws.cell(row=r, column=headers[field]).value for field in rows)
+            r_key = tuple(row[headers[field]] for field in rows)
 
             # Build column key
             if columns:
-                c_key = tuple(ws.cell(row=r, column=headers[field]).value for field in columns)
+                c_key = tuple(row[headers[field]] for field in columns)
             else:
                 c_key = ("Total",)
 
@@ -496,10 +485,10 @@ def create_pivot_table_openpyxl(
 
             combo_key = (r_key, c_key)
             if combo_key not in data_map:
-                data_map[combo_key] = {v: [] for v in values}
+                data_map[combo_key] = {v: [0.0, 0, None, None] for v in values}
 
             for v_field in values:
-                val = ws.cell(row=r, column=headers[v_field]).value
+                val = row[headers[v_field]]
                 # Coerce to float
                 try:
                     if val is not None:
@@ -508,7 +497,11 @@ def create_pivot_table_openpyxl(
                         val = 0.0
                 except ValueError:
                     val = 0.0
-                data_map[combo_key][v_field].append(val)
+                acc = data_map[combo_key][v_field]
+                acc[0] += val
+                acc[1] += 1
+                acc[2] = val if acc[2] is None else min(acc[2], val)
+                acc[3] = val if acc[3] is None else max(acc[3], val)
 
         # Sort keys
         sorted_row_keys = sorted(list(row_keys_set), key=lambda x: str(x))
@@ -518,87 +511,48 @@ def create_pivot_table_openpyxl(
         # Write Result Table
         # ---------------------------------------------------------
 
-        current_row = 1
-        current_col = 1
-
-        # Styles
-        from openpyxl.styles import Font
-        bold_font = Font(bold=True)
-
-        # Write Headers
-        # Row Labels
-        for i, field in enumerate(rows):
-            target_ws.cell(row=current_row, column=current_col + i, value=field).font = bold_font
-
-        # Column Labels (if any)
+        # Headers: row labels, then one column per (column key, value field)
+        header = list(rows)
         if columns:
-            # Shift data start
-            data_start_col = current_col + len(rows)
             for c_key in sorted_col_keys:
                 # Join tuple parts
                 col_label = " - ".join(str(k) for k in c_key)
                 for v_field in values:
-                    target_ws.cell(row=current_row, column=data_start_col, value=f"{col_label} | {v_field}").font = bold_font
-                    data_start_col += 1
+                    header.append(f"{col_label} | {v_field}")
         else:
-            # Just Value fields
-            data_start_col = current_col + len(rows)
             for v_field in values:
-                target_ws.cell(row=current_row, column=data_start_col, value=f"{agg_func.capitalize()} of {v_field}").font = bold_font
-                data_start_col += 1
-
-        current_row += 1
+                header.append(f"{agg_func.capitalize()} of {v_field}")
 
         # Helper for aggregation
-        def calc_agg(vals, func):
-            if not vals:
+        def calc_agg(acc, func):
+            total, count, low, high = acc
+            if not count:
                 return 0
             if func == "sum":
-                return sum(vals)
+                return total
             if func == "count":
-                return len(vals)
+                return count
             if func == "average":
-                return sum(vals) / len(vals)
+                return total / count
             if func == "max":
-                return max(vals)
+                return high
             if func == "min":
-                return min(vals)
+                return low
             return 0
 
-        # Write Data
-
-        for r_key in sorted_row_keys:
-            # Write Row Labels
-            for i, val in enumerate(r_key):
-                target_ws.cell(row=current_row, column=1 + i, value=val)
-
-            col_ptr = 1 + len(rows)
-
-            # Write Data Values
-            if columns:
-                for c_key in sorted_col_keys:
+        def summary_rows():
+            col_keys = sorted_col_keys if columns else [("Total",)]
+            for r_key in sorted_row_keys:
+                out = list(r_key)
+                for c_key in col_keys:
                     stats = data_map.get((r_key, c_key))
                     for v_field in values:
-                        if stats:
-                            result = calc_agg(stats[v_field], agg_func)
-                            target_ws.cell(row=current_row, column=col_ptr, value=result)
-                        else:
-                            target_ws.cell(row=current_row, column=col_ptr, value=0)
-                        col_ptr += 1
-            else:
-                # No column groups
-                stats = data_map.get((r_key, ("Total",)))
-                for v_field in values:
-                    if stats:
-                        result = calc_agg(stats[v_field], agg_func)
-                        target_ws.cell(row=current_row, column=col_ptr, value=result)
-                    else:
-                        target_ws.cell(row=current_row, column=col_ptr, value=0)
-                    col_ptr += 1
-
-            current_row += 1
+                        out.append(calc_agg(stats[v_field], agg_func) if stats else 0)
+                yield out
 
-        wb.save(filepath)
+        result = engine.export_rows(
+            filepath, target_sheet, summary_rows(), header=header, replace=True
+        )
 
         return {
             "success": True,
@@ -607,7 +561,7 @@ def create_pivot_table_openpyxl(
             "details": {
                 "target_sheet": target_sheet,
                 "rows_written": len(sorted_row_keys),
-                "cols_written": col_ptr - 1
+                "cols_written": result["cols_written"]
             }
         }
 
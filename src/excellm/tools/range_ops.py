@@ -5,20 +5,39 @@ These are new tools added in the refactoring.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from ..config import FIND_REPLACE_MAX_CELLS
 from ..core.connection import (
     _init_com,
     get_excel_app,
     get_workbook,
     get_worksheet,
+    iter_range_tiles,
+    mark_sheet_changed,
+    read_formulas,
+    write_cell_updates,
 )
+from ..core.errors import ErrorCodes, ToolError
+from ..core.performance import with_performance_mode
 from ..core.utils import (
+    build_range_address,
+    cell_blocks,
+    cell_text,
+    compile_find_pattern,
     number_to_column,
 )
 
 logger = logging.getLogger(__name__)
 
+# How find_replace matches: in Python on Value2 blocks, or with Excel's Find
+FIND_REPLACE_METHODS = ("auto", "memory", "com")
+
+# Match areas listed per sheet in find_replace results
+MAX_MATCH_AREAS = 500
+
 
 def copy_range_sync(
     source_workbook: str,
@@ -45,10 +64,19 @@ def copy_range_sync(
     """
     _init_com()
 
-    app = get_excel_app()
+    try:
+        app = get_excel_app()
+        src_workbook = get_workbook(app, source_workbook)
+    except Exception:
+        # Fallback to the file engine if the source is a file
+        if os.path.exists(source_workbook):
+            return copy_range_openpyxl(
+                source_workbook, source_sheet, source_range,
+                target_workbook, target_sheet, target_cell, include_formatting
+            )
+        raise
 
     # Get source
-    src_workbook = get_workbook(app, source_workbook)
     src_worksheet = get_worksheet(src_workbook, source_sheet)
     src_range = src_worksheet.Range(source_range)
 
@@ -62,6 +90,7 @@ def copy_range_sync(
 
     # Copy data
     src_range.Copy()
+    mark_sheet_changed(tgt_workbook_name, tgt_sheet_name)
 
     if include_formatting:
         # Paste with all formatting
@@ -104,6 +133,84 @@ def copy_range_sync(
     }
 
 
+def copy_range_openpyxl(
+    source_workbook: str,
+    source_sheet: str,
+    source_range: str,
+    target_workbook: Optional[str] = None,
+    target_sheet: Optional[str] = None,
+    target_cell: str = "A1",
+    include_formatting: bool = True,
+) -> Dict[str, Any]:
+    """Copy a range between Excel files without Excel (file-based).
+
+    Values and formulas are copied as stored; formatting is not copied and
+    formula references are not adjusted. A target sheet that does not exist
+    yet (or a target file) is created by streaming the rows in constant
+    memory; existing sheets are written cell by cell.
+
+    Args:
+        source_workbook: Path to the source file
+        source_sheet: Name of source worksheet
+        source_range: Range to copy (e.g., "A1:D10")
+        target_workbook: Path to the target file (defaults to source)
+        target_sheet: Name of target worksheet (defaults to source)
+        target_cell: Top-left cell of paste destination
+        include_formatting: Ignored; files are copied as values and formulas
+
+    Returns:
+        Dictionary with operation result
+    """
+    from openpyxl.utils import range_boundaries
+
+    from ..core.file_engine import FileEngine
+
+    engine = FileEngine(durability="immediate")
+    tgt_workbook_name = target_workbook or source_workbook
+    tgt_sheet_name = target_sheet or source_sheet
+
+    min_col, min_row, max_col, max_row = range_boundaries(source_range)
+    src_rows = max_row - min_row + 1
+    src_cols = max_col - min_col + 1
+    tgt_start_col, tgt_start_row, _, _ = range_boundaries(target_cell)
+    tgt_end_row = tgt_start_row + src_rows - 1
+    tgt_end_col = tgt_start_col + src_cols - 1
+    target_range_addr = f"{number_to_column(tgt_start_col)}{tgt_start_row}:{number_to_column(tgt_end_col)}{tgt_end_row}"
+
+    rows = engine.iter_rows(source_workbook, source_sheet, source_range)
+    new_sheet = (
+        not os.path.exists(tgt_workbook_name)
+        or tgt_sheet_name not in engine.get_sheet_names(tgt_workbook_name)
+    )
+
+    if new_sheet:
+        if os.path.abspath(tgt_workbook_name) == os.path.abspath(source_workbook):
+            # The export rewrites the source file, so read it first
+            rows = list(rows)
+        engine.export_rows(tgt_workbook_name, tgt_sheet_name, rows, start_cell=target_cell)
+    else:
+        engine.write_range(tgt_workbook_name, tgt_sheet_name, target_cell, list(rows))
+
+    return {
+        "success": True,
+        "source": {
+            "workbook": source_workbook,
+            "sheet": source_sheet,
+            "range": source_range,
+        },
+        "target": {
+            "workbook": tgt_workbook_name,
+            "sheet": tgt_sheet_name,
+            "range": target_range_addr,
+        },
+        "cells_copied": src_rows * src_cols,
+        "include_formatting": False,
+        "engine": "openpyxl",
+        "message": f"Copied {source_range} to {target_range_addr}"
+    }
+
+
+@with_performance_mode
 def sort_range_sync(
     workbook_name: str,
     sheet_name: str,
@@ -120,6 +227,8 @@ def sort_range_sync(
         sort_by: List of sort specifications:
             [{"column": "B", "order": "asc"}, {"column": "C", "order": "desc"}]
         has_header: If True, first row is treated as header
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
 
     Returns:
         Dictionary with operation result
@@ -167,6 +276,7 @@ def sort_range_sync(
     worksheet.Sort.MatchCase = False
     worksheet.Sort.Orientation = 1  # xlTopToBottom
     worksheet.Sort.Apply()
+    mark_sheet_changed(workbook_name, sheet_name)
 
     return {
         "success": True,
@@ -180,6 +290,187 @@ def sort_range_sync(
     }
 
 
+def _is_plain_format(number_format: Optional[str]) -> Optional[bool]:
+    """Whether numbers in this format display as their Value2 text (None: mixed formats)."""
+    if number_format is None:
+        return None
+    return number_format in ("General", "@")
+
+
+def _replaced_value(old: Any, text: str) -> Any:
+    """Value to write for a replaced cell: numbers stay numbers if they still parse."""
+    if isinstance(old, (int, float)) and not isinstance(old, bool):
+        try:
+            number = float(text)
+        except ValueError:
+            return text
+        return int(number) if number.is_integer() else number
+    return text
+
+
+def _find_replace_in_memory(
+    search_range: Any,
+    pattern: "re.Pattern",
+    replace_value: str,
+    match_entire_cell: bool,
+    use_regex: bool,
+    preview_only: bool,
+    find_value: Optional[str] = None,
+    match_case: bool = False,
+) -> Dict[str, Any]:
+    """Match one range in Python and write back only the replaced cells.
+
+    The range is read as Value2 in row tiles; only matching cells are kept.
+    Formula cells are reported as matches (by value) but never overwritten.
+
+    Value2 holds a date as a serial number, so numbers in a column whose
+    number format is not General (dates, currency, mixed formats) are not
+    matched in Python. If find_value is given (no regex), Excel's Find
+    matches their displayed text, searching only the columns that hold
+    them. They are never overwritten, because replacing in the serial
+    number would move the date.
+    """
+    match = pattern.fullmatch if match_entire_cell else pattern.search
+    matched: List[Tuple[int, int]] = []
+    updates: Dict[Tuple[int, int], Any] = {}
+
+    # One NumberFormat read per column (None when a column mixes formats)
+    rows, cols = search_range.Rows.Count, search_range.Columns.Count
+    plain_columns = [
+        _is_plain_format(search_range.Cells(1, c + 1).Resize(rows, 1).NumberFormat) is True
+        for c in range(cols)
+    ]
+    formatted: Dict[int, set] = {}  # Column -> rows holding formatted numbers
+
+    def replace(found: "re.Match", text: str) -> str:
+        if match_entire_cell:
+            return found.expand(replace_value) if use_regex else replace_value
+        if use_regex:
+            return pattern.sub(replace_value, text)
+        # Literal replacement; skip the empty matches a trailing "*" leaves
+        return pattern.sub(lambda m: replace_value if m.group(0) else "", text)
+
+    r = 0
+    for tile in iter_range_tiles(search_range, attribute="Value2"):
+        for row in tile:
+            for c, value in enumerate(row):
+                if value is None or value == "":
+                    continue
+                if not plain_columns[c] and isinstance(value, (int, float)) and not isinstance(value, bool):
+                    formatted.setdefault(c, set()).add(r)
+                    continue
+                text = cell_text(value)
+                found = match(text)
+                if found is None:
+                    continue
+                matched.append((r, c))
+                if not preview_only:
+                    new_text = replace(found, text)
+                    if new_text != text:
+                        updates[(r, c)] = _replaced_value(value, new_text)
+            r += 1
+
+    formatted_matches = 0
+    if formatted and find_value is not None:
+        look_at = 1 if match_entire_cell else 2
+        row0, col0 = search_range.Row, search_range.Column
+        for c, formatted_rows in formatted.items():
+            column = search_range.Cells(1, c + 1).Resize(rows, 1)
+            for cell in _find_cells(column, find_value, match_case, look_at):
+                if cell.Row - row0 in formatted_rows:
+                    matched.append((cell.Row - row0, c))
+                    formatted_matches += 1
+        matched.sort()
+
+    formula_cells_skipped = 0
+    if updates:
+        formulas, _ = read_formulas(search_range, rows, cols, "auto")
+        if formulas is not None:
+            for key in [key for key in updates if formulas[key[0]][key[1]] is not None]:
+                del updates[key]
+                formula_cells_skipped += 1
+
+    write_calls = write_cell_updates(search_range, updates)
+
+    row0, col0 = search_range.Row, search_range.Column
+    areas = [
+        build_range_address(row0 + r0, col0 + c0, row0 + r1, col0 + c1)
+        for r0, c0, r1, c1 in cell_blocks(matched)
+    ]
+    result = {
+        "matches_found": len(matched),
+        "replacements_made": len(updates),
+        "match_addresses": areas[:MAX_MATCH_AREAS],
+        "write_calls": write_calls,
+    }
+    if len(areas) > MAX_MATCH_AREAS:
+        result["addresses_truncated"] = True
+        result["match_areas"] = len(areas)
+    if formula_cells_skipped:
+        result["formula_cells_skipped"] = formula_cells_skipped
+    if formatted_matches and not preview_only:
+        result["formatted_cells_skipped"] = formatted_matches
+        result["hint"] = (
+            "Formatted numbers (dates, currency, ...) were matched on their displayed text "
+            "but not replaced; use method='com' to replace them with Excel's Replace."
+        )
+    elif formatted and find_value is None:
+        result["formatted_cells_unsearched"] = sum(len(rows_) for rows_ in formatted.values())
+        result["hint"] = (
+            "Formatted numbers (dates, currency, ...) are not searched with use_regex; "
+            "their Value2 differs from the displayed text."
+        )
+    return result
+
+
+def _find_cells(search_range: Any, find_value: str, match_case: bool, look_at: int) -> Iterator[Any]:
+    """Yield the cells Excel's Find/FindNext matches in a range, one round-trip each."""
+    found = search_range.Find(
+        What=find_value,
+        LookIn=-4163,  # xlValues
+        LookAt=look_at,
+        MatchCase=match_case,
+    )
+    if not found:
+        return
+    first_address = found.Address
+    while found:
+        yield found
+        found = search_range.FindNext(found)
+        if found and found.Address == first_address:
+            break
+
+
+def _find_replace_com(
+    search_range: Any,
+    find_value: str,
+    replace_value: str,
+    match_case: bool,
+    match_entire_cell: bool,
+    preview_only: bool,
+) -> Dict[str, Any]:
+    """Count matches with Excel's Find/FindNext and replace with Range.Replace."""
+    # LookAt: 1 = xlWhole, 2 = xlPart
+    look_at = 1 if match_entire_cell else 2
+
+    # Count matches first
+    matches = sum(1 for _ in _find_cells(search_range, find_value, match_case, look_at))
+
+    # Perform replacement if not preview
+    replaced = 0
+    if not preview_only and matches > 0:
+        replaced = search_range.Replace(
+            What=find_value,
+            Replacement=replace_value,
+            LookAt=look_at,
+            MatchCase=match_case,
+        )
+        # Replace returns True/False, so we use the count we found
+        replaced = matches if replaced else 0
+
+    return {"matches_found": matches, "replacements_made": replaced}
+
+
 def find_replace_sync(
     workbook_name: str,
     sheet_name: Optional[str] = None,
@@ -189,30 +480,58 @@ def find_replace_sync(
     match_entire_cell: bool = False,
     range_str: Optional[str] = None,
     preview_only: bool = False,
+    use_regex: bool = False,
+    method: str = "auto",
 ) -> Dict[str, Any]:
     """Find and replace values in a sheet or workbook.
 
+    "memory" reads each search range as one Value2 block (in row tiles),
+    matches it in Python and writes back only the replaced cells, grouped
+    into rectangles. It reports where the matches are as compressed
+    addresses. Cells holding formulas are matched by value but left alone,
+    as are numbers in columns with a date, currency or other non-General
+    format, which Excel's Find matches on their displayed text. "com" uses Excel's Find/FindNext (one round-trip per match) and
+    Range.Replace, which also rewrites text inside formulas. "auto" uses
+    memory unless a range has more than FIND_REPLACE_MAX_CELLS cells.
+
     Args:
         workbook_name: Name of open workbook
         sheet_name: Name of worksheet (None = all sheets)
-        find_value: Value to find
-        replace_value: Value to replace with
+        find_value: Value to find; "*" and "?" are Excel wildcards ("~" escapes)
+        replace_value: Value to replace with (with use_regex, may use \\1 groups)
         match_case: If True, match case exactly
         match_entire_cell: If True, match entire cell content
         range_str: Specific range to search (defaults to UsedRange)
         preview_only: If True, only count matches without replacing
+        use_regex: If True, find_value is a Python regular expression
+            (memory method only)
+        method: "auto", "memory" or "com"
 
     Returns:
         Dictionary with operation result
     """
+    if not find_value:
+        raise ToolError("find_value must not be empty.", code=ErrorCodes.VALIDATION_ERROR)
+    if method not in FIND_REPLACE_METHODS:
+        raise ToolError(
+            f"Invalid method '{method}'. Must be one of: {', '.join(FIND_REPLACE_METHODS)}.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+    if use_regex and method == "com":
+        raise ToolError(
+            "use_regex needs the memory method; Excel's Find has no regular expressions.",
+            code=ErrorCodes.VALIDATION_ERROR
+        )
+    try:
+        pattern = compile_find_pattern(find_value, use_regex, match_case)
+    except re.error as e:
+        raise ToolError(f"Invalid regular expression: {e}", code=ErrorCodes.VALIDATION_ERROR) from e
+
     _init_com()
 
     app = get_excel_app()
     workbook = get_workbook(app, workbook_name)
 
-    # LookAt: 1 = xlWhole, 2 = xlPart
-    look_at = 1 if match_entire_cell else 2
-
     results = []
     total_replacements = 0
 
@@ -230,44 +549,27 @@ def find_replace_sync(
         else:
             search_range = ws.UsedRange
 
-        # Count matches first
-        matches = 0
-        find_result = search_range.Find(
-            What=find_value,
-            LookIn=-4163,  # xlValues
-            LookAt=look_at,
-            MatchCase=match_case,
-        )
+        sheet_method = method
+        if method == "auto":
+            cells = search_range.Rows.Count * search_range.Columns.Count
+            sheet_method = "com" if cells > FIND_REPLACE_MAX_CELLS and not use_regex else "memory"
 
-        if find_result:
-            first_address = find_result.Address
-            matches = 1
-
-            while True:
-                find_result = search_range.FindNext(find_result)
-                if not find_result or find_result.Address == first_address:
-                    break
-                matches += 1
-
-        # Perform replacement if not preview
-        replaced = 0
-        if not preview_only and matches > 0:
-            replaced = search_range.Replace(
-                What=find_value,
-                Replacement=replace_value,
-                LookAt=look_at,
-                MatchCase=match_case,
+        if sheet_method == "memory":
+            found = _find_replace_in_memory(
+                search_range, pattern, replace_value, match_entire_cell, use_regex, preview_only,
+                find_value=None if use_regex else find_value, match_case=match_case,
             )
-            # Replace returns True/False, so we use the count we found
-            replaced = matches if replaced else 0
+        else:
+            found = _find_replace_com(
+                search_range, find_value, replace_value, match_case, match_entire_cell, preview_only
+            )
+
+        if found["replacements_made"]:
+            mark_sheet_changed(workbook_name, ws.Name)
 
-        if matches > 0:
-            results.append({
-                "sheet": ws.Name,
-                "matches_found": matches,
-                "replacements_made": replaced if not preview_only else 0,
-            })
-            total_replacements += replaced if not preview_only else 0
+        if found["matches_found"] > 0:
+            results.append({"sheet": ws.Name, "method": sheet_method, **found})
+            total_replacements += found["replacements_made"]
 
     total_matches = sum(r.get("matches_found", 0) for r in results)
 
@@ -279,6 +581,7 @@ def find_replace_sync(
         "replace_value": replace_value,
         "match_case": match_case,
         "match_entire_cell": match_entire_cell,
+        "use_regex": use_regex,
         "preview_only": preview_only,
         "total_matches": total_matches,
         "total_replacements": total_replacements,
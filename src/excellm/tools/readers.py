@@ -6,15 +6,22 @@ Contains tools for reading cells, ranges, and getting unique values.
 import logging
 from typing import Any, Dict, List, Optional
 
+from ..config import UNIQUE_MAX_EXACT_VALUES
 from ..core.connection import (
     _init_com,
     get_excel_app,
     get_workbook,
     get_worksheet,
+    iter_range_tiles,
+    read_formulas,
+    sheet_version,
 )
+from ..core.cursor import decode_cursor, encode_cursor
+from ..core.engine import validate_unique_options
+from ..core.errors import ErrorCodes, ToolError
+from ..core.sketch import ValueProfile, profile_rows, profile_summary
 from ..core.utils import (
     get_cell_type,
-    is_cell_empty,
 )
 from ..validators import (
     get_excel_error_info,
@@ -78,117 +85,113 @@ def read_cell_sync(
     return result
 
 
+def _resume_read(workbook, workbook_name: str, sheet_name: Optional[str], cursor: str) -> Dict[str, Any]:
+    """Decode a read cursor and check that its sheet has not changed since."""
+    state = decode_cursor(cursor, "read")
+    if state["wb"].lower() != workbook_name.lower() or (sheet_name and state["sheet"].lower() != sheet_name.lower()):
+        raise ToolError(
+            f"Cursor belongs to {state['wb']} / {state['sheet']}, not {workbook_name} / {sheet_name or state['sheet']}",
+            code=ErrorCodes.INVALID_CURSOR
+        )
+    worksheet = get_worksheet(workbook, state["sheet"])
+    if state["ver"] != sheet_version(workbook_name, state["sheet"]) or state["used"] != worksheet.UsedRange.Address:
+        raise ToolError(
+            f"Sheet '{state['sheet']}' changed since this cursor was issued. "
+            "Read again without a cursor to start over.",
+            code=ErrorCodes.STALE_CURSOR
+        )
+    state["worksheet"] = worksheet
+    return state
+
+
 def read_range_sync(
     workbook_name: str,
-    sheet_name: str,
+    sheet_name: Optional[str] = None,
     range_str: Optional[str] = None,
     max_rows: Optional[int] = None,
+    include_formulas: str = "auto",
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Read a range of cells.
 
     Args:
         workbook_name: Name of open workbook
-        sheet_name: Name of worksheet
+        sheet_name: Name of worksheet (optional with cursor)
         range_str: Range reference (e.g., "A1:C5"). Defaults to UsedRange.
         max_rows: Maximum rows to return (prevents token explosion). None = unlimited.
+        include_formulas: "auto" (fetch formulas only where the range has any),
+            "always" (fetch the whole Formula array) or "never"
+        cursor: next_cursor of a previous page. Continues that read with its
+            sheet, range, page size and formula mode; the other arguments
+            are ignored.
 
     Returns:
-        Dictionary with range data and metadata. If truncated, includes:
+        Dictionary with range data and metadata. If more rows remain, includes:
         - truncated: True
-        - total_available: actual row count before truncation
-        - hint: suggestion to narrow range
+        - total_available: row count of the whole range
+        - next_cursor: token that continues after the last returned row
+        - hint: how to get the next page
     """
     _init_com()
 
     app = get_excel_app()
     workbook = get_workbook(app, workbook_name)
-    worksheet = get_worksheet(workbook, sheet_name)
 
-    # Get range reference
-    if range_str:
-        rng = worksheet.Range(range_str)
+    if cursor:
+        # Resume from stored bounds: no UsedRange or range-string resolution
+        state = _resume_read(workbook, workbook_name, sheet_name, cursor)
+        worksheet, sheet_name, range_str = state["worksheet"], state["sheet"], state["range"]
+        max_rows, include_formulas = state["page"], state["formulas"]
+        first_row, first_col, last_row, last_col = state["bounds"]
+        rng = worksheet.Range(worksheet.Cells(state["row"], first_col), worksheet.Cells(last_row, last_col))
+        version, used_address = state["ver"], state["used"]
     else:
-        rng = worksheet.UsedRange
-        range_str = rng.Address.replace("$", "")
-
-    # Use batch read for performance
-    values = rng.Value
-
+        worksheet = get_worksheet(workbook, sheet_name)
+        # Stamp before reading, so changes made during the read invalidate the cursor
+        version = sheet_version(workbook_name, sheet_name)
+        used_range = worksheet.UsedRange
+        used_address = used_range.Address
+
+        # Get range reference
+        if range_str:
+            rng = worksheet.Range(range_str)
+        else:
+            rng = used_range
+            range_str = used_address.replace("$", "")
+        first_row, first_col = rng.Row, rng.Column
+        last_row, last_col = first_row + rng.Rows.Count - 1, first_col + rng.Columns.Count - 1
 
+    # Read in row tiles; rows past max_rows are never fetched
+    total_rows = rng.Rows.Count
     data = []
     error_codes = []
     error_messages = []
 
-    if values is not None:
-        # Check if values is a list/tuple (range values) or scalar (single value)
-        if isinstance(values, (list, tuple)):
-            # Check if values is 2D
-            is_2d = len(values) > 0 and isinstance(values[0], (list, tuple))
-
-            if is_2d:
-                for row in values:
-                    row_data = []
-                    row_error_codes = []
-                    row_error_msgs = []
-                    for cell in row:
-                        row_data.append(str(cell) if cell is not None else "")
-                        error_info = get_excel_error_info(cell)
-                        if error_info:
-                            row_error_codes.append(error_info[0])
-                            row_error_msgs.append(error_info[1])
-                        else:
-                            row_error_codes.append(None)
-                            row_error_msgs.append(None)
-                    data.append(row_data)
-                    error_codes.append(row_error_codes)
-                    error_messages.append(row_error_msgs)
-            else:
-                # Single row (1D list/tuple)
-                # Note: read_range usually returns 2D tuple ((v,v),), but just in case
-                row_data = []
-                row_error_codes = []
-                row_error_msgs = []
-                for cell in values:
-                    row_data.append(str(cell) if cell is not None else "")
-                    error_info = get_excel_error_info(cell)
-                    if error_info:
-                        row_error_codes.append(error_info[0])
-                        row_error_msgs.append(error_info[1])
-                    else:
-                        row_error_codes.append(None)
-                        row_error_msgs.append(None)
-                data.append(row_data)
-                error_codes.append(row_error_codes)
-                error_messages.append(row_error_msgs)
-        else:
-            # Scalar value (single cell content like 'Text' or 123)
-            # Treat as 1x1 grid
-            row_data = [str(values)]
-            error_info = get_excel_error_info(values)
-            if error_info:
-                row_err_code = [error_info[0]]
-                row_err_msg = [error_info[1]]
-            else:
-                row_err_code = [None]
-                row_err_msg = [None]
-
+    for tile in iter_range_tiles(rng, max_rows=max_rows or None):
+        for row in tile:
+            row_data = []
+            row_error_codes = []
+            row_error_msgs = []
+            for cell in row:
+                row_data.append(str(cell) if cell is not None else "")
+                error_info = get_excel_error_info(cell)
+                if error_info:
+                    row_error_codes.append(error_info[0])
+                    row_error_msgs.append(error_info[1])
+                else:
+                    row_error_codes.append(None)
+                    row_error_msgs.append(None)
             data.append(row_data)
-            error_codes.append(row_err_code)
-            error_messages.append(row_err_msg)
+            error_codes.append(row_error_codes)
+            error_messages.append(row_error_msgs)
 
     # Calculate dimensions
     rows = len(data)
     cols = len(data[0]) if data else 0
 
-    # Pagination: apply max_rows limit if specified
-    truncated = False
-    total_available = rows
-    if max_rows and rows > max_rows:
-        data = data[:max_rows]
-        error_codes = error_codes[:max_rows]
-        error_messages = error_messages[:max_rows]
-        truncated = True
-        rows = max_rows
+    # Pagination: report the max_rows limit if it cut the range short
+    truncated = bool(max_rows) and total_rows > max_rows
+    total_available = last_row - first_row + 1
 
     result = {
         "success": True,
@@ -208,38 +211,28 @@ def read_range_sync(
     if truncated:
         result["truncated"] = True
         result["total_available"] = total_available
-        result["hint"] = f"Returned {max_rows} of {total_available} rows. Narrow range or use offset."
-
-    # Get formulas
+        result["next_cursor"] = encode_cursor("read", {
+            "wb": workbook_name,
+            "sheet": sheet_name,
+            "range": range_str,
+            "bounds": [first_row, first_col, last_row, last_col],
+            "row": rng.Row + rows,
+            "page": max_rows,
+            "formulas": include_formulas,
+            "ver": version,
+            "used": used_address,
+        })
+        result["hint"] = (
+            f"Returned rows {rng.Row}-{rng.Row + rows - 1} of {first_row}-{last_row}. "
+            "Call read with cursor=next_cursor for the next page."
+        )
+
+    # Get formulas (only the areas that contain any, in "auto" mode)
     try:
-        formulas = rng.Formula
-        formula_data = []
-        if formulas:
-            if isinstance(formulas, (list, tuple)):
-                if len(formulas) > 0 and isinstance(formulas[0], (list, tuple)):
-                    for row in formulas:
-                        row_formulas = []
-                        for f in row:
-                            if isinstance(f, str) and f.startswith("="):
-                                row_formulas.append(f)
-                            else:
-                                row_formulas.append(None)
-                        formula_data.append(row_formulas)
-                else:
-                    row_formulas = []
-                    for f in formulas:
-                        if isinstance(f, str) and f.startswith("="):
-                            row_formulas.append(f)
-                        else:
-                            row_formulas.append(None)
-                    formula_data.append(row_formulas)
-            else:
-                if isinstance(formulas, str) and formulas.startswith("="):
-                    formula_data.append([formulas])
-                else:
-                    formula_data.append([None])
-
-        result["formulas"] = formula_data if formula_data else None
+        read_rng = rng.Resize(rows, cols) if truncated else rng
+        result["formulas"], result["formula_read"] = read_formulas(read_rng, rows, cols, include_formulas)
+    except ToolError:
+        raise
     except Exception:
         result["formulas"] = None
 
@@ -256,17 +249,29 @@ def get_unique_values_sync(
     workbook_name: str,
     sheet_name: str,
     range_str: Optional[str] = None,
+    by_column: bool = False,
+    top_k: Optional[int] = None,
+    min_count: int = 1,
 ) -> Dict[str, Any]:
     """Get unique values and their frequencies from an Excel range.
 
+    Values keep their type: 100, "100" and TRUE are counted apart. The range
+    is streamed in row tiles; a profile with more than
+    UNIQUE_MAX_EXACT_VALUES distinct values switches to a heavy-hitters
+    sketch and a HyperLogLog distinct estimate ("approximate": true).
+
     Args:
         workbook_name: Name of open workbook
         sheet_name: Name of worksheet
         range_str: Excel range. Defaults to UsedRange if omitted.
+        by_column: Profile each column separately ("columns" in the result)
+        top_k: Return at most this many values per profile (None = all)
+        min_count: Leave out values seen fewer times than this
 
     Returns:
         Dictionary with unique values and counts
     """
+    validate_unique_options(top_k, min_count)
     _init_com()
 
     app = get_excel_app()
@@ -280,44 +285,19 @@ def get_unique_values_sync(
         rng = worksheet.UsedRange
         range_str = rng.Address.replace("$", "")
 
-    # Read all values
-    values = rng.Value
-
-    # Count occurrences
-    value_counts = {}
-
-    if values:
-        if isinstance(values, (list, tuple)):
-            if len(values) > 0 and isinstance(values[0], (list, tuple)):
-                for row in values:
-                    for cell in row:
-                        if not is_cell_empty(cell):
-                            val = str(cell)
-                            value_counts[val] = value_counts.get(val, 0) + 1
-            else:
-                for cell in values:
-                    if not is_cell_empty(cell):
-                        val = str(cell)
-                        value_counts[val] = value_counts.get(val, 0) + 1
-        else:
-            if not is_cell_empty(values):
-                val = str(values)
-                value_counts[val] = 1
-
-    # Sort by count descending
-    sorted_values = sorted(
-        [{"value": k, "count": v} for k, v in value_counts.items()],
-        key=lambda x: x["count"],
-        reverse=True
-    )
+    profiles = [
+        ValueProfile(UNIQUE_MAX_EXACT_VALUES, top_k)
+        for _ in range(rng.Columns.Count if by_column else 1)
+    ]
+    for tile in iter_range_tiles(rng):
+        profile_rows(profiles, tile, by_column)
 
     return {
         "success": True,
         "workbook": workbook_name,
         "sheet": sheet_name,
         "range": range_str,
-        "unique_count": len(sorted_values),
-        "values": sorted_values
+        **profile_summary(profiles, by_column, rng.Column, top_k, min_count),
     }
 
 
@@ -4,16 +4,25 @@ Contains the search/filter tool that uses the FilterEngine.
 """
 
 import logging
-from typing import Any, Dict, Optional, Union
+import os
+from typing import Any, Dict, Iterator, Optional, Union
 
+from ..config import FILTER_PLAN_SAMPLE_ROWS, SEARCH_INDEX_MAX_CELLS
 from ..core.connection import (
     _init_com,
+    app_events_active,
     get_excel_app,
     get_workbook,
     get_worksheet,
+    iter_range_tiles,
+    sheet_version,
 )
-from ..core.errors import ToolError
-from ..filters import FilterEngine
+from ..core.cursor import decode_cursor, encode_cursor
+from ..core.errors import ErrorCodes, ToolError
+from ..core.parallel_search import SheetBlock, search_blocks
+from ..core.search_index import SearchIndex, get_index, put_index
+from ..core.utils import is_workbook_file
+from ..filters import FilterEngine, plan_filter, to_filter_tree
 
 logger = logging.getLogger(__name__)
 
@@ -26,25 +35,92 @@ def search_sync(
     has_header: bool = True,
     all_sheets: bool = False,
     max_rows: Optional[int] = None,
+    export_path: Optional[str] = None,
+    export_sheet: str = "Search_Results",
+    use_index: bool = False,
+    parallel: bool = False,
+    sheet_timeout: Optional[float] = None,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Search and filter Excel data.
 
     Args:
-        workbook_name: Name of open workbook
+        workbook_name: Name of open workbook (for all_sheets, also the path
+            of a workbook file that is not open)
         filters: Filter specification (string for simple search, dict for complex)
         sheet_name: Name of worksheet (required if all_sheets is False)
         range_str: Range to search (defaults to UsedRange)
         has_header: If True, first row contains headers
         all_sheets: If True, search all sheets
-        max_rows: Maximum rows to return (prevents token explosion)
+        max_rows: Maximum rows to return (prevents token explosion). On a
+            single sheet the scan stops once this many rows match
+        export_path: If set, also write every matching row (not limited by
+            max_rows) to a new sheet of this .xlsx file
+        export_sheet: Sheet name for the export
+        use_index: If True, keep an index of each searched range so repeated
+            searches skip the read and only test rows that can match. Only
+            on threads with Excel application events attached (the COM
+            worker); elsewhere the status is "events_inactive"
+        parallel: If True (all_sheets), filter sheets in worker processes
+            while the next ones are read; max_rows then caps the rows
+            across all sheets, as it does for workbook files
+        sheet_timeout: Seconds each sheet may be filtered for in an
+            all-sheets search that is parallel or of a workbook file
+        cursor: next_cursor of a previous page. Continues that search after
+            its last returned row with its sheet, range, filters and page
+            size; the other arguments are ignored.
 
     Returns:
-        Dictionary with filtered data and metadata
+        Dictionary with filtered data and metadata. If a single-sheet search
+        stopped at max_rows with rows left to scan, includes:
+        - truncated: True
+        - total_available (scan reached the end) or estimated_total (matches
+          extrapolated from the rows scanned so far)
+        - next_cursor: token that continues after the last returned row
+        - hint: how to get the next page
     """
     _init_com()
 
-    app = get_excel_app()
-    workbook = get_workbook(app, workbook_name)
+    # Not open in Excel: all-sheets searches also read workbook files
+    file_search = all_sheets and not export_path and os.path.exists(workbook_name)
+    workbook = None
+    if not (file_search and is_workbook_file(workbook_name)):
+        try:
+            workbook = get_workbook(get_excel_app(), workbook_name)
+        except Exception:
+            if not file_search:
+                raise
+
+    if cursor:
+        state = _resume_search(workbook, workbook_name, sheet_name, cursor)
+        result = _search_sheet_paged(state["worksheet"], workbook_name, state=state)
+        result["sheet"] = state["sheet"]
+        return result
+
+    if export_path:
+        if all_sheets:
+            raise ToolError(
+                "export_path is only supported when searching a single sheet",
+                code=ErrorCodes.VALIDATION_ERROR
+            )
+        if os.path.abspath(export_path) == os.path.abspath(workbook.FullName):
+            raise ToolError(
+                "export_path must not be the searched workbook while it is open in Excel",
+                code=ErrorCodes.VALIDATION_ERROR
+            )
+
+    if all_sheets and (parallel or workbook is None):
+        if workbook is None:
+            from ..core.file_engine import FileEngine
+
+            result = FileEngine(durability="immediate").search_all_sheets(
+                workbook_name, filters, range_str, has_header, max_rows, parallel, sheet_timeout
+            )
+        else:
+            result = search_blocks(
+                _sheet_blocks(workbook, range_str), filters, has_header, max_rows, sheet_timeout
+            )
+        return {"success": True, "workbook": workbook_name, "all_sheets": True, **result}
 
     if all_sheets:
         # Search all sheets
@@ -59,7 +135,8 @@ def search_sync(
 
             try:
                 result = _search_sheet(
-                    ws, filters, range_str, has_header, workbook_name, max_rows
+                    ws, filters, range_str, has_header, workbook_name, max_rows,
+                    use_index=use_index,
                 )
                 if result.get("rows_filtered", 0) > 0:
                     all_results.append({
@@ -88,7 +165,8 @@ def search_sync(
 
         worksheet = get_worksheet(workbook, sheet_name)
         result = _search_sheet(
-            worksheet, filters, range_str, has_header, workbook_name, max_rows
+            worksheet, filters, range_str, has_header, workbook_name, max_rows,
+            export_path, export_sheet, use_index
         )
         result["sheet"] = sheet_name
         return result
@@ -101,8 +179,15 @@ def _search_sheet(
     has_header: bool,
     workbook_name: str,
     max_rows: Optional[int] = None,
+    export_path: Optional[str] = None,
+    export_sheet: str = "Search_Results",
+    use_index: bool = False,
 ) -> Dict[str, Any]:
     """Search a single worksheet."""
+    if max_rows and max_rows > 0 and not export_path and not use_index:
+        return _search_sheet_paged(
+            worksheet, workbook_name, filters, range_str, has_header, max_rows
+        )
 
     # Get range
     if range_str:
@@ -111,29 +196,40 @@ def _search_sheet(
         rng = worksheet.UsedRange
         range_str = rng.Address.replace("$", "")
 
-    # Read data
-    values = rng.Value
-    if not values:
-        return {
-            "success": True,
-            "workbook": workbook_name,
-            "range": range_str,
-            "data": [],
-            "rows_filtered": 0,
-            "rows_removed": 0,
-            "original_rows": 0,
-        }
-
-    # Convert to 2D list
-    data = []
-    if isinstance(values, (list, tuple)):
-        if len(values) > 0 and isinstance(values[0], (list, tuple)):
-            for row in values:
-                data.append([cell for cell in row])
-        else:
-            data.append([cell for cell in values])
+    # Read data, or reuse the values of a current index of this range
+    index = None
+    index_status = None
+    if use_index and not app_events_active():
+        # Edits made in Excel and recalculations would go unnoticed
+        use_index = False
+        index_status = "events_inactive"
+    if use_index:
+        key = (workbook_name.lower(), worksheet.Name.lower(), range_str.upper())
+        stamp = (sheet_version(workbook_name, worksheet.Name), rng.Address)
+        index = get_index(key, stamp)
+        index_status = "hit"
+
+    if index is not None:
+        data = index.rows
     else:
-        data.append([values])
+        data = _to_rows(rng.Value)
+        if not data:
+            return {
+                "success": True,
+                "workbook": workbook_name,
+                "range": range_str,
+                "data": [],
+                "rows_filtered": 0,
+                "rows_removed": 0,
+                "original_rows": 0,
+            }
+        if use_index:
+            if len(data) * max(map(len, data)) <= SEARCH_INDEX_MAX_CELLS:
+                index = SearchIndex(data)
+                put_index(key, stamp, index)
+                index_status = "built"
+            else:
+                index_status = "too_large"
 
     original_rows = len(data)
 
@@ -148,14 +244,12 @@ def _search_sheet(
     # Initialize filter engine
     engine = FilterEngine()
 
-    # Apply filters
-    filtered_data, row_indices = engine.filter_data(data_rows, filters, headers)
-
-    # Build result with headers
-    result_data = []
-    if has_header and headers:
-        result_data.append(headers)
-    result_data.extend(filtered_data)
+    # Apply filters (with an index, only to the rows it leaves as candidates)
+    tree = to_filter_tree(filters)
+    candidates = None
+    if index is not None:
+        candidates = index.candidate_rows(tree, headers, first_row=len(data) - len(data_rows))
+    filtered_data, row_indices = engine.filter_data(data_rows, tree, headers, candidates)
 
     # Calculate cell locations (Excel row numbers)
     cell_locations = []
@@ -167,6 +261,15 @@ def _search_sheet(
     rows_filtered = len(filtered_data)
     rows_removed = len(data_rows) - rows_filtered
 
+    # Export all matches before pagination trims them
+    export = None
+    if export_path:
+        from ..core.file_engine import FileEngine
+
+        export = FileEngine(durability="immediate").export_rows(
+            export_path, export_sheet, filtered_data, header=headers
+        )
+
     # Pagination: apply max_rows limit
     truncated = False
     total_available = rows_filtered
@@ -176,6 +279,12 @@ def _search_sheet(
         rows_filtered = max_rows
         truncated = True
 
+    # Build result with headers
+    result_data = []
+    if has_header and headers:
+        result_data.append(headers)
+    result_data.extend(filtered_data)
+
     # Get warnings from engine
     warnings = engine.get_warnings() if hasattr(engine, 'get_warnings') else []
 
@@ -194,16 +303,212 @@ def _search_sheet(
     if warnings:
         result["warnings"] = warnings
 
+    if engine.last_plan:
+        result["filter_plan"] = engine.last_plan
+
+    if index_status:
+        result["search_index"] = {
+            "status": index_status,
+            "candidate_rows": len(data_rows) if candidates is None else len(candidates),
+        }
+
+    if export:
+        result["export"] = {
+            "workbook": export_path,
+            "sheet": export_sheet,
+            "range": export["range"],
+            "rows_written": export["rows_written"],
+        }
+
     # Add truncation info if data was limited
     if truncated:
         result["truncated"] = True
         result["total_available"] = total_available
         result["hint"] = f"Returned {max_rows} of {total_available} matching rows."
 
-    # Human-readable filter description
+    _describe_filters(result, filters)
+    return result
+
+
+def _describe_filters(result: Dict[str, Any], filters: Any) -> None:
+    """Add a human-readable filter description to a search result."""
     if isinstance(filters, str):
         result["filter_applied"] = f"contains '{filters}'"
     elif isinstance(filters, dict):
         result["filter_applied"] = "complex filter"
 
+
+def _resume_search(workbook, workbook_name: str, sheet_name: Optional[str], cursor: str) -> Dict[str, Any]:
+    """Decode a search cursor and check that its sheet has not changed since."""
+    state = decode_cursor(cursor, "search")
+    if state["wb"].lower() != workbook_name.lower() or (sheet_name and state["sheet"].lower() != sheet_name.lower()):
+        raise ToolError(
+            f"Cursor belongs to {state['wb']} / {state['sheet']}, not {workbook_name} / {sheet_name or state['sheet']}",
+            code=ErrorCodes.INVALID_CURSOR
+        )
+    worksheet = get_worksheet(workbook, state["sheet"])
+    if state["ver"] != sheet_version(workbook_name, state["sheet"]) or state["used"] != worksheet.UsedRange.Address:
+        raise ToolError(
+            f"Sheet '{state['sheet']}' changed since this cursor was issued. "
+            "Search again without a cursor to start over.",
+            code=ErrorCodes.STALE_CURSOR
+        )
+    state["worksheet"] = worksheet
+    return state
+
+
+def _search_sheet_paged(
+    worksheet,
+    workbook_name: str,
+    filters: Union[str, Dict[str, Any], None] = None,
+    range_str: Optional[str] = None,
+    has_header: bool = True,
+    max_rows: Optional[int] = None,
+    state: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Search a worksheet for one page of max_rows matches.
+
+    The range is read in row tiles and each tile is filtered as it arrives,
+    so reading stops at the tile holding the page's last match. When rows
+    are left after it, the result carries next_cursor (resuming at the row
+    after that match) and the total match count, exact if the scan reached
+    the end of the range and otherwise extrapolated from the rows filtered.
+
+    Args:
+        state: Decoded cursor to continue from; overrides the other arguments
+    """
+    if state is None:
+        # Stamp before reading, so changes made during the search invalidate the cursor
+        version = sheet_version(workbook_name, worksheet.Name)
+        used_range = worksheet.UsedRange
+        used_address = used_range.Address
+        if range_str:
+            rng = worksheet.Range(range_str)
+        else:
+            rng = used_range
+            range_str = used_address.replace("$", "")
+        first_row, first_col = rng.Row, rng.Column
+        last_row, last_col = first_row + rng.Rows.Count - 1, first_col + rng.Columns.Count - 1
+        headers = None
+        start = first_row
+        returned = 0
+    else:
+        filters, range_str, has_header = state["filters"], state["range"], state["header"]
+        max_rows, headers, returned = state["page"], state["columns"], state["returned"]
+        first_row, first_col, last_row, last_col = state["bounds"]
+        version, used_address = state["ver"], state["used"]
+        start = state["row"]
+        rng = worksheet.Range(worksheet.Cells(start, first_col), worksheet.Cells(last_row, last_col))
+
+    data_first = first_row + (1 if has_header else 0)
+    page_first = max(start, data_first)
+    # Conditions are ordered once, on the first rows read, not per tile
+    engine = FilterEngine(plan_rows=0)
+    tree = to_filter_tree(filters)
+    plan = None
+    planned = FILTER_PLAN_SAMPLE_ROWS <= 0
+
+    matches = []
+    cell_locations = []
+    last_match = None
+    row = start  # Excel row of the next row to filter
+    filtered = found = 0
+    for tile in iter_range_tiles(rng):
+        rows = [list(values) for values in tile]
+        if has_header and headers is None:
+            headers = [str(h) if h else f"Column{i+1}" for i, h in enumerate(rows[0])]
+            rows = rows[1:]
+            row += 1
+        if not planned and rows:
+            tree, plan = plan_filter(tree, headers, rows[:FILTER_PLAN_SAMPLE_ROWS])
+            planned = True
+        _, hits = engine.filter_data(rows, tree, headers)
+        filtered += len(rows)
+        found += len(hits)
+        for i in hits[:max_rows - len(matches)]:
+            matches.append(rows[i])
+            cell_locations.append(f"A{row + i}")
+            last_match = row + i
+        row += len(rows)
+        if len(matches) >= max_rows:
+            break
+
+    # Resume after the last returned match if any rows are left
+    resume = last_match + 1 if len(matches) >= max_rows and last_match < last_row else None
+    rows_scanned = (last_row + 1 if resume is None else resume) - page_first
+
+    result = {
+        "success": True,
+        "workbook": workbook_name,
+        "range": range_str,
+        "data": ([headers] if headers else []) + matches,
+        "rows_filtered": len(matches),
+        "rows_removed": rows_scanned - len(matches),
+        "original_rows": last_row - data_first + 1,
+        "columns": headers,
+        "cell_locations": cell_locations,
+        "rows_scanned": rows_scanned,
+    }
+
+    warnings = engine.get_warnings()
+    if warnings:
+        result["warnings"] = warnings
+
+    if plan:
+        result["filter_plan"] = plan
+
+    if resume is not None:
+        result["truncated"] = True
+        if row > last_row:
+            total = returned + found
+            result["total_available"] = total
+            of = f"{total}"
+        else:
+            total = returned + round(found / filtered * (last_row - page_first + 1))
+            result["estimated_total"] = total
+            of = f"about {total} (estimated from {filtered} of {last_row - page_first + 1} rows)"
+        result["next_cursor"] = encode_cursor("search", {
+            "wb": workbook_name,
+            "sheet": worksheet.Name,
+            "range": range_str,
+            "bounds": [first_row, first_col, last_row, last_col],
+            "row": resume,
+            "page": max_rows,
+            "header": has_header,
+            "columns": headers,
+            "filters": filters,
+            "returned": returned + len(matches),
+            "ver": version,
+            "used": used_address,
+        })
+        result["hint"] = (
+            f"Returned matches {returned + 1}-{returned + len(matches)} of {of}. "
+            "Call search with cursor=next_cursor for the next page."
+        )
+
+    _describe_filters(result, filters)
     return result
+
+
+def _sheet_blocks(workbook, range_str: Optional[str]) -> Iterator[SheetBlock]:
+    """Read the values of each visible sheet's search range, one sheet at a time."""
+    for i in range(1, workbook.Worksheets.Count + 1):
+        ws = workbook.Worksheets(i)
+        if ws.Visible != -1:  # Skip hidden sheets
+            continue
+        try:
+            rng = ws.Range(range_str) if range_str else ws.UsedRange
+            yield SheetBlock(ws.Name, rng.Address.replace("$", ""), rng.Row, _to_rows(rng.Value))
+        except Exception as e:
+            logger.warning(f"Error searching sheet {ws.Name}: {e}")
+
+
+def _to_rows(values: Any) -> list:
+    """Convert a COM Range.Value (scalar, row tuple or 2D tuple) to a list of row lists."""
+    if not values:
+        return []
+    if isinstance(values, (list, tuple)):
+        if len(values) > 0 and isinstance(values[0], (list, tuple)):
+            return [list(row) for row in values]
+        return [list(values)]
+    return [[values]]
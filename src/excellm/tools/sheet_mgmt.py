@@ -8,19 +8,26 @@ from typing import Any, Dict, List, Optional
 
 from ..core.connection import (
     _init_com,
+    apply_line_blocks,
     get_excel_app,
     get_workbook,
     get_worksheet,
+    invalidate_registry,
+    mark_sheet_changed,
 )
+from ..core.engine import plan_line_edit
 from ..core.errors import ToolError
+from ..core.performance import with_performance_mode
 from ..core.utils import (
     column_to_number,
+    line_area_address,
     number_to_column,
 )
 
 logger = logging.getLogger(__name__)
 
 
+@with_performance_mode
 def insert_sync(
     workbook_name: str,
     sheet_name: str,
@@ -36,6 +43,8 @@ def insert_sync(
         insert_type: "row" or "column"
         position: Row number or column letter/number
         count: Number of rows/columns to insert
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
 
     Returns:
         Dictionary with operation result
@@ -56,9 +65,9 @@ def insert_sync(
         else:
             start_row = int(position)
 
-        # Insert rows
-        for _ in range(count):
-            worksheet.Rows(start_row).Insert()
+        # Insert all rows in one call
+        worksheet.Rows(f"{start_row}:{start_row + count - 1}").Insert()
+        mark_sheet_changed(workbook_name, sheet_name)
 
         return {
             "success": True,
@@ -85,9 +94,10 @@ def insert_sync(
             else:
                 start_col = position.upper()
 
-        # Insert columns
-        for _ in range(count):
-            worksheet.Columns(start_col).Insert()
+        # Insert all columns in one call
+        end_col = number_to_column(column_to_number(start_col) + count - 1)
+        worksheet.Columns(f"{start_col}:{end_col}").Insert()
+        mark_sheet_changed(workbook_name, sheet_name)
 
         return {
             "success": True,
@@ -144,6 +154,7 @@ def delete_sync(
                 worksheet.Rows(f"{start_row}:{start_row + count - 1}").Delete()
             else:
                 worksheet.Rows(start_row).Delete()
+        mark_sheet_changed(workbook_name, sheet_name)
 
         return {
             "success": True,
@@ -177,6 +188,7 @@ def delete_sync(
                 worksheet.Columns(f"{start_col}:{end_col}").Delete()
             else:
                 worksheet.Columns(start_col).Delete()
+        mark_sheet_changed(workbook_name, sheet_name)
 
         return {
             "success": True,
@@ -192,6 +204,63 @@ def delete_sync(
         raise ToolError(f"Invalid delete_type '{delete_type}'. Must be 'row' or 'column'.")
 
 
+@with_performance_mode
+def bulk_insert_delete_sync(
+    workbook_name: str,
+    sheet_name: str,
+    action: str,
+    line_type: str,
+    positions: List[Any],
+) -> Dict[str, Any]:
+    """Insert or delete rows or columns at many positions in one operation.
+
+    All positions refer to the sheet as it is before the call. They are
+    grouped into blocks (overlapping and adjacent deletions are merged,
+    insertions at the same line add up) and applied with multi-area
+    Range("5:10,20:25").EntireRow.Insert()/Delete() calls, bottom-up.
+
+    Args:
+        workbook_name: Name of open workbook
+        sheet_name: Name of worksheet
+        action: "insert" or "delete"
+        line_type: "row" or "column"
+        positions: Row numbers or column letters/numbers ("5", "5:10", "C",
+            "C:E"), or {"position": "5", "count": 3}. An insert at "5:10"
+            (or count=6) adds 6 lines before line 5
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
+
+    Returns:
+        Dictionary with operation result, including the blocks applied and
+        the number of Insert/Delete calls
+    """
+    action = action.lower()
+    line_type = line_type.lower()
+    blocks = plan_line_edit(action, line_type, positions)
+
+    _init_com()
+
+    app = get_excel_app()
+    workbook = get_workbook(app, workbook_name)
+    worksheet = get_worksheet(workbook, sheet_name)
+
+    calls = apply_line_blocks(worksheet, blocks, line_type, action)
+    mark_sheet_changed(workbook_name, sheet_name)
+
+    count = sum(last - first + 1 for first, last in blocks)
+    past = "inserted" if action == "insert" else "deleted"
+    return {
+        "success": True,
+        "workbook": workbook_name,
+        "sheet": sheet_name,
+        "action": f"{line_type}s_{past}",
+        "count": count,
+        "blocks": [line_area_address(first, last, line_type) for first, last in blocks],
+        "calls": calls,
+        "message": f"{past.capitalize()} {count} {line_type}(s) in {len(blocks)} block(s)"
+    }
+
+
 def manage_sheet_sync(
     workbook_name: str,
     sheet_name: Optional[str] = None,
@@ -261,6 +330,8 @@ def manage_sheet_sync(
             worksheet.Delete()
         finally:
             app.DisplayAlerts = True
+        invalidate_registry(workbook_name, sheet_name)
+        mark_sheet_changed(workbook_name, sheet_name)
 
         return {
             "success": True,
@@ -365,6 +436,9 @@ def manage_sheet_sync(
         else:
             # Move to end
             worksheet.Move(After=target_wb.Worksheets(target_wb.Worksheets.Count))
+        if target_workbook:
+            invalidate_registry(workbook_name, sheet_name)
+            mark_sheet_changed(workbook_name, sheet_name)
 
         return {
             "success": True,
@@ -384,6 +458,8 @@ def manage_sheet_sync(
         worksheet = get_worksheet(workbook, sheet_name)
         old_name = worksheet.Name
         worksheet.Name = target_name
+        invalidate_registry(workbook_name, sheet_name)
+        mark_sheet_changed(workbook_name, sheet_name)
 
         return {
             "success": True,
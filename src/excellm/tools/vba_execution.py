@@ -9,7 +9,7 @@ import re
 import time
 from typing import Optional
 
-from ..core.connection import get_excel_app, get_workbook
+from ..core.connection import get_excel_app, get_workbook, mark_sheet_changed
 from ..core.errors import ErrorCodes, ToolError
 
 
@@ -131,7 +131,8 @@ def execute_vba_sync(
         module_name: Optional custom module name (auto-generated if None)
         procedure_name: Name for the procedure (default: "Main")
         sheet_name: Optional sheet to activate before execution
-        timeout: Execution timeout in seconds (for future use)
+        timeout: Execution timeout in seconds; the server's dispatcher
+            enforces it while waiting for this call
 
     Returns:
         Dictionary with execution result:
@@ -230,6 +231,7 @@ End Sub"""
             # Execute the procedure
             full_procedure_name = f"{final_module_name}.{final_proc_name}"
             app.Run(full_procedure_name)
+            mark_sheet_changed(workbook_name)  # Macros can touch any sheet
 
             return {
                 "success": True,
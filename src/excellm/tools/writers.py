@@ -13,8 +13,11 @@ from ..core.connection import (
     get_excel_app,
     get_workbook,
     get_worksheet,
+    mark_sheet_changed,
+    write_changed_cells,
 )
 from ..core.errors import ErrorCodes, ToolError
+from ..core.performance import with_performance_mode
 from ..core.utils import (
     column_to_number,
     number_to_column,
@@ -288,6 +291,7 @@ def write_cell_sync(
 
     if not dry_run:
         rng.Value = sanitized_value
+        mark_sheet_changed(workbook_name, sheet_name)
 
         if activate:
             try:
@@ -323,6 +327,7 @@ def write_cell_sync(
     }
 
 
+@with_performance_mode
 def write_range_sync(
     workbook_name: str,
     sheet_name: str,
@@ -336,6 +341,7 @@ def write_range_sync(
     max_cells: Optional[int] = None,
     verify_source: Optional[Dict[str, Any]] = None,
     abort_threshold: float = 0.0,
+    diff: bool = False,
 ) -> Dict[str, Any]:
     """Write a 2D array of values to a range with safety verification.
 
@@ -353,6 +359,10 @@ def write_range_sync(
             {"column": "A", "key_index": 0, "match_mode": "contains"}
         abort_threshold: Max allowed mismatch rate (default: 0.0 = 0%)
             If verification fails above this rate, write is aborted.
+        diff: If True, compare with the current values and write only the
+            blocks that changed (fewer recalculations of dependent cells)
+        performance_mode: If True, suspend screen updating, events and automatic
+            calculation during the call and recalculate once at the end
 
     Returns:
         Dictionary with operation result and verification details
@@ -474,8 +484,16 @@ def write_range_sync(
                     "Clear range first or use force_overwrite=True."
                 )
 
+    diff_stats = None
     if not dry_run:
-        rng.Value = write_data
+        if diff:
+            # Caution mode has already read the current values
+            current = existing if not force_overwrite else rng.Value
+            diff_stats = write_changed_cells(rng, current, write_data)
+        else:
+            rng.Value = write_data
+        if diff_stats is None or diff_stats["cells_changed"]:
+            mark_sheet_changed(workbook_name, sheet_name)
 
         if activate:
             try:
@@ -502,6 +520,8 @@ def write_range_sync(
         },
         "dry_run": dry_run,
     }
+    if diff_stats is not None:
+        result.update(diff_stats)
 
     # Add verification results if performed
     if verification:
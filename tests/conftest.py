@@ -1,8 +1,17 @@
 import pytest
 import os
 import tempfile
+import threading
 from pathlib import Path
 
+import fake_com
+
+try:
+    import pythoncom  # noqa: F401
+except ImportError:
+    # No pywin32 (Linux/macOS): let the COM modules import against the fake
+    fake_com.install()
+
 
 @pytest.fixture
 def filename():
@@ -47,3 +56,24 @@ def temp_excel_file():
             os.unlink(tmp_path)
     except Exception:
         pass
+
+
+@pytest.fixture
+def fake_excel(monkeypatch):
+    """Point the COM connection layer at a fresh in-process fake Excel.
+
+    Returns the FakeComRuntime; its ``app`` holds one workbook "Book1.xlsx"
+    with a "Data" sheet.
+    """
+    from excellm.core import connection
+
+    app = fake_com.FakeExcelApp()
+    app.add_workbook("Book1.xlsx", {"Data": [
+        ["Month", "Sales"], ["Jan", 100], ["Feb", 120], ["Mar", 110],
+    ]})
+    runtime = fake_com.FakeComRuntime(app)
+    monkeypatch.setattr(connection, "pythoncom", runtime.pythoncom)
+    monkeypatch.setattr(connection, "win32", runtime.client)
+    monkeypatch.setattr(connection, "_thread_local", threading.local())
+    monkeypatch.setattr(connection, "_stats", dict.fromkeys(connection._stats, 0))
+    return runtime
@@ -0,0 +1,771 @@
+# ruff: noqa: N802, N803, N815 - names mirror the Excel object model
+"""In-process fake of pywin32 and the Excel object model.
+
+Implements the part of Excel.Application the COM tools touch (workbooks,
+worksheets and ranges backed by a dict of cell values) plus fake
+``pythoncom`` and ``win32com.client`` modules whose CoInitialize and
+GetActiveObject calls are counted per thread. Tests and benchmarks use it
+on Linux, where pywin32 is not available.
+
+Usage:
+    runtime = FakeComRuntime(FakeExcelApp(), connect_latency_s=0.002)
+    install(runtime)   # register as sys.modules["pythoncom"] etc.
+    ...
+    runtime.calls["GetActiveObject"], runtime.threads
+"""
+
+import bisect
+import datetime
+import re
+import sys
+import threading
+import time
+import types
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# XlCalculation
+XL_CALCULATION_AUTOMATIC = -4105
+XL_CALCULATION_MANUAL = -4135
+
+# XlCellType
+XL_CELL_TYPE_FORMULAS = -4123
+
+# Day 0 of Excel's 1900 date system (serial 1 is 1900-01-01)
+_EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+_CELL_RE = re.compile(r"^\$?([A-Za-z]{1,3})\$?(\d+)$")
+
+
+def _column_number(letters: str) -> int:
+    n = 0
+    for ch in letters.upper():
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+def _column_letters(n: int) -> str:
+    letters = ""
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _parse_cell(ref: str) -> Tuple[int, int]:
+    match = _CELL_RE.match(ref.strip())
+    if not match:
+        raise ValueError(f"Bad cell reference: {ref}")
+    return int(match.group(2)), _column_number(match.group(1))
+
+
+class FakeCount:
+    """Stand-in for Range.Rows / Range.Columns."""
+
+    def __init__(self, count: int):
+        self.Count = count
+
+
+class FakeRange:
+    """Rectangular block of a FakeWorksheet."""
+
+    def __init__(self, sheet: "FakeWorksheet", r1: int, c1: int, r2: int, c2: int):
+        self.Worksheet = sheet
+        self._bounds = (min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2))
+
+    @property
+    def Row(self) -> int:
+        return self._bounds[0]
+
+    @property
+    def Column(self) -> int:
+        return self._bounds[1]
+
+    @property
+    def Rows(self) -> FakeCount:
+        return FakeCount(self._bounds[2] - self._bounds[0] + 1)
+
+    @property
+    def Columns(self) -> FakeCount:
+        return FakeCount(self._bounds[3] - self._bounds[1] + 1)
+
+    @property
+    def Count(self) -> int:
+        return self.Rows.Count * self.Columns.Count
+
+    @property
+    def Address(self) -> str:
+        r1, c1, r2, c2 = self._bounds
+        start = f"${_column_letters(c1)}${r1}"
+        if (r1, c1) == (r2, c2):
+            return start
+        return f"{start}:${_column_letters(c2)}${r2}"
+
+    def _get(self, formulas: bool = False) -> Any:
+        r1, c1, r2, c2 = self._bounds
+        cells = self.Worksheet._cells
+        self.Worksheet.app.marshal("Range.Formula" if formulas else "Range.Value", self.Count)
+
+        def value(r, c):
+            v = cells.get((r, c))
+            if formulas:
+                return "" if v is None else v
+            if isinstance(v, str) and v.startswith("="):
+                return self.Worksheet.formula_results.get((r, c))
+            return v
+
+        if (r1, c1) == (r2, c2):
+            return value(r1, c1)
+        return tuple(
+            tuple(value(r, c) for c in range(c1, c2 + 1)) for r in range(r1, r2 + 1)
+        )
+
+    def _set(self, data: Any) -> None:
+        self.Worksheet.app.marshal("Range.Value=", self.Count)
+        self._fill(data)
+        self.Worksheet.app.changed(self)
+
+    def _fill(self, data: Any) -> None:
+        r1, c1, r2, c2 = self._bounds
+        if not isinstance(data, (list, tuple)):
+            rows = [[data] * (c2 - c1 + 1)] * (r2 - r1 + 1)
+        elif data and not isinstance(data[0], (list, tuple)):
+            rows = [data]
+        else:
+            rows = data
+        for r in range(r1, r2 + 1):
+            row = rows[r - r1] if r - r1 < len(rows) else ()
+            for c in range(c1, c2 + 1):
+                self.Worksheet._store(r, c, row[c - c1] if c - c1 < len(row) else None)
+
+    Value = property(_get, _set)
+    Value2 = property(_get, _set)
+    Formula = property(lambda self: self._get(formulas=True), _set)
+
+    def _number_formats(self) -> Dict[Tuple[int, int], str]:
+        r1, c1, r2, c2 = self._bounds
+        return {
+            key: fmt for key, fmt in self.Worksheet.number_formats.items()
+            if r1 <= key[0] <= r2 and c1 <= key[1] <= c2
+        }
+
+    @property
+    def NumberFormat(self) -> Optional[str]:
+        """The cells' shared format ("General" unless set), None if they differ."""
+        self.Worksheet.app.round_trip("Range.NumberFormat")
+        found = self._number_formats()
+        formats = set(found.values())
+        if len(found) < self.Count:
+            formats.add("General")
+        return formats.pop() if len(formats) == 1 else None
+
+    @NumberFormat.setter
+    def NumberFormat(self, fmt: str) -> None:
+        r1, c1, r2, c2 = self._bounds
+        formats = self.Worksheet.number_formats
+        for r in range(r1, r2 + 1):
+            for c in range(c1, c2 + 1):
+                if fmt == "General":
+                    formats.pop((r, c), None)
+                else:
+                    formats[(r, c)] = fmt
+
+    @property
+    def Text(self) -> str:
+        """Displayed text of the top-left cell; numbers in a date format show as m/d/yyyy."""
+        self.Worksheet.app.round_trip("Range.Text")
+        return self.Worksheet._display_text(self.Row, self.Column)
+
+    def __call__(self, row: int, col: int = 1) -> "FakeRange":
+        # Default member (Item): a cell relative to the top-left corner
+        r, c = self.Row + row - 1, self.Column + col - 1
+        return FakeRange(self.Worksheet, r, c, r, c)
+
+    @property
+    def Cells(self) -> "FakeRange":
+        return self
+
+    def Resize(self, rows: int, cols: int) -> "FakeRange":
+        return FakeRange(self.Worksheet, self.Row, self.Column, self.Row + rows - 1, self.Column + cols - 1)
+
+    def Offset(self, rows: int = 0, cols: int = 0) -> "FakeRange":
+        r1, c1, r2, c2 = self._bounds
+        return FakeRange(self.Worksheet, r1 + rows, c1 + cols, r2 + rows, c2 + cols)
+
+    @property
+    def EntireRow(self) -> "FakeLines":
+        return FakeLines(self.Worksheet, 0, [(self._bounds[0], self._bounds[2])])
+
+    @property
+    def EntireColumn(self) -> "FakeLines":
+        return FakeLines(self.Worksheet, 1, [(self._bounds[1], self._bounds[3])])
+
+    def ClearContents(self) -> None:
+        self._set(None)
+
+    def Select(self) -> None:
+        pass
+
+    def _formula_cells(self) -> List[Tuple[int, int]]:
+        r1, c1, r2, c2 = self._bounds
+        return sorted(
+            key for key, value in self.Worksheet._cells.items()
+            if r1 <= key[0] <= r2 and c1 <= key[1] <= c2
+            and isinstance(value, str) and value.startswith("=")
+        )
+
+    @property
+    def HasFormula(self) -> Optional[bool]:
+        """True if every cell holds a formula, False if none does, None if mixed."""
+        self.Worksheet.app.calls["HasFormula"] += 1
+        found = len(self._formula_cells())
+        if found == 0:
+            return False
+        return True if found == self.Count else None
+
+    def _find_matches(self, what: str, look_at: int, match_case: bool) -> List[Tuple[int, int]]:
+        """Cells whose value matches literally (no wildcards), row-major."""
+        r1, c1, r2, c2 = self._bounds
+        flags = 0 if match_case else re.IGNORECASE
+        pattern = re.compile(re.escape(str(what)), flags)
+        found = []
+        for (r, c), value in self.Worksheet._cells.items():
+            if not (r1 <= r <= r2 and c1 <= c <= c2):
+                continue
+            # LookIn=xlValues: the displayed text
+            text = self.Worksheet._display_text(r, c)
+            if (pattern.fullmatch if look_at == 1 else pattern.search)(text):
+                found.append((r, c))
+        return sorted(found)
+
+    def Find(self, What: Any, LookIn: int = -4163, LookAt: int = 2, MatchCase: bool = False) -> Optional["FakeRange"]:
+        # One round-trip per call; FindNext walks the matches found here
+        self.Worksheet.app.round_trip("Range.Find")
+        self._found = self._find_matches(What, LookAt, MatchCase)
+        if not self._found:
+            return None
+        r, c = self._found[0]
+        return FakeRange(self.Worksheet, r, c, r, c)
+
+    def FindNext(self, After: "FakeRange") -> Optional["FakeRange"]:
+        self.Worksheet.app.round_trip("Range.FindNext")
+        i = bisect.bisect_right(self._found, (After.Row, After.Column))
+        r, c = self._found[i] if i < len(self._found) else self._found[0]
+        return FakeRange(self.Worksheet, r, c, r, c)
+
+    def Replace(self, What: Any, Replacement: Any, LookAt: int = 2, MatchCase: bool = False) -> bool:
+        self.Worksheet.app.round_trip("Range.Replace")
+        pattern = re.compile(re.escape(str(What)), 0 if MatchCase else re.IGNORECASE)
+        for r, c in self._find_matches(What, LookAt, MatchCase):
+            value = self.Worksheet._cells[(r, c)]
+            text = str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+            self.Worksheet._store(r, c, Replacement if LookAt == 1 else pattern.sub(lambda m: str(Replacement), text))
+        self.Worksheet.app.changed(self)
+        return True
+
+    def SpecialCells(self, cell_type: int) -> "FakeMultiRange":
+        """Formula cells as areas: row runs merged with identical runs below."""
+        self.Worksheet.app.calls["SpecialCells"] += 1
+        if cell_type != XL_CELL_TYPE_FORMULAS:
+            raise NotImplementedError(f"SpecialCells({cell_type})")
+        cells = self._formula_cells()
+        if not cells:
+            raise OSError(-2146827284, "No cells were found.", None, None)
+
+        runs: List[List[int]] = []  # [row, first col, last col]
+        for r, c in cells:
+            if runs and runs[-1][0] == r and runs[-1][2] == c - 1:
+                runs[-1][2] = c
+            else:
+                runs.append([r, c, c])
+        areas: List[List[int]] = []  # [r1, c1, r2, c2]
+        open_areas: Dict[Tuple[int, int], List[int]] = {}
+        for r, first, last in runs:
+            area = open_areas.get((first, last))
+            if area is not None and area[2] == r - 1:
+                area[2] = r
+            else:
+                area = [r, first, r, last]
+                areas.append(area)
+                open_areas[(first, last)] = area
+        return FakeMultiRange([FakeRange(self.Worksheet, *bounds) for bounds in areas])
+
+
+class FakeMultiRange:
+    """Multi-area range, as returned by SpecialCells or Range("A1:B2,D5")."""
+
+    def __init__(self, areas: List[FakeRange]):
+        self._areas = areas
+
+    @property
+    def Count(self) -> int:
+        return sum(area.Count for area in self._areas)
+
+    @property
+    def Areas(self) -> "FakeAreas":
+        return FakeAreas(self._areas)
+
+    def _set(self, data: Any) -> None:
+        # One call fills every area
+        sheet = self._areas[0].Worksheet
+        sheet.app.marshal("Range.Value=", self.Count)
+        for area in self._areas:
+            area._fill(data)
+        sheet.app.changed(self._areas[0])
+
+    Value = property(lambda self: self._areas[0].Value, _set)
+
+    @property
+    def EntireRow(self) -> "FakeLines":
+        return FakeLines(self._areas[0].Worksheet, 0, [(a._bounds[0], a._bounds[2]) for a in self._areas])
+
+    @property
+    def EntireColumn(self) -> "FakeLines":
+        return FakeLines(self._areas[0].Worksheet, 1, [(a._bounds[1], a._bounds[3]) for a in self._areas])
+
+
+class FakeAreas:
+    """Range.Areas collection: callable by 1-based index, iterable."""
+
+    def __init__(self, areas: List[FakeRange]):
+        self._areas = areas
+
+    @property
+    def Count(self) -> int:
+        return len(self._areas)
+
+    def __call__(self, index: int) -> FakeRange:
+        return self._areas[index - 1]
+
+    Item = __call__
+
+    def __iter__(self) -> Iterator[FakeRange]:
+        return iter(self._areas)
+
+
+class FakeLines:
+    """Whole rows or columns of a sheet, as returned by Worksheet.Rows(...)
+    or Range(...).EntireRow. Multi-area lines insert or delete every area
+    in one call, relative to the sheet before the call, like Excel."""
+
+    def __init__(self, sheet: "FakeWorksheet", axis: int, spans: List[Tuple[int, int]]):
+        self.Worksheet = sheet
+        self._axis = axis  # 0: rows, 1: columns
+        self._spans = sorted(spans)
+
+    @property
+    def Count(self) -> int:
+        return sum(end - start + 1 for start, end in self._spans)
+
+    def _shift(self, insert: bool) -> None:
+        if any(a[1] >= b[0] for a, b in zip(self._spans, self._spans[1:])):
+            raise Exception("This command cannot be used on overlapping selections.")
+        sheet = self.Worksheet
+        moved = {}
+        for key, value in sheet._cells.items():
+            pos = key[self._axis]
+            if insert:
+                pos += sum(end - start + 1 for start, end in self._spans if start <= key[self._axis])
+            elif any(start <= pos <= end for start, end in self._spans):
+                continue  # Deleted
+            else:
+                pos -= sum(end - start + 1 for start, end in self._spans if end < key[self._axis])
+            moved[(pos, key[1]) if self._axis == 0 else (key[0], pos)] = value
+        sheet._cells = moved
+        first, last = self._spans[0][0], self._spans[-1][1]
+        bounds = (first, 1, last, 16384) if self._axis == 0 else (1, first, 1048576, last)
+        sheet.app.changed(FakeRange(sheet, *bounds))
+
+    def Insert(self) -> None:
+        self.Worksheet.app.calls["Insert"] += 1
+        self._shift(insert=True)
+
+    def Delete(self) -> None:
+        self.Worksheet.app.calls["Delete"] += 1
+        self._shift(insert=False)
+
+
+class FakeWorksheet:
+    """Worksheet whose cells live in a {(row, col): value} dict."""
+
+    def __init__(self, workbook: "FakeWorkbook", name: str):
+        self.Parent = workbook
+        self.app = workbook.app
+        self.Name = name
+        self.Visible = -1
+        self.ProtectContents = False
+        self._cells: Dict[Tuple[int, int], Any] = {}
+        self.formula_results: Dict[Tuple[int, int], Any] = {}
+        self.number_formats: Dict[Tuple[int, int], str] = {}
+
+    def _store(self, r: int, c: int, value: Any) -> None:
+        if value is None or value == "":
+            self._cells.pop((r, c), None)
+        else:
+            self._cells[(r, c)] = value
+
+    def _display_text(self, r: int, c: int) -> str:
+        """Text a cell shows; numbers in a date format show as m/d/yyyy."""
+        value = self._cells.get((r, c))
+        if isinstance(value, str) and value.startswith("="):
+            value = self.formula_results.get((r, c))
+        fmt = self.number_formats.get((r, c), "General")
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and "y" in fmt.lower():
+            day = _EXCEL_EPOCH + datetime.timedelta(days=value)
+            return f"{day.month}/{day.day}/{day.year}"
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return "" if value is None else str(value)
+
+    @property
+    def Index(self) -> int:
+        return self.Parent._sheets.index(self) + 1
+
+    def Range(self, ref: Any, ref2: Any = None) -> FakeRange:
+        if isinstance(ref, FakeRange):
+            end = ref2 if ref2 is not None else ref
+            return FakeRange(self, ref.Row, ref.Column, end._bounds[2], end._bounds[3])
+        if "," in ref:
+            return FakeMultiRange([self.Range(area) for area in ref.split(",")])
+        start, _, end = ref.partition(":")
+        if start.isdigit() and end.isdigit():  # Whole rows: "5:10"
+            return FakeRange(self, int(start), 1, int(end), 16384)
+        if start.isalpha() and end.isalpha():  # Whole columns: "C:E"
+            return FakeRange(self, 1, _column_number(start), 1048576, _column_number(end))
+        r1, c1 = _parse_cell(start)
+        r2, c2 = _parse_cell(end) if end else (r1, c1)
+        return FakeRange(self, r1, c1, r2, c2)
+
+    @property
+    def Cells(self) -> FakeRange:
+        return FakeRange(self, 1, 1, 1048576, 16384)
+
+    def _lines(self, axis: int, key: Any) -> FakeLines:
+        def number(part: str) -> int:
+            part = part.strip()
+            return int(part) if part.isdigit() else _column_number(part)
+
+        start, _, end = str(key).partition(":")
+        return FakeLines(self, axis, [(number(start), number(end or start))])
+
+    def Rows(self, key: Any) -> FakeLines:
+        return self._lines(0, key)
+
+    def Columns(self, key: Any) -> FakeLines:
+        return self._lines(1, key)
+
+    @property
+    def UsedRange(self) -> FakeRange:
+        if not self._cells:
+            return FakeRange(self, 1, 1, 1, 1)
+        rows = [r for r, _ in self._cells]
+        cols = [c for _, c in self._cells]
+        return FakeRange(self, min(rows), min(cols), max(rows), max(cols))
+
+    def Activate(self) -> None:
+        self.Parent.ActiveSheet = self
+
+    def Calculate(self) -> None:
+        self.app.calls["Calculate"] += 1
+
+    def Delete(self) -> None:
+        self.app.fire("SheetBeforeDelete", self)
+        self.Parent._sheets.remove(self)
+
+
+class FakeSheets:
+    """Worksheets collection: callable by name or 1-based index, iterable."""
+
+    def __init__(self, workbook: "FakeWorkbook"):
+        self._workbook = workbook
+
+    def __call__(self, key: Any) -> FakeWorksheet:
+        self._workbook.app.round_trip("Worksheets()")
+        sheets = self._workbook._sheets
+        if isinstance(key, int):
+            if 1 <= key <= len(sheets):
+                return sheets[key - 1]
+        else:
+            for sheet in sheets:
+                if sheet.Name.lower() == str(key).lower():
+                    return sheet
+        raise KeyError(f"Worksheet not found: {key}")
+
+    Item = __call__
+
+    @property
+    def Count(self) -> int:
+        return len(self._workbook._sheets)
+
+    def __iter__(self) -> Iterator[FakeWorksheet]:
+        return iter(list(self._workbook._sheets))
+
+    def __len__(self) -> int:
+        return len(self._workbook._sheets)
+
+    def Add(self, Before: Optional[FakeWorksheet] = None, After: Optional[FakeWorksheet] = None) -> FakeWorksheet:
+        sheets = self._workbook._sheets
+        n = len(sheets) + 1
+        while any(s.Name == f"Sheet{n}" for s in sheets):
+            n += 1
+        sheet = FakeWorksheet(self._workbook, f"Sheet{n}")
+        if Before is not None:
+            sheets.insert(sheets.index(Before), sheet)
+        elif After is not None:
+            sheets.insert(sheets.index(After) + 1, sheet)
+        elif self._workbook.ActiveSheet in sheets:
+            # Like Excel, a new sheet goes before the active one
+            sheets.insert(sheets.index(self._workbook.ActiveSheet), sheet)
+        else:
+            sheets.append(sheet)
+        return sheet
+
+
+class FakeWorkbook:
+    """Workbook with an ordered list of worksheets."""
+
+    def __init__(self, app: "FakeExcelApp", name: str, sheet_names: List[str]):
+        self.app = app
+        self.Name = name
+        self.Path = "C:\\fake"
+        self.FullName = f"{self.Path}\\{name}"
+        self.Saved = True
+        self.save_count = 0
+        self._sheets = [FakeWorksheet(self, sheet_name) for sheet_name in sheet_names]
+        self.Worksheets = self.Sheets = FakeSheets(self)
+        self.ActiveSheet = self._sheets[0] if self._sheets else None
+
+    def Save(self) -> None:
+        self.save_count += 1
+        self.Saved = True
+
+    def Activate(self) -> None:
+        self.app.ActiveWorkbook = self
+
+    def Close(self, SaveChanges: bool = False) -> None:
+        self.app.fire("WorkbookBeforeClose", self, False)
+        self.app._workbooks.remove(self)
+
+
+class FakeWorkbooks:
+    """Workbooks collection: callable by name or 1-based index, iterable."""
+
+    def __init__(self, app: "FakeExcelApp"):
+        self._app = app
+
+    def __call__(self, key: Any) -> FakeWorkbook:
+        self._app.round_trip("Workbooks()")
+        books = self._app._workbooks
+        if isinstance(key, int):
+            if 1 <= key <= len(books):
+                return books[key - 1]
+        else:
+            for book in books:
+                if book.Name.lower() == str(key).lower():
+                    return book
+        raise KeyError(f"Workbook not found: {key}")
+
+    Item = __call__
+
+    @property
+    def Count(self) -> int:
+        self._app.round_trip("Workbooks.Count")
+        return len(self._app._workbooks)
+
+    def __iter__(self) -> Iterator[FakeWorkbook]:
+        return iter(list(self._app._workbooks))
+
+    def Add(self) -> FakeWorkbook:
+        return self._app.add_workbook(f"Book{len(self._app._workbooks) + 1}")
+
+
+class FakeExcelApp:
+    """Excel.Application with application-level switches and call counters.
+
+    ``call_latency_s`` is added to every object lookup (Workbooks(name),
+    Worksheets(name), Workbooks.Count), standing in for a cross-process
+    COM round-trip, and ``marshal_cost_s`` per cell to every Value/Formula
+    read or Value write (counted in ``calls["cells_marshaled"]``).
+
+    Every mutation (setting a range value, inserting or deleting rows or
+    columns) costs what the application switches make Excel do: a
+    recalculation (``recalc_cost_s``) in automatic calculation mode, a
+    repaint (``repaint_cost_s``) while ScreenUpdating is on and a SheetChange
+    event (``event_cost_s``) while EnableEvents is on. In manual mode the
+    change only marks the app dirty; switching back to automatic then
+    recalculates once, as Excel does.
+    """
+
+    def __init__(
+        self,
+        call_latency_s: float = 0.0,
+        marshal_cost_s: float = 0.0,
+        recalc_cost_s: float = 0.0,
+        repaint_cost_s: float = 0.0,
+        event_cost_s: float = 0.0,
+    ):
+        self.call_latency_s = call_latency_s
+        self.marshal_cost_s = marshal_cost_s
+        self.recalc_cost_s = recalc_cost_s
+        self.repaint_cost_s = repaint_cost_s
+        self.event_cost_s = event_cost_s
+        self.calls: Counter = Counter()
+        self._workbooks: List[FakeWorkbook] = []
+        self.Workbooks = FakeWorkbooks(self)
+        self.ActiveWorkbook: Optional[FakeWorkbook] = None
+        self.Visible = True
+        self.DisplayAlerts = True
+        self.ScreenUpdating = True
+        self.EnableEvents = True
+        self._calculation = XL_CALCULATION_AUTOMATIC
+        self._dirty = False
+        self.Version = "16.0"
+        self.event_sinks: List[Any] = []
+
+    @property
+    def Calculation(self) -> int:
+        return self._calculation
+
+    @Calculation.setter
+    def Calculation(self, value: int) -> None:
+        self._calculation = value
+        if value == XL_CALCULATION_AUTOMATIC and self._dirty:
+            self._recalculate()
+
+    def _recalculate(self) -> None:
+        self.calls["Recalculate"] += 1
+        self._dirty = False
+        if self.recalc_cost_s:
+            time.sleep(self.recalc_cost_s)
+        if self.EnableEvents and self.event_sinks:
+            for book in self._workbooks:
+                for sheet in book._sheets:
+                    if sheet.UsedRange._formula_cells():
+                        self.fire("SheetCalculate", sheet)
+
+    def changed(self, target: Any) -> None:
+        """Pay for a mutation of ``target`` under the current switches."""
+        if self._calculation == XL_CALCULATION_AUTOMATIC:
+            self._recalculate()
+        else:
+            self._dirty = True
+        if self.ScreenUpdating:
+            self.calls["Repaint"] += 1
+            if self.repaint_cost_s:
+                time.sleep(self.repaint_cost_s)
+        if self.EnableEvents:
+            self.calls["SheetChange"] += 1
+            self.fire("SheetChange", target.Worksheet, target)
+            if self.event_cost_s:
+                time.sleep(self.event_cost_s)
+
+    def round_trip(self, name: str) -> None:
+        self.calls[name] += 1
+        if self.call_latency_s:
+            time.sleep(self.call_latency_s)
+
+    def marshal(self, name: str, cells: int) -> None:
+        self.calls[name] += 1
+        self.calls["cells_marshaled"] += cells
+        if self.marshal_cost_s:
+            time.sleep(self.marshal_cost_s * cells)
+
+    def fire(self, event: str, *args: Any) -> None:
+        """Deliver an application event to sinks attached with WithEvents."""
+        for sink in self.event_sinks:
+            handler = getattr(sink, f"On{event}", None)
+            if handler is not None:
+                handler(*args)
+
+    def add_workbook(self, name: str, sheets: Optional[Dict[str, List[List[Any]]]] = None) -> FakeWorkbook:
+        """Open a workbook whose sheets hold the given rows (starting at A1)."""
+        sheets = sheets or {"Sheet1": []}
+        book = FakeWorkbook(self, name, list(sheets))
+        for sheet, rows in zip(book._sheets, sheets.values()):
+            for r, row in enumerate(rows, start=1):
+                for c, value in enumerate(row, start=1):
+                    sheet._store(r, c, value)
+        self._workbooks.append(book)
+        if self.ActiveWorkbook is None:
+            self.ActiveWorkbook = book
+        return book
+
+    def Calculate(self) -> None:
+        self.calls["Calculate"] += 1
+        self._recalculate()
+
+
+class FakeComRuntime:
+    """Fake pythoncom / win32com.client pair that hands out one FakeExcelApp.
+
+    Counts CoInitialize, GetActiveObject and PumpWaitingMessages calls and
+    records which threads connected. GetActiveObject raises like pywin32
+    does when no app is set (Excel not running).
+    """
+
+    COINIT_APARTMENTTHREADED = 2
+
+    def __init__(self, app: Optional[FakeExcelApp] = None, connect_latency_s: float = 0.0):
+        self.app = app
+        self.connect_latency_s = connect_latency_s
+        self.calls: Counter = Counter()
+        self.threads: set = set()
+        self._lock = threading.Lock()
+
+        self.pythoncom = types.ModuleType("pythoncom")
+        for name in ("CoInitialize", "CoInitializeEx", "CoUninitialize", "PumpWaitingMessages"):
+            setattr(self.pythoncom, name, getattr(self, name))
+        self.pythoncom.COINIT_APARTMENTTHREADED = self.COINIT_APARTMENTTHREADED
+
+        self.client = types.ModuleType("win32com.client")
+        self.client.GetActiveObject = self.GetActiveObject
+        self.client.Dispatch = self.Dispatch
+        self.client.WithEvents = self.WithEvents
+        self.win32com = types.ModuleType("win32com")
+        self.win32com.client = self.client
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] += 1
+
+    def CoInitialize(self) -> None:
+        self._count("CoInitialize")
+
+    def CoInitializeEx(self, flags: int) -> None:
+        self._count("CoInitialize")
+
+    def CoUninitialize(self) -> None:
+        self._count("CoUninitialize")
+
+    def PumpWaitingMessages(self) -> int:
+        self._count("PumpWaitingMessages")
+        return 0
+
+    def GetActiveObject(self, prog_id: str) -> FakeExcelApp:
+        self._count("GetActiveObject")
+        with self._lock:
+            self.threads.add(threading.get_ident())
+        if self.connect_latency_s:
+            time.sleep(self.connect_latency_s)
+        if self.app is None:
+            raise OSError(-2147221021, "Operation unavailable", None, None)
+        return self.app
+
+    def Dispatch(self, prog_id: str) -> FakeExcelApp:
+        return self.GetActiveObject(prog_id)
+
+    def WithEvents(self, disp: FakeExcelApp, user_event_class: type) -> Any:
+        """Attach an event sink; events fire synchronously on the calling thread."""
+        self._count("WithEvents")
+        sink = user_event_class()
+        disp.event_sinks.append(sink)
+        return sink
+
+
+def install(runtime: Optional[FakeComRuntime] = None) -> FakeComRuntime:
+    """Register a fake runtime as the pythoncom and win32com.client modules."""
+    runtime = runtime or FakeComRuntime()
+    sys.modules["pythoncom"] = runtime.pythoncom
+    sys.modules["win32com"] = runtime.win32com
+    sys.modules["win32com.client"] = runtime.client
+    return runtime
@@ -0,0 +1,175 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.async_engine import FILE_LANE, AsyncExcelEngine
+from excellm.core.errors import ToolError
+from excellm.core.file_engine import FileEngine
+
+
+class Tracker:
+    """Blocking callable that records how many calls overlap."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, value):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return value
+
+
+def test_calls_on_one_workbook_are_serialized():
+    engine = AsyncExcelEngine(max_workers=4, workbook_concurrency=1, com_worker=False)
+    same, different = Tracker(), Tracker()
+
+    async def main():
+        await asyncio.gather(*(engine.run(same, i, workbook="Book1.xlsx") for i in range(3)))
+        return await asyncio.gather(
+            *(engine.run(different, i, workbook=f"Book{i}.xlsx") for i in range(3))
+        )
+
+    assert asyncio.run(main()) == [0, 1, 2]
+    assert same.peak == 1
+    assert different.peak > 1
+    metrics = engine.metrics()
+    assert metrics["engines"]["COM"]["completed"] == 6
+    assert metrics["workbooks_in_use"] == {}
+    engine.shutdown()
+
+
+def test_full_queue_rejects_calls():
+    engine = AsyncExcelEngine(max_workers=1, max_queue_depth=1)
+
+    async def main():
+        first = asyncio.create_task(engine.run(time.sleep, 0.1))
+        await asyncio.sleep(0.01)
+        with pytest.raises(ToolError) as excinfo:
+            await engine.run(time.sleep, 0)
+        await first
+        return excinfo.value.code
+
+    assert asyncio.run(main()) == "ENGINE_BUSY"
+    lane = engine.metrics()["engines"]["COM"]
+    assert lane["rejected"] == 1
+    assert lane["peak_pending"] == 1
+    engine.shutdown()
+
+
+def test_timeout_keeps_workbook_slot_until_call_returns():
+    engine = AsyncExcelEngine(max_workers=2, workbook_concurrency=1)
+    tracker = Tracker(delay=0.2)
+
+    async def main():
+        with pytest.raises(ToolError) as excinfo:
+            await engine.run(tracker, 1, workbook="Book1.xlsx", timeout=0.05)
+        # The timed-out call is still running; the next one waits for it
+        await engine.run(tracker, 2, workbook="Book1.xlsx", timeout=0)
+        return excinfo.value.code
+
+    assert asyncio.run(main()) == "TIMEOUT"
+    assert tracker.peak == 1
+    lane = engine.metrics()["engines"]["COM"]
+    assert lane["timed_out"] == 1
+    assert lane["completed"] == 2
+    engine.shutdown()
+
+
+def test_errors_propagate_and_are_counted():
+    engine = AsyncExcelEngine()
+
+    def fail():
+        raise ToolError("boom", code="WRITE_FAILED")
+
+    with pytest.raises(ToolError, match="boom"):
+        asyncio.run(engine.run(fail))
+
+    assert engine.metrics()["engines"]["COM"]["failed"] == 1
+    engine.shutdown()
+
+
+def test_engine_facade_uses_the_engine_lane(temp_excel_file):
+    engine = AsyncExcelEngine()
+    file_engine = FileEngine()
+
+    async def main():
+        await engine.write_range(file_engine, temp_excel_file, "Data", "E1", [["Note"]])
+        return await engine.read_range(file_engine, temp_excel_file, "Data", "E1:E1")
+
+    assert asyncio.run(main()) == [["Note"]]
+    assert engine.metrics()["engines"][FILE_LANE]["completed"] == 2
+    engine.shutdown()
+
+
+def test_file_path_calls_do_not_wait_behind_com(temp_excel_file, monkeypatch):
+    from excellm import server
+
+    engine = AsyncExcelEngine(max_workers=1, com_worker=False)
+    monkeypatch.setattr(server, "_async_engine", engine)
+    release = threading.Event()
+
+    async def main():
+        blocked = asyncio.create_task(server._dispatch(release.wait, 5))
+        await asyncio.sleep(0.01)
+        # The only COM thread is busy; a batch on a workbook file still runs
+        result = await asyncio.wait_for(
+            server.batch(temp_excel_file, [{"op": "read", "sheet": "Data", "range": "A1:B1"}]), 2
+        )
+        assert not blocked.done()
+        release.set()
+        await blocked
+        return result
+
+    assert asyncio.run(main())["results"][0]["data"] == [["Month", "Sales"]]
+    lanes = engine.metrics()["engines"]
+    assert lanes[FILE_LANE]["completed"] == 1 and lanes["COM"]["completed"] == 1
+    engine.shutdown()
+
+
+def test_copy_range_of_a_file_runs_on_the_file_lane(temp_excel_file, monkeypatch):
+    from excellm import server
+
+    engine = AsyncExcelEngine(com_worker=False)
+    monkeypatch.setattr(server, "_async_engine", engine)
+
+    result = asyncio.run(server.copy_range(temp_excel_file, "Data", "A1:B2", target_cell="G1"))
+
+    assert result["success"] is True
+    lanes = engine.metrics()["engines"]
+    assert lanes[FILE_LANE]["completed"] == 1 and "COM" not in lanes
+    engine.shutdown()
+
+
+def test_execute_vba_waits_for_its_own_timeout(monkeypatch):
+    from excellm import config, server
+
+    engine = AsyncExcelEngine(timeout_s=0.05, com_worker=False)
+    monkeypatch.setattr(server, "_async_engine", engine)
+    monkeypatch.setattr(config, "VBA_ENABLED", True)
+
+    def slow_macro(*args):
+        time.sleep(0.2)
+        return {"success": True, "timeout": args[-1]}
+
+    monkeypatch.setattr(server, "execute_vba_sync", slow_macro)
+
+    result = asyncio.run(server.execute_vba("Book1.xlsx", "Range(\"A1\").Value = 1", timeout=5))
+    assert result == {"success": True, "timeout": 5}
+    with pytest.raises(ToolError) as exc:
+        asyncio.run(server.execute_vba("Book1.xlsx", "Range(\"A1\").Value = 1", timeout=0.1))
+    assert exc.value.code == "TIMEOUT"
+    engine.shutdown()
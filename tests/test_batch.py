@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.errors import ToolError
+from excellm.core.file_engine import FileEngine
+from excellm.tools.batch import execute_batch_sync
+
+
+def test_oversized_write_rejects_the_batch(fake_excel, temp_excel_file):
+    rows = [[r, r * 2] for r in range(200)]  # 400 cells, over the default 250
+    for workbook in ("Book1.xlsx", temp_excel_file):
+        with pytest.raises(ToolError) as exc:
+            execute_batch_sync(workbook, [
+                {"op": "create_sheet", "sheet": "Big"},
+                {"op": "write", "sheet": "Big", "range": "A1", "data": rows},
+            ])
+        assert exc.value.code == "VALIDATION_ERROR" and "max_cells" in exc.value.message
+
+    assert "Big" not in FileEngine().get_sheet_names(temp_excel_file)
+    result = execute_batch_sync("Book1.xlsx", [
+        {"op": "write", "sheet": "Data", "range": "D1", "data": rows, "max_cells": 400},
+    ])
+    assert result["success"] is True and result["results"][0]["range"] == "D1:E200"
+
+
+def test_write_over_data_needs_force_overwrite(fake_excel, temp_excel_file):
+    sheet = fake_excel.app.Workbooks("Book1.xlsx").Worksheets("Data")
+    for workbook in ("Book1.xlsx", temp_excel_file):
+        ops = [
+            {"op": "write", "sheet": "Data", "range": "B3", "data": [[999, "x"]]},
+            {"op": "write", "sheet": "Data", "range": "F1", "data": [["Note"]]},
+        ]
+        result = execute_batch_sync(workbook, ops, stop_on_error=False)
+        assert [r["success"] for r in result["results"]] == [False, True]
+        assert "already contains data" in result["results"][0]["error"]["message"]
+
+        ops[0]["force_overwrite"] = True
+        assert execute_batch_sync(workbook, ops[:1])["success"] is True
+
+    assert sheet.Range("B3").Value == 999
+    assert FileEngine().read_range(temp_excel_file, "Data", "B3:C3") == [[999, "x"]]
@@ -0,0 +1,99 @@
+import os
+import sys
+
+import openpyxl
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.engine import plan_line_edit
+from excellm.core.errors import ToolError
+from excellm.core.file_engine import FileEngine
+from excellm.core.utils import line_block_addresses, line_shift
+from excellm.tools.sheet_mgmt import bulk_insert_delete_sync
+
+
+def numbered_rows(count):
+    return [[f"r{r}", r] for r in range(1, count + 1)]
+
+
+def column_a(sheet, rows):
+    return [sheet.Range(f"A{r}").Value for r in range(1, rows + 1)]
+
+
+def test_positions_group_into_blocks():
+    positions = ["20:25", "5", {"position": "6", "count": 5}, 11]
+    assert plan_line_edit("delete", "row", positions) == [(5, 11), (20, 25)]
+    assert plan_line_edit("insert", "row", positions) == [(5, 5), (6, 10), (11, 11), (20, 25)]
+    assert plan_line_edit("insert", "row", ["5", "5:6"]) == [(5, 7)]
+    assert plan_line_edit("delete", "column", ["C:E", "f", 8]) == [(3, 6), (8, 8)]
+
+    # Inserts that touch go in separate calls, bottom-up
+    blocks = plan_line_edit("insert", "row", positions)
+    assert line_block_addresses(blocks, "row", "insert") == ["11:11,20:25", "6:10", "5:5"]
+    assert [line_shift(blocks, "insert")(r) for r in (4, 5, 6, 20)] == [4, 6, 12, 33]
+    assert [line_shift([(5, 11)], "delete")(r) for r in (4, 5, 11, 12)] == [4, None, None, 5]
+
+    for bad in ([], ["x"], ["5:3"], [{"position": "5", "count": 0}], [{"position": "5:6", "count": 2}]):
+        with pytest.raises(ToolError) as excinfo:
+            plan_line_edit("delete", "row", bad)
+        assert excinfo.value.code == "VALIDATION_ERROR"
+
+
+def test_scattered_rows_in_one_call(fake_excel):
+    app = fake_excel.app
+    sheet = app.add_workbook("Rows.xlsx", {"Data": numbered_rows(30)}).Worksheets("Data")
+
+    result = bulk_insert_delete_sync("Rows.xlsx", "Data", "delete", "row", ["5:10", "11", "20:25"])
+    assert result["count"] == 13 and result["blocks"] == ["5:11", "20:25"] and result["calls"] == 1
+    assert app.calls["Delete"] == 1 and app.calls["Recalculate"] == 1
+    kept = [f"r{r}" for r in range(1, 31) if not (5 <= r <= 11 or 20 <= r <= 25)]
+    assert column_a(sheet, 17) == kept
+
+    result = bulk_insert_delete_sync("Rows.xlsx", "Data", "insert", "row", ["2", {"position": "4", "count": 2}])
+    assert result["action"] == "rows_inserted" and result["calls"] == 1
+    assert column_a(sheet, 6) == ["r1", None, "r2", "r3", None, None]
+
+
+def test_columns_and_long_addresses(fake_excel):
+    app = fake_excel.app
+    sheet = app.add_workbook("Cols.xlsx", {"Data": [list(range(1, 31))]}).Worksheets("Data")
+
+    bulk_insert_delete_sync("Cols.xlsx", "Data", "delete", "column", ["B", "D:E"])
+    assert [sheet.Range(f"{c}1").Value for c in "ABCD"] == [1, 3, 6, 7]
+
+    # 150 single rows do not fit one address: several calls, same result
+    sheet = app.add_workbook("Long.xlsx", {"Data": numbered_rows(400)}).Worksheets("Data")
+    app.calls.clear()
+    result = bulk_insert_delete_sync("Long.xlsx", "Data", "delete", "row", [str(r) for r in range(2, 301, 2)])
+    assert result["count"] == 150 and result["calls"] > 1
+    assert app.calls["Delete"] == result["calls"]
+    assert column_a(sheet, 4) == ["r1", "r3", "r5", "r7"]
+    assert sheet.Range("A250").Value == "r400"
+
+
+def test_file_engine_matches_openpyxl(tmp_path):
+    path = tmp_path / "lines.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.title = "Data"
+    for row in range(1, 41):
+        wb.active.append([f"r{row}c{col}" for col in range(1, 9)])
+    wb.save(path)
+
+    cases = [
+        ("delete", "row", ["5:10", "11", "30:32", "3"]),
+        ("insert", "row", ["5", {"position": "6", "count": 2}, "20:22"]),
+        ("delete", "column", ["B", "D:E"]),
+        ("insert", "column", ["C", "F"]),
+    ]
+    for action, line_type, positions in cases:
+        blocks = plan_line_edit(action, line_type, positions)
+        expected = openpyxl.load_workbook(path)["Data"]
+        for first, last in reversed(blocks):
+            edit = getattr(expected, f"{action}_{'rows' if line_type == 'row' else 'cols'}")
+            edit(first, last - first + 1)
+
+        FileEngine().bulk_insert_delete(str(path), "Data", action, line_type, positions)
+        actual = openpyxl.load_workbook(path)["Data"]
+        assert list(actual.values) == list(expected.values)
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.async_engine import AsyncExcelEngine
+from excellm.core.com_worker import ComWorker
+from excellm.core.connection import (
+    ProxyRegistry,
+    connection_stats,
+    get_excel_app,
+    get_workbook,
+    get_worksheet,
+)
+from excellm.core.errors import ToolError
+from excellm.tools.readers import read_range_sync
+from excellm.tools.sheet_mgmt import manage_sheet_sync
+
+
+def lookup(workbook_name, sheet_name):
+    return get_worksheet(get_workbook(get_excel_app(), workbook_name), sheet_name)
+
+
+def failing_call():
+    lookup("Book1.xlsx", "Data")
+    raise RuntimeError("The object invoked has disconnected from its clients.")
+
+
+def test_repeat_calls_are_served_from_registry(fake_excel):
+    engine = AsyncExcelEngine(com_worker=True)
+
+    async def main():
+        for _ in range(5):
+            result = await engine.run(read_range_sync, "Book1.xlsx", "Data", "B2", workbook="Book1.xlsx")
+        return result
+
+    assert asyncio.run(main())["data"] == [["100"]]
+    tool = engine.metrics()["tools"]["read_range_sync"]
+    # First call: GetActiveObject + workbook + sheet lookup; later calls hit the cache
+    assert tool["com_lookups"] == 3
+    assert tool["served_from_registry"] == 12
+    assert fake_excel.app.calls["Workbooks()"] == 1
+    assert fake_excel.app.calls["Worksheets()"] == 1
+    engine.shutdown()
+
+
+def test_sheet_tools_invalidate_entries(fake_excel):
+    book = fake_excel.app.Workbooks("Book1.xlsx")
+    data = lookup("Book1.xlsx", "Data")
+
+    manage_sheet_sync("Book1.xlsx", "Data", action="rename", target_name="Sales")
+    with pytest.raises(ToolError) as excinfo:
+        lookup("Book1.xlsx", "Data")
+    assert excinfo.value.code == "SHEET_NOT_FOUND"
+    assert lookup("Book1.xlsx", "Sales") is data
+
+    manage_sheet_sync("Book1.xlsx", "Extra", action="add")
+    assert lookup("Book1.xlsx", "Extra").Name == "Extra"
+    manage_sheet_sync("Book1.xlsx", "Extra", action="remove")
+    with pytest.raises(ToolError):
+        lookup("Book1.xlsx", "Extra")
+    assert [ws.Name for ws in book.Worksheets] == ["Sales"]
+
+
+def test_events_and_failures_invalidate_worker_registry(fake_excel):
+    app = fake_excel.app
+    other = app.add_workbook("Book2.xlsx", {"Other": [["x"]]})
+    worker = ComWorker()
+
+    worker.submit(lookup, "Book2.xlsx", "Other").result()
+    assert fake_excel.calls["WithEvents"] == 1
+
+    # Excel reports the close; the cached proxy must not be handed out again
+    other.Close()
+    with pytest.raises(ToolError) as excinfo:
+        worker.submit(lookup, "Book2.xlsx", "Other").result()
+    assert excinfo.value.code == "WORKBOOK_NOT_FOUND"
+
+    worker.submit(lookup, "Book1.xlsx", "Data").result()
+    before = connection_stats()
+    with pytest.raises(RuntimeError):
+        worker.submit(failing_call).result()
+    worker.submit(lookup, "Book1.xlsx", "Data").result()
+    after = connection_stats()
+    worker.shutdown()
+
+    # The failure dropped the cache: the app is probed and both lookups repeat
+    assert after["app_probes"] - before["app_probes"] == 1
+    assert after["workbook_misses"] - before["workbook_misses"] == 1
+    assert after["sheet_misses"] - before["sheet_misses"] == 1
+
+
+def test_entries_expire_after_ttl(fake_excel):
+    app = fake_excel.app
+    registry = ProxyRegistry(app, ttl_s=0.05)
+    book = app.Workbooks("Book1.xlsx")
+    registry.add_workbook("Book1.xlsx", book)
+    registry.add_worksheet(book, "Data", book.Worksheets("Data"))
+
+    assert registry.workbook("BOOK1.xlsx") is book
+    assert registry.worksheet(book, "data") is not None
+    assert len(registry) == 2
+    time.sleep(0.06)
+    assert registry.workbook("Book1.xlsx") is None
+    assert len(registry) == 0
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.async_engine import AsyncExcelEngine
+from excellm.core.com_worker import ComWorker
+from excellm.core.connection import connection_stats, get_excel_app
+from excellm.excel_session import ExcelSessionManager
+from excellm.tools.readers import read_range_sync
+
+
+def read_on_thread(*args, delay=0.0):
+    time.sleep(delay)  # Keeps pool threads busy so the pool grows
+    return threading.get_ident(), read_range_sync(*args)
+
+
+def test_tool_calls_share_one_sta_thread_and_connection(fake_excel):
+    engine = AsyncExcelEngine(com_worker=True)
+
+    async def main():
+        return await asyncio.gather(*(
+            engine.run(read_on_thread, "Book1.xlsx", "Data", f"A{i}:B{i}", workbook=f"Book{i}")
+            for i in range(1, 5)
+        ))
+
+    results = asyncio.run(main())
+
+    assert [r["data"] for _, r in results] == [
+        [["Month", "Sales"]], [["Jan", "100"]], [["Feb", "120"]], [["Mar", "110"]],
+    ]
+    assert len({thread for thread, _ in results}) == 1
+    assert fake_excel.calls["GetActiveObject"] == 1
+    assert fake_excel.calls["CoInitialize"] == 1
+    metrics = engine.metrics()
+    assert metrics["engines"]["COM"]["max_workers"] == 1
+    assert metrics["engines"]["COM"]["worker"]["alive"]
+    assert metrics["com_connection"]["get_active_object"] == 1
+    assert metrics["com_connection"]["reused"] == 3
+    engine.shutdown()
+
+
+def test_thread_pool_connects_once_per_thread(fake_excel):
+    engine = AsyncExcelEngine(max_workers=4, com_worker=False)
+
+    async def main():
+        return await asyncio.gather(*(
+            engine.run(
+                read_on_thread, "Book1.xlsx", "Data", "A1", delay=0.02, workbook=f"Book{i}"
+            )
+            for i in range(8)
+        ))
+
+    threads = {thread for thread, _ in asyncio.run(main())}
+    engine.shutdown()
+
+    assert len(threads) > 1
+    assert fake_excel.calls["GetActiveObject"] == len(threads)
+
+
+def test_session_manager_runs_on_the_worker(fake_excel):
+    session = ExcelSessionManager()
+
+    async def main():
+        first = await session.get_sheet_names("Book1.xlsx")
+        await session.get_sheet_names("Book1.xlsx")
+        return first
+
+    assert asyncio.run(main()) == ["Data"]
+    assert fake_excel.calls["GetActiveObject"] == 1
+    assert session.excel_app is fake_excel.app
+
+
+def test_worker_order_errors_and_shutdown(fake_excel):
+    worker = ComWorker(idle_pump_s=0.01)
+    seen = []
+
+    first = worker.submit(time.sleep, 0.1)
+    second = worker.submit(seen.append, 2)
+    failing = worker.submit(get_excel_app().Workbooks, "Missing.xlsx")
+    assert first.result() is None and second.result() is None
+    with pytest.raises(KeyError):
+        failing.result()
+    assert seen == [2]
+
+    time.sleep(0.05)
+    assert fake_excel.calls["PumpWaitingMessages"] > 0
+
+    blocker = worker.submit(time.sleep, 0.1)
+    queued = worker.submit(seen.append, 3)
+    time.sleep(0.02)
+    worker.shutdown(cancel_futures=True)
+    assert blocker.done() and not blocker.cancelled()
+    with pytest.raises(CancelledError):
+        queued.result()
+    assert seen == [2]
+    assert worker.stats()["alive"] is False
+    assert fake_excel.calls["CoUninitialize"] == 1
+    with pytest.raises(RuntimeError):
+        worker.submit(seen.append, 4)
+    assert connection_stats()["co_initialize"] == 2  # Main thread and worker
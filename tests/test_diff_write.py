@@ -0,0 +1,111 @@
+import asyncio
+import os
+import sys
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.connection import MAX_DIFF_BLOCKS
+from excellm.core.utils import changed_blocks, same_cell_value
+from excellm.excel_session import ExcelSessionManager
+from excellm.tools.readers import read_range_sync
+from excellm.tools.writers import write_range_sync
+
+ROWS, COLS = 200, 5
+
+
+def grid(number=int):
+    return [[f"r{r}c{c}" if c else number(r) for c in range(COLS)] for r in range(ROWS)]
+
+
+def write(data, **kwargs):
+    return write_range_sync(
+        "Chunk.xlsx", "Data", f"A1:E{len(data)}", data,
+        force_overwrite=True, activate=False, max_cells=ROWS * COLS, **kwargs
+    )
+
+
+def test_cell_comparison_and_blocks():
+    assert same_cell_value(100.0, 100) and same_cell_value(None, "")
+    assert not same_cell_value(1.0, True) and not same_cell_value("100", 100.0)
+    assert not same_cell_value(5.0, "=2+3")
+
+    current = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    new = [[1, "x", "y"], [4, "x", "y"], [0, 8, 9], [None, "", "z"]]
+    assert changed_blocks(current, new) == [(0, 1, 1, 2), (2, 0, 2, 0), (3, 2, 3, 2)]
+    assert changed_blocks(current, current) == []
+    formulas = [[None, None, "=A1*3"], [None, None, None], [None, None, None]]
+    assert changed_blocks(current, current, formulas) == [(0, 2, 0, 2)]
+    assert changed_blocks([[1, 2, 3]], [[1, 2, "=A1*3"]], formulas) == []
+
+
+def test_diff_writes_only_changed_blocks(fake_excel):
+    app = fake_excel.app
+    app.add_workbook("Chunk.xlsx", {"Data": grid(float)})  # Excel returns numbers as float
+    page = read_range_sync("Chunk.xlsx", "Data", max_rows=50)
+
+    # Unchanged chunk: nothing is written
+    app.calls.clear()
+    result = write(grid(), diff=True)
+    assert result["cells_changed"] == 0 and result["cells_unchanged"] == ROWS * COLS
+    assert app.calls["Range.Value="] == 0 and app.calls["Recalculate"] == 0
+    assert "next_cursor" in read_range_sync("Chunk.xlsx", cursor=page["next_cursor"])
+
+    data = grid()
+    data[10][1:3] = ["a", "b"]
+    data[11][1:3] = ["c", "d"]
+    data[150][4] = "e"
+    app.calls.clear()
+    result = write(data, diff=True)
+
+    assert result["cells_changed"] == 5
+    assert result["blocks_written"] == 2 and result["full_write"] is False
+    assert app.calls["Range.Value="] == 2 and app.calls["Recalculate"] == 2
+    assert read_range_sync("Chunk.xlsx", "Data", "A11:E12")["data"] == [
+        ["10.0", "a", "b", "r10c3", "r10c4"], ["11.0", "c", "d", "r11c3", "r11c4"],
+    ]
+    assert read_range_sync("Chunk.xlsx", "Data", "E151")["data"] == [["e"]]
+
+
+def test_scattered_changes_fall_back_to_one_write(fake_excel):
+    app = fake_excel.app
+    app.add_workbook("Chunk.xlsx", {"Data": grid(float)})  # Excel returns numbers as float
+    data = grid()
+    for r in range(0, 2 * (MAX_DIFF_BLOCKS + 1), 2):
+        data[r][2] = "changed"
+
+    app.calls.clear()
+    result = write(data, diff=True)
+    assert result["full_write"] is True and result["blocks_written"] == 1
+    assert result["cells_changed"] == MAX_DIFF_BLOCKS + 1
+    assert app.calls["Range.Value="] == 1
+
+
+def test_session_write_range_diff(fake_excel):
+    session = ExcelSessionManager()
+
+    async def main():
+        return await session.write_range(
+            "Book1.xlsx", "Data", "A2:B3", [["Jan", 100], ["Feb", 125]], force_overwrite=True, activate=False, diff=True
+        )
+
+    result = asyncio.run(main())
+    assert result["cells_changed"] == 1 and result["cells_unchanged"] == 3
+    assert fake_excel.app.Workbooks("Book1.xlsx").Worksheets("Data").Range("B3").Value == 125
+
+
+def test_diff_replaces_formulas_like_a_plain_write(fake_excel):
+    app = fake_excel.app
+    sheets = {}
+    for diff in (False, True):
+        book = app.add_workbook(f"Formulas{diff}.xlsx", {"Data": [["a", 1.0], ["b", "=B1*2"]]})
+        sheet = sheets[diff] = book.Worksheets("Data")
+        sheet.formula_results[(2, 2)] = 2.0
+        result = write_range_sync(
+            f"Formulas{diff}.xlsx", "Data", "A1:B2", [["a", 1], ["b", 2]],
+            force_overwrite=True, activate=False, diff=diff,
+        )
+
+    # The formula's result already equals the constant, but the cell still changes
+    assert result["cells_changed"] == 1
+    assert sheets[True].Range("B2").Formula == sheets[False].Range("B2").Formula == 2
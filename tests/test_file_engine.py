@@ -0,0 +1,225 @@
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.errors import ToolError
+from excellm.core.file_engine import EDIT_MODE, READ_ONLY_MODE, FileEngine
+
+
+def test_read_uses_read_only_mode(temp_excel_file):
+    engine = FileEngine()
+
+    data = engine.read_range(temp_excel_file, "Data", "A1:B2")
+
+    assert data == [["Month", "Sales"], ["Jan", 100]]
+    workbooks = engine.list_workbooks()
+    assert workbooks[0]["mode"] == READ_ONLY_MODE
+    assert workbooks[0]["load_time_ms"] >= 0
+
+
+def test_read_past_last_row_matches_edit_mode(temp_excel_file):
+    engine = FileEngine()
+
+    data = engine.read_range(temp_excel_file, "Data", "A4:B6")
+
+    assert data == [["Mar", 110], [None, None], [None, None]]
+
+
+def test_write_upgrades_to_edit_mode(temp_excel_file):
+    engine = FileEngine()
+    engine.read_range(temp_excel_file, "Data", "A1:A1")
+
+    result = engine.write_range(temp_excel_file, "Data", "E1", [["Note"]])
+
+    assert result["success"] is True
+    assert engine.list_workbooks()[0]["mode"] == EDIT_MODE
+    assert engine.read_range(temp_excel_file, "Data", "E1:E1") == [["Note"]]
+
+    # Change is on disk for a fresh engine
+    assert FileEngine().read_range(temp_excel_file, "Data", "E1:E1") == [["Note"]]
+
+
+def test_sheet_ops_upgrade_to_edit_mode(temp_excel_file):
+    engine = FileEngine()
+    assert engine.get_sheet_names(temp_excel_file) == ["Data"]
+
+    engine.create_sheet(temp_excel_file, "Extra")
+    assert engine.list_workbooks()[0]["mode"] == EDIT_MODE
+
+    engine.delete_sheet(temp_excel_file, "Extra")
+    assert engine.get_sheet_names(temp_excel_file) == ["Data"]
+
+
+def test_deferred_durability_coalesces_saves(temp_excel_file):
+    engine = FileEngine(durability="deferred", flush_interval_ms=0, flush_every=3)
+
+    first = engine.write_range(temp_excel_file, "Data", "E1", [["a"]])
+    second = engine.write_range(temp_excel_file, "Data", "E2", [["b"]])
+
+    assert first["durability"] == {"mode": "deferred", "saved": False, "pending_writes": 1}
+    assert second["durability"]["pending_writes"] == 2
+    assert FileEngine().read_range(temp_excel_file, "Data", "E1:E2") == [[None], [None]]
+
+    third = engine.write_range(temp_excel_file, "Data", "E3", [["c"]])
+
+    assert third["durability"]["saved"] is True
+    assert FileEngine().read_range(temp_excel_file, "Data", "E1:E3") == [["a"], ["b"], ["c"]]
+
+
+def test_explicit_flush_saves_pending_writes(temp_excel_file):
+    engine = FileEngine(durability="deferred", flush_interval_ms=0, flush_every=0)
+    engine.write_range(temp_excel_file, "Data", "E1", [["a"]])
+
+    result = engine.flush()
+
+    assert result["flushed"] == [os.path.abspath(temp_excel_file)]
+    assert engine.flush()["flushed"] == []
+    assert FileEngine().read_range(temp_excel_file, "Data", "E1:E1") == [["a"]]
+
+
+def test_immediate_durability_reports_saved(temp_excel_file):
+    engine = FileEngine(durability="immediate")
+
+    result = engine.create_sheet(temp_excel_file, "Extra")
+
+    assert result["durability"] == {"mode": "immediate", "saved": True, "pending_writes": 0}
+
+
+def test_cache_revalidates_against_file_changes(temp_excel_file):
+    from openpyxl import load_workbook
+
+    engine = FileEngine()
+    assert engine.read_range(temp_excel_file, "Data", "A2:A2") == [["Jan"]]
+
+    wb = load_workbook(temp_excel_file)
+    wb["Data"]["A2"] = "January"
+    wb["Data"]["F9"] = "grow the file"
+    wb.save(temp_excel_file)
+
+    assert engine.read_range(temp_excel_file, "Data", "A2:A2") == [["January"]]
+    stats = engine.cache_stats()
+    assert stats["invalidations"] == 1
+    assert stats["misses"] == 2
+
+
+def test_cache_evicts_and_flushes_dirty_entries(temp_excel_file, tmp_path):
+    import shutil
+
+    other = str(tmp_path / "other.xlsx")
+    shutil.copy(temp_excel_file, other)
+
+    # Budget too small for two workbooks forces eviction on the second load
+    engine = FileEngine(durability="deferred", flush_interval_ms=0, flush_every=0, cache_max_mb=0)
+    engine._workbook_cache.max_bytes = 1
+    engine.write_range(temp_excel_file, "Data", "E1", [["pending"]])
+
+    engine.read_range(other, "Data", "A1:A1")
+
+    stats = engine.cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 1
+    assert FileEngine().read_range(temp_excel_file, "Data", "E1:E1") == [["pending"]]
+
+
+def test_snapshot_reads_match_direct_reads(temp_excel_file):
+    plain = FileEngine()
+    snap = FileEngine(snapshots=True)
+
+    for ref in ("A1:B4", "B2:C3", "A3:B6"):
+        assert snap.read_range(temp_excel_file, "Data", ref) == plain.read_range(
+            temp_excel_file, "Data", ref
+        )
+    assert "Data" in snap._workbook_cache.peek(os.path.abspath(temp_excel_file)).snapshots
+
+
+def test_snapshot_invalidated_by_write(temp_excel_file):
+    engine = FileEngine(snapshots=True)
+    assert engine.read_range(temp_excel_file, "Data", "A2:A2") == [["Jan"]]
+
+    engine.write_range(temp_excel_file, "Data", "A2", [["January"]])
+
+    assert engine.read_range(temp_excel_file, "Data", "A2:A2") == [["January"]]
+    assert engine._workbook_cache.peek(os.path.abspath(temp_excel_file)).version == 1
+
+
+def test_unique_values_with_and_without_snapshots(temp_excel_file):
+    plain = FileEngine().get_unique_values(temp_excel_file, "Data", "A2:A4")
+    snap = FileEngine(snapshots=True).get_unique_values(temp_excel_file, "Data", "A2:A4")
+
+    assert plain["unique_count"] == 3
+    assert sorted(v["value"] for v in plain["values"]) == ["Feb", "Jan", "Mar"]
+    assert snap["values"] == plain["values"]
+
+
+def test_search_filters_rows(temp_excel_file):
+    engine = FileEngine(snapshots=True)
+
+    result = engine.search(
+        temp_excel_file, "Data", {"column": {"type": "name", "value": "Sales"}, "operator": ">", "value": 105}
+    )
+
+    assert result["columns"] == ["Month", "Sales", "Profit", "Region"]
+    assert result["rows_filtered"] == 2
+    assert result["cell_locations"] == ["A3", "A4"]
+
+
+def test_batch_runs_ops_with_a_single_save(temp_excel_file, monkeypatch):
+    engine = FileEngine(durability="immediate")
+    saves = []
+    original = engine._write_entry
+    monkeypatch.setattr(
+        engine, "_write_entry", lambda path, entry: (saves.append(path), original(path, entry))
+    )
+
+    result = engine.execute_batch(temp_excel_file, [
+        {"op": "create_sheet", "sheet": "Summary"},
+        {"op": "write", "sheet": "Summary", "range": "A1", "data": [["Total", 330]]},
+        {"op": "write", "sheet": "Data", "range": "E1", "data": [["Note"]]},
+        {"op": "read", "sheet": "Summary", "range": "A1:B1"},
+        {"op": "sheet_names"},
+    ])
+
+    assert result["success"] is True
+    assert result["saved"] is True
+    assert len(saves) == 1
+    assert [r["op"] for r in result["results"]] == [
+        "create_sheet", "write", "write", "read", "sheet_names"
+    ]
+    assert result["results"][3]["data"] == [["Total", 330]]
+    assert result["results"][4]["sheets"] == ["Data", "Summary"]
+    assert FileEngine().read_range(temp_excel_file, "Summary", "A1:B1") == [["Total", 330]]
+
+
+def test_batch_reports_per_op_errors(temp_excel_file):
+    engine = FileEngine(durability="immediate")
+    ops = [
+        {"op": "read", "sheet": "Missing", "range": "A1"},
+        {"op": "read", "sheet": "Data", "range": "A1"},
+    ]
+
+    stopped = engine.execute_batch(temp_excel_file, ops)
+    assert stopped["success"] is False
+    assert stopped["results"][0]["error"]["code"] == "SHEET_NOT_FOUND"
+    assert stopped["results"][1]["skipped"] is True
+    assert stopped["saved"] is False
+
+    continued = engine.execute_batch(temp_excel_file, ops, stop_on_error=False)
+    assert continued["ops_failed"] == 1
+    assert continued["results"][1]["data"] == [["Month"]]
+
+
+def test_batch_is_validated_before_running(temp_excel_file):
+    engine = FileEngine()
+
+    with pytest.raises(ToolError) as excinfo:
+        engine.execute_batch(temp_excel_file, [
+            {"op": "create_sheet", "sheet": "New"},
+            {"op": "write", "sheet": "New", "range": "A1"},
+        ])
+
+    assert excinfo.value.code == "VALIDATION_ERROR"
+    assert engine.get_sheet_names(temp_excel_file) == ["Data"]
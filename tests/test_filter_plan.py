@@ -0,0 +1,169 @@
+import itertools
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.filters import FilterEngine, FilterGroup, SingleFilter, compile_filter, plan_filter
+from excellm.filters_vector import NUMPY_AVAILABLE, is_vectorizable
+
+needs_numpy = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy is not installed")
+
+HEADERS = ["Name", "Amount", "Note"]
+
+CELLS = [
+    None, "", " ", 0, 1, 5, 5.0, 12.5, -3, True, False, "5", " 5 ", "5.0", "$1,200", "1,200.50",
+    "abc", "ABC ", " Abc def", "defabc", "N/A", "True", "x(1)", 10 ** 20,
+]
+
+FILTER_VALUES = [None, "", "5", " 5", "abc", "ABC", 5, 5.0, 0, True, "$1,200", "a.c", "(", "N/A"]
+
+
+def single_filters():
+    for op in ("=", "!=", ">", ">=", "<", "<=", "contains", "starts_with", "ends_with", "regex",
+               "is_empty", "not_empty"):
+        for value in FILTER_VALUES:
+            for strict in (False, True):
+                yield SingleFilter({"type": "letter", "value": "B"}, op, value, strict_type=strict)
+    for value, value2 in ((1, 10), ("0", "$2,000"), (None, 5), (5, 5)):
+        yield SingleFilter({"type": "index", "value": 2}, "between", value, value2)
+    for values in (["abc", "N/A"], ["5", "abc"], [5, "x"], [5.0], "abc", []):
+        for op in ("in", "not_in"):
+            for strict in (False, True):
+                yield SingleFilter({"type": "name", "value": "amount"}, op, values, strict_type=strict)
+
+
+def assert_same(filters, rows):
+    engine = FilterEngine()
+    plan = compile_filter(filters, HEADERS)
+    for row in rows:
+        expected = engine._matches_filter(row, filters, HEADERS)
+        assert plan.matches(row) == expected, (filters, row)
+        assert plan.test(row) is bool(expected), (filters, row)
+
+
+def test_single_conditions_match_reference():
+    rows = [["n", cell, "note"] for cell in CELLS]
+    for filters in single_filters():
+        assert_same(filters, rows)
+
+
+def test_groups_any_column_and_missing_columns():
+    rows = [list(combo) for combo in itertools.product(["abc", None, "x"], [5, "12", None], ["abc", 7])]
+    rows.append(["short"])
+    trees = [
+        SingleFilter(None, "contains", "ab"),
+        FilterGroup("and", [SingleFilter(None, "contains", "ab"), {"column": {"type": "letter", "value": "B"},
+                                                                     "operator": ">", "value": 4}]),
+        FilterGroup("or", [SingleFilter(None, "=", "abc"), SingleFilter({"type": "letter", "value": "C"}, "=", 7)]),
+        FilterGroup("not", [SingleFilter(None, "is_empty")]),
+        FilterGroup("or", [FilterGroup("not", []), SingleFilter({"type": "name", "value": "Missing"}, "=", "x")]),
+        FilterGroup("and", []),
+        SingleFilter({"type": "letter", "value": "ZZ"}, "not_empty"),
+        SingleFilter({"type": "letter", "value": "1"}, "not_empty"),
+    ]
+    for filters in trees:
+        assert_same(filters, rows)
+
+
+def test_apply_filter_runs_compiled_plan():
+    data = [HEADERS, ["a", "$1,000", "x"], ["b", 50, "abc"], ["c", "n/a", None]]
+    result = FilterEngine().apply_filter(
+        data, {"operator": "or", "conditions": [
+            {"column": {"type": "name", "value": "Amount"}, "operator": ">=", "value": "999"},
+            {"operator": "regex", "value": "^AB"},
+        ]}, start_row=2
+    )
+    assert result["data"] == data[:3]
+    assert result["cell_locations"] == ["B2", "C3"]
+
+    rows, indices = FilterEngine().filter_data(data[1:], "N/A", HEADERS)
+    assert rows == [data[3]] and indices == [2]
+
+
+def test_planner_runs_cheap_deciding_conditions_first():
+    PATTERN = r"item \d+5$"
+    rows = [[f"item {r}", r % 1000, "open" if r % 4 else "void"] for r in range(2000)]
+    amount = {"type": "name", "value": "Amount"}
+    tree = FilterGroup("or", [
+        FilterGroup("and", [
+            SingleFilter(None, "regex", PATTERN),
+            SingleFilter(amount, ">", 990),
+        ]),
+        SingleFilter(None, "contains", "zzz"),
+        SingleFilter({"type": "name", "value": "Note"}, "=", "open"),
+    ])
+
+    planned, report = plan_filter(tree, HEADERS, rows[:256])
+    assert report["sample_rows"] == 256 and report["operator"] == "or"
+    # The common, cheap equality first; the search across all columns for a missing value last
+    assert [c["position"] for c in report["conditions"]] == [2, 0, 1]
+    inner = report["conditions"][1]
+    assert [c["condition"] for c in inner["conditions"]] == ["Amount > 990", f"any column regex {PATTERN!r}"]
+    assert inner["conditions"][0]["match_rate"] < 0.01 < inner["conditions"][1]["match_rate"]
+    assert tree.conditions[0].conditions[0].operator.value == "regex"  # Input left as written
+
+    engine, unplanned = FilterEngine(backend="python"), FilterEngine(backend="python", plan_rows=0)
+    assert engine.filter_data(rows, tree, HEADERS) == unplanned.filter_data(rows, tree, HEADERS)
+    assert engine.last_plan == report and unplanned.last_plan is None
+    single = SingleFilter(amount, ">", 1)
+    assert plan_filter(single, HEADERS, rows) == (single, None)
+
+
+def test_planned_order_selects_the_same_rows():
+    rows = [list(combo) for combo in itertools.product(["abc", None, "x"], [5, "12", None], ["abc", 7])]
+    rows.append(["short"])
+    trees = [
+        FilterGroup("and", [SingleFilter(None, "contains", "ab"),
+                            SingleFilter({"type": "letter", "value": "B"}, ">", 4)]),
+        FilterGroup("or", [SingleFilter(None, "regex", "^x"), SingleFilter({"type": "letter", "value": "C"}, "=", 7),
+                           FilterGroup("not", [SingleFilter({"type": "letter", "value": "A"}, "is_empty")])]),
+        FilterGroup("and", [FilterGroup("or", [SingleFilter(None, "=", "abc"), SingleFilter(None, "=", 5)]),
+                            FilterGroup("and", []), SingleFilter({"type": "name", "value": "Missing"}, "=", "x")]),
+    ]
+    for plan_rows in (1, 5, 100):
+        for filters in trees:
+            expected = FilterEngine(backend="python", plan_rows=0).filter_data(rows, filters, HEADERS)
+            assert FilterEngine(plan_rows=plan_rows).filter_data(rows, filters, HEADERS) == expected
+
+
+@needs_numpy
+def test_numpy_backend_selects_the_same_rows():
+    rows = [[f"n{i}", cell, note] for i, (cell, note) in enumerate(itertools.product(CELLS, ["abc", None, 7]))]
+    rows.append(["short"])
+    trees = list(single_filters()) + [
+        FilterGroup("and", [SingleFilter({"type": "letter", "value": "B"}, ">", 0),
+                            SingleFilter(None, "contains", "ab")]),
+        FilterGroup("or", [SingleFilter({"type": "letter", "value": "C"}, "regex", "^a"),
+                           FilterGroup("not", [SingleFilter({"type": "letter", "value": "B"}, "not_empty")])]),
+        FilterGroup("and", [SingleFilter({"type": "letter", "value": "B"}, "in", ["abc", 5, "$1,200"]),
+                            FilterGroup("or", [])]),
+    ]
+    python, vector = FilterEngine(backend="python"), FilterEngine(backend="numpy")
+    for filters in trees:
+        expected = python.filter_data(rows, filters, HEADERS)
+        assert vector.filter_data(rows, filters, HEADERS) == expected, filters
+        assert vector.last_backend == ("numpy" if is_vectorizable(filters, HEADERS) else "python")
+
+
+@needs_numpy
+def test_numpy_backend_in_apply_filter_and_auto():
+    data = [HEADERS] + [[f"n{r}", r * 10, "abc" if r % 3 else "x"] for r in range(5000)]
+    filters = {"operator": "and", "conditions": [
+        {"column": {"type": "name", "value": "Amount"}, "operator": "between", "value": 100, "value2": 400},
+        {"operator": "contains", "value": "ab"},
+    ]}
+    engine = FilterEngine(backend="auto")
+    result = engine.apply_filter(data, filters, start_row=2)
+    assert engine.last_backend == "numpy"
+    assert result == FilterEngine(backend="python").apply_filter(data, filters, start_row=2)
+    assert result["rows_filtered"] == 21 and result["cell_locations"][:3] == ["B12", "C12", "B13"]
+
+    # Small inputs and trees with no array form stay row by row
+    engine.filter_data(data[1:10], filters, HEADERS)
+    assert engine.last_backend == "python"
+    engine.filter_data(data[1:], "abc", HEADERS)
+    assert engine.last_backend == "python"
@@ -0,0 +1,108 @@
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.errors import ToolError
+from excellm.core.utils import cell_blocks, compile_find_pattern
+from excellm.tools.range_ops import find_replace_sync
+
+
+@pytest.fixture
+def status_sheet(fake_excel):
+    rows = [["Id", "Status", "Note"]]
+    for r in range(1, 41):
+        rows.append([r, "Open" if r % 4 else "closed", f"ticket {r}" if r % 10 else None])
+    book = fake_excel.app.add_workbook("Tickets.xlsx", {"Data": rows})
+    return book.Worksheets("Data")
+
+
+def test_wildcards_and_blocks():
+    assert compile_find_pattern("t*t ?").fullmatch("TICKET 7")
+    assert not compile_find_pattern("t*t ?", match_case=True).fullmatch("TICKET 7")
+    assert compile_find_pattern("~*~?").fullmatch("*?")
+    assert compile_find_pattern(r"ticket \d+$", use_regex=True).search("ticket 12")
+    assert cell_blocks([(0, 1), (0, 2), (1, 1), (1, 2), (3, 0)]) == [(0, 1, 1, 2), (3, 0, 3, 0)]
+
+
+def test_memory_replace_writes_only_matched_blocks(status_sheet):
+    app = status_sheet.app
+    app.calls.clear()
+
+    result = find_replace_sync("Tickets.xlsx", "Data", "open", "In progress", match_entire_cell=True)
+
+    sheet_result = result["results"][0]
+    assert result["total_matches"] == 30 and result["total_replacements"] == 30
+    assert sheet_result["method"] == "memory"
+    assert sheet_result["match_addresses"] == ["B2:B4", "B6:B8", "B10:B12", "B14:B16", "B18:B20",
+                                               "B22:B24", "B26:B28", "B30:B32", "B34:B36", "B38:B40"]
+    # Same value everywhere: one multi-area write, no Find round-trips
+    assert sheet_result["write_calls"] == 1 and app.calls["Range.Value="] == 1
+    assert app.calls["Range.Find"] == 0 and app.calls["Recalculate"] == 1
+    assert status_sheet.Range("B2").Value == "In progress"
+    assert status_sheet.Range("B5").Value == "closed"
+
+
+def test_part_match_regex_and_numbers(status_sheet):
+    result = find_replace_sync("Tickets.xlsx", "Data", r"ticket (\d+)", r"T-\1", use_regex=True)
+    assert result["total_replacements"] == 36
+    assert status_sheet.Range("C2").Value == "T-1"
+    assert status_sheet.Range("C11").Value is None
+
+    # Numbers match by their text and stay numbers
+    preview = find_replace_sync("Tickets.xlsx", "Data", "3", "9", range_str="A2:A41", preview_only=True)
+    assert preview["total_matches"] == 13 and preview["total_replacements"] == 0
+    find_replace_sync("Tickets.xlsx", "Data", "3", "9", range_str="A2:A41")
+    assert status_sheet.Range("A4").Value == 9 and status_sheet.Range("A34").Value == 99
+
+
+def test_formula_cells_are_not_overwritten(status_sheet):
+    status_sheet.Range("D2").Value = "=B2"
+    status_sheet.formula_results[(2, 4)] = "Open"
+
+    result = find_replace_sync("Tickets.xlsx", "Data", "Open", "Done", range_str="B2:D2")
+
+    assert result["results"][0]["formula_cells_skipped"] == 1
+    assert result["total_matches"] == 2 and result["total_replacements"] == 1
+    assert status_sheet.Range("D2").Formula == "=B2"
+
+
+def test_com_fallback_and_validation(status_sheet, monkeypatch):
+    monkeypatch.setattr("excellm.tools.range_ops.FIND_REPLACE_MAX_CELLS", 10)
+    result = find_replace_sync("Tickets.xlsx", "Data", "closed", "Closed", match_case=True)
+
+    assert result["results"][0]["method"] == "com"
+    assert result["total_matches"] == 10 and "match_addresses" not in result["results"][0]
+    assert status_sheet.app.calls["Range.FindNext"] == 10
+    assert status_sheet.Range("B5").Value == "Closed"
+
+    for kwargs in ({"find_value": ""}, {"method": "fast"}, {"use_regex": True, "method": "com"},
+                   {"find_value": "(", "use_regex": True}):
+        with pytest.raises(ToolError) as excinfo:
+            find_replace_sync("Tickets.xlsx", "Data", **{"find_value": "x", **kwargs})
+        assert excinfo.value.code == "VALIDATION_ERROR"
+
+
+def test_dates_match_on_displayed_text(status_sheet):
+    app = status_sheet.app
+    for r in range(2, 42):
+        status_sheet.Range(f"D{r}").Value = 45292 + r  # Dates from 2024-01-03 on, as Value2
+    status_sheet.Range("D2:D41").NumberFormat = "m/d/yyyy"
+    status_sheet.Range("E2").Value = 45
+
+    # The serial numbers hold "45" but the cells show dates
+    app.calls.clear()
+    result = find_replace_sync("Tickets.xlsx", "Data", "45", "46", range_str="D2:E41")
+    assert result["total_matches"] == 1 and status_sheet.Range("E2").Value == 46
+    assert status_sheet.Range("D2").Value == 45294
+    # No round-trip per cell: one Find in the date column, none elsewhere
+    assert app.calls["Range.Text"] == 0 and app.calls["Range.Find"] == 1
+
+    result = find_replace_sync("Tickets.xlsx", "Data", "1/1", "x", range_str="D2:E41")
+    sheet_result = result["results"][0]
+    assert sheet_result["match_addresses"] == ["D9:D18"] and sheet_result["replacements_made"] == 0
+    assert sheet_result["formatted_cells_skipped"] == 10
+    assert status_sheet.Range("D9").Value == 45301
@@ -0,0 +1,131 @@
+import os
+import sys
+
+import openpyxl
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core import parallel_search
+from excellm.core.parallel_search import SheetBlock, filter_block, search_blocks
+from excellm.tools.search import search_sync
+
+
+@pytest.fixture(autouse=True)
+def small_pool(monkeypatch):
+    monkeypatch.setattr(parallel_search, "SEARCH_WORKERS", 2)
+    monkeypatch.setattr(parallel_search, "MIN_PARALLEL_CELLS", 0)
+    yield
+    parallel_search._reset_pool()
+
+
+@pytest.fixture
+def regions_book(fake_excel):
+    sheets = {
+        name: [["Id", "Region", "Amount"]] + [
+            [f"{name}-{r}", ("North", "South", "East")[r % 3], r * 5] for r in range(1, 61)
+        ]
+        for name in ("Jan", "Feb", "Mar", "Apr")
+    }
+    book = fake_excel.app.add_workbook("Regions.xlsx", sheets)
+    book._sheets[2].Visible = 0  # Mar is hidden
+    return book
+
+
+def comparable(result):
+    return [(r["sheet"], r["rows_filtered"], r["data"], r["cell_locations"]) for r in result["results"]]
+
+
+def test_parallel_matches_sequential(regions_book):
+    filters = {"operator": "and", "conditions": [
+        {"column": {"type": "name", "value": "Region"}, "operator": "=", "value": "north"},
+        {"column": {"type": "name", "value": "Amount"}, "operator": ">", "value": 200},
+    ]}
+    sequential = search_sync("Regions.xlsx", filters, all_sheets=True)
+    parallel = search_sync("Regions.xlsx", filters, all_sheets=True, parallel=True)
+
+    assert parallel["parallel"] is True
+    assert [r["sheet"] for r in parallel["results"]] == ["Jan", "Feb", "Apr"]
+    assert comparable(parallel) == comparable(sequential)
+    assert parallel["results"][0]["cell_locations"][0] == "A43"
+    assert parallel["sheets_searched"] == 3 and "truncated" not in parallel
+
+
+def test_global_max_rows_stops_reading_sheets(regions_book):
+    result = search_sync("Regions.xlsx", "south", all_sheets=True, max_rows=25, parallel=True)
+    assert result["total_rows_filtered"] == 25 and result["truncated"] is True
+    assert [(r["sheet"], r["rows_filtered"]) for r in result["results"]] == [("Jan", 20), ("Feb", 5)]
+
+    read = []
+
+    def blocks():
+        for name in ("A", "B", "C"):
+            read.append(name)
+            yield SheetBlock(name, "A1:A11", 1, [["Name"]] + [["south"]] * 10)
+
+    result = search_blocks(blocks(), "south", max_rows=15, parallel=False)
+    assert read == ["A", "B"] and result["sheets_searched"] == 2
+    assert result["results"][1]["cell_locations"] == ["A2", "A3", "A4", "A5", "A6"]
+
+
+def test_sheet_timeout_stops_a_block():
+    data = [["Name"]] + [[f"row {r}"] for r in range(25000)]
+    result = filter_block(data, "row", True, time_budget=1e-9)
+    assert result["timed_out"] is True
+    assert result["rows_scanned"] == parallel_search.CHUNK_ROWS
+    assert len(result["row_indices"]) == parallel_search.CHUNK_ROWS
+
+    limited = filter_block(data, "row 2", True, limit=3)
+    assert limited["row_indices"] == [2, 20, 21] and limited["limited"] is True
+
+
+def test_workbook_file_all_sheets(fake_excel, tmp_path):
+    path = str(tmp_path / "closed.xlsx")
+    wb = openpyxl.Workbook()
+    wb.active.title = "One"
+    wb.active.append(["Name", "Qty"])
+    wb.active.append(["apple", 1])
+    two = wb.create_sheet("Two")
+    two.append(["Name", "Qty"])
+    for name in ("pear", "apple pie", "apple"):
+        two.append([name, 2])
+    hidden = wb.create_sheet("Hidden")
+    hidden.append(["apple"])
+    hidden.sheet_state = "hidden"
+    wb.save(path)
+
+    for parallel in (False, True):
+        result = search_sync(path, "apple", all_sheets=True, parallel=parallel, sheet_timeout=30)
+        assert result["sheets_searched"] == 2 and result["total_rows_filtered"] == 3
+        assert [(r["sheet"], r["cell_locations"]) for r in result["results"]] == [
+            ("One", ["A2"]), ("Two", ["A3", "A4"]),
+        ]
+
+
+def test_filter_block_plans_on_the_first_chunk_only(monkeypatch):
+    plans = []
+    plan_filter = parallel_search.plan_filter
+    monkeypatch.setattr(parallel_search, "plan_filter", lambda *args: plans.append(args) or plan_filter(*args))
+    monkeypatch.setattr(parallel_search, "CHUNK_ROWS", 10)
+    data = [["Id", "Region"]] + [[r, "North" if r % 4 else "South"] for r in range(100)]
+    filters = {"operator": "and", "conditions": [
+        {"column": {"type": "name", "value": "Id"}, "operator": ">=", "value": 0},
+        {"column": {"type": "name", "value": "Region"}, "operator": "=", "value": "South"},
+    ]}
+
+    result = filter_block(data, filters, has_header=True)
+
+    assert result["row_indices"] == list(range(0, 100, 4))
+    assert len(plans) == 1 and len(plans[0][2]) == 10
+
+
+def test_exact_max_rows_is_truncated_only_if_sheets_remain(regions_book):
+    every = search_sync("Regions.xlsx", "south", all_sheets=True, max_rows=60, parallel=True)
+    assert every["total_rows_filtered"] == 60 and "truncated" not in every
+    two = search_sync("Regions.xlsx", "south", all_sheets=True, max_rows=40, parallel=True)
+    assert two["total_rows_filtered"] == 40 and two["truncated"] is True
+
+    blocks = [SheetBlock(f"S{n}", "A1:A3", 1, [["x"], ["a"], ["a"]]) for n in range(2)]
+    assert "truncated" not in search_blocks(blocks, "a", has_header=False, max_rows=4, parallel=False)
+    assert search_blocks(blocks, "a", has_header=False, max_rows=2, parallel=False)["truncated"] is True
@@ -0,0 +1,80 @@
+import datetime
+import os
+import sys
+import zipfile
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from openpyxl import Workbook, load_workbook
+
+from excellm.core.file_engine import SAVE_FULL, SAVE_PARTIAL, FileEngine
+
+
+@pytest.fixture
+def report_workbook(tmp_path):
+    path = str(tmp_path / "report.xlsx")
+    wb = Workbook()
+    wb.active.title = "Sheet0"
+    for i in range(1, 4):
+        wb.create_sheet(f"Sheet{i}")
+    for ws in wb.worksheets:
+        for r in range(1, 51):
+            ws.append([f"{ws.title} row {r}", r, r * 1.5])
+    wb.save(path)
+    return path
+
+
+def raw_members(path):
+    with zipfile.ZipFile(path) as archive:
+        return {info.filename: (info.CRC, info.compress_size) for info in archive.infolist()}
+
+
+def test_write_rewrites_only_the_dirty_sheet(report_workbook):
+    before = raw_members(report_workbook)
+    engine = FileEngine(partial_save=True)
+
+    engine.write_range(report_workbook, "Sheet2", "B2", [[999]])
+
+    assert engine.list_workbooks()[0]["last_save"] == SAVE_PARTIAL
+    after = raw_members(report_workbook)
+    changed = {name for name in after if after[name] != before.get(name)}
+    assert changed == {"xl/worksheets/sheet3.xml"}
+    with zipfile.ZipFile(report_workbook) as archive:
+        assert archive.testzip() is None
+
+    wb = load_workbook(report_workbook)
+    assert wb["Sheet2"]["B2"].value == 999
+    assert wb["Sheet2"]["A2"].value == "Sheet2 row 2"
+    assert wb["Sheet1"]["A50"].value == "Sheet1 row 50"
+    assert not [f for f in os.listdir(os.path.dirname(report_workbook)) if f.endswith(".tmp")]
+
+
+def test_new_styles_rewrite_the_stylesheet(report_workbook):
+    engine = FileEngine(partial_save=True)
+
+    engine.write_range(report_workbook, "Sheet1", "D1", [[datetime.datetime(2024, 5, 1)]])
+
+    assert engine.list_workbooks()[0]["last_save"] == SAVE_PARTIAL
+    wb = load_workbook(report_workbook)
+    assert wb["Sheet1"]["D1"].value == datetime.datetime(2024, 5, 1)
+    assert wb["Sheet1"]["D1"].is_date
+
+
+def test_structure_changes_use_a_full_save(report_workbook):
+    engine = FileEngine(partial_save=True)
+
+    engine.create_sheet(report_workbook, "Extra")
+
+    assert engine.list_workbooks()[0]["last_save"] == SAVE_FULL
+    assert "Extra" in load_workbook(report_workbook).sheetnames
+
+
+def test_partial_save_is_opt_in(report_workbook):
+    engine = FileEngine()
+
+    engine.write_range(report_workbook, "Sheet0", "B2", [[1]])
+
+    assert engine.list_workbooks()[0]["last_save"] == SAVE_FULL
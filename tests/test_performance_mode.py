@@ -0,0 +1,92 @@
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.performance import (
+    XL_CALCULATION_AUTOMATIC,
+    XL_CALCULATION_MANUAL,
+    PerformanceMode,
+)
+from excellm.tools.batch import execute_batch_sync
+from excellm.tools.sheet_mgmt import insert_sync
+
+
+def app_settings(app):
+    return (app.ScreenUpdating, app.EnableEvents, app.Calculation)
+
+
+def test_settings_are_restored_exactly(fake_excel):
+    app = fake_excel.app
+    sheet = app.Workbooks("Book1.xlsx").Worksheets("Data")
+
+    with pytest.raises(RuntimeError):
+        with PerformanceMode(app):
+            assert app_settings(app) == (False, False, XL_CALCULATION_MANUAL)
+            sheet.Range("B2").Value = 1
+            raise RuntimeError("boom")
+    assert app_settings(app) == (True, True, XL_CALCULATION_AUTOMATIC)
+    assert app.calls["Recalculate"] == 1
+
+    # Already manual and events off: only ScreenUpdating is switched, nothing recalculates
+    app.Calculation = XL_CALCULATION_MANUAL
+    app.EnableEvents = False
+    with PerformanceMode(app) as mode:
+        sheet.Range("B3").Value = 2
+    assert app_settings(app) == (True, False, XL_CALCULATION_MANUAL)
+    assert mode.report() == {
+        "enabled": True, "nested": False, "suspended": ["ScreenUpdating"], "recalculated": False,
+    }
+    assert app.calls["Recalculate"] == 1
+
+
+def test_nested_blocks_restore_once(fake_excel):
+    app = fake_excel.app
+    with PerformanceMode(app) as outer:
+        with PerformanceMode(app) as inner:
+            pass
+        assert inner.nested and inner.report()["suspended"] == []
+        assert app_settings(app) == (False, False, XL_CALCULATION_MANUAL)
+    assert not outer.nested
+    assert app_settings(app) == (True, True, XL_CALCULATION_AUTOMATIC)
+
+    with PerformanceMode(app, enabled=False) as off:
+        assert app_settings(app) == (True, True, XL_CALCULATION_AUTOMATIC)
+    assert off.report()["enabled"] is False
+
+
+def test_insert_recalculates_once(fake_excel):
+    app = fake_excel.app
+
+    # One Insert call for all 20 rows
+    insert_sync("Book1.xlsx", "Data", "row", "2", count=20)
+    assert app.calls["Insert"] == 1
+    assert app.calls["Recalculate"] == 1
+    assert app.calls["SheetChange"] == 1
+
+    result = insert_sync("Book1.xlsx", "Data", "row", "2", count=20, performance_mode=True)
+    assert app.calls["Recalculate"] == 2
+    assert app.calls["SheetChange"] == 1
+    assert app.calls["Repaint"] == 1
+    assert result["performance_mode"]["recalculated"] is True
+    assert result["performance_mode"]["suspended"] == ["ScreenUpdating", "EnableEvents", "Calculation"]
+    assert app.Workbooks("Book1.xlsx").Worksheets("Data").Range("A42").Value == "Jan"
+    assert app_settings(app) == (True, True, XL_CALCULATION_AUTOMATIC)
+
+
+def test_batch_runs_in_one_block(fake_excel):
+    app = fake_excel.app
+    operations = [
+        {"op": "write", "sheet": "Data", "range": f"C{row}", "data": [[row]]}
+        for row in range(1, 11)
+    ]
+
+    result = execute_batch_sync("Book1.xlsx", operations, performance_mode=True)
+
+    assert result["success"] and result["ops_run"] == 10
+    assert result["performance_mode"]["recalculated"] is True
+    assert app.calls["Recalculate"] == 1
+    assert app_settings(app) == (True, True, XL_CALCULATION_AUTOMATIC)
@@ -0,0 +1,84 @@
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.com_worker import ComWorker
+from excellm.core.cursor import encode_cursor
+from excellm.core.errors import ToolError
+from excellm.tools.readers import read_range_sync
+from excellm.tools.writers import write_range_sync
+
+
+@pytest.fixture
+def long_sheet(fake_excel):
+    return fake_excel.app.add_workbook("Long.xlsx", {"Data": [[f"r{r}", r] for r in range(1, 26)]})
+
+
+def read_all_pages(first):
+    pages = [first]
+    while "next_cursor" in pages[-1]:
+        pages.append(read_range_sync("Long.xlsx", cursor=pages[-1]["next_cursor"]))
+    return pages
+
+
+def test_cursor_pages_through_range(long_sheet):
+    first = read_range_sync("Long.xlsx", "Data", max_rows=10, include_formulas="never")
+    pages = read_all_pages(first)
+
+    assert [p["rows"] for p in pages] == [10, 10, 5]
+    assert [(p["start_row"], p["end_row"]) for p in pages] == [(1, 10), (11, 20), (21, 25)]
+    assert [row[0] for p in pages for row in p["data"]] == [f"r{r}" for r in range(1, 26)]
+    assert all(p["range"] == "A1:B25" and p["formula_read"] == "skipped" for p in pages)
+    assert pages[1]["total_available"] == 25
+    assert "truncated" not in pages[-1]
+
+
+def test_cursor_keeps_explicit_range(long_sheet):
+    first = read_range_sync("Long.xlsx", "Data", "B5:B12", max_rows=3)
+    pages = read_all_pages(first)
+    assert [row for p in pages for row in p["data"]] == [[str(r)] for r in range(5, 13)]
+    assert all(p["start_col"] == 2 for p in pages)
+
+
+def test_cursor_rejected_after_tool_write_or_growth(long_sheet):
+    first = read_range_sync("Long.xlsx", "Data", max_rows=10)
+    write_range_sync("Long.xlsx", "Data", "A3", [["edited"]], force_overwrite=True)
+    with pytest.raises(ToolError) as excinfo:
+        read_range_sync("Long.xlsx", cursor=first["next_cursor"])
+    assert excinfo.value.code == "STALE_CURSOR"
+
+    # A change no tool or event reported still moves the used range
+    first = read_range_sync("Long.xlsx", "Data", max_rows=10)
+    long_sheet.Worksheets("Data")._store(30, 1, "late")
+    with pytest.raises(ToolError) as excinfo:
+        read_range_sync("Long.xlsx", cursor=first["next_cursor"])
+    assert excinfo.value.code == "STALE_CURSOR"
+
+
+def test_cursor_rejected_after_edit_reported_by_excel(long_sheet):
+    worker = ComWorker()
+    first = worker.submit(read_range_sync, "Long.xlsx", "Data", max_rows=10).result()
+
+    # An edit in the Excel UI: only the SheetChange event reports it
+    long_sheet.Worksheets("Data").Range("A15").Value = "typed"
+    with pytest.raises(ToolError) as excinfo:
+        worker.submit(read_range_sync, "Long.xlsx", cursor=first["next_cursor"]).result()
+    worker.shutdown()
+    assert excinfo.value.code == "STALE_CURSOR"
+
+
+def test_invalid_cursors(long_sheet):
+    first = read_range_sync("Long.xlsx", "Data", max_rows=10)
+    bad = [
+        ("not-a-cursor", "Long.xlsx"),
+        (encode_cursor("search", {}), "Long.xlsx"),
+        (first["next_cursor"], "Book1.xlsx"),
+    ]
+    for cursor, workbook in bad:
+        with pytest.raises(ToolError) as excinfo:
+            read_range_sync(workbook, cursor=cursor)
+        assert excinfo.value.code == "INVALID_CURSOR"
@@ -0,0 +1,94 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.connection import MAX_FORMULA_AREAS
+from excellm.core.errors import ToolError
+from excellm.excel_session import ExcelSessionManager
+from excellm.tools.readers import read_range_sync
+
+
+def add_formulas(app, cells):
+    sheet = app.Workbooks("Book1.xlsx").Worksheets("Data")
+    for (row, col), (formula, value) in cells.items():
+        sheet._store(row, col, formula)
+        sheet.formula_results[(row, col)] = value
+    return sheet
+
+
+def test_pure_data_skips_formula_read(fake_excel):
+    app = fake_excel.app
+    result = read_range_sync("Book1.xlsx", "Data", "A1:B4")
+
+    assert result["formula_read"] == "none"
+    assert result["formulas"] == [[None, None]] * 4
+    assert app.calls["HasFormula"] == 1
+    assert app.calls["Range.Formula"] == 0
+    assert app.calls["cells_marshaled"] == 8
+
+
+def test_mixed_range_reads_only_formula_areas(fake_excel):
+    app = fake_excel.app
+    add_formulas(app, {(r, 3): (f"=B{r}*2", 2 * v) for r, v in ((2, 100), (3, 120), (4, 110))})
+
+    result = read_range_sync("Book1.xlsx", "Data", "A1:C4")
+
+    assert result["formula_read"] == "areas"
+    assert result["data"][1] == ["Jan", "100", "200"]
+    assert [row[2] for row in result["formulas"]] == [None, "=B2*2", "=B3*2", "=B4*2"]
+    assert all(row[:2] == [None, None] for row in result["formulas"])
+    assert app.calls["SpecialCells"] == 1
+    assert app.calls["cells_marshaled"] == 12 + 3
+
+    always = read_range_sync("Book1.xlsx", "Data", "A1:C4", include_formulas="always")
+    assert always["formula_read"] == "full"
+    assert always["formulas"] == result["formulas"]
+
+
+def test_all_formulas_and_scattered_formulas_read_in_full(fake_excel):
+    app = fake_excel.app
+    add_formulas(app, {(r, 3): (f"=B{r}", r) for r in range(1, 5)})
+    result = read_range_sync("Book1.xlsx", "Data", "C1:C4")
+    assert result["formula_read"] == "full"
+    assert app.calls["SpecialCells"] == 0
+
+    # Every other row: more areas than are worth fetching one by one
+    rows = range(10, 10 + 2 * (MAX_FORMULA_AREAS + 1), 2)
+    add_formulas(app, {(r, 1): ("=1", 1) for r in rows})
+    result = read_range_sync("Book1.xlsx", "Data", f"A10:B{rows[-1]}")
+    assert result["formula_read"] == "full"
+    assert result["formulas"][0] == ["=1", None]
+    assert result["formulas"][1] == [None, None]
+
+
+def test_never_and_invalid_modes(fake_excel):
+    app = fake_excel.app
+    result = read_range_sync("Book1.xlsx", "Data", "A1:B4", include_formulas="never")
+    assert result["formulas"] is None
+    assert result["formula_read"] == "skipped"
+    assert app.calls["HasFormula"] == 0
+
+    with pytest.raises(ToolError) as excinfo:
+        read_range_sync("Book1.xlsx", "Data", "A1:B4", include_formulas="sometimes")
+    assert excinfo.value.code == "VALIDATION_ERROR"
+
+
+def test_session_read_range_modes(fake_excel):
+    add_formulas(fake_excel.app, {(4, 2): ("=B2+B3", 220)})
+    session = ExcelSessionManager()
+
+    async def main():
+        return (
+            await session.read_range("Book1.xlsx", "Data", "A1:B4"),
+            await session.read_range("Book1.xlsx", "Data", "A1:B4", include_formulas="never"),
+        )
+
+    auto, never = asyncio.run(main())
+    assert auto["formula_read"] == "areas"
+    assert auto["formulas"][3] == [None, "=B2+B3"]
+    assert never["formulas"] is None
@@ -0,0 +1,134 @@
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core import connection
+from excellm.core.com_engine import COMEngine
+from excellm.core.search_index import SearchIndex, clear_indexes
+from excellm.filters import FilterEngine, to_filter_tree
+from excellm.tools.search import search_sync
+from excellm.tools.writers import write_range_sync
+
+HEADERS = ["Name", "City", "Amount"]
+
+
+@pytest.fixture(autouse=True)
+def no_cached_indexes():
+    clear_indexes()
+    yield
+    clear_indexes()
+
+
+@pytest.fixture
+def people_sheet(fake_excel):
+    cities = ["Cairo", "Giza", "Alexandria", "Luxor", " cairo "]
+    rows = [HEADERS] + [
+        [f"Person {r}", cities[r % 5], r * 3 if r % 7 else f"{r}"] for r in range(1, 301)
+    ]
+    rows.append(["Ünïcode", None, True])
+    fake_excel.app.add_workbook("People.xlsx", {"Data": rows})
+    connection.enable_app_events()  # As on the COM worker thread
+    return rows
+
+
+def column(name):
+    return {"type": "name", "value": name}
+
+
+FILTERS = [
+    "cairo",
+    "son 1",
+    "ro",  # Too short for the index: every row is checked
+    "ünï",
+    {"column": column("City"), "operator": "=", "value": "CAIRO"},
+    {"column": column("City"), "operator": "starts_with", "value": "al"},
+    {"column": column("Name"), "operator": "ends_with", "value": "n 25"},
+    {"column": column("Amount"), "operator": "=", "value": "21"},
+    {"column": column("City"), "operator": "in", "value": ["Luxor", "giza"]},
+    {"operator": "and", "conditions": [
+        {"column": column("City"), "operator": "contains", "value": "xandr"},
+        {"column": column("Amount"), "operator": ">", "value": 600},
+    ]},
+    {"operator": "or", "conditions": [
+        {"column": column("City"), "operator": "=", "value": "luxor"},
+        {"operator": "regex", "value": "^person 1\\d$"},
+    ]},
+    {"operator": "not", "conditions": [{"operator": "contains", "value": "cairo"}]},
+    {"operator": "contains", "value": "true"},
+]
+
+
+def test_candidates_cover_every_match(people_sheet):
+    index = SearchIndex(people_sheet)
+    engine = FilterEngine(backend="python")
+    for filters in FILTERS:
+        tree = to_filter_tree(filters)
+        expected = engine.filter_data(people_sheet[1:], tree, HEADERS)
+        candidates = index.candidate_rows(tree, HEADERS, first_row=1)
+        assert engine.filter_data(people_sheet[1:], tree, HEADERS, candidates) == expected, filters
+
+    city = to_filter_tree({"column": column("City"), "operator": "=", "value": "giza"})
+    assert index.candidate_rows(city, HEADERS, first_row=1) == list(range(0, 300, 5))
+    assert index.candidate_rows(to_filter_tree("ro"), HEADERS) is None
+
+
+def test_indexed_search_matches_plain_search(people_sheet, fake_excel):
+    for filters in FILTERS:
+        plain = search_sync("People.xlsx", filters, "Data")
+        indexed = search_sync("People.xlsx", filters, "Data", use_index=True)
+        info = indexed.pop("search_index")
+        # The plan is sampled from the candidate rows, so its match rates differ
+        indexed.pop("filter_plan", None), plain.pop("filter_plan", None)
+        assert indexed == plain, filters
+        assert info["status"] == ("built" if filters is FILTERS[0] else "hit")
+
+    calls = fake_excel.app.calls
+    reads = calls["Range.Value"]
+    result = search_sync("People.xlsx", "alexandria", "Data", max_rows=5, use_index=True)
+    assert calls["Range.Value"] == reads
+    assert result["search_index"] == {"status": "hit", "candidate_rows": 60}
+    assert result["total_available"] == 60 and len(result["cell_locations"]) == 5
+
+
+def test_writes_invalidate_the_index(people_sheet):
+    first = search_sync("People.xlsx", "person 1", "Data", use_index=True)
+    assert first["search_index"]["status"] == "built"
+
+    write_range_sync("People.xlsx", "Data", "A2", [["Someone else"]], force_overwrite=True)
+    second = search_sync("People.xlsx", "someone", "Data", use_index=True)
+    assert second["search_index"]["status"] == "built"
+    assert second["cell_locations"] == ["A2"]
+    assert search_sync("People.xlsx", "someone", "Data", use_index=True)["search_index"]["status"] == "hit"
+
+
+def test_ranges_over_the_budget_are_not_indexed(people_sheet, monkeypatch):
+    monkeypatch.setattr("excellm.tools.search.SEARCH_INDEX_MAX_CELLS", 100)
+    result = search_sync("People.xlsx", "cairo", "Data", use_index=True)
+    assert result["search_index"] == {"status": "too_large", "candidate_rows": 301}
+    assert result["rows_filtered"] == 120
+
+
+def test_engine_writes_and_recalculation_invalidate_the_index(people_sheet, fake_excel):
+    assert search_sync("People.xlsx", "person 1", "Data", use_index=True)["search_index"]["status"] == "built"
+    COMEngine().write_range("People.xlsx", "Data", "B2", [["Aswan"]])
+    result = search_sync("People.xlsx", "aswan", "Data", use_index=True)
+    assert result["search_index"]["status"] == "built" and result["cell_locations"] == ["A2"]
+
+    sheet = fake_excel.app.Workbooks("People.xlsx").Worksheets("Data")
+    sheet.Range("E1").Formula = "=1+1"
+    assert search_sync("People.xlsx", "aswan", "Data", use_index=True)["search_index"]["status"] == "built"
+    fake_excel.app.Calculate()
+    assert search_sync("People.xlsx", "aswan", "Data", use_index=True)["search_index"]["status"] == "built"
+    assert search_sync("People.xlsx", "aswan", "Data", use_index=True)["search_index"]["status"] == "hit"
+
+
+def test_no_index_without_app_events(people_sheet, fake_excel, monkeypatch):
+    monkeypatch.setattr(connection, "_thread_local", connection.threading.local())
+    for _ in range(2):
+        result = search_sync("People.xlsx", "cairo", "Data", use_index=True)
+        assert result["search_index"] == {"status": "events_inactive", "candidate_rows": 301}
+        assert result["rows_filtered"] == 120
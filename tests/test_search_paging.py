@@ -0,0 +1,91 @@
+import os
+import sys
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.connection import tile_rows_for
+from excellm.core.errors import ToolError
+from excellm.tools.search import search_sync
+from excellm.tools.writers import write_range_sync
+
+
+@pytest.fixture
+def orders_sheet(fake_excel):
+    rows = [["Order", "Status", "Amount"]] + [
+        [f"o{r}", "late" if r % 10 == 3 else "ok", r] for r in range(1, 50001)
+    ]
+    fake_excel.app.add_workbook("Orders.xlsx", {"Data": rows})
+    return rows
+
+
+def test_max_rows_stops_after_first_tile(orders_sheet, fake_excel):
+    calls = fake_excel.app.calls
+    calls.clear()
+    page = search_sync("Orders.xlsx", "late", "Data", max_rows=20)
+
+    # Only the first tile was read from Excel
+    assert calls["cells_marshaled"] == tile_rows_for(3) * 3
+    assert page["rows_filtered"] == 20 and len(page["data"]) == 21
+    assert page["data"][0] == ["Order", "Status", "Amount"]
+    assert page["cell_locations"][:2] == ["A4", "A14"] and page["cell_locations"][-1] == "A194"
+    assert page["rows_scanned"] == 193 and page["original_rows"] == 50000
+    assert page["truncated"] is True and "total_available" not in page
+    assert abs(page["estimated_total"] - 5000) <= 5
+
+
+def test_cursor_pages_match_full_search(orders_sheet):
+    filters = {"column": {"type": "name", "value": "Amount"}, "operator": ">", "value": 49000}
+    full = search_sync("Orders.xlsx", filters, "Data")
+
+    pages = [search_sync("Orders.xlsx", filters, "Data", max_rows=400)]
+    while "next_cursor" in pages[-1]:
+        pages.append(search_sync("Orders.xlsx", None, cursor=pages[-1]["next_cursor"]))
+
+    assert [p["rows_filtered"] for p in pages] == [400, 400, 200]
+    assert [row for p in pages for row in p["data"][1:]] == full["data"][1:]
+    assert [loc for p in pages for loc in p["cell_locations"]] == full["cell_locations"]
+    # The last tile was scanned, so the count is exact from the second page on
+    assert pages[1]["total_available"] == 1000 and "truncated" not in pages[-1]
+    assert all(p["sheet"] == "Data" and p["filter_applied"] == "complex filter" for p in pages)
+
+
+def test_stale_and_foreign_cursors(orders_sheet):
+    page = search_sync("Orders.xlsx", "late", "Data", max_rows=5)
+    with pytest.raises(ToolError) as exc:
+        search_sync("Book1.xlsx", "late", cursor=page["next_cursor"])
+    assert exc.value.code == "INVALID_CURSOR"
+
+    write_range_sync("Orders.xlsx", "Data", "B2", [["late"]], force_overwrite=True)
+    with pytest.raises(ToolError) as exc:
+        search_sync("Orders.xlsx", "late", cursor=page["next_cursor"])
+    assert exc.value.code == "STALE_CURSOR"
+
+
+def test_exported_search_still_scans_everything(fake_excel, tmp_path):
+    fake_excel.app.add_workbook("Small.xlsx", {"Data": [["Name"]] + [[f"n{r}"] for r in range(30)]})
+    path = str(tmp_path / "out.xlsx")
+    result = search_sync("Small.xlsx", "n1", "Data", max_rows=3, export_path=path)
+    assert result["export"]["rows_written"] == 12  # Header included
+    assert result["total_available"] == 11 and len(result["data"]) == 4
+
+
+def test_conditions_are_planned_once_per_search(orders_sheet, monkeypatch):
+    from excellm.tools import search
+
+    plans = []
+    plan_filter = search.plan_filter
+    monkeypatch.setattr(search, "plan_filter", lambda *args: plans.append(args) or plan_filter(*args))
+    filters = {"operator": "and", "conditions": [
+        {"column": {"type": "name", "value": "Amount"}, "operator": ">", "value": 0},
+        {"column": {"type": "name", "value": "Status"}, "operator": "=", "value": "late"},
+    ]}
+
+    page = search_sync("Orders.xlsx", filters, "Data", max_rows=5000)
+
+    assert page["rows_scanned"] > tile_rows_for(3)  # Several tiles were filtered
+    assert len(plans) == 1
+    report = page["filter_plan"]
+    assert [c["position"] for c in report["conditions"]] == [1, 0]
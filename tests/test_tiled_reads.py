@@ -0,0 +1,64 @@
+import os
+import sys
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.connection import COM_READ_TILE_CELLS, iter_range_tiles, tile_rows_for
+from excellm.tools.readers import read_range_sync
+
+
+def numbered_sheet(app, rows, cols):
+    return app.add_workbook("Big.xlsx", {"Data": [[r * 100 + c for c in range(cols)] for r in range(1, rows + 1)]})
+
+
+def test_tiles_cover_range_and_stop_early(fake_excel):
+    app = fake_excel.app
+    sheet = numbered_sheet(app, 95, 4).Worksheets("Data")
+    rng = sheet.Range("A1:D95")
+
+    tiles = list(iter_range_tiles(rng, tile_cells=40))
+    assert [len(tile) for tile in tiles] == [10] * 9 + [5]
+    assert [row[0] for tile in tiles for row in tile] == [r * 100 for r in range(1, 96)]
+    assert app.calls["Range.Value"] == 10
+
+    app.calls.clear()
+    assert sum(len(tile) for tile in iter_range_tiles(rng, max_rows=25, tile_cells=40)) == 25
+    assert app.calls["cells_marshaled"] == 100
+
+    app.calls.clear()
+    for _ in iter_range_tiles(rng, tile_cells=40):
+        break
+    assert app.calls["cells_marshaled"] == 40
+
+
+def test_tile_height_adapts_to_columns():
+    assert tile_rows_for(1, 1000) == 1000
+    assert tile_rows_for(30, 1000) == 33
+    assert tile_rows_for(5000, 1000) == 1
+
+
+def test_read_range_fetches_only_max_rows(fake_excel):
+    app = fake_excel.app
+    rows = tile_rows_for(4) * 2 + 7
+    numbered_sheet(app, rows, 4)
+
+    result = read_range_sync("Big.xlsx", "Data", max_rows=10)
+
+    assert result["rows"] == 10 and result["truncated"] is True
+    assert result["total_available"] == rows
+    assert result["data"][9] == ["1000", "1001", "1002", "1003"]
+    assert result["end_row"] == 10
+    assert app.calls["cells_marshaled"] == 40
+
+    app.calls.clear()
+    full = read_range_sync("Big.xlsx", "Data", include_formulas="never")
+    assert full["rows"] == rows and "truncated" not in full
+    assert full["data"][-1][0] == str(rows * 100)
+    assert app.calls["Range.Value"] == 3
+    assert rows * 4 > COM_READ_TILE_CELLS
+
+
+def test_empty_cell_reads_as_no_rows(fake_excel):
+    result = read_range_sync("Book1.xlsx", "Data", "F9")
+    assert result["data"] == [] and result["rows"] == 0
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import sys
+
+import openpyxl
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from excellm.core.errors import ToolError
+from excellm.core.file_engine import FileEngine
+from excellm.core.sketch import HeavyHitters, HyperLogLog, value_key
+from excellm.excel_session import ExcelSessionManager
+from excellm.tools.readers import get_unique_values_sync
+
+
+@pytest.fixture
+def orders_sheet(fake_excel):
+    rows = [["Region", "Qty", "Paid"]]
+    for r in range(1, 201):
+        rows.append(["North" if r % 4 else "South", float(r % 3), r % 2 == 0])
+    rows.append(["North", "1", None])
+    return fake_excel.app.add_workbook("Orders.xlsx", {"Data": rows})
+
+
+def test_typed_keys_and_sketches():
+    assert value_key(100.0) == value_key(100) != value_key("100")
+    assert value_key(True) != value_key(1)
+
+    hll = HyperLogLog()
+    for i in range(50000):
+        hll.add(value_key(f"id-{i}"))
+    assert abs(hll.estimate() - 50000) / 50000 < 0.03
+
+    heavy = HeavyHitters(16)
+    for i in range(20000):
+        heavy.add(value_key("hot" if i % 5 == 0 else f"cold-{i}"))
+    (top_key, top_count), *_ = heavy.items()
+    assert top_key == ("s", "hot") and 4000 - heavy.error <= top_count <= 4000
+
+
+def test_per_column_top_k_and_min_count(orders_sheet):
+    result = get_unique_values_sync("Orders.xlsx", "Data", "A2:C202", by_column=True, top_k=2)
+    region, qty, paid = result["columns"]
+
+    assert region["column"] == "A" and region["values"] == [
+        {"value": "North", "count": 151}, {"value": "South", "count": 50},
+    ]
+    # 1.0 from Excel and the text "1" are different values
+    assert qty["unique_count"] == 4 and qty["truncated"] is True
+    assert [v["value"] for v in qty["values"]] == [1, 2]
+    assert paid["values"] == [{"value": False, "count": 100}, {"value": True, "count": 100}]
+    assert paid["total_count"] == 200 and paid["approximate"] is False
+
+    flat = get_unique_values_sync("Orders.xlsx", "Data", "B2:B202", min_count=2)
+    assert flat["unique_count"] == 4 and [v["value"] for v in flat["values"]] == [1, 2, 0]
+
+
+def test_high_cardinality_switches_to_sketches(fake_excel, monkeypatch):
+    monkeypatch.setattr("excellm.tools.readers.UNIQUE_MAX_EXACT_VALUES", 1000)
+    rows = [[f"user-{r}", "Busy" if r % 3 == 0 else f"status-{r}"] for r in range(30000)]
+    fake_excel.app.add_workbook("Users.xlsx", {"Data": rows})
+
+    result = get_unique_values_sync("Users.xlsx", "Data", by_column=True, top_k=5)
+    users, status = result["columns"]
+
+    assert users["approximate"] is True and len(users["values"]) == 5
+    assert abs(users["unique_count"] - 30000) / 30000 < 0.03
+    assert status["values"][0]["value"] == "Busy"
+    assert 10000 - status["count_error_bound"] <= status["values"][0]["count"] <= 10000
+
+
+def test_file_engine_columns_and_validation(tmp_path):
+    path = tmp_path / "orders.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.title = "Data"
+    for r in range(1, 31):
+        wb.active.append(["North" if r % 3 else "South", r % 4, None if r % 5 else "x"])
+    wb.save(path)
+
+    plain = FileEngine().get_unique_values(str(path), "Data", by_column=True, min_count=7)
+    snap = FileEngine(snapshots=True).get_unique_values(str(path), "Data", by_column=True, min_count=7)
+    assert snap["columns"] == plain["columns"]
+    assert [c["column"] for c in plain["columns"]] == ["A", "B", "C"]
+    assert plain["columns"][0]["values"] == [{"value": "North", "count": 20}, {"value": "South", "count": 10}]
+    assert plain["columns"][2]["values"] == [] and plain["columns"][2]["unique_count"] == 1
+
+    for kwargs in ({"top_k": 0}, {"min_count": 0}, {"top_k": "5"}):
+        with pytest.raises(ToolError) as excinfo:
+            FileEngine().get_unique_values(str(path), "Data", **kwargs)
+        assert excinfo.value.code == "VALIDATION_ERROR"
+
+
+def test_session_uses_shared_validation(orders_sheet):
+    session = ExcelSessionManager()
+    for kwargs in ({"top_k": True}, {"min_count": True}, {"top_k": 0}):
+        with pytest.raises(ToolError) as excinfo:
+            asyncio.run(session.get_unique_values("Orders.xlsx", "Data", "A1:A10", **kwargs))
+        assert excinfo.value.code == "VALIDATION_ERROR"
+
+
+def test_snapshot_counts_keep_booleans_apart(tmp_path):
+    path = tmp_path / "mixed.xlsx"
+    wb = openpyxl.Workbook()
+    for value in (True, True, 1, 1.0, "a"):
+        wb.active.append([value])
+    wb.save(path)
+
+    plain = FileEngine().get_unique_values(str(path), "Sheet")
+    snap = FileEngine(snapshots=True).get_unique_values(str(path), "Sheet")
+    assert snap["values"] == plain["values"]
+    assert [(type(v["value"]), v["value"], v["count"]) for v in snap["values"]] == [
+        (bool, True, 2), (int, 1, 2), (str, "a", 1),
+    ]
@@ -0,0 +1,194 @@
+import datetime
+import os
+import sys
+import zipfile
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.comments import Comment
+
+from excellm.core.errors import ToolError
+from excellm.core.file_engine import EXPORT_IN_MEMORY, EXPORT_STREAMING, FileEngine
+from excellm.tools.pivot import create_pivot_table_openpyxl
+from excellm.tools.range_ops import copy_range_openpyxl
+
+
+@pytest.fixture
+def sales_workbook(tmp_path):
+    path = str(tmp_path / "sales.xlsx")
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Region", "Product", "Sales"])
+    for i in range(20):
+        ws.append(["North" if i % 2 else "South", f"P{i % 3}", i * 10])
+    wb.save(path)
+    return path
+
+
+def raw_members(path):
+    with zipfile.ZipFile(path) as archive:
+        return {info.filename: (info.CRC, info.compress_size) for info in archive.infolist()}
+
+
+def test_export_adds_sheet_and_copies_other_parts(sales_workbook):
+    before = raw_members(sales_workbook)
+    rows = (
+        [i, f"item {i}", datetime.datetime(2024, 1, 1 + i), True, None, "=A2*2"]
+        for i in range(5)
+    )
+
+    result = FileEngine().export_rows(
+        sales_workbook, "Export", rows, header=["n", "name", "when", "flag", "empty", "calc"]
+    )
+
+    assert result["mode"] == EXPORT_STREAMING
+    assert result["rows_written"] == 6
+    assert result["range"] == "A1:F6"
+    after = raw_members(sales_workbook)
+    assert after["xl/worksheets/sheet1.xml"] == before["xl/worksheets/sheet1.xml"]
+    with zipfile.ZipFile(sales_workbook) as archive:
+        assert archive.testzip() is None
+
+    wb = load_workbook(sales_workbook)
+    assert wb.sheetnames == ["Data", "Export"]
+    ws = wb["Export"]
+    assert ws["A1"].value == "n" and ws["A1"].font.b
+    assert ws["C2"].value == datetime.datetime(2024, 1, 1)
+    assert ws["C2"].is_date
+    assert ws["D3"].value is True
+    assert ws["E3"].value is None
+    assert ws["F2"].value == "=A2*2"
+    assert not ws["A2"].font.b
+    # Existing data and styles are untouched
+    assert wb["Data"]["C21"].value == 190
+
+
+def test_export_replace_and_duplicate(sales_workbook):
+    engine = FileEngine()
+    engine.export_rows(sales_workbook, "Out", [[1, 2]])
+
+    with pytest.raises(ToolError):
+        engine.export_rows(sales_workbook, "Out", [[3]])
+
+    engine.export_rows(sales_workbook, "Out", [[3]], replace=True)
+    assert engine.read_range(sales_workbook, "Out", "A1:B1") == [[3, None]]
+
+
+def test_export_creates_file_at_start_cell(tmp_path):
+    path = str(tmp_path / "new.xlsx")
+
+    result = FileEngine().export_rows(path, "Results", [[1, 2], [3, 4]], start_cell="B3")
+
+    assert result["range"] == "B3:C4"
+    ws = load_workbook(path)["Results"]
+    assert ws["B3"].value == 1
+    assert ws["C4"].value == 4
+
+
+def test_export_flushes_cached_writes_first(sales_workbook):
+    engine = FileEngine(durability="deferred", flush_interval_ms=0, flush_every=0)
+    engine.write_range(sales_workbook, "Data", "A2", [["West"]])
+
+    engine.export_rows(sales_workbook, "Out", [["x"]])
+
+    wb = load_workbook(sales_workbook)
+    assert wb["Data"]["A2"].value == "West"
+    assert wb["Out"]["A1"].value == "x"
+
+
+def test_replacing_sheet_with_related_parts_falls_back(sales_workbook):
+    wb = load_workbook(sales_workbook)
+    wb.create_sheet("Out")["A1"].comment = Comment("note", "me")
+    wb.save(sales_workbook)
+
+    result = FileEngine().export_rows(sales_workbook, "Out", [["new"]], header=["h"], replace=True)
+
+    assert result["mode"] == EXPORT_IN_MEMORY
+    ws = load_workbook(sales_workbook)["Out"]
+    assert ws["A1"].value == "h" and ws["A1"].font.b
+    assert ws["A2"].value == "new"
+
+
+def test_pivot_summary_is_exported(sales_workbook):
+    result = create_pivot_table_openpyxl(
+        sales_workbook, "Data", "A1:C21", rows=["Region"], values=["Sales"]
+    )
+
+    assert result["success"]
+    ws = load_workbook(sales_workbook)["Data_Summary"]
+    assert list(ws.values) == [("Region", "Sum of Sales"), ("North", 1000.0), ("South", 900.0)]
+    assert ws["A1"].font.b
+
+
+def test_copy_range_between_files(sales_workbook, tmp_path):
+    target = str(tmp_path / "copy.xlsx")
+
+    result = copy_range_openpyxl(sales_workbook, "Data", "A1:C3", target, "Copy", "B2")
+
+    assert result["target"]["range"] == "B2:D4"
+    assert result["cells_copied"] == 9
+    ws = load_workbook(target)["Copy"]
+    assert ws["B2"].value == "Region"
+    assert ws["D4"].value == 10
+
+    # Existing target sheet in the same file
+    copy_range_openpyxl(sales_workbook, "Data", "A2:A3", target_cell="E1")
+    ws = load_workbook(sales_workbook)["Data"]
+    assert (ws["E1"].value, ws["E2"].value) == ("South", "North")
+
+
+def test_repeated_exports_reuse_styles(sales_workbook):
+    def style_counts():
+        with zipfile.ZipFile(sales_workbook) as archive:
+            styles = archive.read("xl/styles.xml").decode()
+        return styles.count("<font>") + styles.count("<font "), styles.count("<xf ")
+
+    engine = FileEngine()
+    rows = [[datetime.date(2024, 1, 2), 1]]
+    engine.export_rows(sales_workbook, "First", rows, header=["when", "n"])
+    after_first = style_counts()
+    engine.export_rows(sales_workbook, "Second", rows, header=["when", "n"])
+    engine.export_rows(sales_workbook, "First", rows, header=["when", "n"], replace=True)
+
+    assert style_counts() == after_first
+    ws = load_workbook(sales_workbook)["Second"]
+    assert ws["A1"].font.b and ws["A2"].number_format == "mm-dd-yy"
+
+
+def test_replacing_sheet_drops_calc_chain(sales_workbook):
+    engine = FileEngine()
+    engine.export_rows(sales_workbook, "Out", [["=1+1"]])
+    # Add the calculation chain Excel writes when it saves formulas
+    with zipfile.ZipFile(sales_workbook) as archive:
+        members = {name: archive.read(name) for name in archive.namelist()}
+    members["xl/calcChain.xml"] = (
+        b'<calcChain xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        b'<c r="A1" i="2"/></calcChain>'
+    )
+    members["xl/_rels/workbook.xml.rels"] = members["xl/_rels/workbook.xml.rels"].replace(
+        b"</Relationships>",
+        b'<Relationship Id="rIdCalc" Target="calcChain.xml" Type="http://schemas.'
+        b'openxmlformats.org/officeDocument/2006/relationships/calcChain"/></Relationships>',
+    )
+    members["[Content_Types].xml"] = members["[Content_Types].xml"].replace(
+        b"</Types>",
+        b'<Override PartName="/xl/calcChain.xml" ContentType="application/vnd.openxmlformats-'
+        b'officedocument.spreadsheetml.calcChain+xml"/></Types>',
+    )
+    with zipfile.ZipFile(sales_workbook, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+
+    result = engine.export_rows(sales_workbook, "Out", [["plain"]], replace=True)
+
+    assert result["mode"] == EXPORT_STREAMING
+    with zipfile.ZipFile(sales_workbook) as archive:
+        assert "xl/calcChain.xml" not in archive.namelist()
+        assert b"calcChain" not in archive.read("xl/_rels/workbook.xml.rels")
+        assert b"calcChain" not in archive.read("[Content_Types].xml")
+    assert engine.read_range(sales_workbook, "Out", "A1") == [["plain"]]
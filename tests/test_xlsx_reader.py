@@ -0,0 +1,134 @@
+import datetime
+import os
+import sys
+import zipfile
+
+import pytest
+
+# Adjust path to find excellm package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.worksheet.formula import ArrayFormula
+
+from excellm.core.file_engine import FileEngine
+from excellm.core.xlsx_reader import UnsupportedXlsxError, XlsxReader
+
+
+@pytest.fixture
+def mixed_workbook(tmp_path):
+    path = str(tmp_path / "mixed.xlsx")
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Mixed"
+    ws.append(["Name", "Amount", "Ratio", "Flag", "When", "Formula"])
+    for i in range(1, 30):
+        ws.append([
+            f"item {i % 7}",
+            i * 10,
+            i / 4,
+            i % 2 == 0,
+            datetime.datetime(2024, 1, 1) + datetime.timedelta(days=i),
+            f"=B{i + 1}*2",
+        ])
+    ws["H40"] = "far away"
+    wb.create_sheet("Empty")
+    wb.save(path)
+    return path
+
+
+def openpyxl_rows(path, sheet, min_row, max_row, min_col, max_col):
+    wb = load_workbook(path, read_only=True)
+    rows = [
+        list(r)
+        for r in wb[sheet].iter_rows(
+            min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True
+        )
+    ]
+    wb.close()
+    return rows
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [(1, 30, 1, 6), (5, 9, 2, 5), (28, 45, 1, 8), (2, 2, 6, 6)],
+)
+def test_reader_matches_openpyxl(mixed_workbook, bounds):
+    reader = XlsxReader(mixed_workbook)
+    try:
+        ours = list(reader.iter_rows("Mixed", *bounds))
+    finally:
+        reader.close()
+
+    assert ours == openpyxl_rows(mixed_workbook, "Mixed", *bounds)
+
+
+def test_reader_stops_at_last_row_and_handles_empty_sheet(mixed_workbook):
+    reader = XlsxReader(mixed_workbook)
+
+    assert len(list(reader.iter_rows("Mixed", 35, 100, 1, 8))) == 6
+    assert list(reader.iter_rows("Empty", 1, 5, 1, 2)) == []
+    with pytest.raises(KeyError):
+        list(reader.iter_rows("Missing", 1, 1, 1, 1))
+    reader.close()
+
+
+def test_reader_rejects_array_formulas(tmp_path):
+    path = str(tmp_path / "array.xlsx")
+    wb = Workbook()
+    wb.active["A1"] = ArrayFormula("A1:A2", "=ROW(B1:B2)")
+    wb.save(path)
+
+    reader = XlsxReader(path)
+    with pytest.raises(UnsupportedXlsxError):
+        list(reader.iter_rows("Sheet", 1, 1, 1, 1))
+    reader.close()
+
+    # FileEngine falls back to openpyxl and returns its ArrayFormula object
+    value = FileEngine().read_range(path, "Sheet", "A1:A1")[0][0]
+    assert isinstance(value, ArrayFormula)
+
+
+def test_file_engine_streams_read_only_workbooks(mixed_workbook):
+    engine = FileEngine()
+
+    data = engine.read_range(mixed_workbook, "Mixed", "A1:B3")
+
+    assert data == [["Name", "Amount"], ["item 1", 10], ["item 2", 20]]
+    entry = engine._workbook_cache.peek(os.path.abspath(mixed_workbook))
+    assert entry.reader is not None
+
+    # Upgrading for a write releases the streaming reader
+    engine.write_range(mixed_workbook, "Mixed", "A2", [["changed"]])
+    entry = engine._workbook_cache.peek(os.path.abspath(mixed_workbook))
+    assert entry.reader is None
+    assert engine.read_range(mixed_workbook, "Mixed", "A2:A2") == [["changed"]]
+
+
+def test_shared_formulas_above_range_are_translated(tmp_path):
+    path = str(tmp_path / "shared.xlsx")
+    wb = Workbook()
+    for i in range(1, 6):
+        wb.active.append([i])
+    wb.save(path)
+
+    # openpyxl never writes shared formulas; inject a master in B2 used by B4
+    with zipfile.ZipFile(path) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+    xml = parts["xl/worksheets/sheet1.xml"].decode()
+    xml = xml.replace(
+        '<c r="A2" t="n"><v>2</v></c>',
+        '<c r="A2" t="n"><v>2</v></c><c r="B2"><f t="shared" ref="B2:B4" si="0">A2*2</f><v>4</v></c>',
+    ).replace(
+        '<c r="A4" t="n"><v>4</v></c>',
+        '<c r="A4" t="n"><v>4</v></c><c r="B4"><f t="shared" si="0"/><v>8</v></c>',
+    )
+    parts["xl/worksheets/sheet1.xml"] = xml.encode()
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+    reader = XlsxReader(path)
+    assert list(reader.iter_rows("Sheet", 4, 4, 1, 2)) == [[4, "=A4*2"]]
+    reader.close()
+    assert openpyxl_rows(path, "Sheet", 4, 4, 1, 2) == [[4, "=A4*2"]]